@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import json
+import resource
+import sys
+import time
+from typing import Callable, List, Optional
+
+import wrench
+
+
+def peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of the current process
+
+    :return: the peak RSS in MiB
+    :rtype: float
+    """
+    # On Linux, ru_maxrss survives exec() and may thus be the parent process's, unlike VmHWM
+    try:
+        with open("/proc/self/status", "r") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2 ** 10
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in KiB elsewhere
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def run_benchmark(name: str, body: Callable[[wrench.Simulation], int], platform_xml: str, controller_hostname: str,
+                  daemon_host: str, daemon_port: int, daemon_url: Optional[str] = None,
+                  transport: Optional[wrench.Transport] = None) -> dict:
+    """
+    Run a benchmark in a fresh simulation
+
+    :param name: the benchmark name
+    :type name: str
+    :param body: the benchmark body, which takes a started simulation and returns the number of operations done
+    :type body: Callable[[wrench.Simulation], int]
+    :param platform_xml: the platform description
+    :type platform_xml: str
+    :param controller_hostname: the controller host name
+    :type controller_hostname: str
+    :param daemon_host: the daemon host name
+    :type daemon_host: str
+    :param daemon_port: the daemon port number
+    :type daemon_port: int
+    :param daemon_url: the daemon URL, which overrides the host and port if not None (e.g., "unix:///tmp/wrench.sock")
+    :type daemon_url: Optional[str]
+    :param transport: the transport through which requests are sent (default: the Simulation's default transport)
+    :type transport: Optional[wrench.Transport]
+    :return: the benchmark result
+    :rtype: dict
+    """
+    simulation = wrench.Simulation(daemon_host=daemon_host, daemon_port=daemon_port, daemon_url=daemon_url,
+                                   transport=transport)
+    simulation.start(platform_xml, controller_hostname)
+    request_stats = simulation.enable_request_stats(dump_at_terminate=False)
+    start = time.perf_counter()
+    operations = body(simulation)
+    elapsed = time.perf_counter() - start
+    routes = {route: {"count": stats["count"],
+                      "p50_ms": 1000 * stats["p50_latency"],
+                      "p99_ms": 1000 * stats["p99_latency"],
+                      "mean_ms": 1000 * stats["mean_latency"],
+                      "decode_ms": 1000 * stats["decode_time"] / stats["count"]}
+              for route, stats in sorted(request_stats.get_route_stats().items())}
+    result = {"name": name,
+              "operations": operations,
+              "seconds": elapsed,
+              "operations_per_sec": operations / elapsed if elapsed > 0 else float("inf"),
+              "requests": sum(stats["count"] for stats in routes.values()),
+              "peak_rss_mb": peak_rss_mb(),
+              "routes": routes}
+    simulation.terminate()
+    return result
+
+
+def compare_to_baseline(results: List[dict], baseline: List[dict], tolerance: float) -> List[str]:
+    """
+    Compare benchmark results to a baseline
+
+    :param results: the benchmark results
+    :type results: List[dict]
+    :param baseline: the baseline results
+    :type baseline: List[dict]
+    :param tolerance: the relative slowdown (or memory increase) above which a result is a regression
+    :type tolerance: float
+    :return: a description of each regression
+    :rtype: List[str]
+    """
+    baseline_results = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        reference: Optional[dict] = baseline_results.get(result["name"])
+        if reference is None:
+            continue
+        if result["operations_per_sec"] < reference["operations_per_sec"] / (1 + tolerance):
+            regressions.append(f"{result['name']}: {result['operations_per_sec']:.1f} ops/sec "
+                               f"(baseline: {reference['operations_per_sec']:.1f} ops/sec)")
+        if result["peak_rss_mb"] > reference["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(f"{result['name']}: peak RSS {result['peak_rss_mb']:.1f} MiB "
+                               f"(baseline: {reference['peak_rss_mb']:.1f} MiB)")
+    return regressions
+
+
+def format_results(results: List[dict]) -> str:
+    """
+    Format benchmark results as a table, followed by the per-route latencies of each benchmark
+
+    :param results: the benchmark results
+    :type results: List[dict]
+    :return: the formatted results
+    :rtype: str
+    """
+    lines = [f"{'benchmark':<28}{'ops':>9}{'seconds':>10}{'ops/sec':>12}{'requests':>10}{'peak RSS (MiB)':>16}"]
+    for result in results:
+        lines.append(f"{result['name']:<28}{result['operations']:>9}{result['seconds']:>10.2f}"
+                     f"{result['operations_per_sec']:>12.1f}{result['requests']:>10}{result['peak_rss_mb']:>16.1f}")
+    for result in results:
+        lines.append("")
+        lines.append(f"{result['name']}:")
+        lines.append(f"    {'route':<58}{'count':>8}{'p50 (ms)':>10}{'p99 (ms)':>10}{'decode (ms)':>13}")
+        for route, stats in result["routes"].items():
+            lines.append(f"    {route:<58}{stats['count']:>8}{stats['p50_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+                         f"{stats['decode_ms']:>13.3f}")
+    return "\n".join(lines)
+
+
+def load_results(path: str) -> List[dict]:
+    """
+    Load benchmark results from a JSON file
+
+    :param path: the file path
+    :type path: str
+    :return: the benchmark results
+    :rtype: List[dict]
+    """
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def save_results(path: str, results: List[dict]) -> None:
+    """
+    Save benchmark results to a JSON file
+
+    :param path: the file path
+    :type path: str
+    :param results: the benchmark results
+    :type results: List[dict]
+    """
+    with open(path, "w") as f:
+        json.dump({"python": sys.version.split()[0], "wrench": wrench.__version__,
+                   "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, f, indent=2)
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import argparse
+import copy
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+import wrench
+from wrench.mock_daemon import MockDaemon
+from harness import compare_to_baseline, format_results, load_results, run_benchmark, save_results
+
+EXAMPLES_DIR = pathlib.Path(__file__).parent.resolve().parent / "examples"
+JSON_WORKFLOW_DIR = EXAMPLES_DIR / "json_workflow_simulator"
+COMPOUND_JOB_DIR = EXAMPLES_DIR / "compound_job_simulator"
+
+
+def replicate_workflow(document: dict, copies: int) -> dict:
+    """
+    Build a larger WfCommons workflow out of independent copies of a workflow
+
+    :param document: the WfCommons JSON document
+    :type document: dict
+    :param copies: the number of copies
+    :type copies: int
+    :return: a WfCommons JSON document with copies times as many tasks and files
+    :rtype: dict
+    """
+    def rename(name: str, i: int) -> str:
+        return f"{name}_copy{i}"
+
+    result = copy.deepcopy(document)
+    specification = document["workflow"]["specification"]
+    execution = document["workflow"]["execution"]
+    result["workflow"]["specification"]["tasks"] = [
+        dict(task, name=rename(task["name"], i), id=rename(task["id"], i),
+             parents=[rename(p, i) for p in task["parents"]], children=[rename(c, i) for c in task["children"]],
+             inputFiles=[rename(f, i) for f in task["inputFiles"]],
+             outputFiles=[rename(f, i) for f in task["outputFiles"]])
+        for i in range(copies) for task in specification["tasks"]]
+    result["workflow"]["specification"]["files"] = [dict(f, id=rename(f["id"], i))
+                                                    for i in range(copies) for f in specification["files"]]
+    result["workflow"]["execution"]["tasks"] = [dict(task, id=rename(task["id"], i))
+                                                for i in range(copies) for task in execution["tasks"]]
+    return result
+
+
+def create_workflow_from_json(simulation: wrench.Simulation, json_doc: dict) -> wrench.Workflow:
+    """
+    Import a workflow with the same settings as the json_workflow_simulator example
+    """
+    return simulation.create_workflow_from_json(json_doc, reference_flop_rate="100Mf", ignore_machine_specs=True,
+                                                redundant_dependencies=False, ignore_cycle_creating_dependencies=False,
+                                                min_cores_per_task=1, max_cores_per_task=1, enforce_num_cores=True,
+                                                ignore_avg_cpu=True, show_warnings=False)
+
+
+def bench_add_task(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Build a chain of tasks, linked by files, one request at a time
+    """
+    workflow = simulation.create_workflow()
+    previous_file = simulation.add_file("file_0", 1024)
+    for i in range(1000 * scale):
+        task = workflow.add_task(f"task_{i}", 100.0, 1, 1, 0)
+        task.add_input_file(previous_file)
+        previous_file = simulation.add_file(f"file_{i + 1}", 1024)
+        task.add_output_file(previous_file)
+    return 1000 * scale
+
+
+def bench_add_task_batch(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Same as bench_add_task, within a batch() context
+    """
+    with simulation.batch():
+        return bench_add_task(simulation, scale)
+
+
+def bench_create_workflow_from_json(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Import a large WfCommons workflow (copies of the json_workflow_simulator example's workflow)
+    """
+    with open(JSON_WORKFLOW_DIR / "sample_wfcommons_workflow.json", "r") as f:
+        json_doc = replicate_workflow(json.load(f), 10 * scale)
+    workflow = create_workflow_from_json(simulation, json_doc)
+    return len(workflow.tasks)
+
+
+def bench_submit_wait(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    The main loop of the json_workflow_simulator example: submit one standard job per ready task
+    to the fastest idle compute service, and wait for job completions
+    """
+    with open(JSON_WORKFLOW_DIR / "sample_wfcommons_workflow.json", "r") as f:
+        json_doc = replicate_workflow(json.load(f), scale)
+    hostnames = [hostname for hostname in simulation.get_all_hostnames() if hostname != "UserHost"]
+    ss = simulation.create_simple_storage_service("UserHost", ["/"])
+    idle_cores = {}
+    core_speeds = {}
+    for hostname in hostnames:
+        cs = simulation.create_bare_metal_compute_service(hostname, {hostname: (-1, -1)}, "", {}, {})
+        idle_cores[cs] = cs.get_core_counts()[hostname]
+        core_speeds[cs] = cs.get_core_flop_rates()[hostname]
+    workflow = create_workflow_from_json(simulation, json_doc)
+    ss.create_file_copies(workflow.get_input_files())
+
+    num_jobs = 0
+    while not workflow.is_done():
+        ready_tasks = sorted(workflow.get_ready_tasks(), key=lambda t: t.get_flops(), reverse=True)
+        for task in ready_tasks:
+            candidates = [cs for cs in idle_cores if idle_cores[cs] > 0]
+            if not candidates:
+                break
+            cs = max(candidates, key=lambda c: core_speeds[c])
+            locations = {f: ss for f in task.get_input_files() + task.get_output_files()}
+            cs.submit_standard_job(simulation.create_standard_job([task], locations))
+            idle_cores[cs] -= 1
+            num_jobs += 1
+        event = simulation.wait_for_next_event()
+        idle_cores[event["compute_service"]] += 1
+    return num_jobs
+
+
+def bench_submit_wait_step(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    The same as bench_submit_wait(), with the main loop driven by Simulation.step()
+    """
+    with open(JSON_WORKFLOW_DIR / "sample_wfcommons_workflow.json", "r") as f:
+        json_doc = replicate_workflow(json.load(f), scale)
+    hostnames = [hostname for hostname in simulation.get_all_hostnames() if hostname != "UserHost"]
+    ss = simulation.create_simple_storage_service("UserHost", ["/"])
+    idle_cores = {}
+    core_speeds = {}
+    for hostname in hostnames:
+        cs = simulation.create_bare_metal_compute_service(hostname, {hostname: (-1, -1)}, "", {}, {})
+        idle_cores[cs] = cs.get_core_counts()[hostname]
+        core_speeds[cs] = cs.get_core_flop_rates()[hostname]
+    workflow = create_workflow_from_json(simulation, json_doc)
+    ss.create_file_copies(workflow.get_input_files())
+
+    num_jobs = 0
+    ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+    while not done:
+        submissions = []
+        for task in sorted(ready_tasks, key=lambda t: t.get_flops(), reverse=True):
+            candidates = [cs for cs in idle_cores if idle_cores[cs] > 0]
+            if not candidates:
+                break
+            cs = max(candidates, key=lambda c: core_speeds[c])
+            locations = {f: ss for f in task.get_input_files() + task.get_output_files()}
+            submissions.append(([task], locations, cs))
+            idle_cores[cs] -= 1
+            num_jobs += 1
+        event, ready_tasks, done = simulation.step(workflow, submissions)
+        idle_cores[event["compute_service"]] += 1
+    return num_jobs
+
+
+def bench_run_schedule(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Run the workflow of bench_submit_wait() with a static schedule, which maps tasks, in decreasing bottom-level
+    order, to compute services in a round-robin fashion
+    """
+    with open(JSON_WORKFLOW_DIR / "sample_wfcommons_workflow.json", "r") as f:
+        json_doc = replicate_workflow(json.load(f), scale)
+    hostnames = [hostname for hostname in simulation.get_all_hostnames() if hostname != "UserHost"]
+    ss = simulation.create_simple_storage_service("UserHost", ["/"])
+    compute_services = [simulation.create_bare_metal_compute_service(hostname, {hostname: (-1, -1)}, "", {}, {})
+                        for hostname in hostnames]
+    workflow = create_workflow_from_json(simulation, json_doc)
+    ss.create_file_copies(workflow.get_input_files())
+
+    # Tasks in decreasing bottom-level order, as in list-scheduling heuristics (e.g., HEFT), which is a topological
+    # order
+    tasks = sorted(workflow.tasks.values(), key=lambda t: t.get_bottom_level(), reverse=True)
+    schedule = wrench.StaticSchedule()
+    for i, task in enumerate(tasks):
+        locations = {f: ss for f in task.get_input_files() + task.get_output_files()}
+        schedule.add_task(task, compute_services[i % len(compute_services)], locations)
+    events, _ = simulation.run_schedule(workflow, schedule)
+    return len(events)
+
+
+def bench_list_scheduling(simulation: wrench.Simulation, scale: int, scheduler_class: type) -> int:
+    """
+    Run the workflow of bench_submit_wait() with a scheduler of the wrench.scheduling package
+    """
+    with open(JSON_WORKFLOW_DIR / "sample_wfcommons_workflow.json", "r") as f:
+        json_doc = replicate_workflow(json.load(f), scale)
+    hostnames = [hostname for hostname in simulation.get_all_hostnames() if hostname != "UserHost"]
+    ss = simulation.create_simple_storage_service("UserHost", ["/"])
+    compute_services = [simulation.create_bare_metal_compute_service(hostname, {hostname: (-1, -1)}, "", {}, {})
+                        for hostname in hostnames]
+    workflow = create_workflow_from_json(simulation, json_doc)
+    ss.create_file_copies(workflow.get_input_files())
+    events, _ = scheduler_class(simulation, compute_services, ss).run(workflow)
+    return len(events)
+
+
+def bench_min_min(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Run the workflow of bench_submit_wait() with a MinMinScheduler
+    """
+    return bench_list_scheduling(simulation, scale, wrench.scheduling.MinMinScheduler)
+
+
+def bench_heft(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Run the workflow of bench_submit_wait() with a HEFTScheduler
+    """
+    return bench_list_scheduling(simulation, scale, wrench.scheduling.HEFTScheduler)
+
+
+def bench_compound_actions(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Create compound jobs with chains of actions of all kinds, and run them
+    """
+    bmcs = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0),
+                                                                          "BatchHost2": (6, 12.0)}, "/scratch", {}, {})
+    ss = simulation.create_simple_storage_service("StorageHost", ["/"])
+    num_actions = 0
+    for i in range(100 * scale):
+        input_file = simulation.add_file(f"input_{i}", 1024)
+        output_file = simulation.add_file(f"output_{i}", 1024)
+        ss.create_file_copy(input_file)
+        job = simulation.create_compound_job(f"job_{i}")
+        actions = [job.add_file_read_action(f"read_{i}", input_file, ss),
+                   job.add_compute_action(f"compute_{i}", 100.0, 0, 1, 1, ("AMDAHL", 1.0)),
+                   job.add_sleep_action(f"sleep_{i}", 1.0),
+                   job.add_file_write_action(f"write_{i}", output_file, ss),
+                   job.add_file_delete_action(f"delete_{i}", input_file, ss)]
+        for parent, child in zip(actions, actions[1:]):
+            job.add_action_dependency(parent, child)
+        bmcs.submit_compound_job(job)
+        num_actions += len(actions)
+    for _ in simulation.events():
+        pass
+    return num_actions
+
+
+def bench_compound_actions_builder(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    The same as bench_compound_actions(), with jobs built with a CompoundJobBuilder
+    """
+    bmcs = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0),
+                                                                          "BatchHost2": (6, 12.0)}, "/scratch", {}, {})
+    ss = simulation.create_simple_storage_service("StorageHost", ["/"])
+    num_actions = 0
+    for i in range(100 * scale):
+        input_file, output_file = simulation.add_files([(f"input_{i}", 1024), (f"output_{i}", 1024)])
+        ss.create_file_copy(input_file)
+        builder = wrench.CompoundJobBuilder(simulation, f"job_{i}")
+        actions = [builder.add_file_read_action(f"read_{i}", input_file, ss),
+                   builder.add_compute_action(f"compute_{i}", 100.0, 0, 1, 1, ("AMDAHL", 1.0)),
+                   builder.add_sleep_action(f"sleep_{i}", 1.0),
+                   builder.add_file_write_action(f"write_{i}", output_file, ss),
+                   builder.add_file_delete_action(f"delete_{i}", input_file, ss)]
+        for parent, child in zip(actions, actions[1:]):
+            builder.add_action_dependency(parent, child)
+        builder.submit(bmcs)
+        num_actions += len(actions)
+    for _ in simulation.events():
+        pass
+    return num_actions
+
+
+def bench_vm_lifecycle(simulation: wrench.Simulation, scale: int) -> int:
+    """
+    Create, start, suspend, resume, shut down and destroy VMs
+    """
+    ccs = simulation.create_cloud_compute_service("CloudHeadHost", ["CloudHost1", "CloudHost2"], "/scratch", {}, {})
+    for _ in range(100 * scale):
+        vm = ccs.create_vm(1, 100, {}, {})
+        vm.start()
+        vm.suspend()
+        assert vm.is_suspended()
+        vm.resume()
+        assert vm.is_running()
+        vm.shutdown()
+        assert vm.is_down()
+        ccs.destroy_vm(vm)
+    return 100 * scale
+
+
+# Benchmark name -> (body, platform file, controller host)
+BENCHMARKS = {
+    "add_task": (bench_add_task, COMPOUND_JOB_DIR / "sample_platform.xml", "ControllerHost"),
+    "add_task_batch": (bench_add_task_batch, COMPOUND_JOB_DIR / "sample_platform.xml", "ControllerHost"),
+    "create_workflow_from_json": (bench_create_workflow_from_json,
+                                  JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "submit_wait": (bench_submit_wait, JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "submit_wait_step": (bench_submit_wait_step, JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "run_schedule": (bench_run_schedule, JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "min_min": (bench_min_min, JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "heft": (bench_heft, JSON_WORKFLOW_DIR / "one_host_and_several_clusters.xml", "UserHost"),
+    "compound_actions": (bench_compound_actions, COMPOUND_JOB_DIR / "sample_platform.xml", "ControllerHost"),
+    "compound_actions_builder": (bench_compound_actions_builder, COMPOUND_JOB_DIR / "sample_platform.xml",
+                                 "ControllerHost"),
+    "vm_lifecycle": (bench_vm_lifecycle, COMPOUND_JOB_DIR / "sample_platform.xml", "ControllerHost"),
+}
+
+
+# Transport name -> transport class
+TRANSPORTS = {
+    "requests": wrench.RequestsTransport,
+    "http.client": wrench.HTTPClientTransport,
+    "in-process": wrench.InProcessTransport,
+}
+
+
+def run_one(name: str, scale: int, daemon_host: str, daemon_port: int, daemon_url: str = None,
+            transport: str = "requests") -> dict:
+    """
+    Run one benchmark in the current process
+    """
+    body, platform_file_path, controller_hostname = BENCHMARKS[name]
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+    return run_benchmark(name, lambda simulation: body(simulation, scale), xml_string, controller_hostname,
+                         daemon_host, daemon_port, daemon_url, TRANSPORTS[transport]())
+
+
+def run_all(names, scale: int, daemon_host: str, daemon_port: int, daemon_url: str = None,
+            transport: str = "requests") -> list:
+    """
+    Run benchmarks, each in its own process so that its peak RSS is its own
+    """
+    results = []
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        command = [sys.executable, __file__, "--run-one", name, "--scale", str(scale), "--daemon-host", daemon_host,
+                   "--transport", transport]
+        if daemon_url is not None:
+            command += ["--daemon-url", daemon_url]
+        else:
+            command += ["--daemon-port", str(daemon_port)]
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True).stdout
+        results.append(json.loads(output))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WRENCH Python API client-overhead benchmarks")
+    parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run, among {', '.join(BENCHMARKS)} "
+                                                       f"(default: all)")
+    parser.add_argument("--scale", type=int, default=1, help="problem size multiplier (default: 1)")
+    parser.add_argument("--daemon-host", default="localhost", help="host of the wrench-daemon (default: localhost)")
+    parser.add_argument("--daemon-port", type=int, default=None,
+                        help="port of a running wrench-daemon (default: use an in-process mock daemon)")
+    parser.add_argument("--daemon-url", default=None,
+                        help="URL of a running wrench-daemon, e.g., unix:///tmp/wrench.sock "
+                             "(overrides the host and port)")
+    parser.add_argument("--unix-socket", action="store_true",
+                        help="serve the in-process mock daemon over Unix domain sockets instead of TCP")
+    parser.add_argument("--transport", choices=list(TRANSPORTS), default="requests",
+                        help="transport through which requests are sent (default: requests); the in-process "
+                             "transport has requests answered by a mock daemon in the client process")
+    parser.add_argument("--output", default=None, help="save the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="compare the results to the ones saved in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="relative degradation reported as a regression (default: 0.2)")
+    parser.add_argument("--run-one", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one is not None:
+        print(json.dumps(run_one(args.run_one, args.scale, args.daemon_host, args.daemon_port, args.daemon_url,
+                                 args.transport)))
+        return
+
+    names = args.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+    if args.daemon_port is not None or args.daemon_url is not None or args.transport == "in-process":
+        results = run_all(names, args.scale, args.daemon_host, args.daemon_port or 8101, args.daemon_url,
+                          args.transport)
+    elif args.unix_socket:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with MockDaemon(socket_path=f"{tmp_dir}/wrench.sock"):
+                results = run_all(names, args.scale, args.daemon_host, None, f"unix://{tmp_dir}/wrench.sock",
+                                  args.transport)
+    else:
+        with MockDaemon(daemon_host=args.daemon_host) as daemon:
+            results = run_all(names, args.scale, args.daemon_host, daemon.daemon_port, transport=args.transport)
+
+    print(format_results(results))
+    if args.output is not None:
+        save_results(args.output, results)
+    if args.baseline is not None:
+        regressions = compare_to_baseline(results, load_results(args.baseline), args.tolerance)
+        print()
+        print("\n".join(["Regressions:"] + regressions) if regressions else "No regressions")
+        if regressions:
+            exit(1)
+
+
+if __name__ == "__main__":
+    main()
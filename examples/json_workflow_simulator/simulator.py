@@ -11,11 +11,12 @@
 import json
 import pathlib
 import wrench
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-from wrench.simulation import Simulation  # For type checking
+from wrench.file import File  # For type checking
 from wrench.task import Task  # For type checking
 from wrench.compute_service import ComputeService  # For type checking
+from wrench.storage_service import StorageService  # For type checking
 
 
 def pick_task_to_schedule(tasks: List[Task]):
@@ -33,29 +34,22 @@ def pick_task_to_schedule(tasks: List[Task]):
     return target_task
 
 
-def pick_target_cs(compute_resources: Dict[ComputeService, Dict[str, float]], desired_num_cores: int) -> ComputeService:
+def pick_target_cs(resource_tracker: wrench.scheduling.ResourceTracker, desired_num_cores: int) -> ComputeService:
     """
     A method to select a compute service on which to schedule a task. Right now,
-    just selects the compute service with the largest flop rate
+    just selects the compute service with the largest flop rate among those
+    that have enough idle cores
     """
-    # pick the one with the largest core speed
-    max_core_speed = 0
-    target_cs = None
-    for cs in compute_resources:
-        # If there are no idle cores, don't consider this resource
-        if compute_resources[cs]["num_idle_cores"] < desired_num_cores:
-            continue
-        if compute_resources[cs]["core_speed"] > max_core_speed:
-            max_core_speed = compute_resources[cs]["core_speed"]
-            target_cs = cs
-    return target_cs
-
-
-def schedule_tasks(simulation: Simulation, tasks_to_schedule: List[Task],
-                   compute_resources: Dict[ComputeService, Dict[str, float]], storage_service):
+    return resource_tracker.get_fastest(desired_num_cores)
+
+
+def schedule_tasks(tasks_to_schedule: List[Task], resource_tracker: wrench.scheduling.ResourceTracker,
+                   storage_service) -> List[Tuple[List[Task], Dict[File, StorageService], ComputeService]]:
     """
-    A method that schedules tasks, using list scheduling, if possible
+    A method that schedules tasks, using list scheduling, if possible, and returns
+    the jobs to create and submit, as (tasks, file locations, compute service) tuples
     """
+    submissions = []
 
     while True:
         # If no tasks left to schedule, we're done
@@ -69,7 +63,7 @@ def schedule_tasks(simulation: Simulation, tasks_to_schedule: List[Task],
 
         # Pick one of the compute services on which to schedule the task,
         # using the minimum number of cores for the task
-        target_cs = pick_target_cs(compute_resources, task_to_schedule.get_min_num_cores())
+        target_cs = pick_target_cs(resource_tracker, task_to_schedule.get_min_num_cores())
 
         # If we didn't find a compute service, we're done
         if target_cs is None:
@@ -90,16 +84,14 @@ def schedule_tasks(simulation: Simulation, tasks_to_schedule: List[Task],
         for f in output_files:
             locations[f] = storage_service
 
-        # Create a standard job for the task
-        job = simulation.create_standard_job([task_to_schedule], locations)
-
-        # Submit the standard job for execution
-        target_cs.submit_standard_job(job)
+        # Create a standard job for the task, to be submitted for execution
+        submissions.append(([task_to_schedule], locations, target_cs))
 
-        # Update the number of idle cores of the target compute service
-        compute_resources[target_cs]["num_idle_cores"] -= 1
+        # Reserve the cores of the target compute service until the job is submitted
+        # (the tracker then keeps track of them until the job completes)
+        resource_tracker.acquire(target_cs, task_to_schedule.get_min_num_cores())
 
-    return
+    return submissions
 
 
 def main():
@@ -140,19 +132,10 @@ def main():
             bmcs = simulation.create_bare_metal_compute_service(host, {host: (-1, -1)}, "", {}, {})
             running_bmcss.append(bmcs)
 
-        # Create a data structure that keeps track of the compute resources, which
-        # will be used for scheduling
+        # Create a data structure that keeps track of the idle cores of the compute
+        # services as jobs are submitted and complete, which will be used for scheduling
         print(f"Creating a convenient data structure for scheduling...")
-        compute_resources: dict[ComputeService, dict] = {}
-        for bmcs in running_bmcss:
-            # print(f"Getting core counts...")
-            per_host_num_cores = bmcs.get_core_counts()
-            num_cores = per_host_num_cores[list(per_host_num_cores.keys())[0]]
-            # print(f"Getting core flop rates...")
-            per_host_core_speed = bmcs.get_core_flop_rates()
-            core_speed = per_host_core_speed[list(per_host_core_speed.keys())[0]]
-            compute_resources[bmcs] = {"num_idle_cores": num_cores, "core_speed": core_speed}
-        # print(compute_resources)
+        resource_tracker = wrench.scheduling.ResourceTracker(simulation, running_bmcss)
 
         # Import the workflow from JSON
         print(f"Importing the workflow from JSON...")
@@ -172,19 +155,18 @@ def main():
 
         # Create all needed files on the storage service
         print(f"Create all file copies on the storage service...")
-        files = workflow.get_input_files()
-        for f in files:
-            ss.create_file_copy(f)
+        ss.create_file_copies(workflow.get_input_files())
 
 
         # We are now ready to schedule the workflow
         print(f"Starting my main loop!")
-        while not workflow.is_done():
+        ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+        while not done:
             # Perform some scheduling, perhaps
-            schedule_tasks(simulation, workflow.get_ready_tasks(), compute_resources, ss)
+            submissions = schedule_tasks(ready_tasks, resource_tracker, ss)
 
-            # Wait for next event
-            event = simulation.wait_for_next_event()
+            # Create and submit the jobs, wait for next event, and get the new ready tasks
+            event, ready_tasks, done = simulation.step(workflow, submissions)
             if event["event_type"] != "standard_job_completion":
                 print(f"\t- Event: {event}")  # Should make sure it's a job completion
                 raise wrench.WRENCHException("Received an unexpected event")
@@ -192,7 +174,6 @@ def main():
                 completed_job = event["standard_job"]
                 completed_task_name = completed_job.get_tasks()[0].get_name()
                 print(f"Task {completed_task_name} has completed!")
-                compute_resources[event["compute_service"]]["num_idle_cores"] += 1
 
         print(f"Workflow execution completed at time {simulation.get_simulated_time()}!")
 
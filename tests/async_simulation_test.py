@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+import json
+import pathlib
+
+import wrench
+
+
+async def run_simulation(xml_string: str, num_tasks: int) -> float:
+    async with wrench.AsyncSimulation() as simulation:
+        await simulation.start(xml_string, "ControllerHost")
+
+        cs = await simulation.create_bare_metal_compute_service(
+            "BatchHeadHost",
+            {"BatchHost1": (6, 10.0),
+             "BatchHost2": (6, 12.0)},
+            "/scratch",
+            {},
+            {})
+        ss = await simulation.create_simple_storage_service("StorageHost", ["/"])
+
+        assert await cs.supports_standard_jobs(), "CS should support standard jobs"
+        assert (await cs.get_core_counts())["BatchHost1"] == 6, "Invalid core count"
+
+        workflow = await simulation.create_workflow()
+        previous_file = await simulation.add_file("input", 1024)
+        await ss.create_file_copy(previous_file)
+        tasks = []
+        for i in range(0, num_tasks):
+            task = await workflow.add_task(f"task{i}", 10000000000, 1, 1, 0)
+            await task.add_input_file(previous_file)
+            previous_file = await simulation.add_file(f"file{i}", 1024)
+            await task.add_output_file(previous_file)
+            tasks.append(task)
+
+        assert await tasks[0].get_state() == wrench.Task.TaskState.READY, "task0 should be READY"
+        assert await tasks[-1].get_state() == wrench.Task.TaskState.NOT_READY, "The last task should be NOT_READY"
+        assert await tasks[0].get_bottom_level() == num_tasks - 1, "Invalid bottom-level for task0"
+        assert await tasks[0].get_input_files() == [simulation.get_all_files()["input"]], "Invalid input files"
+        assert await previous_file.get_size() == 1024, "Invalid file size"
+        assert await tasks[0].get_flops() == 10000000000 and await tasks[0].get_memory() == 0, "Invalid task specs"
+        tasks[1].flops = tasks[1].min_num_cores = tasks[1].max_num_cores = tasks[1].memory = None
+        assert [await tasks[1].get_flops(), await tasks[1].get_min_num_cores(), await tasks[1].get_max_num_cores(),
+                await tasks[1].get_memory()] == [10000000000, 1, 1, 0], "Task specs should be obtained from the daemon"
+
+        job = await simulation.create_standard_job(tasks, {simulation.get_all_files()["input"]: ss,
+                                                           previous_file: ss})
+        await cs.submit_standard_job(job)
+
+        # Another coroutine can use the simulation while this one waits for the next event
+        event, _ = await asyncio.gather(simulation.wait_for_next_event(), simulation.get_simulated_time())
+        assert event["event_type"] == "standard_job_completion", "Was expecting a standard job completion event " \
+                                                                 "but instead got a: " + event["event_type"]
+        assert event["standard_job"] == job, "Invalid job in event"
+        assert await workflow.is_done(), "The workflow should be done"
+        assert await ss.lookup_file(previous_file), "The last file should be present in the storage service"
+        bulk_files = await simulation.add_files([("bulk_file1", 10), ("bulk_file2", 10)])
+        await ss.create_file_copies(bulk_files[:1])
+        assert await ss.lookup_files(bulk_files) == [True, False], "Invalid bulk lookup"
+        timings = await workflow.get_task_timings()
+        assert timings.states == [wrench.Task.TaskState.COMPLETED] * num_tasks, "Invalid task states in timings"
+        assert timings.end_dates[-1] == await tasks[-1].get_end_date(), "Invalid end date in timings"
+
+        cj = await simulation.create_compound_job("")
+        sa = await cj.add_sleep_action("", 10.0)
+        await cs.submit_compound_job(cj)
+        events = [event async for event in simulation.events()]
+        assert [e["event_type"] for e in events] == ["compound_job_completion"], "Was expecting a compound job " \
+                                                                                 "completion event"
+        assert await sa.get_state() == wrench.Action.ActionState.COMPLETED, "The sleep action should be COMPLETED"
+
+        step_workflow = await simulation.create_workflow()
+        step_task = await step_workflow.add_task("step_task", 10000000000, 1, 1, 0)
+        event, ready_tasks, done = await simulation.step(step_workflow, [([step_task], {}, cs)])
+        assert event["standard_job"].get_tasks() == [step_task], "Was expecting the step task's job to complete"
+        assert ready_tasks == [] and done, "The step workflow should be done"
+        schedule_workflow = await simulation.create_workflow()
+        schedule_task = await schedule_workflow.add_task("schedule_task", 10000000000, 1, 1, 0)
+        events, timings = await simulation.run_schedule(schedule_workflow,
+                                                        wrench.StaticSchedule([(schedule_task, cs, {})]))
+        assert [e["standard_job"].get_tasks() for e in events] == [[schedule_task]], "Invalid schedule events"
+        assert timings.states == [wrench.Task.TaskState.COMPLETED], "The scheduled task should be COMPLETED"
+
+        builder = wrench.CompoundJobBuilder(simulation, "built_job")
+        builder.add_sleep_action("built_sleep1", 5.0)
+        builder.add_sleep_action("built_sleep2", 5.0)
+        builder.add_action_dependency("built_sleep1", "built_sleep2")
+        built_job = await builder.submit(cs)
+        events = [event async for event in simulation.events()]
+        assert [e["compound_job"] for e in events] == [built_job], "Was expecting a built job completion event"
+        built_sleep1, built_sleep2 = built_job.get_actions()
+        assert await built_sleep1.get_end_date() <= await built_sleep2.get_start_date(), \
+            "The built sleep actions should have run in sequence"
+
+        try:
+            await workflow.add_task("task0", 10.0, 1, 1, 0)
+            raise RuntimeError("Shouldn't be able to add the same task twice")
+        except wrench.WRENCHException as e:
+            pass
+
+        return await simulation.get_simulated_time()
+
+
+async def import_workflows(xml_string: str, json_workflow_file_path: pathlib.Path) -> None:
+    async with wrench.AsyncSimulation() as simulation:
+        await simulation.start(xml_string, "ControllerHost")
+
+        with open(json_workflow_file_path) as f:
+            wfcommons_json_workflow = json.load(f)
+        workflow1 = await simulation.create_workflow_from_json(wfcommons_json_workflow, "2", False, False, False, 3, 3,
+                                                               False, False, False)
+        # Same workflow, streamed from the file
+        workflow2 = await simulation.create_workflow_from_json_file(json_workflow_file_path, "2", False, False, False,
+                                                                    3, 3, False, False, False)
+        assert workflow1.tasks and sorted(workflow2.tasks) == sorted(workflow1.tasks), \
+            "Both workflows should have the same tasks"
+        assert sorted(t.get_name() for t in await workflow2.get_ready_tasks()) == \
+               sorted(t.get_name() for t in await workflow1.get_ready_tasks()), \
+            "Both workflows should have the same ready tasks"
+        for name, task in workflow1.tasks.items():
+            assert await task.get_number_of_children() == await workflow2.tasks[name].get_number_of_children(), \
+                f"Both workflows should have the same dependencies for {name}"
+
+
+async def main(xml_string: str, json_workflow_file_path: pathlib.Path) -> None:
+    # Drive several simulations concurrently from the same event loop
+    end_dates = await asyncio.gather(*[run_simulation(xml_string, n) for n in range(2, 7)])
+    for n, end_date in zip(range(2, 7), end_dates):
+        assert end_date >= n, f"Incoherent end date for simulation with {n} tasks: {end_date}"
+    await import_workflows(xml_string, json_workflow_file_path)
+
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+    json_workflow_file_path = pathlib.Path(current_dir / "sample_wfcommons_workflow.json")
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+
+    asyncio.run(main(xml_string, json_workflow_file_path))
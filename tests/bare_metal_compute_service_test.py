@@ -129,6 +129,14 @@ if __name__ == "__main__":
 
     assert workflow.is_done(), "The workflow should be done"
 
+    timings = workflow.get_task_timings()
+    assert timings.names == ["task1", "task2"], "Invalid task names in timings"
+    assert timings.states == [wrench.Task.TaskState.COMPLETED] * 2, "Invalid task states in timings"
+    assert timings.start_dates == [task1.get_start_date(), task2.get_start_date()], "Invalid start dates in timings"
+    assert timings.end_dates == [task1.get_end_date(), task2.get_end_date()], "Invalid end dates in timings"
+    assert workflow.get_task_states() == {"task1": wrench.Task.TaskState.COMPLETED,
+                                          "task2": wrench.Task.TaskState.COMPLETED}, "Invalid task states"
+
     # Trying a bogus job
     workflow1 = simulation.create_workflow()
     t1 = workflow1.add_task("task", 10.0, 1, 2, 0)
@@ -165,4 +173,114 @@ if __name__ == "__main__":
 
     assert t4.get_state() == wrench.Task.TaskState.READY, "t4's state should be READY"
 
+    # Jobs that complete while the simulation sleeps
+    workflow5 = simulation.create_workflow()
+    t5 = workflow5.add_task("task5", 10000000000, 1, 1, 0)
+    t6 = workflow5.add_task("task6", 10000000000, 1, 1, 0)
+    t7 = workflow5.add_task("task7", 10000000000, 1, 1, 0)
+    file5 = simulation.add_file("file5", 10)
+    file6 = simulation.add_file("file6", 10)
+    t5.add_output_file(file5)
+    t6.add_output_file(file6)
+    t7.add_input_file(file5)
+    t7.add_input_file(file6)
+    assert workflow5.get_ready_tasks() == [t5, t6], "t5 and t6 should be ready"
+    assert t5.get_bottom_level() == 1, "t5 should have bottom-level 1"
+    job5 = simulation.create_standard_job([t5], {})
+    job6 = simulation.create_standard_job([t6], {})
+    cs.submit_standard_job(job5)
+    cs.submit_standard_job(job6)
+    assert workflow5.get_ready_tasks() == [], "No task should be ready"
+
+    simulation.sleep(10)
+    assert workflow5.get_ready_tasks() == [t7], "t7 should be ready"
+    assert t6.get_state() == wrench.Task.TaskState.COMPLETED, "t6's state should be COMPLETED"
+    events = simulation.get_events()
+    assert {e["standard_job"] for e in events} == {job5, job6}, "Was expecting two standard job completion events"
+
+    # Scheduling loop driven by simulation events
+    workflow6 = simulation.create_workflow()
+    for i in range(0, 3):
+        workflow6.add_task(f"task{i}", 10000000000, 1, 1, 0)
+    cs.submit_standard_job(simulation.create_standard_job([workflow6.get_tasks()["task0"]], {}))
+    num_events = 0
+    for event in simulation.events():
+        assert event["event_type"] == "standard_job_completion", "Was expecting a standard job completion event"
+        num_events += 1
+        ready_tasks = workflow6.get_ready_tasks()
+        if ready_tasks:
+            cs.submit_standard_job(simulation.create_standard_job([ready_tasks[0]], {}))
+    assert num_events == 3, "Was expecting three events"
+    assert workflow6.is_done(), "workflow6 should be done"
+
+    # Scheduling loop driven by steps, without any query about the workflow
+    workflow7 = simulation.create_workflow()
+    t8 = workflow7.add_task("task8", 10000000000, 1, 1, 0)
+    t9 = workflow7.add_task("task9", 10000000000, 1, 1, 0)
+    t10 = workflow7.add_task("task10", 30000000000, 1, 1, 0)
+    t11 = workflow7.add_task("task11", 10000000000, 1, 1, 0)
+    file8, file9, file10 = simulation.add_files([("file8", 10), ("file9", 10), ("file10", 10)])
+    t8.add_output_file(file8)
+    t8.add_output_file(file9)
+    t9.add_input_file(file8)
+    t9.add_output_file(file10)
+    t10.add_input_file(file9)
+    t11.add_input_file(file10)
+    step_routes = []
+    simulation.add_request_hook(lambda method, route, *_: step_routes.append(route))
+    ready_tasks, done = workflow7.get_ready_tasks(), workflow7.is_done()
+    assert ready_tasks == [t8] and not done, "t8 should be ready"
+    completed_tasks = []
+    while not done:
+        event, ready_tasks, done = simulation.step(workflow7, [([task], {file8: ss, file9: ss, file10: ss}, cs)
+                                                               for task in ready_tasks])
+        assert event["event_type"] == "standard_job_completion", "Was expecting a standard job completion event"
+        completed_tasks += event["standard_job"].get_tasks()
+    assert completed_tasks == [t8, t9, t11, t10], f"Unexpected completion order {completed_tasks}"
+    assert not [r for r in step_routes if r.startswith("workflows/{}/") and "createStandardJob" not in r], \
+        f"The workflow should not have been queried {step_routes}"
+    try:
+        simulation.step(workflow7, [([t8], {}, cs)])
+        raise AssertionError("Should not be able to submit a completed task")
+    except wrench.WRENCHException:
+        pass
+
+    # Run of a static schedule
+    workflow8 = simulation.create_workflow()
+    t12, t13, t14, t15 = [workflow8.add_task(f"task{i}", 10000000000, 1, 1, 0) for i in range(12, 16)]
+    file12, file13, file14 = simulation.add_files([("file12", 10), ("file13", 10), ("file14", 10)])
+    t12.add_output_file(file12)
+    t13.add_input_file(file12)
+    t14.add_input_file(file12)
+    t13.add_output_file(file13)
+    t14.add_output_file(file14)
+    t15.add_input_file(file13)
+    t15.add_input_file(file14)
+    locations = {file12: ss, file13: ss, file14: ss}
+    schedule = wrench.StaticSchedule([(t12, cs, locations), (t13, cs, locations)])
+    schedule.add_task(t14, cs, locations)
+    schedule.add_task(t15, cs, locations)
+    str(schedule)
+    repr(schedule)
+    try:
+        schedule.add_task(t15, cs, locations)
+        raise AssertionError("Should not be able to schedule a task twice")
+    except wrench.WRENCHException:
+        pass
+    events, timings = simulation.run_schedule(workflow8, schedule)
+    assert len(schedule) == 4 and len(events) == 4, "Was expecting one event per task"
+    assert [e["standard_job"].get_tasks()[0] for e in events[::3]] == [t12, t15], "Invalid events"
+    assert timings.states == [wrench.Task.TaskState.COMPLETED] * 4, "All tasks should be COMPLETED"
+    assert timings.start_dates[3] >= max(timings.end_dates[1:3]), "task15 should start after its parents"
+
+    # A task that is never submitted
+    workflow9 = simulation.create_workflow()
+    t16, t17 = [workflow9.add_task(f"task{i}", 10000000000, 1, 1, 0) for i in range(16, 18)]
+    try:
+        simulation.run_schedule(workflow9, wrench.StaticSchedule([(t17, cs, {})]))
+        raise AssertionError("Should not be able to run an incomplete schedule")
+    except wrench.WRENCHException:
+        pass
+    assert t16.get_state() == wrench.Task.TaskState.READY, "task16 should not have been submitted"
+
     simulation.terminate()
@@ -68,6 +68,12 @@ if __name__ == "__main__":
 
     assert fwa.get_state() == wrench.Action.ActionState.READY, "FileWriteAction1 should be in the READY state"
 
+    # States are not queried again until the simulation advances
+    routes = []
+    simulation.add_request_hook(lambda method, route, *_: routes.append(route))
+    assert fwa.get_state() == wrench.Action.ActionState.READY, "FileWriteAction1 should be in the READY state"
+    assert routes == [], f"Unexpected requests {routes}"
+
     assert fwa.get_file() == file1, "FileWriteAction1 doesn't have the correct file"
     assert fwa.get_file_location() == ss1, "FileWriteAction1 doesn't have the correct file location"
     assert not fwa.uses_scratch(), "FileWriteAction1 doesn't have the correct use of scratch"
@@ -165,6 +171,49 @@ if __name__ == "__main__":
     assert not ca.get_failure_cause(), "ComputeAction1 should have a None failure cause"
 
     assert ca.get_state() == wrench.Action.ActionState.COMPLETED, "ComputeAction1 should be in the COMPLETED state"
+    assert fwa.get_state() == wrench.Action.ActionState.COMPLETED, "FileWriteAction1 should be in the COMPLETED state"
+
+    # Build a job with all its actions and dependencies at once
+    file3 = simulation.add_file("file3", 1024)
+    ss1.create_file_copy(file3)
+    built_routes = []
+    simulation.add_request_hook(lambda method, route, *_: built_routes.append(route))
+    builder = wrench.CompoundJobBuilder(simulation, "BuiltJob")
+    builder.add_file_copy_action("BuiltCopy", file3, ss1, ss2)
+    builder.add_compute_action("BuiltCompute", 100.0, 0, 2, 1, ("AMDAHL", 0.8))
+    builder.add_sleep_action("BuiltSleep", 1.0)
+    builder.add_action_dependency("BuiltCopy", "BuiltCompute")
+    builder.add_action_dependency("BuiltCompute", "BuiltSleep")
+    str(builder)
+    repr(builder)
+    for bogus in [lambda: builder.add_sleep_action("BuiltSleep", 1.0),
+                  lambda: builder.add_sleep_action("", 1.0),
+                  lambda: builder.add_action_dependency("BuiltSleep", "BogusAction")]:
+        try:
+            bogus()
+            raise AssertionError("Should not be able to add a duplicate, unnamed or unknown action")
+        except wrench.WRENCHException:
+            pass
+    built_job = builder.submit(bmcs)
+    assert len(built_routes) == 7, f"Unexpected routes {built_routes}"
+    assert built_job.get_name() == "BuiltJob", "The built job doesn't have the correct name"
+    assert [a.get_name() for a in built_job.get_actions()] == ["BuiltCopy", "BuiltCompute", "BuiltSleep"], \
+        "The built job doesn't have the correct actions"
+    built_copy, built_compute, built_sleep = built_job.get_actions()
+    assert isinstance(built_copy, wrench.FileCopyAction) and built_copy.get_file() == file3, \
+        "The built copy action is invalid"
+    assert built_compute.get_parallel_model() == ("AMDAHL", 0.8), "The built compute action is invalid"
+    assert built_sleep.get_sleep_time() == 1.0, "The built sleep action is invalid"
+    event = simulation.wait_for_next_event()
+    assert event["event_type"] == "compound_job_completion", f"Received an unexpected event: {event['event_type']}"
+    assert event["compound_job"] == built_job, "Invalid job in event"
+    assert built_copy.get_end_date() <= built_compute.get_start_date() and \
+           built_compute.get_end_date() <= built_sleep.get_start_date(), "Built actions should have run in sequence"
+    try:
+        builder.build()
+        raise AssertionError("Should not be able to build a job twice")
+    except wrench.WRENCHException:
+        pass
 
     # Let's create a job that will fail
     cj3 = simulation.create_compound_job("")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import pathlib
+import sys
+
+import wrench
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+
+    # The mock daemon stands in for the wrench-daemon binary, which may not be installed
+    with wrench.Daemon([sys.executable, "-m", "wrench.mock_daemon"]) as daemon:
+        str(daemon)
+        repr(daemon)
+        assert daemon.is_healthy(), "The daemon should accept connections"
+
+        for _ in range(0, 2):
+            simulation = daemon.simulation()
+            simulation.start(xml_string, "ControllerHost")
+            assert simulation.get_simulated_time() == 0, "The simulation time should be zero"
+            simulation.terminate()
+        assert daemon.num_restarts == 0, "The daemon should have been reused"
+
+        # A dead daemon is restarted on the same port
+        port = daemon.daemon_port
+        daemon.process.kill()
+        daemon.process.wait()
+        assert not daemon.is_running(), "The daemon should not be running"
+        simulation = daemon.simulation()
+        assert daemon.num_restarts == 1 and daemon.daemon_port == port, "The daemon should have been restarted"
+        simulation.start(xml_string, "ControllerHost")
+        simulation.terminate()
+
+    assert not daemon.is_running(), "The daemon should have been stopped"
+    try:
+        daemon.simulation()
+        raise AssertionError("Should not be able to get a simulation from a stopped daemon")
+    except wrench.WRENCHException:
+        pass
+
+    try:
+        wrench.Daemon(["/bogus/wrench-daemon"]).start()
+        raise AssertionError("Should not be able to launch a bogus daemon")
+    except wrench.WRENCHException:
+        pass
+
+    try:
+        wrench.Daemon([sys.executable, "-c", "pass"]).start()
+        raise AssertionError("Should not be able to launch a daemon that exits right away")
+    except wrench.WRENCHException:
+        pass
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+import pathlib
+import sys
+import tempfile
+
+import wrench
+from wrench.mock_daemon import MockDaemon
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+
+    # In-process mock daemon, on any available port
+    with MockDaemon() as daemon:
+        simulation = wrench.Simulation(daemon_port=daemon.daemon_port)
+        try:
+            simulation.start(xml_string, "ControllerHost")
+        except wrench.WRENCHException as e:
+            sys.stderr.write(f"Error: {e}\n")
+            exit(1)
+
+        assert simulation.get_simulated_time() == 0, "The simulation time should be zero"
+
+        cs = simulation.create_bare_metal_compute_service("BatchHeadHost",
+                                                          {"BatchHost1": (6, 10.0), "BatchHost2": (6, 12.0)},
+                                                          "/scratch", {}, {})
+        ss = simulation.create_simple_storage_service("ControllerHost", ["/"])
+        workflow = simulation.create_workflow()
+        task1 = workflow.add_task("task1", 100.0, 1, 1, 0)
+        task2 = workflow.add_task("task2", 100.0, 1, 1, 0)
+        file = simulation.add_file("file", 1024)
+        task1.add_output_file(file)
+        task2.add_input_file(file)
+        assert workflow.get_ready_tasks() == [task1], "Only task1 should be ready"
+
+        job = simulation.create_standard_job([task1, task2], {file: ss})
+        cs.submit_standard_job(job)
+        event = simulation.wait_for_next_event()
+        assert event["event_type"] == "standard_job_completion", "The job should have completed"
+        assert simulation.get_simulated_time() > 0, "The simulation time should have advanced"
+        assert workflow.is_done(), "The workflow should be done"
+
+        # A bogus request fails as with the real daemon
+        try:
+            workflow.add_task("task1", 100.0, 1, 1, 0)
+            raise AssertionError("Should not be able to add a task with a duplicate name")
+        except wrench.WRENCHException:
+            pass
+
+        simulation.terminate()
+
+    # Mock daemon on Unix domain sockets
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket_path = f"{tmp_dir}/wrench.sock"
+        with MockDaemon(socket_path=socket_path):
+            simulation = wrench.Simulation(daemon_url=f"unix://{socket_path}")
+            simulation.start(xml_string, "ControllerHost")
+            assert simulation.socket_path != socket_path, "The simulation should be served on its own socket"
+            cs = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0)},
+                                                              "/scratch", {}, {})
+            workflow = simulation.create_workflow()
+            with simulation.batch():
+                tasks = [workflow.add_task(f"task{i}", 100.0, 1, 1, 0) for i in range(0, 10)]
+            cs.submit_standard_job(simulation.create_standard_job(tasks, {}))
+            event = simulation.wait_for_next_event()
+            assert event["event_type"] == "standard_job_completion", "The job should have completed"
+            assert workflow.is_done(), "The workflow should be done"
+            simulation.terminate()
+
+            async def run_async_simulation() -> float:
+                async with wrench.AsyncSimulation(daemon_url=f"unix://{socket_path}") as async_simulation:
+                    await async_simulation.start(xml_string, "ControllerHost")
+                    await async_simulation.sleep(10)
+                    return await async_simulation.get_simulated_time()
+
+            assert asyncio.run(run_async_simulation()) == 10, "The simulation time should have advanced"
+
+    try:
+        wrench.Simulation(daemon_url="ftp://localhost:8101")
+        raise AssertionError("Should not be able to use an ftp URL")
+    except wrench.WRENCHException:
+        pass
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+import pathlib
+import sys
+
+import wrench
+
+
+def create_fork_join_workflow(simulation: wrench.Simulation, prefix: str) -> wrench.Workflow:
+    workflow = simulation.create_workflow()
+    entry = workflow.add_task(f"{prefix}_entry", 10000000000, 1, 1, 0)
+    exit_task = workflow.add_task(f"{prefix}_exit", 10000000000, 1, 1, 0)
+    entry_file = simulation.add_file(f"{prefix}_entry_file", 10)
+    entry.add_output_file(entry_file)
+    for i in range(0, 10):
+        task = workflow.add_task(f"{prefix}_task{i}", (i + 1) * 10000000000, 1, 1, 0)
+        file = simulation.add_file(f"{prefix}_file{i}", 10)
+        task.add_input_file(entry_file)
+        task.add_output_file(file)
+        exit_task.add_input_file(file)
+    return workflow
+
+
+async def run_async_tracker(xml_string: str) -> None:
+    async with wrench.AsyncSimulation() as simulation:
+        await simulation.start(xml_string, "ControllerHost")
+        cs = await simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0)},
+                                                                "/scratch", {}, {})
+        tracker = wrench.scheduling.ResourceTracker(
+            simulation, core_specs=await wrench.scheduling.ComputeResources.get_core_specs([cs]))
+        assert tracker.num_cores == {cs: 6} and tracker.core_flop_rates[cs] > 0, "Invalid core specifications"
+        job_events = []
+        simulation.add_job_listener(lambda event_type, job, _: job_events.append((event_type, job)))
+        workflow = await simulation.create_workflow()
+        task = await workflow.add_task("tracked_task", 10000000000, 2, 2, 0)
+        task.min_num_cores = task.memory = None
+        job = await simulation.create_standard_job([task], {})
+        await cs.submit_standard_job(job)
+        assert tracker.get_num_busy_cores(cs) == 2, "The job should use the task's cores"
+        await simulation.wait_for_next_event()
+        assert job_events == [("standard_job_submission", job), ("standard_job_completion", job)], \
+            f"Invalid job events {job_events}"
+        assert tracker.get_num_idle_cores(cs) == 6, "All cores should be idle"
+        tracker.close()
+
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+
+    simulation = wrench.Simulation()
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+    try:
+        simulation.start(xml_string, "ControllerHost")
+    except wrench.WRENCHException as e:
+        sys.stderr.write(f"Error: {e}\n")
+        exit(1)
+
+    cs1 = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0)}, "/scratch", {}, {})
+    cs2 = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost2": (2, 10.0)}, "/scratch", {}, {})
+    ss = simulation.create_simple_storage_service("StorageHost", ["/"])
+
+    # Index of idle cores
+    resources = wrench.scheduling.ComputeResources([cs1, cs2])
+    repr(resources)
+    assert resources.num_cores == {cs1: 6, cs2: 2}, f"Invalid core counts {resources.num_cores}"
+    assert resources.get_max_num_idle_cores() == 6, "All cores should be idle"
+    assert resources.get_fastest(3) == cs1, "cs1 is the only compute service with 3 idle cores"
+    resources.acquire(cs1, 5)
+    assert resources.get_fastest(2) == cs2, "cs2 is the only compute service with 2 idle cores"
+    assert resources.get_fastest(3) is None, "No compute service has 3 idle cores"
+    try:
+        resources.acquire(cs1, 2)
+        raise AssertionError("Should not be able to acquire more cores than are idle")
+    except wrench.WRENCHException:
+        pass
+    resources.release(cs1, 5)
+    assert resources.get_num_idle_cores(cs1) == 6, "All cores of cs1 should be idle"
+
+    # Index of idle cores and RAM
+    resources = wrench.scheduling.ComputeResources([cs1, cs2], {cs1: 1000})
+    assert resources.get_fastest(1, 2000) == cs2, "cs2 is the only compute service with unlimited RAM"
+    resources.acquire(cs2, 2)
+    assert resources.get_fastest(1, 2000) is None, "No compute service has both 1 idle core and 2000 bytes of RAM"
+    resources.acquire(cs1, 1, 600)
+    assert resources.get_idle_ram(cs1) == 400 and resources.get_fastest(1, 500) is None, "Invalid idle RAM"
+
+    # Index of idle cores kept up-to-date as jobs are submitted and complete
+    tracker = wrench.scheduling.ResourceTracker(simulation, [cs1, cs2], {cs1: 1000})
+    repr(tracker)
+    job_events = []
+    simulation.add_job_listener(lambda event_type, job, cs: job_events.append((event_type, job, cs)))
+    workflow = simulation.create_workflow()
+    tasks = [workflow.add_task(f"tracked_task{i}", 10000000000 * (i + 1), 2, 2, 500) for i in range(0, 4)]
+    assert tracker.get_fastest(2) == cs1, "cs1 should come first"
+    tracker.acquire(cs1, 2, 500)
+    tracker.acquire(cs1, 2, 500)
+    assert tracker.get_num_idle_cores(cs1) == 2 and tracker.get_idle_ram(cs1) == 0, "Cores should be reserved"
+    assert tracker.get_fastest(2, 500) == cs2, "cs1 does not have enough idle RAM"
+    tracker.acquire(cs2, 2)
+    event, ready_tasks, done = simulation.step(workflow, [([tasks[0]], {}, cs1), ([tasks[1]], {}, cs1),
+                                                          ([tasks[2]], {}, cs2)])
+    assert [e[0] for e in job_events[:3]] == ["standard_job_submission"] * 3, "Invalid job events"
+    assert job_events[3][0] == "standard_job_completion" and job_events[3][1] == event["standard_job"], \
+        "The listener should be called with the first completion"
+    assert tracker.get_num_busy_cores(cs1) == 2, f"Invalid number of busy cores {tracker.get_num_busy_cores(cs1)}"
+    assert tracker.get_num_idle_cores(cs1) == 4 and tracker.get_idle_ram(cs1) == 500, "task0 should have completed"
+    # Oversubscription and cancellation of reservations
+    tasks[3].min_num_cores = tasks[3].memory = None
+    job = simulation.create_standard_job([tasks[3]], {})
+    cs2.submit_standard_job(job)
+    assert tracker.get_num_busy_cores(cs2) == 4 and tracker.get_num_idle_cores(cs2) == 0, "cs2 is oversubscribed"
+    tracker.acquire(cs1, 1)
+    tracker.release(cs1, 1)
+    assert tracker.get_num_idle_cores(cs1) == 4, "The reservation should have been cancelled"
+    while not workflow.is_done():
+        simulation.wait_for_next_event()
+    assert tracker.get_num_idle_cores(cs1) == 6 and tracker.get_num_idle_cores(cs2) == 2, "All cores should be idle"
+    tracker.close()
+    try:
+        tracker.close()
+        raise AssertionError("Should not be able to remove a job listener twice")
+    except wrench.WRENCHException:
+        pass
+
+    # Each scheduler runs a workflow to completion
+    for scheduler_class in [wrench.scheduling.FCFSScheduler, wrench.scheduling.MinMinScheduler,
+                            wrench.scheduling.MaxMinScheduler, wrench.scheduling.HEFTScheduler]:
+        scheduler = scheduler_class(simulation, [cs1, cs2], ss)
+        repr(scheduler)
+        workflow = create_fork_join_workflow(simulation, scheduler_class.__name__)
+        events, timings = scheduler.run(workflow)
+        assert len(events) == 12, f"{scheduler_class.__name__}: was expecting one event per task, got {len(events)}"
+        assert all(e["event_type"] == "standard_job_completion" for e in events), "All jobs should have completed"
+        assert timings.states == [wrench.Task.TaskState.COMPLETED] * 12, "All tasks should be COMPLETED"
+        assert timings.start_dates[1] >= max(timings.end_dates[0:1] + timings.end_dates[2:]), \
+            "The exit task should start last"
+
+    # Priorities of the list schedulers
+    workflow = create_fork_join_workflow(simulation, "priorities")
+    tasks = [workflow.tasks[f"priorities_task{i}"] for i in range(0, 10)]
+    for scheduler_class, expected_tasks in [(wrench.scheduling.MinMinScheduler, tasks[5:] + tasks[0:1]),
+                                            (wrench.scheduling.MaxMinScheduler, tasks[5:] + tasks[4:5])]:
+        scheduler = scheduler_class(simulation, [cs1], ss)
+        submissions = scheduler.schedule(tasks[5:])
+        submissions += scheduler.schedule(tasks)
+        assert len(submissions) == 6 and scheduler.get_num_queued_tasks() == 4, "cs1 has 6 cores"
+        assert sorted([s[0][0] for s in submissions], key=tasks.index) == sorted(expected_tasks, key=tasks.index), \
+            f"{scheduler_class.__name__}: unexpected submissions"
+    scheduler = wrench.scheduling.FCFSScheduler(simulation, [cs1], ss)
+    submissions = scheduler.schedule(tasks[3:]) + scheduler.schedule(tasks)
+    assert [s[0][0] for s in submissions] == tasks[3:9], "Tasks should be scheduled in order of arrival"
+    scheduler = wrench.scheduling.MinMinScheduler(simulation, [cs1], ss)
+    submissions = scheduler.schedule(tasks)
+    assert [s[0][0] for s in submissions] == tasks[0:6], "Shortest tasks should be scheduled first"
+    # Tasks that need more cores than are idle stay queued, without blocking the others
+    wide_task = simulation.create_workflow().add_task("wide_task", 10000000000, 4, 4, 0)
+    scheduler = wrench.scheduling.FCFSScheduler(simulation, [cs1], ss)
+    submissions = scheduler.schedule(tasks[0:3] + [wide_task] + tasks[3:])
+    assert [s[0][0] for s in submissions] == tasks[0:3] + tasks[3:6], "The wide task should not fit"
+    assert scheduler.get_num_queued_tasks() == 5, "The wide task and 4 tasks should be queued"
+
+    # HEFT
+    scheduler = wrench.scheduling.HEFTScheduler(simulation, [cs1, cs2], ss)
+    ranks = scheduler.get_upward_ranks(workflow)
+    assert list(ranks)[0] == "priorities_entry", "The entry task should come first in topological order"
+    assert ranks["priorities_entry"] == 1 + 10 + 1, f"Invalid upward rank {ranks['priorities_entry']}"
+    schedule = scheduler.plan(workflow)
+    assert len(schedule) == 12, "All tasks should be in the schedule"
+    assert schedule.entries[1][0] == tasks[9], "The task with the longest path should come first"
+
+    # Subclasses must define the priority of tasks
+    try:
+        wrench.scheduling.Scheduler(simulation, [cs1], ss)
+        raise AssertionError("Should not be able to instantiate a Scheduler")
+    except TypeError:
+        pass
+
+    # Tasks that do not fit on any compute service
+    workflow = simulation.create_workflow()
+    workflow.add_task("too_large", 10000000000, 7, 7, 0)
+    for scheduler_class in [wrench.scheduling.FCFSScheduler, wrench.scheduling.HEFTScheduler]:
+        try:
+            scheduler_class(simulation, [cs1, cs2], ss).run(workflow)
+            raise AssertionError("Should not be able to run a task that needs 7 cores")
+        except wrench.WRENCHException:
+            pass
+
+    simulation.terminate()
+
+    # The index can also be kept up-to-date by an AsyncSimulation
+    asyncio.run(run_async_tracker(xml_string))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import pathlib
+
+import wrench
+
+
+def run_chain(simulation: wrench.Simulation, xml_string: str, num_tasks: int) -> float:
+    simulation.start(xml_string, "ControllerHost")
+    cs = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0)}, "/scratch", {}, {})
+    workflow = simulation.create_workflow()
+    previous_task = None
+    for i in range(0, num_tasks):
+        task = workflow.add_task(f"task{i}", 10000000000, 1, 1, 0)
+        if previous_task is not None:
+            file = simulation.add_file(f"file{i}", 0)
+            previous_task.add_output_file(file)
+            task.add_input_file(file)
+        previous_task = task
+    ss = simulation.create_simple_storage_service("StorageHost", ["/"])
+    job = simulation.create_standard_job(list(workflow.get_tasks().values()),
+                                         {file: ss for file in simulation.get_all_files().values()})
+    cs.submit_standard_job(job)
+    event = simulation.wait_for_next_event()
+    assert event["event_type"] == "standard_job_completion", f"Received an unexpected event: {event['event_type']}"
+    return simulation.get_simulated_time()
+
+
+def fail(simulation: wrench.Simulation) -> None:
+    simulation.start("<bogus/>", "ControllerHost")
+
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+
+    with wrench.SimulationPool(num_workers=2, daemon_ports=[8101]) as pool:
+        str(pool)
+        repr(pool)
+        makespans = pool.map(run_chain, [(xml_string, num_tasks) for num_tasks in range(1, 5)])
+        assert all(m1 < m2 for m1, m2 in zip(makespans, makespans[1:])), f"Unexpected makespans {makespans}"
+
+        # Simulations can also be driven from the calling process
+        assert run_chain(pool.simulation(), xml_string, 1) == makespans[0], "Simulations should be deterministic"
+
+        try:
+            pool.submit(fail).result()
+            raise AssertionError("Should not be able to start a simulation on a bogus platform")
+        except wrench.WRENCHException:
+            pass
+
+    try:
+        pool.simulation()
+        raise AssertionError("Should not be able to get a simulation from a stopped pool")
+    except wrench.WRENCHException:
+        pass
+
+    try:
+        wrench.SimulationPool(num_daemons=1, daemon_command=["/bogus/wrench-daemon"]).start()
+        raise AssertionError("Should not be able to launch a bogus daemon")
+    except wrench.WRENCHException:
+        pass
@@ -45,6 +45,23 @@ if __name__ == "__main__":
     ss.lookup_file(file1)
     ss.lookup_file(file2)
 
+    # Bulk file creation and placement
+    routes = []
+    simulation.add_request_hook(lambda method, route, *_: routes.append(route))
+    bulk_files = simulation.add_files([(f"bulk_file{i}", 10) for i in range(0, 100)])
+    assert [f.get_name() for f in bulk_files] == [f"bulk_file{i}" for i in range(0, 100)], "Invalid bulk files"
+    assert all(simulation.get_all_files()[f.get_name()] is f for f in bulk_files), "Bulk files should be registered"
+    ss.create_file_copies(bulk_files[::2])
+    assert ss.lookup_files(bulk_files[:4]) == [True, False, True, False], "Invalid bulk lookup"
+    assert ss.lookup_files([file1, file2]) == [True, False], "Invalid bulk lookup"
+    assert simulation.add_files([]) == [] and ss.lookup_files([]) == [], "Empty bulk requests should be no-ops"
+    assert len(routes) == 100 + 50 + 4 + 2, f"Unexpected number of requests {len(routes)}"
+    try:
+        ss.create_file_copies([bulk_files[0], file2])
+        raise wrench.WRENCHException("Shouldn't be able to store big file on storage service")
+    except wrench.WRENCHException as e:
+        pass
+
     try:
         file2._name = "BOGUS"  # Really horrible
         ss.lookup_file(file2)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+import pathlib
+import socket
+import tempfile
+import threading
+from typing import List, Tuple
+
+import wrench
+from wrench.async_connection_pool import AsyncConnectionPool
+from wrench.mock_daemon import MockDaemon
+
+
+def run_chain(simulation: wrench.Simulation, xml_string: str, json_workflow_file_path: pathlib.Path) -> float:
+    simulation.start(xml_string, "ControllerHost")
+    routes = []
+    simulation.add_request_hook(lambda method, route, *_: routes.append(route))
+    cs = simulation.create_bare_metal_compute_service("BatchHeadHost", {"BatchHost1": (6, 10.0)}, "/scratch", {}, {})
+    ss = simulation.create_simple_storage_service("StorageHost", ["/"])
+    workflow = simulation.create_workflow()
+    with simulation.batch():
+        file = simulation.add_file("file", 1024)
+        task1 = workflow.add_task("task1", 10000000000, 1, 1, 0)
+        task2 = workflow.add_task("task2", 10000000000, 1, 1, 0)
+        task1.add_output_file(file)
+        task2.add_input_file(file)
+    assert "addFile" in routes and "workflows/{}/createTask" in routes, f"Unexpected routes {routes}"
+    job = simulation.create_standard_job([task1, task2], {file: ss})
+    cs.submit_standard_job(job)
+    event = simulation.wait_for_next_event()
+    assert event["event_type"] == "standard_job_completion", f"Received an unexpected event: {event['event_type']}"
+    assert task2.get_state() == wrench.Task.TaskState.COMPLETED, "task2 should be completed"
+
+    # Streamed upload and download of a workflow import
+    imported_workflow = simulation.create_workflow_from_json_file(json_workflow_file_path, "2", False, False, False,
+                                                                  3, 3, False, False, False)
+    assert imported_workflow.tasks, "The imported workflow should have tasks"
+
+    try:
+        workflow.add_task("task1", 1, 1, 1, 0)
+        raise AssertionError("Should not be able to add a task with a duplicate name")
+    except wrench.WRENCHException:
+        pass
+    return simulation.get_simulated_time()
+
+
+def serve_pipelined(listener: socket.socket, plans: List[Tuple[int, str]], received: List[str]) -> None:
+    """
+    Accept one connection per (number of answers, mode) plan, answer the first requests of the connection, and then
+    either stall until the client gives up (as if the next requests were being processed), answer the next request
+    partially and close the connection ("truncate"), or close the connection before reading the next request
+    ("close"), and record the paths of the requests that may have been processed
+    """
+    listener.settimeout(3)
+    for num_answers, mode in plans:
+        try:
+            connection, _ = listener.accept()
+        except socket.timeout:
+            return
+        buffer = b""
+        num_requests = 0
+        while True:
+            data = connection.recv(1 << 16)
+            if not data:
+                break
+            buffer += data
+            while b"\r\n\r\n" in buffer:
+                head, rest = buffer.split(b"\r\n\r\n", 1)
+                length = int([line for line in head.split(b"\r\n")
+                              if line.lower().startswith(b"content-length:")][0].split(b":")[1])
+                if len(rest) < length:
+                    break
+                buffer = rest[length:]
+                num_requests += 1
+                if num_requests > num_answers and mode == "close":
+                    break
+                received.append(head.split(b" ")[1].decode())
+                if num_requests > num_answers and mode == "stall":
+                    continue
+                body = b'{"wrench_api_request_success": true}'
+                answer = (b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                          b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+                if num_requests > num_answers:
+                    connection.sendall(answer[:-10])
+                    break
+                connection.sendall(answer)
+            if num_requests > num_answers and mode != "stall":
+                break
+        connection.close()
+
+
+def run_pipelined(plans: List[Tuple[int, str]], num_requests: int, pipelined: bool = True) -> Tuple[List[str], bool]:
+    """
+    Send pipelined POST requests (or POST requests one after the other) to a server that behaves according to plans
+    (see serve_pipelined())
+    """
+    listener = socket.create_server(("localhost", 0))
+    received = []
+    server = threading.Thread(target=serve_pipelined, args=(listener, plans, received), daemon=True)
+    server.start()
+    transport = wrench.HTTPClientTransport(timeout=(5, 0.5))
+    url = f"http://localhost:{listener.getsockname()[1]}"
+    try:
+        if pipelined:
+            answers = transport.request_many([("POST", f"{url}/createTask{i}", {}) for i in range(num_requests)])
+        else:
+            answers = [transport.request("POST", f"{url}/createTask{i}", {}) for i in range(num_requests)]
+        failed = False
+        assert len(answers) == num_requests, "All requests should have been answered"
+    except wrench.WRENCHException:
+        failed = True
+    server.join(5)
+    listener.close()
+    return received, failed
+
+
+async def run_async_pooled(listener: socket.socket, server: threading.Thread, num_requests: int,
+                           long_poll: bool = False) -> Tuple[bool, bool]:
+    """
+    Send POST requests one after the other over the AsyncSimulation's default transport, the last one being
+    cancelled if it is a long poll, and return whether a request failed and whether the connection was closed
+    """
+    pool = AsyncConnectionPool(timeout=(5, 0.5))
+    url = f"http://localhost:{listener.getsockname()[1]}"
+    failed = False
+    writers = []
+    try:
+        for i in range(num_requests - 1):
+            await pool.request("POST", f"{url}/createTask{i}", {})
+        writers = [writer for connections in pool.idle_connections.values() for _, writer in connections]
+        if long_poll:
+            task = asyncio.ensure_future(pool.request("POST", f"{url}/createTask{num_requests - 1}", {}, True))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        else:
+            await pool.request("POST", f"{url}/createTask{num_requests - 1}", {})
+    except wrench.WRENCHException:
+        failed = True
+    # The server stops when the connection is closed
+    closed = all(writer.is_closing() for writer in writers)
+    await asyncio.get_running_loop().run_in_executor(None, server.join, 5)
+    await pool.close()
+    return failed, closed
+
+
+def run_async_pipelined(plans: List[Tuple[int, str]], num_requests: int, long_poll: bool = False) \
+        -> Tuple[List[str], bool, bool]:
+    """
+    Send POST requests with an AsyncConnectionPool to a server that behaves according to plans (see
+    serve_pipelined())
+    """
+    listener = socket.create_server(("localhost", 0))
+    received = []
+    server = threading.Thread(target=serve_pipelined, args=(listener, plans, received), daemon=True)
+    server.start()
+    failed, closed = asyncio.run(run_async_pooled(listener, server, num_requests, long_poll))
+    listener.close()
+    return received, failed, closed
+
+
+async def run_async(simulation: wrench.AsyncSimulation, xml_string: str, json_workflow_file_path: pathlib.Path) \
+        -> float:
+    async with simulation:
+        await simulation.start(xml_string, "ControllerHost")
+        imported_workflow = await simulation.create_workflow_from_json_file(json_workflow_file_path, "2", False, False,
+                                                                            False, 3, 3, False, False, False)
+        assert imported_workflow.tasks, "The imported workflow should have tasks"
+        await simulation.sleep(10)
+        return await simulation.get_simulated_time()
+
+
+if __name__ == "__main__":
+
+    current_dir = pathlib.Path(__file__).parent.resolve()
+    platform_file_path = pathlib.Path(current_dir / "sample_platform.xml")
+    json_workflow_file_path = pathlib.Path(current_dir / "sample_wfcommons_workflow.json")
+
+    with open(platform_file_path, "r") as platform_file:
+        xml_string = platform_file.read()
+
+    # All transports behave the same
+    makespans = [
+        run_chain(wrench.Simulation(daemon_port=8101), xml_string, json_workflow_file_path),
+        run_chain(wrench.Simulation(daemon_port=8101, transport=wrench.HTTPClientTransport(timeout=(5, 30))),
+                  xml_string, json_workflow_file_path),
+        run_chain(wrench.Simulation(transport=wrench.InProcessTransport()), xml_string, json_workflow_file_path),
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with MockDaemon(socket_path=f"{tmp_dir}/wrench.sock"):
+            makespans.append(run_chain(wrench.Simulation(daemon_url=f"unix://{tmp_dir}/wrench.sock",
+                                                         transport=wrench.HTTPClientTransport()),
+                                       xml_string, json_workflow_file_path))
+    assert makespans[0] > 0, "The simulated time should have advanced"
+    # The in-process and Unix socket transports go to mock daemons, whose time model may differ from the daemon's
+    assert makespans[2] == makespans[3], f"Unexpected makespans {makespans}"
+    assert makespans[0] == makespans[1], f"Unexpected makespans {makespans}"
+
+    # Several in-process simulations can share a mock daemon
+    daemon = MockDaemon()
+    simulations = [wrench.Simulation(transport=wrench.InProcessTransport(daemon)) for _ in range(0, 2)]
+    for simulation in simulations:
+        simulation.start(xml_string, "ControllerHost")
+    simulations[0].sleep(10)
+    assert [s.get_simulated_time() for s in simulations] == [10, 0], "Simulations should be independent"
+    for simulation in simulations:
+        simulation.terminate()
+
+    # Unanswered pipelined requests are re-sent only if the connection was closed before their answers started
+    received, failed = run_pipelined([(3, "close"), (10, "close")], 8)
+    assert not failed and received == [f"/createTask{i}" for i in range(8)], f"Unexpected requests {received}"
+    # A timeout does not say whether the daemon has processed the request
+    received, failed = run_pipelined([(3, "stall"), (10, "close")], 8)
+    assert failed, "A read timeout should be reported"
+    assert received == [f"/createTask{i}" for i in range(8)], f"No POST should have been sent twice: {received}"
+
+    # The same goes for requests sent one after the other over a reused connection
+    received, failed = run_pipelined([(1, "close"), (10, "close")], 2, pipelined=False)
+    assert not failed and received == ["/createTask0", "/createTask1"], f"Unexpected requests {received}"
+    received, failed = run_pipelined([(1, "truncate"), (10, "close")], 2, pipelined=False)
+    assert failed and received == ["/createTask0", "/createTask1"], f"No POST should have been sent twice: {received}"
+
+    # A connection severed while a streamed answer is decoded is reported as such
+    listener = socket.create_server(("localhost", 0))
+    server = threading.Thread(target=serve_pipelined, args=(listener, [(0, "truncate")], []), daemon=True)
+    server.start()
+    try:
+        wrench.RequestsTransport(timeout=(5, 5)).request(
+            "POST", f"http://localhost:{listener.getsockname()[1]}/createWorkflowFromJSON", {},
+            decode=lambda chunks: b"".join(chunks))
+        raise AssertionError("Should not be able to read a truncated answer")
+    except wrench.WRENCHException:
+        pass
+    server.join(5)
+    listener.close()
+
+    # And with the asynchronous transport
+    received, failed, _ = run_async_pipelined([(1, "close"), (10, "close")], 2)
+    assert not failed and received == ["/createTask0", "/createTask1"], f"Unexpected requests {received}"
+    received, failed, _ = run_async_pipelined([(1, "truncate"), (10, "close")], 2)
+    assert failed and received == ["/createTask0", "/createTask1"], f"No POST should have been sent twice: {received}"
+    # The connection of a cancelled request is closed
+    received, failed, closed = run_async_pipelined([(1, "stall")], 2, long_poll=True)
+    assert not failed and closed, "The connection of the cancelled request should have been closed"
+
+    simulation = wrench.AsyncSimulation(transport=wrench.AsyncInProcessTransport())
+    assert asyncio.run(run_async(simulation, xml_string, json_workflow_file_path)) == 10, "The simulated time should be 10"
+
+    try:
+        wrench.Simulation(daemon_port=1, transport=wrench.HTTPClientTransport()).start(xml_string, "ControllerHost")
+        raise AssertionError("Should not be able to connect to a bogus port")
+    except wrench.WRENCHException:
+        pass
+
+    # A transport must implement request()
+    for transport_class in [wrench.Transport, wrench.AsyncTransport]:
+        try:
+            transport_class()
+            raise AssertionError(f"Should not be able to instantiate {transport_class.__name__}")
+        except TypeError:
+            pass
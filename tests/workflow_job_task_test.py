@@ -46,6 +46,17 @@ if __name__ == "__main__":
         pass
     file3 = simulation.add_file("file3", 10000)
 
+    # Zero-valued attributes are cached like any other
+    empty_file = simulation.add_file("empty_file", 0)
+    empty_task = simulation.create_workflow().add_task("empty_task", 0.0, 1, 1, 0)
+    routes = []
+    simulation.add_request_hook(lambda method, route, *_: routes.append(route))
+    for _ in range(2):
+        assert empty_file.get_size() == 0, "Empty file has an incorrect size"
+        assert empty_task.get_flops() == 0.0, "Empty task has an incorrect flops"
+        assert empty_task.get_memory() == 0, "Empty task has an incorrect memory"
+    assert routes == [], f"Unexpected requests {routes}"
+
     files = simulation.get_all_files()
     assert files[file1.get_name()] == file1, "File1 should be known to the simulation"
     assert files[file2.get_name()] == file2, "File2 should be known to the simulation"
@@ -60,6 +71,7 @@ if __name__ == "__main__":
     assert task1.get_min_num_cores() == 1, "Task1 has an incorrect min num cores"
     assert task1.get_max_num_cores() == 8, "Task1 has an incorrect max num cores"
     assert task1.get_memory() == 1024, "Task1 has an incorrect ram footprint"
+    assert not hasattr(task1, "__dict__") and not hasattr(file1, "__dict__"), "Handles should not have a __dict__"
 
     task1.add_input_file(file1)
     assert file1 in task1.get_input_files(), "File1 should be input to Task1"
@@ -75,6 +87,20 @@ if __name__ == "__main__":
 
     assert workflow.get_input_files() == [file1], "The workflow's input files should only be File1"
 
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        task_table = workflow.get_task_table()
+        assert task_table.get_tasks(task_table.ready_mask()) == [task1], "Only Task1 should be ready in the task table"
+        assert task_table.get_task_with_max("flops") == task2, "Task2 should have the most flops"
+        assert task_table.get_task_with_max("flops", task_table.ready_mask() & task_table.fits_mask(2)) == task1, \
+            "Task1 should be the ready task with the most flops that fits on 2 cores"
+        assert task_table.get_task_with_min("flops", task_table.fits_mask(0)) is None, "No task should fit on 0 cores"
+        assert list(task_table.bottom_levels) == [1, 0], "Invalid bottom-levels in the task table"
+        assert workflow.get_task_table() is task_table, "The task table should be cached"
+
     try:
         job = simulation.create_standard_job([task2], {})
         raise wrench.WRENCHException("Should not be able to create a job with non-completed parents not in job")
@@ -91,6 +91,54 @@ if __name__ == "__main__":
     if len(workflow1.get_ready_tasks()) != 1:
         raise wrench.WRENCHException("There should be 1 ready tasks")
 
+    # Batched workflow construction
+    workflow3 = simulation.create_workflow()
+    with simulation.batch():
+        file4 = simulation.add_file("file4", 100)
+        file5 = simulation.add_file("file5", 100)
+        task3 = workflow3.add_task("task3", 100.0, 1, 1, 0)
+        task4 = workflow3.add_task("task4", 100.0, 1, 1, 0)
+        task3.add_output_file(file4)
+        task4.add_input_file(file4)
+        task4.add_output_file(file5)
+        if "task3" in workflow3.get_tasks():
+            raise wrench.WRENCHException("task3 should not be registered before the batch is sent")
+
+    if simulation.get_all_files()["file5"] != file5:
+        raise wrench.WRENCHException("file5 should have been added to the simulation")
+    if workflow3.get_ready_tasks() != [task3]:
+        raise wrench.WRENCHException("The list of ready tasks is invalid (should be [task3])")
+    assert task3.get_bottom_level() == 1, "Task3 should have bottom-level 1"
+
+    try:
+        with simulation.batch():
+            workflow3.add_task("task5", 100.0, 1, 1, 0)
+            workflow3.add_task("task5", 100.0, 1, 1, 0)
+        raise wrench.WRENCHException("Shouldn't be able to add the same task twice in a batch")
+    except wrench.WRENCHException as e:
+        pass
+
+    # Per-route request statistics, including for batched requests
+    request_stats = simulation.enable_request_stats(dump_at_terminate=False)
+    hooked_routes = []
+    simulation.add_request_hook(lambda method, route, *args: hooked_routes.append(f"{method} {route}"))
+    workflow4 = simulation.create_workflow()
+    with simulation.batch():
+        workflow4.add_task("task6", 100.0, 1, 1, 0)
+        workflow4.add_task("task7", 100.0, 1, 1, 0)
+    route_stats = request_stats.get_route_stats()
+    assert route_stats["POST createWorkflow"]["count"] == 1, "There should be one createWorkflow request"
+    assert route_stats["POST workflows/{}/createTask"]["count"] == 2, "There should be two createTask requests"
+    assert route_stats["POST workflows/{}/createTask"]["payload_bytes"] > 0, "Payload sizes should be recorded"
+    assert hooked_routes == ["POST createWorkflow"] + ["POST workflows/{}/createTask"] * 2, \
+        "The request hook should have been called for each request"
+    assert "workflows/{}/createTask" in str(request_stats), "The profile table should list createTask"
+    try:
+        simulation.remove_request_hook(print)
+        raise wrench.WRENCHException("Shouldn't be able to remove a function that is not a request hook")
+    except wrench.WRENCHException as e:
+        pass
+
     f = open(json_workflow_file_path)
     wfcommons_json_workflow = json.load(f)
     f.close()
@@ -98,6 +146,46 @@ if __name__ == "__main__":
                                                      False,
                                                      False, 3, 3, False,
                                                      False, False)
+    if workflow2.is_done():
+        raise wrench.WRENCHException("workflow2 should not be done")
+    for task in workflow2.get_ready_tasks():
+        assert task.get_state() == wrench.Task.TaskState.READY, f"{task.get_name()} should be READY"
+
+    # Same workflow, streamed from the file
+    workflow3 = simulation.create_workflow_from_json_file(json_workflow_file_path, "2", False, False, False, 3, 3,
+                                                          False, False, False)
+    if sorted(workflow3.tasks) != sorted(workflow2.tasks):
+        raise wrench.WRENCHException("workflow3 should have the same tasks as workflow2")
+    if sorted(t.get_name() for t in workflow3.get_ready_tasks()) != \
+            sorted(t.get_name() for t in workflow2.get_ready_tasks()):
+        raise wrench.WRENCHException("workflow3 should have the same ready tasks as workflow2")
+
+    # The files and tasks of imported workflows are decoded into typed specifications, with any backend
+    for backend in wrench.JSONSerializer.BACKENDS:
+        try:
+            serializer = wrench.JSONSerializer(backend)
+        except wrench.WRENCHException:
+            continue  # The backend is not installed
+        workflow_spec = serializer.loads_workflow_spec(serializer.dumps(
+            {"wrench_api_request_success": True, "workflow_name": "workflow_x",
+             "files": [{"name": "file_x", "size": 10.0}],
+             "tasks": [{"name": "task_x", "flops": 1.0, "min_num_cores": 1, "max_num_cores": 2, "memory": 0.0,
+                        "input_file_names": ["file_x"], "output_file_names": []}]}))
+        assert workflow_spec.workflow_name == "workflow_x", f"{backend}: invalid decoded workflow name"
+        assert workflow_spec.tasks[0] == wrench.WorkflowTaskSpec("task_x", 1.0, 1, 2, 0.0, ["file_x"], []), \
+            f"{backend}: invalid decoded task specification"
+        assert workflow_spec.files[0] == wrench.WorkflowFileSpec("file_x", 10.0), \
+            f"{backend}: invalid decoded file specification"
+        try:
+            serializer.loads_workflow_spec(serializer.dumps({"workflow_name": "workflow_x", "tasks": [{}]}))
+            raise AssertionError(f"{backend}: shouldn't be able to decode an invalid answer")
+        except wrench.WRENCHException:
+            pass
+    try:
+        wrench.JSONSerializer("bogus_backend")
+        raise wrench.WRENCHException("Shouldn't be able to use a bogus JSON backend")
+    except wrench.WRENCHException as e:
+        pass
 
     simulation.terminate()
 
@@ -16,7 +16,14 @@ __credits__ = 'University of Hawaii at Manoa, Oak Ridge National Laboratory'
 from .exception import WRENCHException
 
 from .simulation import Simulation
+from .async_simulation import AsyncSimulation
+from .simulation_pool import SimulationPool
+from .daemon import Daemon
 from .simulation_item import SimulationItem
+from .transport import (Transport, RequestsTransport, HTTPClientTransport, InProcessTransport, AsyncTransport,
+                        AsyncInProcessTransport)
+from .request_stats import RequestStats
+from .json_serializer import JSONSerializer
 
 from .bare_metal_compute_service import BareMetalComputeService
 from .compute_service import ComputeService
@@ -30,8 +37,14 @@ from .file import File
 from .workflow import Workflow
 from .standard_job import StandardJob
 from .task import Task
+from .task_graph import TaskGraph
+from .task_timings import TaskTimings
+from .static_schedule import StaticSchedule
+from .task_table import TaskTable
+from .workflow_spec import WorkflowSpec, WorkflowFileSpec, WorkflowTaskSpec
 
 from .compound_job import CompoundJob
+from .compound_job_builder import CompoundJobBuilder
 from .action import Action
 from .compute_action import ComputeAction
 from .file_copy_action import FileCopyAction
@@ -39,3 +52,5 @@ from .file_delete_action import FileDeleteAction
 from .file_read_action import FileReadAction
 from .sleep_action import SleepAction
 
+
+from . import scheduling
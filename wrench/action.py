@@ -16,6 +16,8 @@ class Action(SimulationItem):
     WRENCH Action class
     """
 
+    __slots__ = ("compound_job",)
+
     def __init__(self, simulation, name: str, compound_job: CompoundJob) -> None:
         """
         Constructor
@@ -43,7 +45,7 @@ class Action(SimulationItem):
         """
         Get the state of the action
         """
-        return self.ActionState(self._simulation._action_get_state(self))
+        return self._simulation._action_get_state(self)
 
     def get_job(self) -> CompoundJob:
         """
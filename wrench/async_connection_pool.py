@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from wrench.exception import WRENCHException
+from wrench.json_serializer import JSONSerializer
+from wrench.json_stream import JSONStringBody
+from wrench.transport import AsyncTransport
+from wrench.unix_socket_adapter import SCHEME as UNIX_SOCKET_SCHEME, unix_socket_path
+
+
+class _ClosedBeforeAnswer(Exception):
+    """
+    Raised when the daemon closes a connection before starting to answer a request, which it has thus not processed
+    """
+
+
+class AsyncConnectionPool(AsyncTransport):
+    """
+    A minimal non-blocking HTTP/1.1 client, built on asyncio streams, that sends JSON requests to the WRENCH
+    daemon over pooled keep-alive connections. Concurrent requests use distinct connections, so that many
+    long-polling requests (e.g., waiting for the next simulation event) can be in flight at once. Requests to
+    "http+unix" URLs (see unix_socket_url()) are sent over Unix domain sockets. This is the default transport of
+    the AsyncSimulation class.
+
+    :param pool_size: maximum number of connections that can be open at once
+    :type pool_size: int
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+           (None means "wait forever")
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    :param serializer: the JSON encoder/decoder (default: one with the fastest backend installed)
+    :type serializer: Optional[JSONSerializer]
+    """
+
+    def __init__(self,
+                 pool_size: int = 10,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 serializer: Optional[JSONSerializer] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        super().__init__(timeout)
+        self.pool_size = pool_size
+        if serializer is not None:
+            self.serializer = serializer
+        self.idle_connections: Dict[Union[Tuple[str, int], str],
+                                    List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.semaphore = None
+
+    async def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                      decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Send a request to the daemon and wait for its answer
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: JSON data to send with the request, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks (default: the serializer's loads()
+               on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.pool_size)
+        parts = urlsplit(url)
+        if parts.scheme == UNIX_SOCKET_SCHEME:
+            address, host = unix_socket_path(url), "localhost"
+        else:
+            address, host = (parts.hostname, parts.port or 80), parts.netloc
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        body = json_data if isinstance(json_data, JSONStringBody) else self.serializer.dumps(json_data)
+        payload = (f"{method} {path} HTTP/1.1\r\n"
+                   f"Host: {host}\r\n"
+                   f"Content-Type: application/json\r\n"
+                   f"Content-Length: {len(body)}\r\n\r\n").encode()
+        if isinstance(body, bytes):
+            payload += body
+
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+        else:
+            connect_timeout = read_timeout = self.timeout
+        if long_poll:
+            read_timeout = None
+
+        async with self.semaphore:
+            while True:
+                reused = bool(self.idle_connections.get(address))
+                writer = None
+                sent = False
+                pooled = False
+                try:
+                    if reused:
+                        reader, writer = self.idle_connections[address].pop()
+                    else:
+                        connection = asyncio.open_unix_connection(address) if isinstance(address, str) \
+                            else asyncio.open_connection(*address)
+                        reader, writer = await asyncio.wait_for(connection, connect_timeout)
+                    try:
+                        writer.write(payload)
+                        await writer.drain()
+                        if isinstance(body, JSONStringBody):
+                            # Stream the body, which can be read only once
+                            for chunk in iter(lambda: body.read(1 << 16), b""):
+                                writer.write(chunk)
+                                await writer.drain()
+                        sent = True
+                        answer, keep_alive = await asyncio.wait_for(self.__read_response(reader), read_timeout)
+                    except (OSError, _ClosedBeforeAnswer) as e:
+                        if reused and isinstance(body, bytes) and (not sent or isinstance(e, _ClosedBeforeAnswer)):
+                            # The daemon closed the idle connection before processing the request: retry on a new one
+                            continue
+                        raise
+                    if keep_alive:
+                        self.idle_connections.setdefault(address, []).append((reader, writer))
+                        pooled = True
+                except (OSError, _ClosedBeforeAnswer, asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        ValueError) as e:
+                    # The request may have been processed by the daemon, and thus cannot be safely re-sent
+                    raise WRENCHException("Connection to wrench-daemon severed: " + str(e))
+                finally:
+                    # Including if the request is cancelled (e.g., a long poll), as part of an answer may be left
+                    if writer is not None and not pooled:
+                        writer.close()
+                return self.serializer.loads(answer) if decode is None else decode((answer,))
+
+    @staticmethod
+    async def __read_response(reader: asyncio.StreamReader) -> Tuple[bytes, bool]:
+        """
+        Read an HTTP response
+
+        :param reader: the stream from which to read
+        :type reader: asyncio.StreamReader
+
+        :return: the raw JSON answer, and whether the connection can be kept alive
+        :rtype: Tuple[bytes, bool]
+
+        :raises _ClosedBeforeAnswer: if the connection is closed before the status line
+        """
+        status_line = await reader.readline()
+        if not status_line:
+            raise _ClosedBeforeAnswer("Connection closed before any answer")
+        version = status_line.split(b" ", 1)[0]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version == b"HTTP/1.1" or connection == "keep-alive")
+        return body, keep_alive
+
+    async def close(self) -> None:
+        """
+        Close all idle connections
+        """
+        idle_connections, self.idle_connections = self.idle_connections, {}
+        for connections in idle_connections.values():
+            for _, writer in connections:
+                writer.close()
@@ -0,0 +1,1241 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+import json
+import pathlib
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from wrench.async_connection_pool import AsyncConnectionPool
+from wrench.bare_metal_compute_service import BareMetalComputeService
+from wrench.batch_compute_service import BatchComputeService
+from wrench.cloud_compute_service import CloudComputeService
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+from wrench.file import File
+from wrench.file_registry_service import FileRegistryService
+from wrench.json_serializer import JSONSerializer
+from wrench.standard_job import StandardJob
+from wrench.static_schedule import StaticSchedule
+from wrench.compound_job import CompoundJob
+from wrench.action import Action
+from wrench.sleep_action import SleepAction
+from wrench.compute_action import ComputeAction
+from wrench.file_copy_action import FileCopyAction
+from wrench.file_delete_action import FileDeleteAction
+from wrench.file_write_action import FileWriteAction
+from wrench.file_read_action import FileReadAction
+from wrench.storage_service import StorageService
+from wrench.task import Task
+from wrench.task_graph import TaskGraph
+from wrench.task_table import TaskTable
+from wrench.task_timings import TaskTimings
+from wrench.transport import AsyncTransport
+from wrench.unix_socket_adapter import split_daemon_url, unix_socket_url
+from wrench.virtual_machine import VirtualMachine
+from wrench.workflow import Workflow
+from wrench.workflow_spec import WorkflowSpec
+from wrench import workflow_import
+
+
+# noinspection GrazieInspection
+class AsyncSimulation:
+    """
+    WRENCH asyncio simulation class. This class provides the same API as the Simulation class, but its methods
+    (and those of the Workflow, Task, File, CompoundJob, Action, ComputeService, StorageService,
+    FileRegistryService, and VirtualMachine objects it creates) that interact with the wrench-daemon are coroutines,
+    which makes it possible to drive many simulations concurrently from a single event loop.
+
+    Example::
+
+        async with wrench.AsyncSimulation() as simulation:
+            await simulation.start(platform_xml, "ControllerHost")
+            workflow = await simulation.create_workflow()
+            task = await workflow.add_task("task", 100.0, 1, 1, 0)
+            event = await simulation.wait_for_next_event()
+
+    :param daemon_host: name of the host on which the WRENCH daemon is running
+    :type daemon_host: str
+    :param daemon_port: port number on which the WRENCH daemon is listening
+    :type daemon_port: int
+    :param pool_size: maximum number of connections open at once to the WRENCH daemon
+    :type pool_size: int
+    :param timeout: timeout in seconds for requests to the WRENCH daemon, either as a single value or as
+           a (connect timeout, read timeout) tuple (None means "wait forever"). Only the connect timeout
+           applies to wait_for_next_event(), which blocks until the next simulation event occurs
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    :param json_backend: the library used to encode/decode the JSON documents exchanged with the WRENCH daemon
+           ("msgspec", "orjson" or "json"), or None to use the fastest one installed
+    :type json_backend: Optional[str]
+    :param daemon_url: if not None, the URL of the WRENCH daemon, which overrides daemon_host and daemon_port:
+           either "http://<host>:<port>", or "unix://<socket path>" to send requests over Unix domain sockets
+    :type daemon_url: Optional[str]
+    :param transport: the transport through which requests are sent to the WRENCH daemon (default: a pool of
+           asyncio connections built with pool_size and timeout, which are otherwise ignored)
+    :type transport: Optional[AsyncTransport]
+
+    :raises WRENCHException: if the JSON backend is unknown or not installed, or if the daemon URL is invalid
+    """
+
+    def __init__(self,
+                 daemon_host: Optional[str] = "localhost",
+                 daemon_port: Optional[int] = 8101,
+                 pool_size: int = 10,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 json_backend: Optional[str] = None,
+                 daemon_url: Optional[str] = None,
+                 transport: Optional[AsyncTransport] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        self.socket_path = None
+        if daemon_url is not None:
+            daemon_host, daemon_port, self.socket_path = split_daemon_url(daemon_url)
+        self.daemon_host = daemon_host
+        self.daemon_port = daemon_port
+        self.daemon_url = self.__get_url("api")
+        self.started = False
+        self.terminated = False
+        self.spec = None
+
+        self.serializer = JSONSerializer(json_backend)
+        if transport is None:
+            transport = AsyncConnectionPool(pool_size=pool_size, timeout=timeout)
+        self.transport = transport
+        self.transport.serializer = self.serializer
+
+        # Functions called when a standard job is submitted, and when it completes or fails
+        self.job_listeners = []
+
+        # Same bookkeeping as in the Simulation class to keep the workflows' task graphs up-to-date
+        self.__running_standard_jobs = set()
+        self.__running_compound_jobs = set()
+        self.__pending_events = deque()
+        self.__task_states_outdated = False
+        self.__state_cache = {}
+
+        # Simulation Item Dictionaries
+        self.workflows = {}
+        self.actions = {}
+        self.standard_jobs = {}
+        self.compound_jobs = {}
+        self.files = {}
+        self.compute_services = {}
+        self.storage_services = {}
+        self.file_registry_services = {}
+        # Default for test only
+        self.simid = 101
+
+    async def __aenter__(self) -> "AsyncSimulation":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.terminate()
+
+    def __get_url(self, path: str) -> str:
+        """
+        Get the URL of a route on the daemon
+
+        :param path: the path of the route, without leading slash (e.g., "api")
+        :type path: str
+        :return: the URL
+        :rtype: str
+        """
+        if self.socket_path is not None:
+            return unix_socket_url(self.socket_path, path)
+        return f"http://{self.daemon_host}:{self.daemon_port}/{path}"
+
+    async def __send_request_to_daemon(self, method: str, route: str, json_data: dict,
+                                       long_poll: bool = False) -> dict:
+        """
+        Send a request to the daemon
+
+        :param method: HTTP method
+        :type method: str
+        :param route: the route
+        :type route: str
+        :param json_data: the request's JSON data
+        :type json_data: dict
+        :param long_poll: whether the answer may take arbitrarily long
+        :type long_poll: bool
+
+        :return: the JSON answer
+        :rtype: dict
+
+        :raises WRENCHException: if the daemon cannot be reached, or if the request failed
+        """
+        response = await self.transport.request(method, route, json_data, long_poll=long_poll)
+        if not response.get("wrench_api_request_success", True):
+            raise WRENCHException(response["failure_cause"])
+        return response
+
+    async def start(self, platform_xml: str, controller_hostname: str) -> None:
+        """
+        Start a new simulation (will do nothing if simulation has already started)
+
+        :param platform_xml: platform description string in XML
+        :type platform_xml: str
+        :param controller_hostname: the name of the (simulated) host in the platform on which the
+               simulation controller will run
+        :type controller_hostname: str
+
+        :raises WRENCHException: if there is any error during the simulation instantiation
+        """
+        if self.terminated:
+            raise WRENCHException("This simulation has been terminated.")
+
+        if not self.started:
+            self.spec = {"platform_xml": platform_xml, "controller_hostname": controller_hostname}
+            try:
+                response = await self.transport.request("POST", f"{self.daemon_url}/startSimulation", self.spec)
+            except WRENCHException:
+                raise WRENCHException(
+                    f"Cannot connect to WRENCH daemon ({self.socket_path or f'{self.daemon_host}:{self.daemon_port}'})."
+                    f" Perhaps it needs to be started (e.g., with wrench.Daemon)?")
+
+            if not response["wrench_api_request_success"]:
+                self.terminated = True
+                raise WRENCHException(response["failure_cause"])
+
+            self.daemon_port = response["port_number"]
+            if self.socket_path is not None:
+                self.socket_path = response.get("socket_path", self.socket_path)
+            self.daemon_url = self.__get_url("simulation")
+            self.started = True
+
+    async def terminate(self) -> None:
+        """
+        Terminate the simulation (which, unlike for the Simulation class, is not done automatically
+        when the Python process exits)
+        """
+        if self.started and not self.terminated:
+            try:
+                await self.transport.request("POST", f"{self.daemon_url}/{self.simid}/terminateSimulation", {})
+            except WRENCHException:
+                pass  # The server process was just killed by me!
+        await self.transport.close()
+        self.terminated = True
+
+    def add_job_listener(self, listener: Callable[[str, StandardJob, ComputeService], None]) -> None:
+        """
+        Add a function to be called whenever a standard job is submitted to a compute service, and whenever a
+        standard job completes or fails, as with Simulation.add_job_listener() (the listener is a regular function,
+        not a coroutine)
+
+        :param listener: the function
+        :type listener: Callable[[str, StandardJob, ComputeService], None]
+        """
+        self.job_listeners.append(listener)
+
+    def remove_job_listener(self, listener: Callable[[str, StandardJob, ComputeService], None]) -> None:
+        """
+        Remove a function added with add_job_listener()
+
+        :param listener: the function
+        :type listener: Callable[[str, StandardJob, ComputeService], None]
+
+        :raises WRENCHException: if the function is not a job listener
+        """
+        if listener not in self.job_listeners:
+            raise WRENCHException("Not a job listener")
+        self.job_listeners.remove(listener)
+
+    async def wait_for_next_event(self) -> Dict[str, Union[str, StandardJob, ComputeService]]:
+        """
+        Wait for the next simulation event to occur
+
+        :return: A JSON object
+        :rtype: Dict[str, Union[str, StandardJob, ComputeService]]
+        """
+        if self.__pending_events:
+            return self.__pending_events.popleft()
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/"
+                                                              f"waitForNextSimulationEvent", {}, long_poll=True)
+        self.__state_cache.clear()
+        event = self.__json_event_to_dict(response["event"])
+        await self.__process_job_event(event)
+        # Other jobs may have completed at the same date
+        self.__task_states_outdated = bool(self.__running_standard_jobs)
+        return event
+
+    async def get_events(self) -> List[Dict[str, Union[str, StandardJob, ComputeService]]]:
+        """
+        Get all simulation events since last time we checked
+
+        :return: A list of events
+        :rtype: List[Dict[str, Union[str, StandardJob, ComputeService]]]
+        """
+        events = list(self.__pending_events) + await self.__fetch_events()
+        self.__pending_events.clear()
+        return events
+
+    async def events(self) -> AsyncIterator[Dict[str, Union[str, StandardJob, ComputeService]]]:
+        """
+        Iterate over simulation events as they occur, as in Simulation.events(), but with an asynchronous
+        iterator::
+
+            async for event in simulation.events():
+                # submit new jobs, if any, based on the event
+
+        :return: An asynchronous iterator over events
+        :rtype: AsyncIterator[Dict[str, Union[str, StandardJob, ComputeService]]]
+        """
+        for event in await self.get_events():
+            yield event
+        while self.__running_standard_jobs or self.__running_compound_jobs:
+            yield await self.wait_for_next_event()
+
+    async def step(self, workflow: Workflow,
+                   submissions: Iterable[Tuple[List[Task], dict[File, StorageService], ComputeService]] = ()) \
+            -> Tuple[Dict[str, Union[str, StandardJob, ComputeService]], List[Task], bool]:
+        """
+        Perform one iteration of a scheduling loop, as in Simulation.step(), with the jobs created concurrently, and
+        then submitted concurrently before waiting for the next event
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :param submissions: the (tasks, file locations, compute service) jobs to create and submit, if any
+        :type submissions: Iterable[Tuple[List[Task], dict[File, StorageService], ComputeService]]
+
+        :return: the next event, the ready tasks of the workflow, and whether the workflow is done
+        :rtype: Tuple[Dict[str, Union[str, StandardJob, ComputeService]], List[Task], bool]
+
+        :raises WRENCHException: if there is any error in the responses
+        """
+        submissions = list(submissions)
+        jobs = await asyncio.gather(*[self.create_standard_job(tasks, file_locations)
+                                      for tasks, file_locations, _ in submissions])
+        await asyncio.gather(*[self._submit_standard_job(job, cs) for job, (_, _, cs) in zip(jobs, submissions)])
+        event = await self.wait_for_next_event()
+        return event, await self._workflow_get_ready_tasks(workflow), await self._workflow_is_done(workflow)
+
+    async def run_schedule(self, workflow: Workflow, schedule: StaticSchedule) \
+            -> Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]:
+        """
+        Run a workflow to completion according to a static schedule, as in Simulation.run_schedule()
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :param schedule: the schedule, which must include all the tasks of the workflow that have not completed
+        :type schedule: StaticSchedule
+
+        :return: all the events that occurred during the run, in order, and the timings of all tasks of the workflow
+        :rtype: Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]
+
+        :raises WRENCHException: if a job fails, if the schedule cannot complete the workflow, or if there is any
+                                 error in the responses
+        """
+        queues = schedule._get_queues()
+        events = []
+        ready_tasks, done = await self._workflow_get_ready_tasks(workflow), await self._workflow_is_done(workflow)
+        while not done:
+            submissions = StaticSchedule._take_ready_tasks(queues, ready_tasks)
+            if not submissions and not self.__running_standard_jobs and not self.__pending_events:
+                raise WRENCHException(f"The schedule cannot complete workflow {workflow.get_name()}: no job is "
+                                      f"running and none of the ready tasks "
+                                      f"{[task.get_name() for task in ready_tasks]} is next in its compute "
+                                      f"service's queue")
+            event, ready_tasks, done = await self.step(workflow, submissions)
+            events.append(event)
+            if event["event_type"] == "standard_job_failure":
+                raise WRENCHException(f"Job {event['standard_job'].get_name()} failed: {event['failure_cause']}")
+        events.extend(self.__pending_events)
+        self.__pending_events.clear()
+        return events, await self._workflow_get_task_timings(workflow)
+
+    async def create_standard_job(self, tasks: List[Task], file_locations: dict[File, StorageService]) -> StandardJob:
+        """
+        Create a standard job
+
+        :param tasks: list of tasks
+        :type tasks: List[Task]
+        :param file_locations: list of file locations
+        :type file_locations: List[FileLocation]
+
+        :return: A StandardJob object
+        :rtype: StandardJob
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        workflow = tasks[0].get_workflow()
+        for task in tasks:
+            if task.get_workflow() != workflow:
+                raise WRENCHException("Cannot create a standard job with tasks from different workflows")
+
+        data = {"tasks": [t.get_name() for t in tasks],
+                "file_locations": {fl.get_name(): file_locations[fl].get_name() for fl in file_locations}}
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                               f"{workflow.get_name()}/createStandardJob", data)
+        self.standard_jobs[response["job_name"]] = StandardJob(self, response["job_name"], tasks)
+        return self.standard_jobs[response["job_name"]]
+
+    async def create_compound_job(self, name: str) -> CompoundJob:
+        """
+        Create a compound job
+
+        :param name: name of compound job
+        :type name: str
+
+        :return: A CompoundJob object
+        :rtype: CompoundJob
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/createCompoundJob",
+                                                       {"name": name})
+        self.compound_jobs[response["job_name"]] = CompoundJob(self, response["job_name"])
+        return self.compound_jobs[response["job_name"]]
+
+    async def create_workflow(self) -> Workflow:
+        """
+        Create a workflow
+
+        :return: A workflow object
+        :rtype: Workflow
+        """
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/createWorkflow", {})
+        self.workflows[response["workflow_name"]] = Workflow(self, response["workflow_name"])
+        return self.workflows[response["workflow_name"]]
+
+    async def add_file(self, name: str, size: int) -> File:
+        """
+        Add a file to the simulation
+
+        :param name: file name
+        :type name: str
+        :param size: file size in bytes
+        :type size: int
+
+        :return: A file object
+        :rtype: File
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/addFile",
+                                            {"name": name, "size": size})
+        self.files[name] = File(self, name, size)
+        return self.files[name]
+
+    async def add_files(self, files: Iterable[Tuple[str, int]]) -> List[File]:
+        """
+        Add files to the simulation, with concurrent requests (instead of one round-trip to the daemon after the
+        other, as with add_file())
+
+        :param files: the (file name, file size in bytes) pairs
+        :type files: Iterable[Tuple[str, int]]
+
+        :return: the file objects, in order
+        :rtype: List[File]
+
+        :raises WRENCHException: if a file cannot be added
+        """
+        new_files = [File(self, name, size) for name, size in files]
+
+        async def add(new_file: File) -> None:
+            await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/addFile",
+                                                {"name": new_file.get_name(), "size": new_file.size})
+            self.files[new_file.get_name()] = new_file
+
+        await asyncio.gather(*[add(new_file) for new_file in new_files])
+        return new_files
+
+    def get_all_files(self) -> dict[str, File]:
+        """
+        Get the list of all files
+
+        :return: A dictionary of File objects where file names are keys
+        :rtype: dict[str, File]
+        """
+        return self.files
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        Sleep (in simulation) for a number of seconds
+
+        :param seconds: number of seconds
+        :type seconds: float
+        """
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/advanceTime",
+                                            {"increment": seconds})
+        self.__state_cache.clear()
+        self.__task_states_outdated = bool(self.__running_standard_jobs)
+
+    async def get_simulated_time(self) -> float:
+        """
+        Get the current simulation date
+
+        :return: the simulation date
+        :rtype: float
+        """
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/getTime", {})
+        return response["time"]
+
+    async def create_bare_metal_compute_service(self, hostname: str,
+                                                resources: dict[str, [int, int]],
+                                                scratch_space: str,
+                                                property_list: dict[str, str],
+                                                message_payload_list: dict[str, int]) -> BareMetalComputeService:
+        """
+        Create a bare metal compute service
+
+        :param hostname: name of the (simulated) host on which the compute service should run
+        :type hostname: str
+        :param resources: compute resources as a dict of hostnames where values are tuples of #cores and ram in bytes
+                          (negative values mean: use everything available)
+        :param scratch_space: the compute service's scratch space’s mount point ("" means none)
+        :type scratch_space: str
+        :param property_list: a property list ({} means "use all defaults")
+        :type property_list: dict
+        :param message_payload_list: a message payload list ({} means "use all defaults")
+        :type message_payload_list: dict
+        :return: the service name
+        :rtype: BareMetalComputeService
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        data = {"head_host": hostname, "resources": json.dumps(resources), "scratch_space": scratch_space,
+                "property_list": json.dumps(property_list),
+                "message_payload_list": json.dumps(message_payload_list)}
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"addBareMetalComputeService", data)
+        self.compute_services[response["service_name"]] = BareMetalComputeService(self, response["service_name"])
+        return self.compute_services[response["service_name"]]
+
+    async def create_batch_compute_service(self, hostname: str,
+                                           resources: list,
+                                           scratch_space: str,
+                                           property_list: dict[str, str],
+                                           message_payload_list: dict[str, int]) -> BatchComputeService:
+        """
+        Create a batch compute service
+
+        :param hostname: name of the (simulated) host on which the compute service should run
+        :type hostname: str
+        :param resources: compute resources as a list of hostnames
+        :param scratch_space: the compute service's scratch space's mount point ("" means none)
+        :type scratch_space: str
+        :param property_list: a property list ({} means “use all defaults”)
+        :type property_list: dict
+        :param message_payload_list: a message payload list ({} means “use all defaults”)
+        :type message_payload_list: dict
+        :return: the service name
+        :rtype: BatchComputeService
+
+        :raise WRENCHException: if there is any error in the response
+        """
+        data = {"head_host": hostname, "resources": resources, "scratch_space": scratch_space,
+                "property_list": json.dumps(property_list),
+                "message_payload_list": json.dumps(message_payload_list)}
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"addBatchComputeService", data)
+        self.compute_services[response["service_name"]] = BatchComputeService(self, response["service_name"])
+        return self.compute_services[response["service_name"]]
+
+    async def create_cloud_compute_service(self, hostname: str,
+                                           execution_host: list,
+                                           scratch_space: str,
+                                           property_list: dict[str, str],
+                                           message_payload_list: dict[str, int]) -> CloudComputeService:
+        """
+        Create a cloud compute service
+
+        :param hostname: name of the (simulated) host on which the compute service should run
+        :type hostname: str
+        :param execution_host: compute resources as a list of hostnames
+        :param scratch_space: the compute service’s scratch space’s mount point (”” means none)
+        :type scratch_space: str
+        :param property_list: a property list ({} means “use all defaults”)
+        :type property_list: dict
+        :param message_payload_list: a message payload list ({} means “use all defaults”)
+        :type message_payload_list: dict
+        :return: the service name
+        :rtype: CloudComputeService
+
+        :raise WRENCHException: if there is any error in the response
+        """
+        data = {"head_host": hostname, "resources": execution_host, "scratch_space": scratch_space,
+                "property_list": json.dumps(property_list),
+                "message_payload_list": json.dumps(message_payload_list)}
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"addCloudComputeService", data)
+        self.compute_services[response["service_name"]] = CloudComputeService(self, response["service_name"])
+        return self.compute_services[response["service_name"]]
+
+    async def create_simple_storage_service(self, hostname: str, mount_points: List[str]) -> StorageService:
+        """
+        Create a simple storage service
+
+        :param hostname: name of the (simulated) host on which the storage service should run
+        :type hostname: str
+        :param mount_points: list of mount points (i.e., disks) that the storage service should use
+        :type mount_points: List[str]
+        :return: the service name
+        :rtype: StorageService
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"addSimpleStorageService",
+                                                       {"head_host": hostname, "mount_points": mount_points})
+        self.storage_services[response["service_name"]] = StorageService(self, response["service_name"])
+        return self.storage_services[response["service_name"]]
+
+    async def create_file_registry_service(self, hostname: str) -> FileRegistryService:
+        """
+        Create a file registry service
+
+        :param hostname: name of the (simulated) host on which the file registry service should run
+        :type hostname: str
+
+        :return: the service name
+        :rtype: FileRegistryService
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"addFileRegistryService", {"head_host": hostname})
+        self.file_registry_services[response["service_name"]] = FileRegistryService(self, response["service_name"])
+        return self.file_registry_services[response["service_name"]]
+
+    async def get_all_hostnames(self) -> List[str]:
+        """
+        Get the list of hostnames in the simulated platform
+
+        :return: list of hostnames
+        :rtype: List[str]
+        """
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/hostnames", {})
+        return response["hostnames"]
+
+    async def create_workflow_from_json(self, json_object: json, reference_flop_rate: str, ignore_machine_specs: bool,
+                                        redundant_dependencies: bool, ignore_cycle_creating_dependencies: bool,
+                                        min_cores_per_task: int, max_cores_per_task: int, enforce_num_cores: bool,
+                                        ignore_avg_cpu: bool, show_warnings: bool) -> Workflow:
+        """
+        Create a workflow from a JSON file
+
+        :param json_object: A JSON object created from a WfCommons JSON file
+        :type json_object: json
+        :param reference_flop_rate: reference flop rate (e.g., "100Mf")
+        :type reference_flop_rate: str
+        :param ignore_machine_specs: whether to ignore machine specifications in the JSON
+        :type ignore_machine_specs: bool
+        :param redundant_dependencies: whether to take into account redundant task dependencies
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether to ignore cycles when creating task dependencies
+        :type ignore_cycle_creating_dependencies: bool
+        :param min_cores_per_task: the minimum number of cores for a task if not specified in the JSON
+        :type min_cores_per_task: int
+        :param max_cores_per_task: the maximum number of cores for a task if not specified in the JSON
+        :type max_cores_per_task: int
+        :param enforce_num_cores: whether to enforce the number of cores for a task even if specified in the JSON
+        :type enforce_num_cores: bool
+        :param ignore_avg_cpu: whether to ignore the average CPU time information in the JSON to compute
+               sequential task execution times
+        :type ignore_avg_cpu: bool
+        :param show_warnings: whether to show warnings when importing the JSON (displayed on the wrench-daemon console)
+        :type show_warnings: bool
+
+        :return: A workflow
+        :rtype: Workflow
+        """
+        parameters = workflow_import.get_import_parameters(reference_flop_rate, ignore_machine_specs,
+                                                           redundant_dependencies,
+                                                           ignore_cycle_creating_dependencies, min_cores_per_task,
+                                                           max_cores_per_task, enforce_num_cores, ignore_avg_cpu,
+                                                           show_warnings)
+        workflow_spec: WorkflowSpec = await self.transport.request(
+            "POST", f"{self.daemon_url}/{self.simid}/createWorkflowFromJSON",
+            workflow_import.get_json_object_request(self.serializer, json_object, parameters),
+            decode=lambda chunks: self.serializer.loads_workflow_spec(b"".join(chunks)))
+        return workflow_import.create_workflow_from_spec(self, workflow_spec,
+                                                         workflow_import.get_json_object_tasks(json_object),
+                                                         redundant_dependencies, ignore_cycle_creating_dependencies)
+
+    async def create_workflow_from_json_file(self, path: Union[str, pathlib.Path], reference_flop_rate: str,
+                                             ignore_machine_specs: bool, redundant_dependencies: bool,
+                                             ignore_cycle_creating_dependencies: bool, min_cores_per_task: int,
+                                             max_cores_per_task: int, enforce_num_cores: bool, ignore_avg_cpu: bool,
+                                             show_warnings: bool) -> Workflow:
+        """
+        Create a workflow from a WfCommons JSON file. Unlike with create_workflow_from_json(), the file is never
+        loaded in memory as a whole: it is streamed to the daemon, and the daemon's answer is decoded incrementally,
+        which keeps memory usage low for very large workflows.
+
+        :param path: the path of a WfCommons JSON file
+        :type path: Union[str, pathlib.Path]
+        :param reference_flop_rate: reference flop rate (e.g., "100Mf")
+        :type reference_flop_rate: str
+        :param ignore_machine_specs: whether to ignore machine specifications in the JSON
+        :type ignore_machine_specs: bool
+        :param redundant_dependencies: whether to take into account redundant task dependencies
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether to ignore cycles when creating task dependencies
+        :type ignore_cycle_creating_dependencies: bool
+        :param min_cores_per_task: the minimum number of cores for a task if not specified in the JSON
+        :type min_cores_per_task: int
+        :param max_cores_per_task: the maximum number of cores for a task if not specified in the JSON
+        :type max_cores_per_task: int
+        :param enforce_num_cores: whether to enforce the number of cores for a task even if specified in the JSON
+        :type enforce_num_cores: bool
+        :param ignore_avg_cpu: whether to ignore the average CPU time information in the JSON to compute
+               sequential task execution times
+        :type ignore_avg_cpu: bool
+        :param show_warnings: whether to show warnings when importing the JSON (displayed on the wrench-daemon console)
+        :type show_warnings: bool
+
+        :return: A workflow
+        :rtype: Workflow
+
+        :raises WRENCHException: if the file is not valid JSON, or if the daemon cannot import it
+        :raises OSError: if the file cannot be read
+        """
+        # Only the task names, ids and parents are needed to mirror the task graph
+        json_tasks = workflow_import.get_json_file_tasks(path)
+        parameters = workflow_import.get_import_parameters(reference_flop_rate, ignore_machine_specs,
+                                                           redundant_dependencies,
+                                                           ignore_cycle_creating_dependencies, min_cores_per_task,
+                                                           max_cores_per_task, enforce_num_cores, ignore_avg_cpu,
+                                                           show_warnings)
+        workflow_spec: WorkflowSpec = await self.transport.request(
+            "POST", f"{self.daemon_url}/{self.simid}/createWorkflowFromJSON",
+            workflow_import.get_json_file_request(self.serializer, path, parameters),
+            decode=WorkflowSpec.from_stream)
+        return workflow_import.create_workflow_from_spec(self, workflow_spec, json_tasks, redundant_dependencies,
+                                                         ignore_cycle_creating_dependencies)
+
+    ####################################################################################
+    # Below are "private/protected" coroutines that are not part of the user API, but
+    # awaited by the wrapper classes that form the user API
+    ####################################################################################
+
+    async def _submit_standard_job(self, job: StandardJob, cs: ComputeService, service_specific_args="{}") -> None:
+        data = {"compute_service_name": cs.get_name(), "service_specific_args": service_specific_args}
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/standardJobs/"
+                                                    f"{job.get_name()}/submit", data)
+        self.__state_cache.clear()
+        self.__running_standard_jobs.add(job.get_name())
+        task_graph = job.get_tasks()[0].get_workflow().task_graph
+        for task in job.get_tasks():
+            task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState.PENDING))
+        if self.job_listeners:
+            # Listeners read the (cached) specifications of the job's tasks
+            await asyncio.gather(*[getter(task) for task in job.get_tasks()
+                                   for getter in (self._task_get_min_num_cores, self._task_get_memory)])
+        for listener in self.job_listeners:
+            listener("standard_job_submission", job, cs)
+
+    async def _submit_compound_job(self, job: CompoundJob, cs: ComputeService, service_specific_args="{}") -> None:
+        data = {"compute_service_name": cs.get_name(), "service_specific_args": service_specific_args}
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                    f"{job.get_name()}/submit", data)
+        self.__state_cache.clear()
+        self.__running_compound_jobs.add(job.get_name())
+
+    async def _create_file_copy_at_storage_service(self, file: File, storage_service: StorageService) -> None:
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/storage_services/"
+                                                    f"{storage_service.get_name()}/createFileCopy",
+                                            {"filename": file.get_name()})
+
+    async def _create_file_copies_at_storage_service(self, files: Iterable[File],
+                                                     storage_service: StorageService) -> None:
+        await asyncio.gather(*[self._create_file_copy_at_storage_service(file, storage_service) for file in files])
+
+    async def _lookup_files_at_storage_service(self, files: Iterable[File],
+                                               storage_service: StorageService) -> List[bool]:
+        return list(await asyncio.gather(*[self._lookup_file_at_storage_service(file, storage_service)
+                                           for file in files]))
+
+    async def _lookup_file_at_storage_service(self, file: File, storage_service: StorageService) -> bool:
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/storage_services/"
+                                                               f"{storage_service.get_name()}/lookupFile",
+                                                       {"filename": file.get_name()})
+        return response["result"]
+
+    async def _add_input_file(self, task: Task, file: File) -> None:
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                    f"{task.get_workflow().get_name()}/tasks/"
+                                                    f"{task.get_name()}/addInputFile", {"file": file.get_name()})
+        self.__state_cache.clear()
+        if task.input_files is None:
+            task.input_files = []
+        task.input_files.append(file)
+        task_graph = task.get_workflow().task_graph
+        task_graph.apply(lambda: task_graph.add_input_file(task.get_name(), file.get_name()))
+
+    async def _add_output_file(self, task: Task, file: File) -> None:
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                    f"{task.get_workflow().get_name()}/tasks/"
+                                                    f"{task.get_name()}/addOutputFile", {"file": file.get_name()})
+        self.__state_cache.clear()
+        if task.output_files is None:
+            task.output_files = []
+        task.output_files.append(file)
+        task_graph = task.get_workflow().task_graph
+        task_graph.apply(lambda: task_graph.add_output_file(task.get_name(), file.get_name()))
+
+    async def _get_task_input_files(self, task: Task) -> List[File]:
+        if task.input_files is None:
+            response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                  f"{task.get_workflow().get_name()}/tasks/"
+                                                                  f"{task.get_name()}/inputFiles", {})
+            task.input_files = [self.files[filename] for filename in response["files"]]
+        return task.input_files
+
+    async def _get_task_output_files(self, task: Task) -> List[File]:
+        if task.output_files is None:
+            response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                  f"{task.get_workflow().get_name()}/tasks/"
+                                                                  f"{task.get_name()}/outputFiles", {})
+            task.output_files = [self.files[filename] for filename in response["files"]]
+        return task.output_files
+
+    async def _file_get_size(self, file: File) -> int:
+        if file.size is None:
+            response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/files/"
+                                                                  f"{file.get_name()}/size", {})
+            file.size = response["size"]
+        return file.size
+
+    async def __get_simulation_state(self, route: str, key: str):
+        """
+        Query the daemon about a value that only changes as the simulation advances, as in Simulation
+
+        :param route: the (GET) route of the query
+        :type route: str
+        :param key: the key of the value in the answer
+        :type key: str
+        :return: the value
+        """
+        if route not in self.__state_cache:
+            response = await self.__send_request_to_daemon("GET", route, {})
+            self.__state_cache[route] = response[key]
+        return self.__state_cache[route]
+
+    async def __task_get(self, task: Task, route: str, key: str, cached: bool = False):
+        route = f"{self.daemon_url}/{self.simid}/workflows/{task.get_workflow().get_name()}/tasks/" \
+                f"{task.get_name()}/{route}"
+        if cached:
+            return await self.__get_simulation_state(route, key)
+        return (await self.__send_request_to_daemon("GET", route, {}))[key]
+
+    async def _task_get_state(self, task: Task) -> Task.TaskState:
+        task_graph = await self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_state(task.get_name())
+        return Task.TaskState(await self.__task_get(task, "getState", "state", cached=True))
+
+    async def _task_get_number_of_children(self, task: Task) -> int:
+        task_graph = await self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_number_of_children(task.get_name())
+        return await self.__task_get(task, "getNumberOfChildren", "number_of_children")
+
+    async def _task_get_bottom_level(self, task: Task) -> int:
+        task_graph = await self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_bottom_level(task.get_name())
+        return await self.__task_get(task, "getBottomLevel", "bottom_level")
+
+    async def _task_get_flops(self, task: Task) -> float:
+        if task.flops is None:
+            task.flops = await self.__task_get(task, "getFlops", "flops")
+        return task.flops
+
+    async def _task_get_min_num_cores(self, task: Task) -> int:
+        if task.min_num_cores is None:
+            task.min_num_cores = await self.__task_get(task, "getMinNumCores", "min_num_cores")
+        return task.min_num_cores
+
+    async def _task_get_max_num_cores(self, task: Task) -> int:
+        if task.max_num_cores is None:
+            task.max_num_cores = await self.__task_get(task, "getMaxNumCores", "max_num_cores")
+        return task.max_num_cores
+
+    async def _task_get_memory(self, task: Task) -> int:
+        if task.memory is None:
+            task.memory = await self.__task_get(task, "getMemory", "memory")
+        return task.memory
+
+    async def _task_get_start_date(self, task: Task) -> float:
+        return await self.__task_get(task, "getStartDate", "time", cached=True)
+
+    async def _task_get_end_date(self, task: Task) -> float:
+        return await self.__task_get(task, "getEndDate", "time", cached=True)
+
+    async def __add_action(self, compound_job: CompoundJob, route: str, data: dict) -> dict:
+        return await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                           f"{compound_job.get_name()}/{route}", data)
+
+    async def _add_compute_action(self, compound_job: CompoundJob, name: str, flops: float, ram: int,
+                                  max_num_cores: int, min_num_cores: int, parallel_model: tuple) -> Action:
+        data = {"name": name, "flops": flops, "ram": ram,
+                "min_num_cores": min_num_cores, "max_num_cores": max_num_cores, "parallel_model": parallel_model}
+        response = await self.__add_action(compound_job, "addComputeAction", data)
+        compute_action = ComputeAction(self, compound_job, response["name"], flops, ram,
+                                       min_num_cores, max_num_cores, parallel_model)
+        compound_job.actions.append(compute_action)
+        return compute_action
+
+    async def _add_file_copy_action(self, compound_job: CompoundJob, name: str, file: File,
+                                    src_storage_service: StorageService,
+                                    dest_storage_service: StorageService) -> Action:
+        data = {"name": name, "file_name": file.get_name(), "src_storage_service_name": src_storage_service.get_name(),
+                "dest_storage_service_name": dest_storage_service.get_name()}
+        response = await self.__add_action(compound_job, "addFileCopyAction", data)
+        file_copy_action = FileCopyAction(self, compound_job, response["name"], file, src_storage_service,
+                                          dest_storage_service, response["uses_scratch"] == "1")
+        compound_job.actions.append(file_copy_action)
+        return file_copy_action
+
+    async def _add_file_delete_action(self, compound_job: CompoundJob, name: str, file: File,
+                                      storage_service: StorageService) -> Action:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
+        response = await self.__add_action(compound_job, "addFileDeleteAction", data)
+        file_delete_action = FileDeleteAction(self, compound_job, response["name"], file, storage_service,
+                                              response["uses_scratch"] == "1")
+        compound_job.actions.append(file_delete_action)
+        return file_delete_action
+
+    async def _add_file_write_action(self, compound_job: CompoundJob, name: str, file: File,
+                                     storage_service: StorageService) -> Action:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
+        response = await self.__add_action(compound_job, "addFileWriteAction", data)
+        file_write_action = FileWriteAction(self, compound_job, response["name"], file, storage_service,
+                                            response["uses_scratch"] == "1")
+        compound_job.actions.append(file_write_action)
+        return file_write_action
+
+    async def _add_file_read_action(self, compound_job: CompoundJob, name: str, file: File,
+                                    storage_service: StorageService, num_bytes_to_read: int) -> Action:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name(),
+                "num_bytes_to_read": num_bytes_to_read}
+        response = await self.__add_action(compound_job, "addFileReadAction", data)
+        file_read_action = FileReadAction(self, compound_job, response["name"], file, storage_service,
+                                          response["num_bytes_to_read"], response["uses_scratch"] == "1")
+        compound_job.actions.append(file_read_action)
+        return file_read_action
+
+    async def _add_sleep_action(self, compound_job: CompoundJob, name: str, sleep_time: float) -> Action:
+        response = await self.__add_action(compound_job, "addSleepAction", {"name": name, "sleep_time": sleep_time})
+        sleep_action = SleepAction(self, compound_job, response["sleep_action_name"], sleep_time)
+        compound_job.actions.append(sleep_action)
+        return sleep_action
+
+    async def _build_compound_job(self, name: str, actions: List[Tuple[str, tuple]],
+                                  dependencies: List[Tuple[str, str]], parent_jobs: List[CompoundJob],
+                                  compute_service: Optional[ComputeService] = None,
+                                  service_specific_args: str = "{}") -> CompoundJob:
+        compound_job = await self.create_compound_job(name)
+        add_action = {"add_compute_action": self._add_compute_action,
+                      "add_file_copy_action": self._add_file_copy_action,
+                      "add_file_delete_action": self._add_file_delete_action,
+                      "add_file_write_action": self._add_file_write_action,
+                      "add_file_read_action": self._add_file_read_action,
+                      "add_sleep_action": self._add_sleep_action}
+        new_actions = await asyncio.gather(*[add_action[kind](compound_job, *args) for kind, args in actions])
+        # Concurrently added actions are appended in the order in which they are created on the daemon side
+        compound_job.actions[:] = new_actions
+        actions_by_name = {action.get_name(): action for action in new_actions}
+        await asyncio.gather(*[self._add_action_dependency(compound_job, actions_by_name[parent],
+                                                           actions_by_name[child])
+                               for parent, child in dependencies],
+                             *[self._add_parent_job(compound_job, parent_job) for parent_job in parent_jobs])
+        if compute_service is not None:
+            await self._submit_compound_job(compound_job, compute_service, service_specific_args)
+        return compound_job
+
+    async def __action_get(self, action: Action, route: str, key: str):
+        return await self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                 f"{action.get_job().get_name()}/actions/{action.get_name()}/{route}",
+                                                 key)
+
+    async def _action_get_state(self, action: Action) -> Action.ActionState:
+        return Action.ActionState(await self.__action_get(action, "getState", "state"))
+
+    async def _action_get_start_date(self, action: Action) -> float:
+        return await self.__action_get(action, "getStartDate", "time")
+
+    async def _action_get_end_date(self, action: Action) -> float:
+        return await self.__action_get(action, "getEndDate", "time")
+
+    async def _action_get_failure_cause(self, action: Action) -> str | None:
+        failure_cause = await self.__action_get(action, "getFailureCause", "action_failure_cause")
+        return failure_cause if failure_cause != "" else None
+
+    async def _add_action_dependency(self, compound_job: CompoundJob, parent_action: Action,
+                                     child_action: Action) -> None:
+        await self.__add_action(compound_job, "addActionDependency",
+                                {"parent_action_name": parent_action.get_name(),
+                                 "child_action_name": child_action.get_name()})
+        self.__state_cache.clear()
+
+    async def _add_parent_job(self, compound_job: CompoundJob, parent_compound_job: CompoundJob) -> None:
+        await self.__add_action(compound_job, "addParentJob", {"parent_compound_job": parent_compound_job.get_name()})
+        self.__state_cache.clear()
+
+    async def _create_vm(self, service: CloudComputeService, num_cores: int, ram_memory: int,
+                         property_list: dict[str, str], message_payload_list: dict[str, int]) -> VirtualMachine:
+        data = {"num_cores": num_cores, "ram_memory": ram_memory,
+                "property_list": json.dumps(property_list),
+                "message_payload_list": json.dumps(message_payload_list)}
+        response = await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                               f"cloud_compute_services/{service.get_name()}/createVM",
+                                                       data)
+        return VirtualMachine(self, service, response["vm_name"])
+
+    async def __vm_request(self, vm: VirtualMachine, method: str, route: str) -> dict:
+        return await self.__send_request_to_daemon(method, f"{self.daemon_url}/{self.simid}/cloud_compute_services/"
+                                                           f"{vm.get_cloud_compute_service().get_name()}/vms/"
+                                                           f"{vm.get_name()}/{route}", {})
+
+    async def _start_vm(self, vm: VirtualMachine) -> BareMetalComputeService:
+        response = await self.__vm_request(vm, "POST", "startVM")
+        self.compute_services[response["service_name"]] = BareMetalComputeService(self, response["service_name"])
+        return self.compute_services[response["service_name"]]
+
+    async def _shutdown_vm(self, vm: VirtualMachine) -> None:
+        await self.__vm_request(vm, "POST", "shutdownVM")
+
+    async def _destroy_vm(self, vm: VirtualMachine) -> None:
+        await self.__vm_request(vm, "POST", "destroyVM")
+
+    async def _suspend_vm(self, vm: VirtualMachine) -> None:
+        await self.__vm_request(vm, "POST", "suspendVM")
+
+    async def _resume_vm(self, vm: VirtualMachine) -> None:
+        await self.__vm_request(vm, "POST", "resumeVM")
+
+    async def _is_vm_running(self, vm: VirtualMachine) -> bool:
+        return (await self.__vm_request(vm, "GET", "isVMRunning"))["result"]
+
+    async def _is_vm_down(self, vm: VirtualMachine) -> bool:
+        return (await self.__vm_request(vm, "GET", "isVMDown"))["result"]
+
+    async def _is_vm_suspended(self, vm: VirtualMachine) -> bool:
+        return (await self.__vm_request(vm, "GET", "isVMSuspended"))["result"]
+
+    async def __compute_service_get(self, cs: ComputeService, route: str) -> dict:
+        return await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/compute_services/"
+                                                          f"{cs.get_name()}/{route}", {})
+
+    async def _supports_compound_jobs(self, cs: ComputeService) -> bool:
+        return (await self.__compute_service_get(cs, "supportsCompoundJobs"))["result"]
+
+    async def _supports_pilot_jobs(self, cs: ComputeService) -> bool:
+        return (await self.__compute_service_get(cs, "supportsPilotJobs"))["result"]
+
+    async def _supports_standard_jobs(self, cs: ComputeService) -> bool:
+        return (await self.__compute_service_get(cs, "supportsStandardJobs"))["result"]
+
+    async def _get_core_flop_rates(self, cs: ComputeService) -> Dict[str, float]:
+        response = await self.__compute_service_get(cs, "coreFlopRates")
+        return dict(zip(response["hostnames"], response["flop_rates"]))
+
+    async def _get_core_counts(self, cs: ComputeService) -> Dict[str, int]:
+        response = await self.__compute_service_get(cs, "coreCounts")
+        return dict(zip(response["hostnames"], response["core_counts"]))
+
+    async def _workflow_create_task(self, workflow: Workflow, name: str, flops: float, min_num_cores: int,
+                                    max_num_cores: int, memory: int) -> Task:
+        data = {"name": name,
+                "flops": flops,
+                "min_num_cores": min_num_cores,
+                "max_num_cores": max_num_cores,
+                "memory": memory}
+        await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                    f"{workflow.get_name()}/createTask", data)
+        workflow.tasks[name] = Task(self, workflow, name, flops, min_num_cores, max_num_cores, memory)
+        workflow.task_graph.apply(lambda: workflow.task_graph.add_task(name))
+        return workflow.tasks[name]
+
+    async def _workflow_get_input_files(self, workflow: Workflow) -> List[File]:
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                              f"{workflow.get_name()}/inputFiles", {})
+        return [self.files[filename] for filename in response["files"]]
+
+    async def _workflow_get_ready_tasks(self, workflow: Workflow) -> List[Task]:
+        task_graph = await self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return [workflow.tasks[task_name] for task_name in task_graph.get_ready_tasks()]
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                              f"{workflow.get_name()}/readyTasks", {})
+        return [workflow.tasks[task_name] for task_name in response["tasks"]]
+
+    async def _workflow_is_done(self, workflow: Workflow) -> bool:
+        task_graph = await self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return task_graph.is_done()
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                              f"{workflow.get_name()}/isDone", {})
+        return response["result"]
+
+    async def _workflow_get_task_states(self, workflow: Workflow) -> Dict[str, Task.TaskState]:
+        task_graph = await self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return {task_name: task_graph.get_state(task_name) for task_name in workflow.tasks}
+        states = await asyncio.gather(*[self.__task_get(task, "getState", "state") for task in workflow.tasks.values()])
+        return {task_name: Task.TaskState(state) for task_name, state in zip(workflow.tasks, states)}
+
+    async def _workflow_get_task_timings(self, workflow: Workflow) -> TaskTimings:
+        states = await self._workflow_get_task_states(workflow)
+        dates = await asyncio.gather(*[self.__task_get(task, route, "time") for task in workflow.tasks.values()
+                                       for route in ("getStartDate", "getEndDate")])
+        return TaskTimings(list(workflow.tasks), list(states.values()), dates[0::2], dates[1::2])
+
+    async def _workflow_get_task_table(self, workflow: Workflow) -> TaskTable:
+        # The table is built on the tasks' cached flops, numbers of cores and memory requirements
+        await asyncio.gather(*[getter(task) for task in workflow.tasks.values()
+                               for getter in (self._task_get_flops, self._task_get_min_num_cores,
+                                              self._task_get_max_num_cores, self._task_get_memory)])
+        task_graph = await self.__get_task_graph(workflow)
+        if task_graph is None:
+            states = await self._workflow_get_task_states(workflow)
+            bottom_levels = await asyncio.gather(*[self.__task_get(task, "getBottomLevel", "bottom_level")
+                                                   for task in workflow.tasks.values()])
+            return TaskTable(list(workflow.tasks.values()), list(states.values()), bottom_levels)
+        task_table = workflow.task_table
+        if task_table is None or task_table.version != task_graph.version:
+            if task_table is not None:
+                task_graph.state_listeners.remove(task_table.set_state)
+            task_table = TaskTable(list(workflow.tasks.values()),
+                                   [task_graph.get_state(task_name) for task_name in workflow.tasks],
+                                   [task_graph.get_bottom_level(task_name) for task_name in workflow.tasks])
+            task_table.version = task_graph.version
+            task_graph.state_listeners.append(task_table.set_state)
+            workflow.task_table = task_table
+        return task_table
+
+    async def __file_registry_request(self, file_registry_service: FileRegistryService, route: str,
+                                      data: dict) -> dict:
+        return await self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
+                                                           f"{file_registry_service.get_name()}/{route}", data)
+
+    async def _add_entry_to_file_registry_service(self, file_registry_service: FileRegistryService, file: File,
+                                                  storage_service: StorageService) -> None:
+        await self.__file_registry_request(file_registry_service, "addEntry",
+                                           {"file_name": file.get_name(),
+                                            "storage_service_name": storage_service.get_name()})
+
+    async def _lookup_entry_in_file_registry_service(self, file_registry_service: FileRegistryService,
+                                                     file: File) -> List[StorageService]:
+        response = await self.__file_registry_request(file_registry_service, "lookupEntry",
+                                                      {"file_name": file.get_name()})
+        return [self.storage_services[name] for name in response["storage_services"]]
+
+    async def _remove_entry_from_file_registry_service(self, file_registry_service: FileRegistryService, file: File,
+                                                       storage_service: StorageService) -> None:
+        await self.__file_registry_request(file_registry_service, "removeEntry",
+                                           {"file_name": file.get_name(),
+                                            "storage_service_name": storage_service.get_name()})
+
+    ###############################
+    # Private methods
+    ###############################
+
+    async def __get_task_graph(self, workflow: Workflow) -> Optional[TaskGraph]:
+        """
+        Get the task graph of a workflow, brought up-to-date, if it can be used instead of querying the daemon
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: the task graph, or None if the daemon must be queried
+        :rtype: Optional[TaskGraph]
+        """
+        if not workflow.task_graph.synchronized:
+            return None
+        if self.__task_states_outdated:
+            self.__pending_events.extend(await self.__fetch_events())
+        return workflow.task_graph
+
+    async def __fetch_events(self) -> List[Dict[str, Union[str, StandardJob, ComputeService]]]:
+        """
+        Get all simulation events that have not been received yet from the daemon
+
+        :return: A list of events
+        :rtype: List[Dict[str, Union[str, StandardJob, ComputeService]]]
+        """
+        response = await self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/simulationEvents", {})
+        self.__state_cache.clear()
+        events = [self.__json_event_to_dict(e) for e in response["events"]]
+        for event in events:
+            await self.__process_job_event(event)
+        self.__task_states_outdated = False
+        return events
+
+    async def __process_job_event(self, event: Dict[str, Union[str, StandardJob, ComputeService]]) -> None:
+        """
+        Record that a job has completed or failed and, for a standard job, update the task graph of its workflow
+        and notify the job listeners
+
+        :param event: the event
+        :type event: Dict[str, Union[str, StandardJob, ComputeService]]
+        """
+        if "standard_job" not in event:
+            self.__running_compound_jobs.discard(event["compound_job"].get_name())
+            return
+        await self.__update_task_states(event["standard_job"], event["event_type"] == "standard_job_completion")
+        for listener in self.job_listeners:
+            listener(event["event_type"], event["standard_job"], event["compute_service"])
+
+    async def __update_task_states(self, job: StandardJob, success: bool) -> None:
+        """
+        Update the task graph of a standard job's workflow once the job has completed or failed
+
+        :param job: the standard job
+        :type job: StandardJob
+        :param success: whether the job has completed successfully
+        :type success: bool
+        """
+        self.__running_standard_jobs.discard(job.get_name())
+        task_graph = job.get_tasks()[0].get_workflow().task_graph
+        if success:
+            for task in job.get_tasks():
+                task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState.COMPLETED))
+            return
+        if not task_graph.synchronized:
+            return
+        # Some tasks of a failed job may have completed, and the others are no longer pending
+        try:
+            states = await asyncio.gather(*[self.__task_get(task, "getState", "state") for task in job.get_tasks()])
+        except WRENCHException:
+            task_graph.synchronized = False
+            return
+        for task, state in zip(job.get_tasks(), states):
+            task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState(state)))
+
+    def __json_event_to_dict(self, json_event: Dict[str, str]) -> Dict[str, Union[str, StandardJob, ComputeService]]:
+        """
+        :param json_event:
+        :type json_event: Dict[str, str]
+
+        :return
+        :rtype: Dict[str, Union[str, StandardJob, ComputeService]]
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        event_type = json_event["event_type"]
+        if event_type not in ("standard_job_completion", "standard_job_failure",
+                              "compound_job_completion", "compound_job_failure"):
+            raise WRENCHException("Unknown event type " + event_type)
+
+        event_dict = {"event_type": event_type,
+                      "compute_service": self.compute_services[json_event["compute_service_name"]],
+                      "submit_date": json_event["submit_date"],
+                      "end_date": json_event["end_date"],
+                      "event_date": json_event["event_date"]}
+        if event_type.startswith("standard_job"):
+            event_dict["standard_job"] = self.standard_jobs[json_event["job_name"]]
+        else:
+            event_dict["compound_job"] = self.compound_jobs[json_event["job_name"]]
+        if event_type.endswith("failure"):
+            event_dict["failure_cause"] = json_event["failure_cause"]
+        return event_dict
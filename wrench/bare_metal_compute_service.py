@@ -14,6 +14,8 @@ class BareMetalComputeService(ComputeService):
     WRENCH Bare Metal Compute Service class
     """
 
+    __slots__ = ()
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
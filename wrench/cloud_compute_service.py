@@ -17,6 +17,8 @@ class CloudComputeService(ComputeService):
     WRENCH Cloud Compute Service class
     """
 
+    __slots__ = ()
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
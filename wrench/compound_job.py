@@ -33,6 +33,8 @@ class CompoundJob(SimulationItem):
     WRENCH Action class
     """
 
+    __slots__ = ("actions",)
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import json
+from typing import Optional, Tuple
+
+from wrench.compound_job import CompoundJob
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+from wrench.file import File
+from wrench.storage_service import StorageService
+
+
+class CompoundJobBuilder:
+    """
+    Client-side builder of a compound job. Actions, dependencies between actions and parent jobs are recorded
+    locally, without any request to the daemon, and the job is created with all of them when build() (or
+    submit()) is called, with requests that are pipelined over a single connection, instead of one round-trip
+    to the daemon per action and per dependency. Actions are referred to by their names, which must be unique
+    within the job. With an AsyncSimulation, build() and submit() return coroutines.
+
+    Example::
+
+        builder = wrench.CompoundJobBuilder(simulation, "job")
+        builder.add_file_read_action("read", file, storage_service)
+        builder.add_compute_action("compute", 100.0, 0, 1, 1, ("AMDAHL", 1.0))
+        builder.add_action_dependency("read", "compute")
+        job = builder.submit(compute_service)
+
+    :param simulation: simulation object
+    :type simulation: Union[Simulation, AsyncSimulation]
+    :param name: name of the compound job
+    :type name: str
+
+    :raises WRENCHException: if the name is empty
+    """
+
+    def __init__(self, simulation, name: str) -> None:
+        """
+        Constructor
+        """
+        if not name:
+            raise WRENCHException("A compound job built with a CompoundJobBuilder must have a name")
+        self._simulation = simulation
+        self._name = name
+        self._actions = []
+        # Names of the actions, to check for duplicates and dependencies in constant time
+        self._action_names = set()
+        self._dependencies = []
+        self._parent_jobs = []
+        self._built = False
+
+    def __add_action(self, kind: str, name: str, args: tuple) -> str:
+        """
+        Record an action
+
+        :param kind: the name of the CompoundJob method that adds the action
+        :type kind: str
+        :param name: the action name
+        :type name: str
+        :param args: the arguments of the CompoundJob method
+        :type args: tuple
+        :return: the action name
+        :rtype: str
+
+        :raises WRENCHException: if the name is empty or already used in the job, or if the job has been built
+        """
+        self.__check_not_built()
+        if not name:
+            raise WRENCHException("Actions added with a CompoundJobBuilder must have a name")
+        if name in self._action_names:
+            raise WRENCHException(f"Action {name} already exists in job {self._name}")
+        self._action_names.add(name)
+        self._actions.append((kind, (name,) + args))
+        return name
+
+    def __check_not_built(self) -> None:
+        """
+        :raises WRENCHException: if the job has been built
+        """
+        if self._built:
+            raise WRENCHException(f"Compound job {self._name} has already been built")
+
+    def add_compute_action(self, name: str, flops: float, ram: int, max_num_cores: int, min_num_cores: int,
+                           parallel_model: Tuple[str, float]) -> str:
+        """
+        Add a compute action to the compound job (see CompoundJob.add_compute_action())
+
+        :param name: name of compute action
+        :type name: str
+        :param flops: flops associated with this action
+        :type flops: float
+        :param ram: minimum amount of ram needed
+        :type ram: int
+        :param max_num_cores: maximum amount of cores this action can use
+        :type max_num_cores: int
+        :param min_num_cores: minimum amount of cores this action needs
+        :type min_num_cores: int
+        :param parallel_model: type of parallel model and settings for it, e.g., ("AMDAHL", 0.8)
+        :type parallel_model: Tuple[str, float]
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_compute_action", name, (flops, ram, max_num_cores, min_num_cores,
+                                                              parallel_model))
+
+    def add_file_copy_action(self, name: str, file: File, src_storage_service: StorageService,
+                             dest_storage_service: StorageService) -> str:
+        """
+        Add a file copy action to the compound job
+
+        :param name: name of file copy action
+        :type name: str
+        :param file: the file being copied
+        :type file: File
+        :param src_storage_service: source storage service being copied from
+        :type src_storage_service: StorageService
+        :param dest_storage_service: destination storage service being copied to
+        :type dest_storage_service: StorageService
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_file_copy_action", name, (file, src_storage_service, dest_storage_service))
+
+    def add_file_delete_action(self, name: str, file: File, storage_service: StorageService) -> str:
+        """
+        Add a file delete action to the compound job
+
+        :param name: name of file delete action
+        :type name: str
+        :param file: the file being deleted
+        :type file: File
+        :param storage_service: storage service file is deleted from
+        :type storage_service: StorageService
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_file_delete_action", name, (file, storage_service))
+
+    def add_file_write_action(self, name: str, file: File, storage_service: StorageService) -> str:
+        """
+        Add a file write action to the compound job
+
+        :param name: name of file write action
+        :type name: str
+        :param file: the file to write
+        :type file: File
+        :param storage_service: storage service to write the file to
+        :type storage_service: StorageService
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_file_write_action", name, (file, storage_service))
+
+    def add_file_read_action(self, name: str, file: File, storage_service: StorageService,
+                             num_bytes_to_read: int = 0) -> str:
+        """
+        Add a file read action to the compound job
+
+        :param name: name of file read action
+        :type name: str
+        :param file: the file to read
+        :type file: File
+        :param storage_service: storage service to read the file from
+        :type storage_service: StorageService
+        :param num_bytes_to_read: number of bytes to read in file (0 means "the whole file")
+        :type num_bytes_to_read: int
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_file_read_action", name, (file, storage_service, num_bytes_to_read))
+
+    def add_sleep_action(self, name: str, sleep_time: float) -> str:
+        """
+        Add a sleep action to the compound job
+
+        :param name: name of the sleep action
+        :type name: str
+        :param sleep_time: the time to sleep
+        :type sleep_time: float
+        :return: the action name
+        :rtype: str
+        """
+        return self.__add_action("add_sleep_action", name, (sleep_time,))
+
+    def add_action_dependency(self, parent_action_name: str, child_action_name: str) -> None:
+        """
+        Add a dependency between two actions of the compound job
+
+        :param parent_action_name: the name of the parent action
+        :type parent_action_name: str
+        :param child_action_name: the name of the child action
+        :type child_action_name: str
+
+        :raises WRENCHException: if an action has not been added to the job, or if the job has been built
+        """
+        self.__check_not_built()
+        for action_name in (parent_action_name, child_action_name):
+            if action_name not in self._action_names:
+                raise WRENCHException(f"Action {action_name} does not exist in job {self._name}")
+        self._dependencies.append((parent_action_name, child_action_name))
+
+    def add_parent_job(self, parent_compound_job: CompoundJob) -> None:
+        """
+        Add a parent compound job to the compound job
+
+        :param parent_compound_job: the parent compound job
+        :type parent_compound_job: CompoundJob
+
+        :raises WRENCHException: if the job has been built
+        """
+        self.__check_not_built()
+        self._parent_jobs.append(parent_compound_job)
+
+    def build(self) -> CompoundJob:
+        """
+        Create the compound job, with all its actions, action dependencies and parent jobs
+
+        :return: the compound job, whose actions are in the order in which they were added
+        :rtype: CompoundJob
+
+        :raises WRENCHException: if the job has already been built, or if there is any error in the responses
+                                 (in which case the job may have been partially built)
+        """
+        return self.__build()
+
+    def submit(self, compute_service: ComputeService,
+               service_specific_args: Optional[dict[str, str]] = None) -> CompoundJob:
+        """
+        Create the compound job, with all its actions, action dependencies and parent jobs, and submit it to a
+        compute service
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param service_specific_args: the service-specific arguments (e.g., for a batch compute service)
+        :type service_specific_args: Optional[dict[str, str]]
+        :return: the compound job, whose actions are in the order in which they were added
+        :rtype: CompoundJob
+
+        :raises WRENCHException: if the job has already been built, or if there is any error in the responses
+                                 (in which case the job may have been partially built)
+        """
+        return self.__build(compute_service, json.dumps(service_specific_args or {}))
+
+    def __build(self, compute_service: Optional[ComputeService] = None, service_specific_args: str = "{}"):
+        """
+        Create the compound job, and submit it if a compute service is given
+
+        :param compute_service: the compute service (or None)
+        :type compute_service: Optional[ComputeService]
+        :param service_specific_args: the service-specific arguments, in JSON
+        :type service_specific_args: str
+        :return: the compound job (or a coroutine, with an AsyncSimulation)
+        :rtype: CompoundJob
+        """
+        self.__check_not_built()
+        self._built = True
+        return self._simulation._build_compound_job(self._name, self._actions, self._dependencies,
+                                                    self._parent_jobs, compute_service, service_specific_args)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the CompoundJobBuilder object
+
+        :return: String representation of the CompoundJobBuilder object
+        :rtype: str
+        """
+        return (f"CompoundJobBuilder(name={self._name}, num_actions={len(self._actions)}, "
+                f"num_dependencies={len(self._dependencies)})")
@@ -17,6 +17,8 @@ class ComputeAction(Action):
     WRENCH Action class
     """
 
+    __slots__ = ("flops", "ram", "min_num_cores", "max_num_cores", "parallel_model")
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, flops: float, ram: int, min_num_cores: int,
                  max_num_cores: int, parallel_model: tuple) -> None:
         """
@@ -20,6 +20,8 @@ class ComputeService(SimulationItem):
     WRENCH Compute Service class
     """
 
+    __slots__ = ()
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import atexit
+import socket
+import subprocess
+import time
+from typing import Optional, Sequence
+
+from wrench.exception import WRENCHException
+from wrench.simulation import Simulation
+
+
+class Daemon:
+    """
+    Local wrench-daemon process, launched on a given or available port, and restarted if it dies. A daemon
+    hosts any number of simulations, one after the other or at the same time, so that keeping it running
+    avoids the process startup cost of each simulation. It is stopped when the Python process exits, if not
+    before.
+
+    Example::
+
+        with wrench.Daemon() as daemon:
+            for platform_xml in platforms:
+                simulation = daemon.simulation()
+                simulation.start(platform_xml, "ControllerHost")
+                ...
+                simulation.terminate()
+
+    :param command: the command that launches the daemon, to which "--port <port number>" is appended
+    :type command: Sequence[str]
+    :param daemon_host: name of the host on which the daemon listens
+    :type daemon_host: str
+    :param daemon_port: port number on which the daemon listens (None means "any available port")
+    :type daemon_port: Optional[int]
+    :param startup_timeout: time in seconds to wait for the daemon to accept connections
+    :type startup_timeout: float
+    :param log_path: path of the file to which the daemon's output is written (None means "discard it")
+    :type log_path: Optional[str]
+    """
+
+    def __init__(self,
+                 command: Sequence[str] = ("wrench-daemon",),
+                 daemon_host: str = "localhost",
+                 daemon_port: Optional[int] = None,
+                 startup_timeout: float = 30.0,
+                 log_path: Optional[str] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        self.command = list(command)
+        self.daemon_host = daemon_host
+        self.daemon_port = daemon_port
+        self.startup_timeout = startup_timeout
+        self.log_path = log_path
+        self.process = None
+        self.num_restarts = 0
+
+    def __enter__(self) -> "Daemon":
+        """
+        Start the daemon when entering a with block
+
+        :return: the daemon
+        :rtype: Daemon
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Stop the daemon when leaving a with block
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Launch the daemon, and wait for it to accept connections (will do nothing if it is running)
+
+        :raises WRENCHException: if the daemon cannot be launched, exits, or does not accept connections in time
+        """
+        if self.is_running():
+            return
+        if self.daemon_port is None:
+            with socket.socket() as s:
+                s.bind((self.daemon_host, 0))
+                self.daemon_port = s.getsockname()[1]
+        log_file = open(self.log_path, "ab") if self.log_path is not None else subprocess.DEVNULL
+        try:
+            self.process = subprocess.Popen(self.command + ["--port", str(self.daemon_port)],
+                                            stdout=log_file, stderr=subprocess.STDOUT)
+        except OSError as e:
+            raise WRENCHException(f"Cannot launch WRENCH daemon ({' '.join(self.command)}): {e}")
+        finally:
+            if self.log_path is not None:
+                log_file.close()
+        atexit.register(self.stop)
+        deadline = time.monotonic() + self.startup_timeout
+        while not self.is_healthy():
+            if self.process.poll() is not None:
+                self.stop()
+                raise WRENCHException(f"WRENCH daemon exited on port {self.daemon_port}"
+                                      + (f" (see {self.log_path})" if self.log_path is not None else ""))
+            if time.monotonic() > deadline:
+                self.stop()
+                raise WRENCHException(f"WRENCH daemon did not accept connections on port {self.daemon_port} "
+                                      f"within {self.startup_timeout} seconds")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        """
+        Stop the daemon, and all the simulations it hosts
+        """
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:  # pragma: no cover
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        atexit.unregister(self.stop)
+
+    def restart(self) -> None:
+        """
+        Stop the daemon, if it is running, and launch it again on the same port
+
+        :raises WRENCHException: if the daemon cannot be launched, exits, or does not accept connections in time
+        """
+        self.stop()
+        self.start()
+        self.num_restarts += 1
+
+    def is_running(self) -> bool:
+        """
+        Check whether the daemon process is running (which it may not be if it has crashed)
+
+        :return: True if the daemon process is running, False otherwise
+        :rtype: bool
+        """
+        return self.process is not None and self.process.poll() is None
+
+    def is_healthy(self) -> bool:
+        """
+        Check whether the daemon process is running and accepts connections
+
+        :return: True if the daemon is healthy, False otherwise
+        :rtype: bool
+        """
+        if not self.is_running():
+            return False
+        try:
+            socket.create_connection((self.daemon_host, self.daemon_port), timeout=1).close()
+        except OSError:
+            return False
+        return True
+
+    def ensure_running(self) -> None:
+        """
+        Restart the daemon if it has been launched but is no longer running, e.g., after a crash
+
+        :raises WRENCHException: if the daemon has not been launched, or cannot be restarted
+        """
+        if self.process is None:
+            raise WRENCHException("The WRENCH daemon has not been started")
+        if not self.is_running():
+            self.restart()
+
+    def simulation(self, **simulation_args) -> Simulation:
+        """
+        Get a new simulation connected to the daemon, which is restarted first if it is no longer running
+
+        :param simulation_args: the other arguments of the Simulation constructor (e.g., timeout=60)
+        :return: a simulation, which still needs to be started
+        :rtype: Simulation
+
+        :raises WRENCHException: if the daemon has not been launched, or cannot be restarted
+        """
+        self.ensure_running()
+        return Simulation(self.daemon_host, self.daemon_port, **simulation_args)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the Daemon object
+
+        :return: String representation of the Daemon object
+        :rtype: str
+        """
+        return f"Daemon(command={self.command}, daemon_port={self.daemon_port}, running={self.is_running()})"
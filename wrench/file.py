@@ -24,6 +24,8 @@ class File(SimulationItem):
     WRENCH File class
     """
 
+    __slots__ = ("size",)
+
     def __init__(self, simulation: Simulation, name: str, size: number = None) -> None:
         """
         Constructor
@@ -43,9 +45,7 @@ class File(SimulationItem):
         :return: A number of bytes
         :rtype: int
         """
-        if not self.size:
-            self.size = self._simulation._file_get_size(self)
-        return self.size;
+        return self._simulation._file_get_size(self)
 
     def __str__(self) -> str:
         """
@@ -17,6 +17,8 @@ class FileCopyAction(Action):
     WRENCH File Copy Action class
     """
 
+    __slots__ = ("src_storage_service", "dest_storage_service", "file", "_uses_scratch")
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, file: File,
                  src_storage_service: StorageService, dest_storage_service: StorageService, uses_scratch: bool) -> None:
         """
@@ -17,6 +17,8 @@ class FileDeleteAction(Action):
     WRENCH File Delete Action class
     """
 
+    __slots__ = ("storage_service", "file", "_uses_scratch")
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, file: File,
                  storage_service: StorageService, uses_scratch: bool) -> None:
         """
@@ -17,6 +17,8 @@ class FileReadAction(Action):
     WRENCH Action class
     """
 
+    __slots__ = ("file", "storage_service", "num_bytes_to_read", "_uses_scratch")
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, file: File, storage_service: StorageService,
                  num_bytes_to_read: int, uses_scratch: bool) -> None:
         """
@@ -18,6 +18,8 @@ class FileRegistryService(SimulationItem):
     WRENCH File Registry Service class
     """
 
+    __slots__ = ()
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
@@ -38,7 +40,7 @@ class FileRegistryService(SimulationItem):
         :type file: File
         :return:
         """
-        self._simulation._add_entry_to_file_registry_service(self, file, storage_service)
+        return self._simulation._add_entry_to_file_registry_service(self, file, storage_service)
 
     def lookup_entry(self, file: File) -> List[StorageService]:
         """
@@ -61,7 +63,7 @@ class FileRegistryService(SimulationItem):
         :type storage_service: StorageService
         :return:
         """
-        self._simulation._remove_entry_from_file_registry_service(self, file, storage_service)
+        return self._simulation._remove_entry_from_file_registry_service(self, file, storage_service)
 
     def __str__(self) -> str:
         """
@@ -17,6 +17,8 @@ class FileWriteAction(Action):
     WRENCH File Write Action class
     """
 
+    __slots__ = ("storage_service", "file", "_uses_scratch")
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, file: File,
                  storage_service: StorageService, uses_scratch: bool) -> None:
         """
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import json
+from typing import Any, Optional, Union
+
+from wrench.exception import WRENCHException
+from wrench.workflow_spec import WorkflowSpec
+
+
+class JSONSerializer:
+    """
+    Encoder/decoder of the JSON documents exchanged with the WRENCH daemon. It uses msgspec or orjson, which are
+    optional dependencies, when installed, and the standard json module otherwise.
+
+    :param backend: the backend to use ("msgspec", "orjson" or "json"), or None to use the fastest one installed
+    :type backend: Optional[str]
+
+    :raises WRENCHException: if the requested backend is unknown or not installed
+    """
+
+    BACKENDS = ("msgspec", "orjson", "json")
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        """
+        Constructor
+        """
+        if backend is not None and backend not in self.BACKENDS:
+            raise WRENCHException(f"Unknown JSON backend {backend} (should be one of {', '.join(self.BACKENDS)})")
+        self.backend = None
+        self.__workflow_decoder = None
+        self.__decode_errors = (KeyError, TypeError)
+        for candidate in ([backend] if backend is not None else self.BACKENDS):
+            if candidate == "msgspec":
+                try:
+                    import msgspec
+                except ImportError:
+                    continue
+                encoder = msgspec.json.Encoder()
+                self.__dumps = encoder.encode
+                self.__loads = msgspec.json.Decoder().decode
+                self.__workflow_decoder = msgspec.json.Decoder(WorkflowSpec).decode
+                self.__decode_errors = (msgspec.ValidationError,)
+            elif candidate == "orjson":
+                try:
+                    import orjson
+                except ImportError:
+                    continue
+                self.__dumps = orjson.dumps
+                self.__loads = orjson.loads
+            else:
+                self.__dumps = self.__stdlib_dumps
+                self.__loads = json.loads
+            self.backend = candidate
+            break
+        if self.backend is None:
+            raise WRENCHException(f"JSON backend {backend} is not installed (pip install {backend})")
+
+    @staticmethod
+    def __stdlib_dumps(obj: Any) -> bytes:
+        """
+        Encode an object with the standard json module
+
+        :param obj: the object
+        :type obj: Any
+        :return: the UTF-8 encoded JSON document
+        :rtype: bytes
+        """
+        return json.dumps(obj).encode()
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object with the backend's encoder
+
+        :param obj: the object
+        :type obj: Any
+        :return: the UTF-8 encoded JSON document
+        :rtype: bytes
+        """
+        return self.__dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document with the backend's decoder
+
+        :param data: the JSON document
+        :type data: Union[bytes, str]
+        :return: the decoded object
+        :rtype: Any
+        """
+        return self.__loads(data)
+
+    def loads_workflow_spec(self, data: Union[bytes, str]) -> WorkflowSpec:
+        """
+        Decode the daemon's answer to a createWorkflowFromJSON request. With the msgspec backend, the files and
+        tasks are decoded straight into WorkflowFileSpec and WorkflowTaskSpec objects.
+
+        :param data: the JSON document
+        :type data: Union[bytes, str]
+        :return: the workflow specification
+        :rtype: WorkflowSpec
+
+        :raises WRENCHException: if the answer does not match the expected structure
+        """
+        try:
+            if self.__workflow_decoder is not None:
+                return self.__workflow_decoder(data)
+            return WorkflowSpec.from_dict(self.__loads(data))
+        except self.__decode_errors as e:
+            raise WRENCHException(f"Invalid createWorkflowFromJSON answer: {e}")
+
+    def __repr__(self) -> str:
+        """
+        String representation of the JSONSerializer object
+
+        :return: String representation of the JSONSerializer object
+        :rtype: str
+        """
+        return f"JSONSerializer(backend={self.backend})"
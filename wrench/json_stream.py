@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Set, Tuple
+
+from wrench.exception import WRENCHException
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONStreamParser:
+    """
+    Incremental parser of a JSON document read as a sequence of byte chunks (e.g., from a file or an HTTP
+    response), which yields the elements of the arrays found at given paths one at a time, so that the
+    whole document never needs to be held in memory. Objects are walked key by key, and the elements of
+    other arrays are decoded one at a time and discarded.
+
+    Example::
+
+        with open("workflow.json", "rb") as f:
+            parser = JSONStreamParser(iter(lambda: f.read(1 << 20), b""))
+            for path, task in parser.items({("workflow", "specification", "tasks")}):
+                ...
+
+    :param chunks: the chunks of the UTF-8 encoded JSON document
+    :type chunks: Iterable[bytes]
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """
+        Constructor
+        """
+        self.__chunks = iter(chunks)
+        self.__utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def items(self, paths: Set[Tuple[str, ...]]) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """
+        Parse the document
+
+        :param paths: the paths, as tuples of object keys from the root of the document, of the arrays whose
+               elements and of the other (non-object) values to yield
+        :type paths: Set[Tuple[str, ...]]
+
+        :return: an iterator over (path, value) tuples, in document order
+        :rtype: Iterator[Tuple[Tuple[str, ...], Any]]
+
+        :raises WRENCHException: if the document is not valid JSON
+        """
+        yield from self.__walk((), paths)
+        if self.__skip_whitespace():
+            raise self.__error("extra data after the document")
+
+    def __walk(self, path: Tuple[str, ...], paths: Set[Tuple[str, ...]]) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """
+        Parse a value
+
+        :param path: the path of the value
+        :type path: Tuple[str, ...]
+        :param paths: the paths of the values to yield
+        :type paths: Set[Tuple[str, ...]]
+
+        :return: an iterator over (path, value) tuples
+        :rtype: Iterator[Tuple[Tuple[str, ...], Any]]
+        """
+        c = self.__skip_whitespace()
+        if c == "{":
+            self.__pos += 1
+            if self.__skip_whitespace() == "}":
+                self.__pos += 1
+                return
+            while True:
+                key = self.__decode_value()
+                if not isinstance(key, str):
+                    raise self.__error("object keys must be strings")
+                self.__expect(":")
+                yield from self.__walk(path + (key,), paths)
+                if self.__expect(",}") == "}":
+                    return
+        elif c == "[":
+            self.__pos += 1
+            if self.__skip_whitespace() == "]":
+                self.__pos += 1
+                return
+            while True:
+                element = self.__decode_value()
+                if path in paths:
+                    yield path, element
+                if self.__expect(",]") == "]":
+                    return
+        else:
+            value = self.__decode_value()
+            if path in paths:
+                yield path, value
+
+    def __fill(self, min_size: int = 1) -> bool:
+        """
+        Append at least min_size characters (unless the end of the document is reached) to the buffer
+
+        :param min_size: the minimum number of characters to append
+        :type min_size: int
+
+        :return: False if the end of the document was reached before, True otherwise
+        :rtype: bool
+        """
+        if self.__eof:
+            return False
+        parts = [self.__buffer[self.__pos:]]
+        self.__pos = 0
+        size = 0
+        while size < min_size:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                parts.append(self.__utf8_decoder.decode(b"", final=True))
+                self.__eof = True
+                break
+            parts.append(self.__utf8_decoder.decode(chunk))
+            size += len(parts[-1])
+        self.__buffer = "".join(parts)
+        return True
+
+    def __skip_whitespace(self) -> str:
+        """
+        Skip whitespace
+
+        :return: the next character, or "" at the end of the document
+        :rtype: str
+        """
+        while True:
+            self.__pos = _WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__fill():
+                return ""
+
+    def __expect(self, characters: str) -> str:
+        """
+        Consume the next (non-whitespace) character, which must be one of the given characters
+
+        :param characters: the expected characters
+        :type characters: str
+
+        :return: the character
+        :rtype: str
+
+        :raises WRENCHException: if the next character is not one of the given characters
+        """
+        c = self.__skip_whitespace()
+        if not c or c not in characters:
+            raise self.__error(f"expected one of {characters!r}")
+        self.__pos += 1
+        return c
+
+    def __decode_value(self) -> Any:
+        """
+        Decode the next value, reading more of the document until it is complete
+
+        :return: the value
+        :rtype: Any
+
+        :raises WRENCHException: if the value is not valid JSON
+        """
+        self.__skip_whitespace()
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(self.__buffer, self.__pos)
+                # A value that ends with the buffer may be a number whose digits have not all been read
+                if end < len(self.__buffer) or self.__eof:
+                    self.__pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.__eof:
+                    raise WRENCHException(f"Invalid JSON document: {e}")
+            # Read at least as much as is already buffered, so that long values are re-decoded a few times only
+            self.__fill(max(1, len(self.__buffer) - self.__pos))
+
+    def __error(self, message: str) -> WRENCHException:
+        """
+        Build the exception raised for a syntax error at the current position
+
+        :param message: the error message
+        :type message: str
+
+        :return: the exception
+        :rtype: WRENCHException
+        """
+        return WRENCHException(f"Invalid JSON document: {message} (near {self.__buffer[self.__pos:self.__pos + 32]!r})")
+
+
+class JSONStringBody:
+    """
+    File-like HTTP request body holding a JSON object whose first member is a string with the contents of a (UTF-8)
+    text file, e.g., {"json_string": "<file contents>", "other": ...}. The file contents are escaped as the body is
+    read, so that the file is never held in memory.
+
+    :param path: the file path
+    :type path: str
+    :param key: the key of the member holding the file contents
+    :type key: str
+    :param members: the other members of the object, as an encoded JSON object
+    :type members: bytes
+    :param chunk_size: the size of the chunks in which the file is read
+    :type chunk_size: int
+    """
+
+    def __init__(self, path: str, key: str, members: bytes = b"{}", chunk_size: int = 1 << 20) -> None:
+        """
+        Constructor
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.prefix = b"{" + json.dumps(key).encode() + b':"'
+        self.suffix = b'"' + (b"," + members.strip()[1:] if members.strip() != b"{}" else b"}")
+        self.length = sum(len(chunk) for chunk in self.__iter_chunks())
+        self.__chunks: Optional[Iterator[bytes]] = None
+        self.__pending = b""
+        self.__offset = 0
+
+    def __len__(self) -> int:
+        """
+        Size of the body
+
+        :return: a number of bytes
+        :rtype: int
+        """
+        return self.length
+
+    def __iter_chunks(self) -> Iterator[bytes]:
+        """
+        Generate the body
+
+        :return: an iterator over the chunks of the body
+        :rtype: Iterator[bytes]
+        """
+        yield self.prefix
+        utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(self.path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                text = utf8_decoder.decode(chunk)
+                if text:
+                    yield json.dumps(text)[1:-1].encode()
+        text = utf8_decoder.decode(b"", final=True)
+        if text:
+            yield json.dumps(text)[1:-1].encode()
+        yield self.suffix
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read (part of) the body
+
+        :param size: the maximum number of bytes to read (-1 to read the rest of the body)
+        :type size: int
+
+        :return: the bytes read, or b"" at the end of the body
+        :rtype: bytes
+        """
+        if self.__chunks is None:
+            self.__chunks = self.__iter_chunks()
+        parts = []
+        while size != 0:
+            if self.__offset == len(self.__pending):
+                self.__pending = next(self.__chunks, b"")
+                self.__offset = 0
+                if not self.__pending:
+                    break
+            end = len(self.__pending) if size < 0 else min(len(self.__pending), self.__offset + size)
+            parts.append(self.__pending[self.__offset:end])
+            if size > 0:
+                size -= end - self.__offset
+            self.__offset = end
+        return b"".join(parts)
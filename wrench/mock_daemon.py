@@ -0,0 +1,1265 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import re
+import socketserver
+import threading
+import xml.etree.ElementTree as ElementTree
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from wrench.exception import WRENCHException
+
+
+def _parse_quantity(value: str, units: Dict[str, float]) -> float:
+    """
+    Parse a SimGrid-style quantity (e.g., "10Gf", "5000GiB", "100MBps")
+
+    :param value: the quantity as a string
+    :type value: str
+    :param units: the unit suffixes (without prefix) and their multipliers
+    :type units: Dict[str, float]
+    :return: the quantity in base units
+    :rtype: float
+    """
+    match = re.fullmatch(r"\s*([0-9.eE+-]+)\s*([A-Za-z]*)\s*", value)
+    if not match:
+        raise WRENCHException(f"Invalid quantity '{value}'")
+    number, suffix = float(match.group(1)), match.group(2)
+    if suffix == "":
+        return number
+    prefixes = {"": 1, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+                "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60}
+    for unit, multiplier in units.items():
+        if suffix.endswith(unit) and suffix[:-len(unit)] in prefixes:
+            return number * prefixes[suffix[:-len(unit)]] * multiplier
+    raise WRENCHException(f"Invalid unit in quantity '{value}'")
+
+
+def _parse_flop_rate(value: str) -> float:
+    """
+    Parse a flop rate (e.g., "100Gf")
+
+    :param value: the flop rate as a string
+    :type value: str
+    :return: the flop rate in flop/sec
+    :rtype: float
+    """
+    return _parse_quantity(value, {"f": 1, "flops": 1})
+
+
+def _parse_bytes(value: str) -> float:
+    """
+    Parse a number of bytes (e.g., "5000GiB")
+
+    :param value: the number of bytes as a string
+    :type value: str
+    :return: the number of bytes
+    :rtype: float
+    """
+    return _parse_quantity(value, {"B": 1, "b": 1 / 8})
+
+
+class _Host:
+    """
+    A host of the simulated platform
+    """
+
+    def __init__(self, name: str, speed: float, cores: int, ram: float, disks: Dict[str, float]) -> None:
+        self.name = name
+        self.speed = speed
+        self.cores = cores
+        self.ram = ram
+        self.disks = disks
+
+
+class _Task:
+    """
+    A workflow task, with its simulated state
+    """
+
+    def __init__(self, name: str, flops: float, min_num_cores: int, max_num_cores: int, memory: float) -> None:
+        self.name = name
+        self.flops = flops
+        self.min_num_cores = min_num_cores
+        self.max_num_cores = max_num_cores
+        self.memory = memory
+        self.input_files = []
+        self.output_files = []
+        self.parents = set()
+        self.children = set()
+        self.state = "NOT_READY"
+        self.start_date = -1.0
+        self.end_date = -1.0
+
+
+class _Workflow:
+    """
+    A workflow, i.e., a DAG of tasks whose dependencies stem from files and explicit control dependencies
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.tasks = {}
+        self.producers = {}
+
+    def lookup_task(self, name: str) -> _Task:
+        if name not in self.tasks:
+            raise WRENCHException(f"Unknown task {name}")
+        return self.tasks[name]
+
+    @staticmethod
+    def path_exists(source: _Task, destination: _Task) -> bool:
+        visited, to_visit = {destination.name}, [destination]
+        while to_visit:
+            for parent in to_visit.pop().parents:
+                if parent is source:
+                    return True
+                if parent.name not in visited:
+                    visited.add(parent.name)
+                    to_visit.append(parent)
+        return False
+
+    def add_dependency(self, parent: _Task, child: _Task, redundant: bool = False, ignore_cycles: bool = False) -> None:
+        # Same rules as WRENCH: redundant dependencies are dropped unless asked for, cycles are errors
+        if parent is child or parent in child.parents:
+            return
+        if self.path_exists(child, parent):
+            if ignore_cycles:
+                return
+            raise WRENCHException(f"Adding a dependency from {parent.name} to {child.name} would create a cycle")
+        if not redundant and self.path_exists(parent, child):
+            return
+        child.parents.add(parent)
+        parent.children.add(child)
+        self.update_state(child)
+
+    def update_state(self, task: _Task) -> None:
+        if task.state in ("PENDING", "COMPLETED"):
+            return
+        if all(parent.state == "COMPLETED" for parent in task.parents):
+            task.state = "READY"
+        else:
+            task.state = "NOT_READY"
+
+    def bottom_level(self, task: _Task) -> int:
+        levels = {}
+        stack = [(task, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current.name in levels:
+                continue
+            if expanded or not current.children:
+                levels[current.name] = 1 + max((levels[c.name] for c in current.children), default=-1)
+            else:
+                stack.append((current, True))
+                stack.extend((c, False) for c in current.children if c.name not in levels)
+        return levels[task.name]
+
+
+class _ComputeService:
+    """
+    A compute service, described by the hosts it can use
+    """
+
+    def __init__(self, name: str, kind: str, hosts: Dict[str, Tuple[int, float]]) -> None:
+        self.name = name
+        self.kind = kind
+        self.hosts = hosts
+        self.vms = {}
+
+    def supports(self, job_kind: str) -> bool:
+        if self.kind == "cloud":
+            return False
+        if job_kind == "pilot":
+            return self.kind == "batch"
+        return True
+
+
+class _VM:
+    """
+    A virtual machine created on a cloud compute service
+    """
+
+    def __init__(self, name: str, cloud_service: _ComputeService, num_cores: int, ram: float) -> None:
+        self.name = name
+        self.cloud_service = cloud_service
+        self.num_cores = num_cores
+        self.ram = ram
+        self.state = "DOWN"
+        self.num_starts = 0
+
+
+class _Action:
+    """
+    An action of a compound job
+    """
+
+    def __init__(self, name: str, kind: str, spec: dict) -> None:
+        self.name = name
+        self.kind = kind
+        self.spec = spec
+        self.parents = set()
+        self.state = "READY"
+        self.start_date = -1.0
+        self.end_date = -1.0
+        self.failure_cause = ""
+
+
+class _CompoundJob:
+    """
+    A compound job, i.e., a DAG of actions
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.actions = {}
+        self.parent_jobs = set()
+        self.end_date = None
+
+
+class _StandardJob:
+    """
+    A standard job, i.e., a set of tasks and file locations
+    """
+
+    def __init__(self, name: str, workflow: _Workflow, tasks: List[_Task], file_locations: Dict[str, str]) -> None:
+        self.name = name
+        self.workflow = workflow
+        self.tasks = tasks
+        self.file_locations = file_locations
+
+
+class _MockSimulation:
+    """
+    The state of one simulation hosted by the mock daemon, and the handlers for all its REST routes
+    """
+
+    ACTION_STATES = {"NOT_READY": 0, "READY": 1, "STARTED": 2, "COMPLETED": 3, "KILLED": 4, "FAILED": 5}
+    TASK_STATES = {"NOT_READY": 0, "READY": 1, "PENDING": 2, "COMPLETED": 3, "UNKNOWN": 4}
+
+    def __init__(self, platform_xml: str, controller_hostname: str) -> None:
+        self.hosts = self.__parse_platform(platform_xml)
+        if controller_hostname not in self.hosts:
+            raise WRENCHException(f"Unknown host {controller_hostname}")
+        self.lock = threading.RLock()
+        self.now = 0.0
+        self.names = itertools.count()
+        self.sequence = itertools.count()
+        self.files = {}
+        self.workflows = {}
+        self.compute_services = {}
+        self.storage_services = {}
+        self.file_registry_services = {}
+        self.standard_jobs = {}
+        self.compound_jobs = {}
+        self.scheduled = []
+        self.events = []
+        self.terminated = False
+        self.routes = self.__build_routes()
+
+    @staticmethod
+    def __parse_platform(platform_xml: str) -> Dict[str, _Host]:
+        try:
+            root = ElementTree.fromstring(platform_xml)
+        except ElementTree.ParseError as e:
+            raise WRENCHException(f"Invalid platform XML: {e}")
+        hosts = {}
+        for element in root.iter():
+            if element.tag == "host":
+                props = {p.get("id"): p.get("value") for p in element.findall("prop")}
+                disks = {}
+                for disk in element.findall("disk"):
+                    disk_props = {p.get("id"): p.get("value") for p in disk.findall("prop")}
+                    if "mount" in disk_props:
+                        disks[disk_props["mount"]] = _parse_bytes(disk_props.get("size", "inf"))
+                hosts[element.get("id")] = _Host(element.get("id"), _parse_flop_rate(element.get("speed", "1f")),
+                                                 int(element.get("core", "1")),
+                                                 _parse_bytes(props["ram"]) if "ram" in props else float("inf"),
+                                                 disks)
+            elif element.tag == "cluster":
+                for radical in element.get("radical").split(","):
+                    bounds = radical.split("-")
+                    for i in range(int(bounds[0]), int(bounds[-1]) + 1):
+                        name = f"{element.get('prefix', '')}{i}{element.get('suffix', '')}"
+                        hosts[name] = _Host(name, _parse_flop_rate(element.get("speed", "1f")),
+                                            int(element.get("core", "1")), float("inf"), {})
+        return hosts
+
+    def __build_routes(self) -> List[Tuple[re.Pattern, Callable]]:
+        table = {
+            "terminateSimulation": self.terminate_simulation,
+            "waitForNextSimulationEvent": self.wait_for_next_simulation_event,
+            "simulationEvents": self.simulation_events,
+            "getTime": self.get_time,
+            "advanceTime": self.advance_time,
+            "hostnames": self.hostnames,
+            "addFile": self.add_file,
+            "files/{file}/size": self.file_size,
+            "addBareMetalComputeService": self.add_bare_metal_compute_service,
+            "addBatchComputeService": self.add_batch_compute_service,
+            "addCloudComputeService": self.add_cloud_compute_service,
+            "addSimpleStorageService": self.add_simple_storage_service,
+            "addFileRegistryService": self.add_file_registry_service,
+            "compute_services/{cs}/supportsCompoundJobs": lambda d, cs: self.supports(cs, "compound"),
+            "compute_services/{cs}/supportsPilotJobs": lambda d, cs: self.supports(cs, "pilot"),
+            "compute_services/{cs}/supportsStandardJobs": lambda d, cs: self.supports(cs, "standard"),
+            "compute_services/{cs}/coreFlopRates": self.core_flop_rates,
+            "compute_services/{cs}/coreCounts": self.core_counts,
+            "storage_services/{ss}/createFileCopy": self.create_file_copy,
+            "storage_services/{ss}/lookupFile": self.lookup_file_on_storage_service,
+            "fileRegistryServices/{frs}/addEntry": self.add_entry,
+            "fileRegistryServices/{frs}/lookupEntry": self.lookup_entry,
+            "fileRegistryServices/{frs}/removeEntry": self.remove_entry,
+            "createWorkflow": self.create_workflow,
+            "createWorkflowFromJSON": self.create_workflow_from_json,
+            "workflows/{wf}/createTask": self.create_task,
+            "workflows/{wf}/inputFiles": self.workflow_input_files,
+            "workflows/{wf}/readyTasks": self.ready_tasks,
+            "workflows/{wf}/isDone": self.is_done,
+            "workflows/{wf}/createStandardJob": self.create_standard_job,
+            "workflows/{wf}/tasks/{task}/addInputFile": self.add_input_file,
+            "workflows/{wf}/tasks/{task}/addOutputFile": self.add_output_file,
+            "workflows/{wf}/tasks/{task}/inputFiles": lambda d, wf, task: self.task_files(wf, task, "input_files"),
+            "workflows/{wf}/tasks/{task}/outputFiles": lambda d, wf, task: self.task_files(wf, task, "output_files"),
+            "workflows/{wf}/tasks/{task}/getState":
+                lambda d, wf, task: {"state": self.TASK_STATES[self.lookup_task(wf, task).state]},
+            "workflows/{wf}/tasks/{task}/getFlops": lambda d, wf, task: {"flops": self.lookup_task(wf, task).flops},
+            "workflows/{wf}/tasks/{task}/getMinNumCores":
+                lambda d, wf, task: {"min_num_cores": self.lookup_task(wf, task).min_num_cores},
+            "workflows/{wf}/tasks/{task}/getMaxNumCores":
+                lambda d, wf, task: {"max_num_cores": self.lookup_task(wf, task).max_num_cores},
+            "workflows/{wf}/tasks/{task}/getMemory": lambda d, wf, task: {"memory": self.lookup_task(wf, task).memory},
+            "workflows/{wf}/tasks/{task}/getNumberOfChildren":
+                lambda d, wf, task: {"number_of_children": len(self.lookup_task(wf, task).children)},
+            "workflows/{wf}/tasks/{task}/getBottomLevel":
+                lambda d, wf, task: {"bottom_level": self.workflows[wf].bottom_level(self.lookup_task(wf, task))},
+            "workflows/{wf}/tasks/{task}/getStartDate":
+                lambda d, wf, task: {"time": self.lookup_task(wf, task).start_date},
+            "workflows/{wf}/tasks/{task}/getEndDate": lambda d, wf, task: {"time": self.lookup_task(wf, task).end_date},
+            "standardJobs/{job}/submit": self.submit_standard_job,
+            "createCompoundJob": self.create_compound_job,
+            "compoundJobs/{job}/submit": self.submit_compound_job,
+            "compoundJobs/{job}/addComputeAction": lambda d, job: self.add_action(d, job, "compute"),
+            "compoundJobs/{job}/addFileCopyAction": lambda d, job: self.add_action(d, job, "file_copy"),
+            "compoundJobs/{job}/addFileDeleteAction": lambda d, job: self.add_action(d, job, "file_delete"),
+            "compoundJobs/{job}/addFileWriteAction": lambda d, job: self.add_action(d, job, "file_write"),
+            "compoundJobs/{job}/addFileReadAction": lambda d, job: self.add_action(d, job, "file_read"),
+            "compoundJobs/{job}/addSleepAction": lambda d, job: self.add_action(d, job, "sleep"),
+            "compoundJobs/{job}/addActionDependency": self.add_action_dependency,
+            "compoundJobs/{job}/addParentJob": self.add_parent_job,
+            "compoundJobs/{job}/actions/{action}/getState":
+                lambda d, job, action: {"state": self.ACTION_STATES[self.lookup_action(job, action).state]},
+            "compoundJobs/{job}/actions/{action}/getStartDate":
+                lambda d, job, action: {"time": self.lookup_action(job, action).start_date},
+            "compoundJobs/{job}/actions/{action}/getEndDate":
+                lambda d, job, action: {"time": self.lookup_action(job, action).end_date},
+            "compoundJobs/{job}/actions/{action}/getFailureCause":
+                lambda d, job, action: {"action_failure_cause": self.lookup_action(job, action).failure_cause},
+            "cloud_compute_services/{cs}/createVM": self.create_vm,
+            "cloud_compute_services/{cs}/vms/{vm}/startVM": self.start_vm,
+            "cloud_compute_services/{cs}/vms/{vm}/shutdownVM": lambda d, cs, vm: self.vm_transition(
+                cs, vm, ("RUNNING", "SUSPENDED"), "DOWN"),
+            "cloud_compute_services/{cs}/vms/{vm}/suspendVM": lambda d, cs, vm: self.vm_transition(
+                cs, vm, ("RUNNING",), "SUSPENDED"),
+            "cloud_compute_services/{cs}/vms/{vm}/resumeVM": lambda d, cs, vm: self.vm_transition(
+                cs, vm, ("SUSPENDED",), "RUNNING"),
+            "cloud_compute_services/{cs}/vms/{vm}/destroyVM": self.destroy_vm,
+            "cloud_compute_services/{cs}/vms/{vm}/isVMRunning":
+                lambda d, cs, vm: {"result": self.lookup_vm(cs, vm).state == "RUNNING"},
+            "cloud_compute_services/{cs}/vms/{vm}/isVMDown":
+                lambda d, cs, vm: {"result": self.lookup_vm(cs, vm).state == "DOWN"},
+            "cloud_compute_services/{cs}/vms/{vm}/isVMSuspended":
+                lambda d, cs, vm: {"result": self.lookup_vm(cs, vm).state == "SUSPENDED"},
+        }
+        routes = []
+        for template, handler in table.items():
+            pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)
+            routes.append((re.compile(pattern + "$"), handler))
+        return routes
+
+    def handle(self, route: str, data: dict) -> dict:
+        """
+        Answer a request to one of the simulation's routes
+
+        :param route: the route, relative to /simulation/{simid}/
+        :type route: str
+        :param data: the JSON data attached to the request
+        :type data: dict
+        :return: the JSON answer
+        :rtype: dict
+        """
+        for pattern, handler in self.routes:
+            match = pattern.match(route)
+            if match:
+                with self.lock:
+                    return handler(data, **match.groupdict())
+        raise WRENCHException(f"Unknown route {route}")
+
+    ###############################
+    # Helpers
+    ###############################
+
+    def new_name(self, prefix: str) -> str:
+        return f"{prefix}_{next(self.names)}"
+
+    def lookup(self, registry: dict, name: str, kind: str):
+        if name not in registry:
+            raise WRENCHException(f"Unknown {kind} {name}")
+        return registry[name]
+
+    def lookup_host(self, name: str) -> _Host:
+        return self.lookup(self.hosts, name, "host")
+
+    def lookup_file(self, name: str) -> dict:
+        return self.lookup(self.files, name, "file")
+
+    def lookup_task(self, workflow_name: str, task_name: str) -> _Task:
+        return self.lookup(self.workflows, workflow_name, "workflow").lookup_task(task_name)
+
+    def lookup_action(self, job_name: str, action_name: str) -> _Action:
+        return self.lookup(self.lookup(self.compound_jobs, job_name, "compound job").actions, action_name, "action")
+
+    def lookup_vm(self, cs_name: str, vm_name: str) -> _VM:
+        return self.lookup(self.lookup(self.compute_services, cs_name, "compute service").vms, vm_name, "VM")
+
+    def schedule(self, date: float, callback: Callable[[], Optional[dict]]) -> None:
+        """
+        Schedule a callback at a simulated date
+
+        :param date: the simulated date
+        :type date: float
+        :param callback: the callback, which returns the event it causes, if any
+        :type callback: Callable[[], Optional[dict]]
+        """
+        heapq.heappush(self.scheduled, (date, next(self.sequence), callback))
+
+    def process_scheduled(self, until: float) -> None:
+        """
+        Advance the simulated time, running all callbacks scheduled up to a date
+
+        :param until: the date
+        :type until: float
+        """
+        while self.scheduled and self.scheduled[0][0] <= until:
+            date, _, callback = heapq.heappop(self.scheduled)
+            self.now = max(self.now, date)
+            event = callback()
+            if event is not None:
+                event["event_date"] = self.now
+                self.events.append(event)
+
+    def execution_speed(self, cs: _ComputeService, max_num_cores: int) -> Tuple[float, float]:
+        """
+        Determine how fast a compute service executes work (trivial time model: on its first host only)
+
+        :param cs: the compute service
+        :type cs: _ComputeService
+        :param max_num_cores: the maximum number of cores the work can use
+        :type max_num_cores: int
+        :return: a (flop rate, RAM) tuple
+        :rtype: Tuple[float, float]
+        """
+        host_name = next(iter(cs.hosts))
+        cores, ram = cs.hosts[host_name]
+        return self.hosts[host_name].speed * max(1, min(cores, max_num_cores)), ram
+
+    ###############################
+    # Route handlers
+    ###############################
+
+    def terminate_simulation(self, data: dict) -> dict:
+        self.terminated = True
+        return {}
+
+    def wait_for_next_simulation_event(self, data: dict) -> dict:
+        if not self.events:
+            if not self.scheduled:
+                raise WRENCHException("No simulation event can occur")
+            self.process_scheduled(self.scheduled[0][0])
+        return {"event": self.events.pop(0)}
+
+    def simulation_events(self, data: dict) -> dict:
+        events, self.events = self.events, []
+        return {"events": events}
+
+    def get_time(self, data: dict) -> dict:
+        return {"time": self.now}
+
+    def advance_time(self, data: dict) -> dict:
+        until = self.now + float(data["increment"])
+        self.process_scheduled(until)
+        self.now = until
+        return {}
+
+    def hostnames(self, data: dict) -> dict:
+        return {"hostnames": list(self.hosts)}
+
+    def add_file(self, data: dict) -> dict:
+        if data["name"] in self.files:
+            raise WRENCHException(f"File {data['name']} already exists")
+        self.files[data["name"]] = {"name": data["name"], "size": data["size"]}
+        return {}
+
+    def file_size(self, data: dict, file: str) -> dict:
+        return {"size": self.lookup_file(file)["size"]}
+
+    def add_bare_metal_compute_service(self, data: dict) -> dict:
+        self.lookup_host(data["head_host"])
+        hosts = {}
+        for host_name, (num_cores, ram) in json.loads(data["resources"]).items():
+            host = self.lookup_host(host_name)
+            hosts[host_name] = (host.cores if num_cores < 0 else num_cores, host.ram if ram < 0 else host.ram)
+        name = self.new_name("bare_metal_compute_service")
+        self.compute_services[name] = _ComputeService(name, "bare_metal", hosts)
+        return {"service_name": name}
+
+    def add_batch_compute_service(self, data: dict) -> dict:
+        self.lookup_host(data["head_host"])
+        hosts = {h: (self.lookup_host(h).cores, self.lookup_host(h).ram) for h in data["resources"]}
+        name = self.new_name("batch_compute_service")
+        self.compute_services[name] = _ComputeService(name, "batch", hosts)
+        return {"service_name": name}
+
+    def add_cloud_compute_service(self, data: dict) -> dict:
+        self.lookup_host(data["head_host"])
+        hosts = {h: (self.lookup_host(h).cores, self.lookup_host(h).ram) for h in data["resources"]}
+        name = self.new_name("cloud_compute_service")
+        self.compute_services[name] = _ComputeService(name, "cloud", hosts)
+        return {"service_name": name}
+
+    def add_simple_storage_service(self, data: dict) -> dict:
+        host = self.lookup_host(data["head_host"])
+        for mount_point in data["mount_points"]:
+            if mount_point not in host.disks:
+                raise WRENCHException(f"No disk mounted at {mount_point} on host {host.name}")
+        capacity = sum(host.disks[m] for m in data["mount_points"])
+        name = self.new_name("simple_storage_service")
+        self.storage_services[name] = {"capacity": capacity, "files": set()}
+        return {"service_name": name}
+
+    def add_file_registry_service(self, data: dict) -> dict:
+        self.lookup_host(data["head_host"])
+        name = self.new_name("file_registry_service")
+        self.file_registry_services[name] = {}
+        return {"service_name": name}
+
+    def supports(self, cs_name: str, job_kind: str) -> dict:
+        return {"result": self.lookup(self.compute_services, cs_name, "compute service").supports(job_kind)}
+
+    def core_flop_rates(self, data: dict, cs: str) -> dict:
+        hosts = self.lookup(self.compute_services, cs, "compute service").hosts
+        return {"hostnames": list(hosts), "flop_rates": [self.hosts[h].speed for h in hosts]}
+
+    def core_counts(self, data: dict, cs: str) -> dict:
+        hosts = self.lookup(self.compute_services, cs, "compute service").hosts
+        return {"hostnames": list(hosts), "core_counts": [hosts[h][0] for h in hosts]}
+
+    def store_file(self, ss_name: str, file_name: str) -> None:
+        ss = self.lookup(self.storage_services, ss_name, "storage service")
+        file = self.lookup_file(file_name)
+        if file_name in ss["files"]:
+            return
+        used = sum(self.files[f]["size"] for f in ss["files"])
+        if used + file["size"] > ss["capacity"]:
+            raise WRENCHException(f"Not enough space on storage service {ss_name} for file {file_name}")
+        ss["files"].add(file_name)
+
+    def create_file_copy(self, data: dict, ss: str) -> dict:
+        self.store_file(ss, data["filename"])
+        return {}
+
+    def lookup_file_at(self, ss_name: str, file_name: str) -> bool:
+        ss = self.lookup(self.storage_services, ss_name, "storage service")
+        self.lookup_file(file_name)
+        return file_name in ss["files"]
+
+    def lookup_file_on_storage_service(self, data: dict, ss: str) -> dict:
+        return {"result": self.lookup_file_at(ss, data["filename"])}
+
+    def add_entry(self, data: dict, frs: str) -> dict:
+        entries = self.lookup(self.file_registry_services, frs, "file registry service")
+        self.lookup_file(data["file_name"])
+        self.lookup(self.storage_services, data["storage_service_name"], "storage service")
+        locations = entries.setdefault(data["file_name"], [])
+        if data["storage_service_name"] not in locations:
+            locations.append(data["storage_service_name"])
+        return {}
+
+    def lookup_entry(self, data: dict, frs: str) -> dict:
+        entries = self.lookup(self.file_registry_services, frs, "file registry service")
+        self.lookup_file(data["file_name"])
+        return {"storage_services": list(entries.get(data["file_name"], []))}
+
+    def remove_entry(self, data: dict, frs: str) -> dict:
+        entries = self.lookup(self.file_registry_services, frs, "file registry service")
+        locations = entries.get(data["file_name"], [])
+        if data["storage_service_name"] in locations:
+            locations.remove(data["storage_service_name"])
+        return {}
+
+    def create_workflow(self, data: dict) -> dict:
+        name = self.new_name("workflow")
+        self.workflows[name] = _Workflow(name)
+        return {"workflow_name": name}
+
+    def new_task(self, workflow: _Workflow, name: str, flops: float, min_num_cores: int, max_num_cores: int,
+                 memory: float) -> _Task:
+        if name in workflow.tasks:
+            raise WRENCHException(f"Task {name} already exists in workflow {workflow.name}")
+        task = _Task(name, flops, min_num_cores, max_num_cores, memory)
+        workflow.tasks[name] = task
+        workflow.update_state(task)
+        return task
+
+    def create_task(self, data: dict, wf: str) -> dict:
+        workflow = self.lookup(self.workflows, wf, "workflow")
+        self.new_task(workflow, data["name"], data["flops"], data["min_num_cores"], data["max_num_cores"],
+                      data["memory"])
+        return {}
+
+    def attach_input_file(self, workflow: _Workflow, task: _Task, file_name: str) -> None:
+        self.lookup_file(file_name)
+        task.input_files.append(file_name)
+        if file_name in workflow.producers:
+            workflow.add_dependency(workflow.producers[file_name], task)
+
+    def attach_output_file(self, workflow: _Workflow, task: _Task, file_name: str) -> None:
+        self.lookup_file(file_name)
+        if file_name in workflow.producers and workflow.producers[file_name] is not task:
+            raise WRENCHException(f"File {file_name} is already the output of another task")
+        task.output_files.append(file_name)
+        workflow.producers[file_name] = task
+        for consumer in workflow.tasks.values():
+            if file_name in consumer.input_files:
+                workflow.add_dependency(task, consumer)
+
+    def add_input_file(self, data: dict, wf: str, task: str) -> dict:
+        self.attach_input_file(self.workflows[wf], self.lookup_task(wf, task), data["file"])
+        return {}
+
+    def add_output_file(self, data: dict, wf: str, task: str) -> dict:
+        self.attach_output_file(self.workflows[wf], self.lookup_task(wf, task), data["file"])
+        return {}
+
+    def task_files(self, wf: str, task: str, attribute: str) -> dict:
+        return {"files": list(getattr(self.lookup_task(wf, task), attribute))}
+
+    def workflow_input_files(self, data: dict, wf: str) -> dict:
+        workflow = self.lookup(self.workflows, wf, "workflow")
+        files = []
+        for task in workflow.tasks.values():
+            for file_name in task.input_files:
+                if file_name not in workflow.producers and file_name not in files:
+                    files.append(file_name)
+        return {"files": files}
+
+    def ready_tasks(self, data: dict, wf: str) -> dict:
+        workflow = self.lookup(self.workflows, wf, "workflow")
+        return {"tasks": [t.name for t in workflow.tasks.values() if t.state == "READY"]}
+
+    def is_done(self, data: dict, wf: str) -> dict:
+        workflow = self.lookup(self.workflows, wf, "workflow")
+        return {"result": all(t.state == "COMPLETED" for t in workflow.tasks.values())}
+
+    def create_workflow_from_json(self, data: dict) -> dict:
+        document = json.loads(data["json_string"])
+        reference_flop_rate = _parse_flop_rate(data["reference_flop_rate"])
+        if "specification" in document["workflow"]:
+            task_specs = document["workflow"]["specification"]["tasks"]
+            file_specs = {f["id"]: f.get("sizeInBytes", 0) for f in document["workflow"]["specification"]["files"]}
+            executions = {t["id"]: t for t in document["workflow"].get("execution", {}).get("tasks", [])}
+        else:
+            task_specs = document["workflow"]["tasks"]
+            file_specs = {}
+            for task_spec in task_specs:
+                for f in task_spec.get("files", []):
+                    file_specs[f.get("id", f.get("name"))] = f.get("sizeInBytes", f.get("size", 0))
+                task_spec["inputFiles"] = [f.get("id", f.get("name")) for f in task_spec.get("files", [])
+                                           if f.get("link") == "input"]
+                task_spec["outputFiles"] = [f.get("id", f.get("name")) for f in task_spec.get("files", [])
+                                            if f.get("link") == "output"]
+            executions = {t.get("id", t["name"]): t for t in task_specs}
+
+        for file_name, size in file_specs.items():
+            if file_name not in self.files:
+                self.files[file_name] = {"name": file_name, "size": size}
+
+        name = self.new_name("workflow")
+        workflow = _Workflow(name)
+        self.workflows[name] = workflow
+        for task_spec in task_specs:
+            task_id = task_spec.get("id", task_spec.get("name"))
+            execution = executions.get(task_id, {})
+            runtime = execution.get("runtimeInSeconds", execution.get("runtime", 0))
+            specified_cores = execution.get("coreCount", execution.get("cores"))
+            if specified_cores is None or data["enforce_num_cores"]:
+                min_num_cores, max_num_cores = data["min_cores_per_task"], data["max_cores_per_task"]
+            else:
+                min_num_cores = max_num_cores = int(specified_cores)
+            self.new_task(workflow, task_id, runtime * reference_flop_rate, min_num_cores, max_num_cores,
+                          execution.get("memoryInBytes", 0))
+        for task_spec in task_specs:
+            task = workflow.tasks[task_spec.get("id", task_spec.get("name"))]
+            for file_name in task_spec.get("inputFiles", []):
+                self.attach_input_file(workflow, task, file_name)
+            for file_name in task_spec.get("outputFiles", []):
+                self.attach_output_file(workflow, task, file_name)
+        # Parents are referred to by id or, in some WfCommons instances, by name
+        ids_by_name = {task_spec["name"]: task_spec.get("id", task_spec["name"]) for task_spec in task_specs}
+        for task_spec in task_specs:
+            task = workflow.tasks[task_spec.get("id", task_spec.get("name"))]
+            for parent_name in task_spec.get("parents", []):
+                if parent_name not in workflow.tasks:
+                    parent_name = ids_by_name.get(parent_name, parent_name)
+                workflow.add_dependency(workflow.lookup_task(parent_name), task, data["redundant_dependencies"],
+                                        data["ignore_cycle_creating_dependencies"])
+
+        return {"workflow_name": name,
+                "files": [{"name": f, "size": self.files[f]["size"]} for f in file_specs],
+                "tasks": [{"name": t.name, "flops": t.flops, "min_num_cores": t.min_num_cores,
+                           "max_num_cores": t.max_num_cores, "memory": t.memory,
+                           "input_file_names": t.input_files, "output_file_names": t.output_files}
+                          for t in workflow.tasks.values()]}
+
+    def create_standard_job(self, data: dict, wf: str) -> dict:
+        workflow = self.lookup(self.workflows, wf, "workflow")
+        tasks = [workflow.lookup_task(name) for name in data["tasks"]]
+        for task in tasks:
+            if task.state in ("PENDING", "COMPLETED"):
+                raise WRENCHException(f"Task {task.name} cannot be part of a new job")
+            for parent in task.parents:
+                if parent.state != "COMPLETED" and parent not in tasks:
+                    raise WRENCHException(f"Task {task.name} has a non-completed parent that is not in the job")
+        for file_name, ss_name in data["file_locations"].items():
+            self.lookup_file(file_name)
+            self.lookup(self.storage_services, ss_name, "storage service")
+        name = self.new_name("standard_job")
+        self.standard_jobs[name] = _StandardJob(name, workflow, tasks, data["file_locations"])
+        return {"job_name": name}
+
+    def submit_standard_job(self, data: dict, job: str) -> dict:
+        job = self.lookup(self.standard_jobs, job, "standard job")
+        cs = self.lookup(self.compute_services, data["compute_service_name"], "compute service")
+        if not cs.supports("standard"):
+            raise WRENCHException(f"Compute service {cs.name} does not support standard jobs")
+        for task in job.tasks:
+            _, ram = self.execution_speed(cs, task.max_num_cores)
+            if task.memory > ram:
+                raise WRENCHException(f"Task {task.name} requires more memory than available")
+        submit_date = self.now
+        previous_states = {task.name: task.state for task in job.tasks}
+        for task in job.tasks:
+            task.state = "PENDING"
+
+        # Check that all input files will be available
+        produced = {f for task in job.tasks for f in task.output_files}
+        missing = [f for task in job.tasks for f in task.input_files
+                   if f not in produced and not (f in job.file_locations and
+                                                 self.lookup_file_at(job.file_locations[f], f))]
+
+        def complete(end_date: float) -> dict:
+            event = {"compute_service_name": cs.name, "job_name": job.name, "submit_date": submit_date,
+                     "end_date": end_date}
+            if missing:
+                for task in job.tasks:
+                    task.state = previous_states[task.name]
+                    job.workflow.update_state(task)
+                event.update({"event_type": "standard_job_failure",
+                              "failure_cause": f"File {missing[0]} is not available"})
+                return event
+            date = submit_date
+            for task in self.__topological_order(job.tasks):
+                speed, _ = self.execution_speed(cs, task.max_num_cores)
+                task.start_date = date
+                date += task.flops / speed
+                task.end_date = date
+            for task in job.tasks:
+                task.state = "COMPLETED"
+                for file_name in task.output_files:
+                    if file_name in job.file_locations:
+                        self.store_file(job.file_locations[file_name], file_name)
+            for task in job.tasks:
+                for child in task.children:
+                    job.workflow.update_state(child)
+            event["event_type"] = "standard_job_completion"
+            return event
+
+        if missing:
+            self.schedule(self.now, lambda: complete(self.now))
+        else:
+            duration = 0.0
+            for task in job.tasks:
+                speed, _ = self.execution_speed(cs, task.max_num_cores)
+                duration += task.flops / speed
+            end_date = self.now + duration
+            self.schedule(end_date, lambda: complete(end_date))
+        return {}
+
+    @staticmethod
+    def __topological_order(tasks: List[_Task]) -> List[_Task]:
+        ordered, done = [], set()
+        pending = list(tasks)
+        while pending:
+            for task in pending:
+                if all(p in done or p not in tasks for p in task.parents):
+                    ordered.append(task)
+                    done.add(task)
+                    pending.remove(task)
+                    break
+        return ordered
+
+    def create_compound_job(self, data: dict) -> dict:
+        name = data["name"] if data["name"] else self.new_name("compound_job")
+        if name in self.compound_jobs:
+            raise WRENCHException(f"Compound job {name} already exists")
+        self.compound_jobs[name] = _CompoundJob(name)
+        return {"job_name": name}
+
+    def add_action(self, data: dict, job: str, kind: str) -> dict:
+        job = self.lookup(self.compound_jobs, job, "compound job")
+        name = data["name"] if data["name"] else self.new_name(f"{kind}_action")
+        if name in job.actions:
+            raise WRENCHException(f"Action {name} already exists in job {job.name}")
+        answer = {"name": name}
+        if kind.startswith("file_"):
+            file = self.lookup_file(data["file_name"])
+            for key in ("storage_service_name", "src_storage_service_name", "dest_storage_service_name"):
+                if key in data:
+                    self.lookup(self.storage_services, data[key], "storage service")
+            answer["uses_scratch"] = "0"
+            if kind == "file_read":
+                if not data.get("num_bytes_to_read"):
+                    data["num_bytes_to_read"] = file["size"]
+                answer["num_bytes_to_read"] = data["num_bytes_to_read"]
+        if kind == "sleep":
+            answer = {"sleep_action_name": name}
+        job.actions[name] = _Action(name, kind, data)
+        return answer
+
+    def add_action_dependency(self, data: dict, job: str) -> dict:
+        parent = self.lookup_action(job, data["parent_action_name"])
+        child = self.lookup_action(job, data["child_action_name"])
+        child.parents.add(parent)
+        if child.state == "READY":
+            child.state = "NOT_READY"
+        return {}
+
+    def add_parent_job(self, data: dict, job: str) -> dict:
+        job = self.lookup(self.compound_jobs, job, "compound job")
+        job.parent_jobs.add(self.lookup(self.compound_jobs, data["parent_compound_job"], "compound job"))
+        return {}
+
+    def action_duration(self, cs: _ComputeService, action: _Action) -> float:
+        if action.kind == "sleep":
+            return float(action.spec["sleep_time"])
+        if action.kind == "compute":
+            speed, _ = self.execution_speed(cs, action.spec["max_num_cores"])
+            return action.spec["flops"] / speed
+        return 0.0
+
+    def run_action(self, action: _Action) -> None:
+        spec = action.spec
+        if action.kind == "file_read":
+            if not self.lookup_file_at(spec["storage_service_name"], spec["file_name"]):
+                raise WRENCHException(f"File {spec['file_name']} is not available")
+        elif action.kind == "file_write":
+            self.store_file(spec["storage_service_name"], spec["file_name"])
+        elif action.kind == "file_copy":
+            if not self.lookup_file_at(spec["src_storage_service_name"], spec["file_name"]):
+                raise WRENCHException(f"File {spec['file_name']} is not available")
+            self.store_file(spec["dest_storage_service_name"], spec["file_name"])
+        elif action.kind == "file_delete":
+            if not self.lookup_file_at(spec["storage_service_name"], spec["file_name"]):
+                raise WRENCHException(f"File {spec['file_name']} is not available")
+            self.storage_services[spec["storage_service_name"]]["files"].discard(spec["file_name"])
+
+    def submit_compound_job(self, data: dict, job: str) -> dict:
+        job = self.lookup(self.compound_jobs, job, "compound job")
+        cs = self.lookup(self.compute_services, data["compute_service_name"], "compute service")
+        if not cs.supports("compound"):
+            raise WRENCHException(f"Compute service {cs.name} does not support compound jobs")
+        submit_date = self.now
+
+        def start() -> None:
+            date = self.now
+            for parent_job in job.parent_jobs:
+                if parent_job.end_date is None:
+                    raise WRENCHException(f"Parent job {parent_job.name} has not completed")
+                date = max(date, parent_job.end_date)
+            done = set()
+            failure_cause = None
+            pending = list(job.actions.values())
+            while pending and failure_cause is None:
+                action = next(a for a in pending if a.parents <= done)
+                pending.remove(action)
+                action.start_date = date
+                try:
+                    self.run_action(action)
+                except WRENCHException as e:
+                    action.state = "FAILED"
+                    action.failure_cause = str(e)
+                    action.end_date = date
+                    failure_cause = str(e)
+                    break
+                date += self.action_duration(cs, action)
+                action.end_date = date
+                done.add(action)
+            for action in pending:
+                action.state = "KILLED"
+            job.end_date = date
+
+            def complete() -> dict:
+                for a in done:
+                    a.state = "COMPLETED"
+                event = {"compute_service_name": cs.name, "job_name": job.name, "submit_date": submit_date,
+                         "end_date": date}
+                if failure_cause is None:
+                    event["event_type"] = "compound_job_completion"
+                else:
+                    event.update({"event_type": "compound_job_failure", "failure_cause": failure_cause})
+                return event
+
+            self.schedule(date, complete)
+
+        for action in job.actions.values():
+            action.state = "STARTED" if not action.parents else action.state
+        if all(parent_job.end_date is not None for parent_job in job.parent_jobs):
+            start()
+        else:
+            # Start once all parent jobs are done
+            def wait_for_parents() -> None:
+                if all(parent_job.end_date is not None for parent_job in job.parent_jobs):
+                    start()
+                else:
+                    self.schedule(min(d for d, _, _ in self.scheduled) if self.scheduled else self.now,
+                                  wait_for_parents)
+            self.schedule(self.now, wait_for_parents)
+        return {}
+
+    def create_vm(self, data: dict, cs: str) -> dict:
+        cloud_service = self.lookup(self.compute_services, cs, "compute service")
+        if cloud_service.kind != "cloud":
+            raise WRENCHException(f"Compute service {cs} is not a cloud compute service")
+        if data["num_cores"] > max(cores for cores, _ in cloud_service.hosts.values()):
+            raise WRENCHException("Not enough resources to create the VM")
+        name = self.new_name("vm")
+        cloud_service.vms[name] = _VM(name, cloud_service, data["num_cores"], data["ram_memory"])
+        return {"vm_name": name}
+
+    def start_vm(self, data: dict, cs: str, vm: str) -> dict:
+        vm = self.lookup_vm(cs, vm)
+        if vm.state != "DOWN":
+            raise WRENCHException(f"VM {vm.name} is not down")
+        vm.state = "RUNNING"
+        vm.num_starts += 1
+        host_name = next(iter(vm.cloud_service.hosts))
+        name = f"{vm.name}_bare_metal_compute_service_{vm.num_starts}"
+        self.compute_services[name] = _ComputeService(name, "bare_metal", {host_name: (vm.num_cores, float("inf"))})
+        return {"service_name": name}
+
+    def vm_transition(self, cs: str, vm: str, from_states: Tuple[str, ...], to_state: str) -> dict:
+        vm = self.lookup_vm(cs, vm)
+        if vm.state not in from_states:
+            raise WRENCHException(f"VM {vm.name} is in state {vm.state}")
+        vm.state = to_state
+        return {}
+
+    def destroy_vm(self, data: dict, cs: str, vm: str) -> dict:
+        vm = self.lookup_vm(cs, vm)
+        if vm.state != "DOWN":
+            raise WRENCHException(f"VM {vm.name} is not down")
+        del vm.cloud_service.vms[vm.name]
+        return {}
+
+
+def _answer(dispatch: Callable[[str, dict], dict], path: str, body: bytes) -> bytes:
+    """
+    Answer a request as the wrench-daemon does, i.e., with a JSON object that reports whether the request succeeded
+
+    :param dispatch: the function that answers the request's route and JSON data
+    :type dispatch: Callable[[str, dict], dict]
+    :param path: the route
+    :type path: str
+    :param body: the request's body
+    :type body: bytes
+    :return: the encoded JSON answer
+    :rtype: bytes
+    """
+    try:
+        data = json.loads(body) if body.startswith(b"{") else {}
+        answer = dispatch(path, data)
+        answer["wrench_api_request_success"] = True
+    except WRENCHException as e:
+        answer = {"wrench_api_request_success": False, "failure_cause": str(e)}
+    except (KeyError, TypeError, ValueError) as e:
+        answer = {"wrench_api_request_success": False, "failure_cause": f"Invalid request: {e!r}"}
+    return json.dumps(answer).encode()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP/1.1 request handler that supports keep-alive connections and pipelined requests
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Answer right away, and write each answer in a single segment
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def do_GET(self) -> None:
+        self.__answer()
+
+    def do_POST(self) -> None:
+        self.__answer()
+
+    def do_PUT(self) -> None:
+        self.__answer()
+
+    def __answer(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        payload = _answer(self.server.dispatch, self.path, body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self) -> str:
+        return str(self.client_address)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _UnixRequestHandler(_RequestHandler):
+    """
+    Request handler for Unix domain sockets, on which Nagle's algorithm does not apply
+    """
+
+    disable_nagle_algorithm = False
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], dispatch: Callable[[str, dict], dict]) -> None:
+        super().__init__(address, _RequestHandler)
+        self.dispatch = dispatch
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, dispatch: Callable[[str, dict], dict]) -> None:
+        super().__init__(path, _UnixRequestHandler)
+        self.dispatch = dispatch
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+class MockDaemon:
+    """
+    A lightweight, pure-Python stand-in for the wrench-daemon, which implements the WRENCH REST API with a
+    trivial time model (tasks and actions run one after the other, at the speed of the first host of the
+    compute service, ignoring contention and I/O times). It is meant for testing and benchmarking client code
+    without building WRENCH, and not for obtaining meaningful simulation results.
+
+    :param daemon_host: name of the host on which the mock daemon listens
+    :type daemon_host: str
+    :param daemon_port: port number on which the mock daemon listens (0 means "any available port")
+    :type daemon_port: int
+    :param socket_path: if not None, listen on Unix domain sockets whose paths start with this path
+           instead of on TCP ports
+    :type socket_path: Optional[str]
+    """
+
+    def __init__(self,
+                 daemon_host: str = "localhost",
+                 daemon_port: int = 0,
+                 socket_path: Optional[str] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        self.daemon_host = daemon_host
+        self.daemon_port = daemon_port
+        self.socket_path = socket_path
+        self.simulations = {}
+        self.servers = []
+        # Route dispatchers of the simulations started with answer(), by port number
+        self.dispatchers = {}
+        self.lock = threading.Lock()
+        self.simulation_ids = itertools.count(1)
+
+    def __enter__(self) -> "MockDaemon":
+        """
+        Start the mock daemon when entering a with block
+
+        :return: the mock daemon
+        :rtype: MockDaemon
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Stop the mock daemon when leaving a with block
+        """
+        self.stop()
+
+    def __serve(self, address, dispatch: Callable[[str, dict], dict]) -> socketserver.BaseServer:
+        if self.socket_path is not None:
+            if os.path.exists(address):
+                os.unlink(address)
+            server = _UnixServer(address, dispatch)
+        else:
+            server = _TCPServer(address, dispatch)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with self.lock:
+            self.servers.append(server)
+        return server
+
+    def start(self) -> None:
+        """
+        Start listening for simulation start requests
+        """
+        address = self.socket_path if self.socket_path is not None else (self.daemon_host, self.daemon_port)
+        server = self.__serve(address, self.__dispatch_api)
+        if self.socket_path is None:
+            self.daemon_port = server.server_address[1]
+
+    def stop(self) -> None:
+        """
+        Stop the mock daemon and all the simulations it hosts
+        """
+        with self.lock:
+            servers, self.servers = self.servers, []
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+            if self.socket_path is not None and os.path.exists(server.server_address):
+                os.unlink(server.server_address)
+
+    def answer(self, port: int, path: str, body: bytes) -> bytes:
+        """
+        Answer a request without going through HTTP, e.g., for the in-process transport (the mock daemon need not
+        be started): requests to "/api/" routes start simulations, and the requests to a simulation's routes are
+        sent to the port number returned by its startSimulation request
+
+        :param port: the port number to which the request is sent (ignored for "/api/" routes)
+        :type port: int
+        :param path: the route
+        :type path: str
+        :param body: the request's JSON body
+        :type body: bytes
+        :return: the encoded JSON answer
+        :rtype: bytes
+        """
+        if path.startswith("/api/"):
+            return _answer(self.__dispatch_in_process_api, path, body)
+        return _answer(self.dispatchers.get(port, self.__dispatch_unknown), path, body)
+
+    @staticmethod
+    def __dispatch_unknown(path: str, data: dict) -> dict:
+        raise WRENCHException(f"Unknown route {path}")
+
+    def __start_simulation(self, path: str, data: dict) -> Tuple[int, Callable[[str, dict], dict]]:
+        """
+        Start a simulation
+
+        :param path: the route
+        :type path: str
+        :param data: the JSON data attached to the request
+        :type data: dict
+        :return: the simulation id, and the function that answers requests to the simulation's routes
+        :rtype: Tuple[int, Callable[[str, dict], dict]]
+        """
+        if path.rstrip("/") != "/api/startSimulation":
+            raise WRENCHException(f"Unknown route {path}")
+        simulation = _MockSimulation(data["platform_xml"], data["controller_hostname"])
+        simulation_id = next(self.simulation_ids)
+        self.simulations[simulation_id] = simulation
+
+        def dispatch(route: str, route_data: dict) -> dict:
+            match = re.fullmatch(r"/simulation/[^/]+/(.+)", route)
+            if match is None:
+                raise WRENCHException(f"Unknown route {route}")
+            if simulation.terminated:
+                raise WRENCHException("The simulation has been terminated")
+            return simulation.handle(match.group(1), route_data)
+
+        return simulation_id, dispatch
+
+    def __dispatch_in_process_api(self, path: str, data: dict) -> dict:
+        """
+        Answer a simulation start request sent with answer(), in which case the new simulation's port number is
+        its id
+
+        :param path: the route
+        :type path: str
+        :param data: the JSON data attached to the request
+        :type data: dict
+        :return: the JSON answer
+        :rtype: dict
+        """
+        simulation_id, dispatch = self.__start_simulation(path, data)
+        self.dispatchers[simulation_id] = dispatch
+        return {"port_number": simulation_id}
+
+    def __dispatch_api(self, path: str, data: dict) -> dict:
+        """
+        Answer a simulation start request by serving the new simulation on its own port/socket
+
+        :param path: the route
+        :type path: str
+        :param data: the JSON data attached to the request
+        :type data: dict
+        :return: the JSON answer
+        :rtype: dict
+        """
+        simulation_id, dispatch = self.__start_simulation(path, data)
+        if self.socket_path is not None:
+            path = f"{self.socket_path}.{simulation_id}"
+            self.__serve(path, dispatch)
+            return {"port_number": simulation_id, "socket_path": path}
+        server = self.__serve((self.daemon_host, 0), dispatch)
+        return {"port_number": server.server_address[1]}
+
+
+def main() -> None:
+    """
+    Run the mock daemon until interrupted, e.g., "python -m wrench.mock_daemon --port 8101"
+    """
+    parser = argparse.ArgumentParser(description="Pure-Python mock wrench-daemon (for testing purposes only)")
+    parser.add_argument("--host", default="localhost", help="host name on which to listen (default: localhost)")
+    parser.add_argument("--port", type=int, default=8101, help="port number on which to listen (default: 8101)")
+    parser.add_argument("--socket-path", default=None, help="listen on Unix domain sockets instead of TCP ports")
+    args = parser.parse_args()
+
+    daemon = MockDaemon(daemon_host=args.host, daemon_port=args.port, socket_path=args.socket_path)
+    daemon.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
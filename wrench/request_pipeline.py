@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import io
+import socket
+import time
+from http.client import HTTPException, HTTPResponse, RemoteDisconnected
+from typing import Callable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from wrench.exception import WRENCHException
+from wrench.json_serializer import JSONSerializer
+
+
+class _SharedReader(io.BufferedReader):
+    """
+    Buffered reader over a socket that is shared by successive responses, and thus not closed when one
+    response has been read
+    """
+
+    def close(self) -> None:
+        pass
+
+    def release(self) -> None:
+        super().close()
+
+
+class _ResponseSocket:
+    """
+    Socket-like object through which an HTTPResponse reads its data from a shared reader
+    """
+
+    def __init__(self, reader: _SharedReader) -> None:
+        self.reader = reader
+
+    def makefile(self, *args, **kwargs) -> _SharedReader:
+        return self.reader
+
+
+class RequestPipeline:
+    """
+    A sequence of requests to the WRENCH daemon, sent over a single connection using HTTP/1.1 pipelining:
+    requests are written back-to-back, in windows of at most window_size requests, without waiting for
+    the answer to a request before sending the next one. Because the daemon answers the requests sent over a
+    connection in order, answers are returned in the order in which requests were added. If the daemon closes the
+    connection cleanly part-way (e.g., because it caps the number of requests per keep-alive connection), i.e.,
+    announces that it closes it, or closes it before starting to answer the next request, requests that have not
+    been answered yet are re-sent over a new connection. Any other error (e.g., a timeout, or an answer that
+    cannot be decoded) is raised, since requests that have not been answered may have been processed by the
+    daemon, and thus cannot be safely re-sent.
+
+    :param daemon_host: name of the host on which the WRENCH daemon is running
+    :type daemon_host: str
+    :param daemon_port: port number on which the WRENCH daemon is listening
+    :type daemon_port: int
+    :param window_size: maximum number of requests sent before reading their answers
+    :type window_size: int
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    :param on_answer: function called for each answer with the request's HTTP method, path, payload size, and
+           the answer's size, decoding time and latency (measured from the time the request's window was sent)
+    :type on_answer: Optional[Callable[[str, str, int, int, float, float], None]]
+    :param serializer: the JSON encoder/decoder (default: one with the fastest backend installed)
+    :type serializer: Optional[JSONSerializer]
+    :param socket_path: if not None, the path of the Unix domain socket on which the daemon is listening,
+           instead of daemon_host and daemon_port
+    :type socket_path: Optional[str]
+    """
+
+    def __init__(self,
+                 daemon_host: Optional[str],
+                 daemon_port: Optional[int],
+                 window_size: int = 64,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 on_answer: Optional[Callable[[str, str, int, int, float, float], None]] = None,
+                 serializer: Optional[JSONSerializer] = None,
+                 socket_path: Optional[str] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        self.daemon_host = daemon_host
+        self.daemon_port = daemon_port
+        self.socket_path = socket_path
+        self.__host = f"{daemon_host}:{daemon_port}" if socket_path is None else "localhost"
+        self.window_size = window_size
+        self.timeout = timeout
+        self.on_answer = on_answer
+        self.serializer = serializer if serializer is not None else JSONSerializer()
+        self.requests = []
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def add_request(self, method: str, url: str, json_data: dict) -> None:
+        """
+        Add a request to the pipeline
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route (only its path and query are used)
+        :type url: str
+        :param json_data: JSON data to send with the request
+        :type json_data: dict
+        """
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        body = self.serializer.dumps(json_data)
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.__host}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n")
+        self.requests.append((method, path, len(body), head.encode() + body))
+
+    def __connect(self) -> socket.socket:
+        """
+        Open a connection to the daemon
+
+        :return: a connected socket
+        :rtype: socket.socket
+        """
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+        else:
+            connect_timeout = read_timeout = self.timeout
+        if self.socket_path is not None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(connect_timeout)
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+        else:
+            sock = socket.create_connection((self.daemon_host, self.daemon_port), timeout=connect_timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(read_timeout)
+        return sock
+
+    def send(self, stop_on_failure: bool = True) -> List[dict]:
+        """
+        Send all requests and return the daemon's answers, in order
+
+        :param stop_on_failure: whether to stop sending requests once an answer reports a failure (in which case
+               requests already sent in the same window as the failed request may have been processed by the daemon)
+        :type stop_on_failure: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached, or if the connection fails in a way that does not
+                                 make it possible to know whether unanswered requests have been processed
+        """
+        answers = []
+        while len(answers) < len(self.requests):
+            num_answered_on_connection = 0
+            sock = None
+            reader = None
+            try:
+                sock = self.__connect()
+                reader = _SharedReader(socket.SocketIO(sock, "rb"))
+                connection_closed = False
+                while len(answers) < len(self.requests) and not connection_closed:
+                    window = self.requests[len(answers):len(answers) + self.window_size]
+                    sent_date = time.perf_counter()
+                    sock.sendall(b"".join(request for _, _, _, request in window))
+                    for method, path, payload_size, _ in window:
+                        response = HTTPResponse(_ResponseSocket(reader), method=method)
+                        try:
+                            response.begin()
+                        except RemoteDisconnected:
+                            # The daemon closed the connection before answering this request, which it has thus
+                            # not processed, nor any of the next ones
+                            if num_answered_on_connection == 0:
+                                raise
+                            connection_closed = True
+                            break
+                        raw_answer = response.read()
+                        received_date = time.perf_counter()
+                        answer = self.serializer.loads(raw_answer)
+                        if self.on_answer is not None:
+                            self.on_answer(method, path, payload_size, len(raw_answer),
+                                           time.perf_counter() - received_date, received_date - sent_date)
+                        answers.append(answer)
+                        num_answered_on_connection += 1
+                        if stop_on_failure and not answer.get("wrench_api_request_success", True):
+                            return answers
+                        if response.will_close:
+                            connection_closed = True
+                            break
+            except (OSError, HTTPException, ValueError) as e:
+                raise WRENCHException("Connection to wrench-daemon severed: " + str(e))
+            finally:
+                if reader is not None:
+                    reader.release()
+                if sock is not None:
+                    sock.close()
+        return answers
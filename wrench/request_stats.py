@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import math
+from array import array
+from typing import Dict
+
+
+class RequestStats:
+    """
+    Per-route statistics of the requests sent to the WRENCH daemon, which are aggregated by (HTTP method, route
+    template), e.g., ("GET", "workflows/{}/tasks/{}/getState"). An instance is typically obtained with
+    Simulation.enable_request_stats(), but any instance can be passed to Simulation.add_request_hook().
+    """
+
+    # Route segments that are followed by the name of a simulation item
+    COLLECTIONS = {"workflows", "tasks", "files", "standardJobs", "compoundJobs", "actions", "compute_services",
+                   "cloud_compute_services", "vms", "storage_services", "fileRegistryServices"}
+
+    def __init__(self) -> None:
+        """
+        Constructor
+        """
+        self.routes = {}
+
+    @staticmethod
+    def route_template(path: str) -> str:
+        """
+        Get the template of a route, e.g., "workflows/{}/tasks/{}/getState" for
+        "/simulation/42/workflows/workflow_0/tasks/task_1/getState"
+
+        :param path: the path of the route's URL
+        :type path: str
+        :return: the route template
+        :rtype: str
+        """
+        segments = path.split("?")[0].strip("/").split("/")
+        # Drop the /simulation/{simid} or /api prefix
+        segments = segments[2:] if segments[0] == "simulation" else segments[1:]
+        return "/".join("{}" if i > 0 and segments[i - 1] in RequestStats.COLLECTIONS else segment
+                        for i, segment in enumerate(segments))
+
+    def __call__(self, method: str, route: str, payload_size: int, response_size: int, decode_time: float,
+                 latency: float) -> None:
+        """
+        Record a request (the signature is that of request hooks)
+
+        :param method: the HTTP method
+        :type method: str
+        :param route: the route template
+        :type route: str
+        :param payload_size: the size of the request's JSON payload in bytes
+        :type payload_size: int
+        :param response_size: the size of the JSON answer in bytes
+        :type response_size: int
+        :param decode_time: the time spent decoding the JSON answer in seconds
+        :type decode_time: float
+        :param latency: the wall-clock time between sending the request and receiving the answer in seconds
+        :type latency: float
+        """
+        key = (method, route)
+        if key not in self.routes:
+            self.routes[key] = [0, 0, 0.0, array("d")]
+        stats = self.routes[key]
+        stats[0] += payload_size
+        stats[1] += response_size
+        stats[2] += decode_time
+        stats[3].append(latency)
+
+    def reset(self) -> None:
+        """
+        Forget all recorded requests
+        """
+        self.routes = {}
+
+    def get_route_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the statistics of each route, by decreasing total latency
+
+        :return: a dictionary whose keys are "<HTTP method> <route template>" strings and whose values are
+                 dictionaries with keys "count", "total_latency", "mean_latency", "p50_latency", "p99_latency",
+                 "max_latency", "decode_time" (all in seconds), "payload_bytes" and "response_bytes"
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        route_stats = {}
+        for (method, route), (payload_bytes, response_bytes, decode_time, latencies) in self.routes.items():
+            ordered = sorted(latencies)
+            route_stats[f"{method} {route}"] = {
+                "count": len(ordered),
+                "total_latency": math.fsum(ordered),
+                "mean_latency": math.fsum(ordered) / len(ordered),
+                "p50_latency": ordered[max(0, math.ceil(0.50 * len(ordered)) - 1)],
+                "p99_latency": ordered[max(0, math.ceil(0.99 * len(ordered)) - 1)],
+                "max_latency": ordered[-1],
+                "decode_time": decode_time,
+                "payload_bytes": payload_bytes,
+                "response_bytes": response_bytes}
+        return dict(sorted(route_stats.items(), key=lambda item: -item[1]["total_latency"]))
+
+    def __str__(self) -> str:
+        """
+        Profile table of the routes, by decreasing total latency
+
+        :return: String representation of the statistics
+        :rtype: str
+        """
+        lines = [f"{'route':<64}{'count':>8}{'total (s)':>11}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+                 f"{'decode (s)':>12}{'sent (B)':>12}{'received (B)':>14}"]
+        for route, stats in self.get_route_stats().items():
+            lines.append(f"{route:<64}{stats['count']:>8}{stats['total_latency']:>11.3f}"
+                         f"{1000 * stats['p50_latency']:>10.3f}{1000 * stats['p99_latency']:>10.3f}"
+                         f"{stats['decode_time']:>12.3f}{stats['payload_bytes']:>12}{stats['response_bytes']:>14}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the RequestStats object
+
+        :return: String representation of the RequestStats object
+        :rtype: str
+        """
+        return f"RequestStats(num_routes={len(self.routes)})"
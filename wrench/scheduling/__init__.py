@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from .compute_resources import ComputeResources
+from .resource_tracker import ResourceTracker
+from .scheduler import Scheduler
+from .fcfs_scheduler import FCFSScheduler
+from .min_min_scheduler import MinMinScheduler
+from .max_min_scheduler import MaxMinScheduler
+from .heft_scheduler import HEFTScheduler
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+
+
+class ComputeResources:
+    """
+    Index of the cores (and RAM) of a set of compute services, which keeps track of how many of them are idle, so
+    that the fastest compute service with enough idle cores for a task is found in logarithmic time (rather than
+    with a scan of all compute services, and requests to the daemon, at each scheduling decision). The core counts
+    and core flop rates of the compute services are obtained once, when the index is built. A compute service with
+    several hosts is considered as a whole, i.e., as having the cores of all its hosts, at the flop rate of its
+    fastest host, since it is the compute service that picks the host on which a job runs. With an AsyncSimulation,
+    the core counts and core flop rates are obtained beforehand with get_core_specs().
+
+    :param compute_services: the compute services
+    :type compute_services: Iterable[ComputeService]
+    :param ram_capacities: the RAM capacities of the compute services, in bytes, if RAM is to be accounted for
+           (compute services that are not in the dictionary have unlimited RAM)
+    :type ram_capacities: Optional[Dict[ComputeService, float]]
+    :param core_specs: the number of cores and the core flop rate of each compute service (default: obtained from
+           the daemon, which requires the compute services of a Simulation)
+    :type core_specs: Optional[Dict[ComputeService, Tuple[int, float]]]
+
+    :raises WRENCHException: if there is no compute service
+    """
+
+    def __init__(self, compute_services: Iterable[ComputeService],
+                 ram_capacities: Optional[Dict[ComputeService, float]] = None,
+                 core_specs: Optional[Dict[ComputeService, Tuple[int, float]]] = None) -> None:
+        """
+        Constructor
+        """
+        self.num_cores: Dict[ComputeService, int] = {}
+        self.core_flop_rates: Dict[ComputeService, float] = {}
+        for compute_service in compute_services:
+            if core_specs is not None:
+                self.num_cores[compute_service], self.core_flop_rates[compute_service] = core_specs[compute_service]
+            else:
+                self.num_cores[compute_service] = sum(compute_service.get_core_counts().values())
+                self.core_flop_rates[compute_service] = max(compute_service.get_core_flop_rates().values())
+        if not self.num_cores:
+            raise WRENCHException("At least one compute service is needed")
+        self.ram_capacities: Dict[ComputeService, float] = {cs: (ram_capacities or {}).get(cs, float("inf"))
+                                                            for cs in self.num_cores}
+        # Fastest compute services first (in the given order, for equal flop rates)
+        self.compute_services: List[ComputeService] = sorted(self.num_cores, key=lambda cs: -self.core_flop_rates[cs])
+        self.__positions = {cs: i for i, cs in enumerate(self.compute_services)}
+        # Segment trees of the maximum number of idle cores, and of the maximum idle RAM, of the compute services
+        # in each range of positions
+        self.__num_leaves = 1
+        while self.__num_leaves < len(self.compute_services):
+            self.__num_leaves *= 2
+        self.__max_num_idle_cores = [0] * (2 * self.__num_leaves)
+        self.__max_idle_ram = [0.0] * (2 * self.__num_leaves)
+        for compute_service in self.compute_services:
+            self._set_idle_resources(compute_service, self.num_cores[compute_service],
+                                     self.ram_capacities[compute_service])
+
+    @staticmethod
+    async def get_core_specs(compute_services: Iterable[ComputeService]) -> Dict[ComputeService, Tuple[int, float]]:
+        """
+        Obtain the number of cores and the core flop rate of compute services of an AsyncSimulation, concurrently,
+        e.g., to build an index with ComputeResources(compute_services, core_specs=await get_core_specs(...))
+
+        :param compute_services: the compute services
+        :type compute_services: Iterable[ComputeService]
+
+        :return: the number of cores and the core flop rate of each compute service
+        :rtype: Dict[ComputeService, Tuple[int, float]]
+
+        :raises WRENCHException: if there is any error in the responses
+        """
+        compute_services = list(compute_services)
+        answers = await asyncio.gather(*[getter() for compute_service in compute_services
+                                         for getter in (compute_service.get_core_counts,
+                                                        compute_service.get_core_flop_rates)])
+        return {compute_service: (sum(answers[2 * i].values()), max(answers[2 * i + 1].values()))
+                for i, compute_service in enumerate(compute_services)}
+
+    def _set_idle_resources(self, compute_service: ComputeService, num_idle_cores: int, idle_ram: float) -> None:
+        """
+        Set the number of idle cores and the idle RAM of a compute service, and update the segment trees
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_idle_cores: its number of idle cores
+        :type num_idle_cores: int
+        :param idle_ram: its idle RAM, in bytes
+        :type idle_ram: float
+        """
+        node = self.__num_leaves + self.__positions[compute_service]
+        self.__max_num_idle_cores[node] = num_idle_cores
+        self.__max_idle_ram[node] = idle_ram
+        node //= 2
+        while node:
+            self.__max_num_idle_cores[node] = max(self.__max_num_idle_cores[2 * node],
+                                                  self.__max_num_idle_cores[2 * node + 1])
+            self.__max_idle_ram[node] = max(self.__max_idle_ram[2 * node], self.__max_idle_ram[2 * node + 1])
+            node //= 2
+
+    def get_num_idle_cores(self, compute_service: ComputeService) -> int:
+        """
+        Get the number of idle cores of a compute service
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :return: a number of cores
+        :rtype: int
+        """
+        return self.__max_num_idle_cores[self.__num_leaves + self.__positions[compute_service]]
+
+    def get_idle_ram(self, compute_service: ComputeService) -> float:
+        """
+        Get the idle RAM of a compute service
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :return: a RAM size in bytes
+        :rtype: float
+        """
+        return self.__max_idle_ram[self.__num_leaves + self.__positions[compute_service]]
+
+    def get_max_num_idle_cores(self) -> int:
+        """
+        Get the largest number of idle cores of any compute service
+
+        :return: a number of cores
+        :rtype: int
+        """
+        return self.__max_num_idle_cores[1]
+
+    def get_fastest(self, num_cores: int = 1, ram: float = 0) -> Optional[ComputeService]:
+        """
+        Get the compute service with the fastest cores among those that have enough idle cores and RAM. This
+        takes logarithmic time, unless RAM is accounted for, in which case subtrees of compute services that have
+        enough idle cores but not enough idle RAM may have to be explored.
+
+        :param num_cores: the number of idle cores needed
+        :type num_cores: int
+        :param ram: the idle RAM needed, in bytes
+        :type ram: float
+        :return: a compute service, or None if no compute service has enough idle cores and RAM
+        :rtype: Optional[ComputeService]
+        """
+        nodes = [1]
+        while nodes:
+            node = nodes.pop()
+            if self.__max_num_idle_cores[node] < num_cores or self.__max_idle_ram[node] < ram:
+                continue
+            if node >= self.__num_leaves:
+                return self.compute_services[node - self.__num_leaves]
+            nodes.extend((2 * node + 1, 2 * node))
+        return None
+
+    def acquire(self, compute_service: ComputeService, num_cores: int, ram: float = 0) -> None:
+        """
+        Mark idle cores (and RAM) of a compute service as busy
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_cores: the number of cores
+        :type num_cores: int
+        :param ram: the RAM, in bytes
+        :type ram: float
+
+        :raises WRENCHException: if the compute service does not have enough idle cores or RAM
+        """
+        num_idle_cores = self.get_num_idle_cores(compute_service)
+        idle_ram = self.get_idle_ram(compute_service)
+        if num_idle_cores < num_cores or idle_ram < ram:
+            raise WRENCHException(f"Compute service {compute_service.get_name()} has {num_idle_cores} idle cores "
+                                  f"and {idle_ram} bytes of idle RAM, but {num_cores} cores and {ram} bytes are "
+                                  f"needed")
+        self._set_idle_resources(compute_service, num_idle_cores - num_cores, idle_ram - ram)
+
+    def release(self, compute_service: ComputeService, num_cores: int, ram: float = 0) -> None:
+        """
+        Mark busy cores (and RAM) of a compute service as idle
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_cores: the number of cores
+        :type num_cores: int
+        :param ram: the RAM, in bytes
+        :type ram: float
+        """
+        self._set_idle_resources(compute_service,
+                                 min(self.get_num_idle_cores(compute_service) + num_cores,
+                                     self.num_cores[compute_service]),
+                                 min(self.get_idle_ram(compute_service) + ram, self.ram_capacities[compute_service]))
+
+    def __repr__(self) -> str:
+        """
+        :return: String representation of the ComputeResources object
+        :rtype: str
+        """
+        return (f"{type(self).__name__}(num_compute_services={len(self.compute_services)}, "
+                f"num_cores={sum(self.num_cores.values())})")
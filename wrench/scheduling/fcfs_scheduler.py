@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from wrench.scheduling.scheduler import Scheduler
+from wrench.task import Task
+
+
+class FCFSScheduler(Scheduler):
+    """
+    First-come, first-served list scheduler: ready tasks are scheduled in the order in which they became ready (and,
+    for tasks that became ready at the same time, in the order in which they were added to the workflow), each one
+    on the compute service with the fastest cores among those that have enough idle cores (see Scheduler).
+    """
+
+    def _get_priority(self, task: Task) -> float:
+        """
+        Get the priority of a ready task, which is the same for all tasks
+
+        :param task: the task
+        :type task: Task
+        :return: a priority
+        :rtype: float
+        """
+        return 0
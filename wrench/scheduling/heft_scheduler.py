@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import heapq
+from typing import Dict, Iterable, List, Tuple, Union
+
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+from wrench.scheduling.compute_resources import ComputeResources
+from wrench.standard_job import StandardJob
+from wrench.static_schedule import StaticSchedule
+from wrench.storage_service import StorageService
+from wrench.task import Task
+from wrench.task_timings import TaskTimings
+from wrench.workflow import Workflow
+
+
+class HEFTScheduler:
+    """
+    Heterogeneous Earliest Finish Time (HEFT) scheduler, which maps all the tasks of a workflow that have not been
+    submitted yet to compute services up front, and then runs the resulting StaticSchedule. Tasks are considered in
+    order of decreasing upward rank (i.e., the length of the longest path from the task to an exit task, in terms
+    of mean execution times), and each one is mapped to the compute service on which it finishes the earliest,
+    given when the cores of each compute service become free. The execution time of a task on a compute service is
+    estimated as its number of flops divided by its minimum number of cores and by the flop rate of the compute
+    service's cores (see ComputeResources). This is the non-insertion variant of HEFT, and data transfer times are
+    not accounted for, since all files are read from and written to the same storage service.
+
+    Planning relies on the workflow's task graph (see TaskGraph), and takes O(T log T + T S) time for T tasks and
+    S compute services, without any request to the daemon other than those needed to get the tasks' flops and
+    numbers of cores, if not known already.
+
+    Example::
+
+        scheduler = wrench.scheduling.HEFTScheduler(simulation, compute_services, storage_service)
+        events, timings = scheduler.run(workflow)
+
+    :param simulation: simulation object
+    :type simulation: Simulation
+    :param compute_services: the compute services on which tasks are run
+    :type compute_services: Iterable[ComputeService]
+    :param storage_service: the storage service on which the tasks' input and output files are read and written
+    :type storage_service: StorageService
+    """
+
+    def __init__(self, simulation, compute_services: Iterable[ComputeService],
+                 storage_service: StorageService) -> None:
+        """
+        Constructor
+        """
+        self.simulation = simulation
+        self.resources = ComputeResources(compute_services)
+        self.storage_service = storage_service
+
+    def get_upward_ranks(self, workflow: Workflow) -> Dict[str, float]:
+        """
+        Get the upward ranks of the tasks of a workflow that have not been submitted yet
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: a dictionary of upward ranks where task names are keys, in topological order
+        :rtype: Dict[str, float]
+
+        :raises WRENCHException: if the workflow's task graph is not in sync with the daemon, or if there is any
+                                 error in the responses
+        """
+        task_states = workflow.get_task_states()
+        task_graph = workflow.task_graph
+        if not task_graph.synchronized:
+            raise WRENCHException(f"The task graph of workflow {workflow.get_name()} is not in sync with the daemon")
+        task_names = [name for name, state in task_states.items()
+                      if state in (Task.TaskState.READY, Task.TaskState.NOT_READY)]
+        pending_names = set(task_names)
+        mean_flop_rate = sum(self.resources.core_flop_rates.values()) / len(self.resources.core_flop_rates)
+        # Exit tasks first, then each task once all its children have been ranked
+        num_unranked_children = {name: sum(1 for child in task_graph.children[name] if child in pending_names)
+                                 for name in task_names}
+        to_rank = [name for name in task_names if not num_unranked_children[name]]
+        ranks = {}
+        while to_rank:
+            name = to_rank.pop()
+            task = workflow.tasks[name]
+            ranks[name] = (task.get_flops() / (task.get_min_num_cores() * mean_flop_rate) +
+                           max((ranks[child] for child in task_graph.children[name] if child in pending_names),
+                               default=0))
+            for parent in task_graph.parents[name]:
+                if parent in pending_names:
+                    num_unranked_children[parent] -= 1
+                    if not num_unranked_children[parent]:
+                        to_rank.append(parent)
+        return dict(reversed(ranks.items()))
+
+    def plan(self, workflow: Workflow) -> StaticSchedule:
+        """
+        Compute the HEFT schedule of the tasks of a workflow that have not been submitted yet
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: the schedule
+        :rtype: StaticSchedule
+
+        :raises WRENCHException: if a task cannot run on any compute service, if the workflow's task graph is not
+                                 in sync with the daemon, or if there is any error in the responses
+        """
+        ranks = self.get_upward_ranks(workflow)
+        task_graph = workflow.task_graph
+        # Decreasing upward ranks, ties being broken in topological order, so that parents come before children
+        topological_indices = {name: i for i, name in enumerate(ranks)}
+        task_names = sorted(ranks, key=lambda name: (-ranks[name], topological_indices[name]))
+        # Dates at which the cores of each compute service become free
+        core_free_dates = {cs: [0.0] * self.resources.num_cores[cs] for cs in self.resources.compute_services}
+        finish_dates = {}
+        schedule = StaticSchedule()
+        for name in task_names:
+            task = workflow.tasks[name]
+            num_cores = task.get_min_num_cores()
+            ready_date = max((finish_dates[parent] for parent in task_graph.parents[name] if parent in finish_dates),
+                             default=0.0)
+            best = None
+            for cs in self.resources.compute_services:
+                free_dates = core_free_dates[cs]
+                if num_cores > len(free_dates):
+                    continue
+                free_date = free_dates[0] if num_cores == 1 else heapq.nsmallest(num_cores, free_dates)[-1]
+                finish_date = (max(ready_date, free_date) +
+                               task.get_flops() / (num_cores * self.resources.core_flop_rates[cs]))
+                if best is None or finish_date < best[0]:
+                    best = (finish_date, cs)
+            if best is None:
+                raise WRENCHException(f"Task {name} needs {num_cores} cores, which no compute service has")
+            finish_date, cs = best
+            for _ in range(0, num_cores):
+                heapq.heapreplace(core_free_dates[cs], finish_date)
+            finish_dates[name] = finish_date
+            schedule.add_task(task, cs, {file: self.storage_service
+                                         for file in task.get_input_files() + task.get_output_files()})
+        return schedule
+
+    def run(self, workflow: Workflow) -> Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]:
+        """
+        Run a workflow to completion according to its HEFT schedule (see plan() and Simulation.run_schedule())
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: all the events that occurred during the run, in order, and the timings of all tasks of the workflow
+        :rtype: Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]
+
+        :raises WRENCHException: if a job fails, if a task cannot run on any compute service, or if there is any
+                                 error in the responses
+        """
+        return self.simulation.run_schedule(workflow, self.plan(workflow))
+
+    def __repr__(self) -> str:
+        """
+        :return: String representation of the HEFTScheduler object
+        :rtype: str
+        """
+        return f"HEFTScheduler(resources={self.resources!r})"
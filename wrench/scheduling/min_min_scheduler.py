@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from wrench.scheduling.scheduler import Scheduler
+from wrench.task import Task
+
+
+class MinMinScheduler(Scheduler):
+    """
+    Min-min list scheduler: the ready task with the shortest execution time is scheduled first, on the compute
+    service with the fastest cores among those that have enough idle cores (see Scheduler), which is the one on
+    which it completes the earliest. The execution time of a task is estimated as its number of flops divided by
+    its minimum number of cores.
+    """
+
+    def _get_priority(self, task: Task) -> float:
+        """
+        Get the priority of a ready task, which is its estimated execution time
+
+        :param task: the task
+        :type task: Task
+        :return: a priority
+        :rtype: float
+        """
+        return task.get_flops() / task.get_min_num_cores()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from wrench.compute_service import ComputeService
+from wrench.scheduling.compute_resources import ComputeResources
+from wrench.standard_job import StandardJob
+
+
+class ResourceTracker(ComputeResources):
+    """
+    Index of the idle cores (and RAM) of a set of compute services (see ComputeResources), which is kept up-to-date
+    automatically as standard jobs are submitted to these compute services and as they complete or fail (see
+    Simulation.add_job_listener()). A job is considered to use, until it completes or fails, the minimum number of
+    cores and the memory of each of its tasks. The simulation can also be an AsyncSimulation, in which case the
+    core counts and core flop rates of the compute services are obtained beforehand::
+
+        tracker = wrench.scheduling.ResourceTracker(
+            simulation, core_specs=await wrench.scheduling.ComputeResources.get_core_specs(
+                simulation.compute_services.values()))
+
+    A scheduler that makes several decisions before the corresponding jobs are submitted (e.g., within a call to
+    Simulation.step()) reserves the resources of each decision with acquire(), so that they are no longer
+    considered idle. The reservations on a compute service are then used up by the jobs submitted to it::
+
+        tracker = wrench.scheduling.ResourceTracker(simulation)
+        ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+        while not done:
+            submissions = []
+            for task in ready_tasks:
+                cs = tracker.get_fastest(task.get_min_num_cores())
+                if cs is not None:
+                    tracker.acquire(cs, task.get_min_num_cores())
+                    submissions.append(([task], {f: ss for f in task.get_input_files()}, cs))
+            event, ready_tasks, done = simulation.step(workflow, submissions)
+
+    :param simulation: simulation object
+    :type simulation: Union[Simulation, AsyncSimulation]
+    :param compute_services: the compute services (default: all the compute services of the simulation)
+    :type compute_services: Optional[Iterable[ComputeService]]
+    :param ram_capacities: the RAM capacities of the compute services, in bytes, if RAM is to be accounted for
+           (compute services that are not in the dictionary have unlimited RAM)
+    :type ram_capacities: Optional[Dict[ComputeService, float]]
+    :param core_specs: the number of cores and the core flop rate of each compute service (default: obtained from
+           the daemon, which requires a Simulation)
+    :type core_specs: Optional[Dict[ComputeService, Tuple[int, float]]]
+
+    :raises WRENCHException: if there is no compute service
+    """
+
+    def __init__(self, simulation, compute_services: Optional[Iterable[ComputeService]] = None,
+                 ram_capacities: Optional[Dict[ComputeService, float]] = None,
+                 core_specs: Optional[Dict[ComputeService, Tuple[int, float]]] = None) -> None:
+        """
+        Constructor
+        """
+        super().__init__(simulation.compute_services.values() if compute_services is None else compute_services,
+                         ram_capacities, core_specs)
+        self.simulation = simulation
+        # Cores and RAM used by jobs, and reserved for jobs that have not been submitted yet, on each compute service
+        self.__num_busy_cores = {cs: 0 for cs in self.compute_services}
+        self.__busy_ram = {cs: 0.0 for cs in self.compute_services}
+        self.__num_reserved_cores = {cs: 0 for cs in self.compute_services}
+        self.__reserved_ram = {cs: 0.0 for cs in self.compute_services}
+        # Compute service, cores and RAM of each submitted job that has not completed or failed
+        self.__job_allocations: Dict[str, Tuple[ComputeService, int, float]] = {}
+        simulation.add_job_listener(self.handle_job_event)
+
+    def __update(self, compute_service: ComputeService, num_cores: int, ram: float,
+                 num_reserved_cores: int, reserved_ram: float) -> None:
+        """
+        Add cores and RAM to those used by jobs, and to those reserved, on a compute service (a compute service
+        may be oversubscribed, in which case it has no idle cores until enough jobs have completed)
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_cores: the number of cores used by jobs (or released, if negative)
+        :type num_cores: int
+        :param ram: the RAM used by jobs (or released, if negative), in bytes
+        :type ram: float
+        :param num_reserved_cores: the number of cores reserved (or no longer reserved, if negative)
+        :type num_reserved_cores: int
+        :param reserved_ram: the RAM reserved (or no longer reserved, if negative), in bytes
+        :type reserved_ram: float
+        """
+        self.__num_busy_cores[compute_service] += num_cores
+        self.__busy_ram[compute_service] += ram
+        self.__num_reserved_cores[compute_service] += num_reserved_cores
+        self.__reserved_ram[compute_service] += reserved_ram
+        self._set_idle_resources(compute_service,
+                                 max(0, self.num_cores[compute_service] - self.__num_busy_cores[compute_service] -
+                                     self.__num_reserved_cores[compute_service]),
+                                 max(0.0, self.ram_capacities[compute_service] - self.__busy_ram[compute_service] -
+                                     self.__reserved_ram[compute_service]))
+
+    def acquire(self, compute_service: ComputeService, num_cores: int, ram: float = 0) -> None:
+        """
+        Reserve idle cores (and RAM) of a compute service for a job that is about to be submitted to it
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_cores: the number of cores
+        :type num_cores: int
+        :param ram: the RAM, in bytes
+        :type ram: float
+
+        :raises WRENCHException: if the compute service does not have enough idle cores or RAM
+        """
+        super().acquire(compute_service, num_cores, ram)
+        self.__update(compute_service, 0, 0, num_cores, ram)
+
+    def release(self, compute_service: ComputeService, num_cores: int, ram: float = 0) -> None:
+        """
+        Cancel a reservation of cores (and RAM) of a compute service, for a job that is not submitted after all
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :param num_cores: the number of cores
+        :type num_cores: int
+        :param ram: the RAM, in bytes
+        :type ram: float
+        """
+        self.__update(compute_service, 0, 0, -min(num_cores, self.__num_reserved_cores[compute_service]),
+                      -min(ram, self.__reserved_ram[compute_service]))
+
+    def get_num_busy_cores(self, compute_service: ComputeService) -> int:
+        """
+        Get the number of cores of a compute service that are used by jobs (which may be larger than its number
+        of cores, if it is oversubscribed)
+
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        :return: a number of cores
+        :rtype: int
+        """
+        return self.__num_busy_cores[compute_service]
+
+    def handle_job_event(self, event_type: str, job: StandardJob, compute_service: ComputeService) -> None:
+        """
+        Update the index when a standard job is submitted, completes or fails (this method is called by the
+        simulation, see Simulation.add_job_listener())
+
+        :param event_type: the type of the event
+        :type event_type: str
+        :param job: the job
+        :type job: StandardJob
+        :param compute_service: the compute service
+        :type compute_service: ComputeService
+        """
+        if compute_service not in self.num_cores:
+            return
+        if event_type == "standard_job_submission":
+            # The simulation has cached the specifications of the tasks
+            num_cores = sum(task.min_num_cores for task in job.get_tasks())
+            ram = sum(task.memory for task in job.get_tasks())
+            self.__job_allocations[job.get_name()] = (compute_service, num_cores, ram)
+            self.__update(compute_service, num_cores, ram,
+                          -min(num_cores, self.__num_reserved_cores[compute_service]),
+                          -min(ram, self.__reserved_ram[compute_service]))
+        elif job.get_name() in self.__job_allocations:
+            _, num_cores, ram = self.__job_allocations.pop(job.get_name())
+            self.__update(compute_service, -num_cores, -ram, 0, 0)
+
+    def close(self) -> None:
+        """
+        Stop keeping the index up-to-date
+        """
+        self.simulation.remove_job_listener(self.handle_job_event)
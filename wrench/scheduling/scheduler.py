@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import abc
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+from wrench.file import File
+from wrench.scheduling.compute_resources import ComputeResources
+from wrench.standard_job import StandardJob
+from wrench.storage_service import StorageService
+from wrench.task import Task
+from wrench.task_timings import TaskTimings
+from wrench.workflow import Workflow
+
+
+class Scheduler(abc.ABC):
+    """
+    Base class of the list schedulers, which submit the ready tasks of a workflow, each one in its own standard
+    job, in order of priority, to the compute services that have enough idle cores for them. Ready tasks are kept
+    in one priority queue per minimum number of cores, and idle cores in a ComputeResources index, so that a
+    scheduling decision only looks at the queues of the tasks that fit in the idle cores, and takes logarithmic
+    time and no request to the daemon. A task that needs more cores than any compute service has idle is deferred
+    until cores are released, without blocking the tasks of lower priority. A scheduler assumes that it submits all
+    the jobs that run on its compute services.
+
+    A scheduler can run a workflow to completion with run(), or be plugged into a scheduling loop::
+
+        scheduler = wrench.scheduling.MinMinScheduler(simulation, compute_services, storage_service)
+        ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+        while not done:
+            event, ready_tasks, done = simulation.step(workflow, scheduler.schedule(ready_tasks))
+            scheduler.handle_event(event)
+
+    Subclasses define the priority of tasks (see _get_priority()), and may define how a compute service is
+    selected for a task (see _select_compute_service()).
+
+    :param simulation: simulation object
+    :type simulation: Simulation
+    :param compute_services: the compute services on which tasks are run
+    :type compute_services: Iterable[ComputeService]
+    :param storage_service: the storage service on which the tasks' input and output files are read and written
+    :type storage_service: StorageService
+    """
+
+    def __init__(self, simulation, compute_services: Iterable[ComputeService],
+                 storage_service: StorageService) -> None:
+        """
+        Constructor
+        """
+        self.simulation = simulation
+        self.resources = ComputeResources(compute_services)
+        self.storage_service = storage_service
+        # Heaps of (priority, arrival number, task) entries, for each minimum number of cores of the tasks
+        self.__queues: Dict[int, List[Tuple[float, int, Task]]] = {}
+        self.__arrival_numbers = itertools.count()
+        # Names of the tasks that are queued or have been submitted
+        self.__known_task_names = set()
+        # Compute service and number of cores of each submitted task whose job has not completed or failed
+        self.__allocations: Dict[str, Tuple[ComputeService, int]] = {}
+
+    @abc.abstractmethod
+    def _get_priority(self, task: Task) -> float:
+        """
+        Get the priority of a ready task (tasks with lower values are scheduled first, and tasks with equal values
+        are scheduled in the order in which they became ready)
+
+        :param task: the task
+        :type task: Task
+        :return: a priority
+        :rtype: float
+        """
+
+    def _select_compute_service(self, task: Task) -> Optional[ComputeService]:
+        """
+        Select the compute service on which to run a ready task, among those that have enough idle cores (the
+        default is the one with the fastest cores)
+
+        :param task: the task
+        :type task: Task
+        :return: a compute service, or None if the task must wait for cores to be released
+        :rtype: Optional[ComputeService]
+        """
+        return self.resources.get_fastest(task.get_min_num_cores())
+
+    def _get_file_locations(self, task: Task) -> dict[File, StorageService]:
+        """
+        Get the locations of the input and output files of a task
+
+        :param task: the task
+        :type task: Task
+        :return: the file locations
+        :rtype: dict[File, StorageService]
+        """
+        return {file: self.storage_service for file in task.get_input_files() + task.get_output_files()}
+
+    def schedule(self, ready_tasks: Iterable[Task]) \
+            -> List[Tuple[List[Task], dict[File, StorageService], ComputeService]]:
+        """
+        Queue the ready tasks that are not queued yet, and take, in order of priority, the queued tasks for
+        which there are enough idle cores
+
+        :param ready_tasks: the ready tasks of the workflow (e.g., as returned by Simulation.step())
+        :type ready_tasks: Iterable[Task]
+        :return: the (tasks, file locations, compute service) jobs to create and submit (see Simulation.step())
+        :rtype: List[Tuple[List[Task], dict[File, StorageService], ComputeService]]
+        """
+        for task in ready_tasks:
+            if task.get_name() not in self.__known_task_names:
+                self.__known_task_names.add(task.get_name())
+                heapq.heappush(self.__queues.setdefault(task.get_min_num_cores(), []),
+                               (self._get_priority(task), next(self.__arrival_numbers), task))
+        submissions = []
+        deferred = []
+        while True:
+            # Highest-priority task among those that fit in the idle cores of a compute service (tasks that need
+            # more cores stay queued, without being looked at)
+            max_num_idle_cores = self.resources.get_max_num_idle_cores()
+            queue = None
+            for num_cores, candidate_queue in self.__queues.items():
+                if num_cores <= max_num_idle_cores and (queue is None or candidate_queue[0] < queue[0]):
+                    queue = candidate_queue
+            if queue is None:
+                break
+            entry = heapq.heappop(queue)
+            task = entry[2]
+            if not queue:
+                del self.__queues[task.get_min_num_cores()]
+            compute_service = self._select_compute_service(task)
+            if compute_service is None:
+                deferred.append(entry)
+                continue
+            self.resources.acquire(compute_service, task.get_min_num_cores())
+            self.__allocations[task.get_name()] = (compute_service, task.get_min_num_cores())
+            submissions.append(([task], self._get_file_locations(task), compute_service))
+        for entry in deferred:
+            heapq.heappush(self.__queues.setdefault(entry[2].get_min_num_cores(), []), entry)
+        return submissions
+
+    def handle_event(self, event: Dict[str, Union[str, StandardJob, ComputeService]]) -> None:
+        """
+        Release the cores of the tasks of a job that has completed or failed (the tasks of a failed job are queued
+        again when they are ready again)
+
+        :param event: the event
+        :type event: Dict[str, Union[str, StandardJob, ComputeService]]
+        """
+        if event["event_type"] not in ("standard_job_completion", "standard_job_failure"):
+            return
+        for task in event["standard_job"].get_tasks():
+            if task.get_name() in self.__allocations:
+                self.resources.release(*self.__allocations.pop(task.get_name()))
+                if event["event_type"] == "standard_job_failure":
+                    self.__known_task_names.discard(task.get_name())
+
+    def get_num_queued_tasks(self) -> int:
+        """
+        Get the number of tasks that are ready but have not been submitted yet
+
+        :return: a number of tasks
+        :rtype: int
+        """
+        return sum(len(queue) for queue in self.__queues.values())
+
+    def run(self, workflow: Workflow) -> Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]:
+        """
+        Run a workflow to completion, i.e., submit its tasks as they become ready and cores become idle, until all
+        tasks have completed. The run is driven with Simulation.step(), so that each simulation event costs at most
+        two round-trips to the daemon.
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: all the events that occurred during the run, in order, and the timings of all tasks of the workflow
+        :rtype: Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]
+
+        :raises WRENCHException: if a job fails, if a ready task cannot run on any compute service, or if there is
+                                 any error in the responses
+        """
+        events = []
+        ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+        while not done:
+            submissions = self.schedule(ready_tasks)
+            if not submissions and not self.__allocations:
+                raise WRENCHException(f"Workflow {workflow.get_name()} cannot be completed: no job is running and "
+                                      f"none of the compute services has enough cores for the ready tasks "
+                                      f"{[entry[2].get_name() for queue in self.__queues.values() for entry in queue]}")
+            event, ready_tasks, done = self.simulation.step(workflow, submissions)
+            events.append(event)
+            self.handle_event(event)
+            if event["event_type"] == "standard_job_failure":
+                raise WRENCHException(f"Job {event['standard_job'].get_name()} failed: {event['failure_cause']}")
+        # Events of the last jobs that have completed at the same date
+        for event in self.simulation.get_events():
+            events.append(event)
+            self.handle_event(event)
+        return events, workflow.get_task_timings()
+
+    def __repr__(self) -> str:
+        """
+        :return: String representation of the scheduler
+        :rtype: str
+        """
+        return f"{type(self).__name__}(resources={self.resources!r}, num_queued_tasks={self.get_num_queued_tasks()})"
@@ -9,11 +9,13 @@
 
 import sys
 import atexit
+import contextlib
 import json
 import pathlib
-from typing import Dict, List, Optional, Union
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import requests
+from urllib3.util.retry import Retry
 
 from wrench.bare_metal_compute_service import BareMetalComputeService
 from wrench.batch_compute_service import BatchComputeService
@@ -22,7 +24,11 @@ from wrench.compute_service import ComputeService
 from wrench.exception import WRENCHException
 from wrench.file import File
 from wrench.file_registry_service import FileRegistryService
+from wrench.json_serializer import JSONSerializer
+from wrench.json_stream import JSONStringBody
+from wrench.request_stats import RequestStats
 from wrench.standard_job import StandardJob
+from wrench.static_schedule import StaticSchedule
 from wrench.compound_job import CompoundJob
 from wrench.action import Action
 from wrench.sleep_action import SleepAction
@@ -33,8 +39,15 @@ from wrench.file_write_action import FileWriteAction
 from wrench.file_read_action import FileReadAction
 from wrench.storage_service import StorageService
 from wrench.task import Task
+from wrench.task_graph import TaskGraph
+from wrench.task_table import TaskTable
+from wrench.task_timings import TaskTimings
+from wrench.transport import RequestsTransport, Transport
+from wrench.unix_socket_adapter import split_daemon_url, unix_socket_url
 from wrench.virtual_machine import VirtualMachine
 from wrench.workflow import Workflow
+from wrench.workflow_spec import WorkflowSpec
+from wrench import workflow_import
 
 
 # noinspection GrazieInspection
@@ -48,20 +61,84 @@ class Simulation:
     :type daemon_host: str
     :param daemon_port: port number on which the WRENCH daemon is listening
     :type daemon_port: int
+    :param pool_size: maximum number of keep-alive connections kept open to the WRENCH daemon
+    :type pool_size: int
+    :param max_retries: number of times a request is retried if the connection to the WRENCH daemon
+           cannot be established, or a urllib3 Retry object for full control over the retry policy
+    :type max_retries: Union[int, Retry]
+    :param timeout: timeout in seconds for requests to the WRENCH daemon, either as a single value or as
+           a (connect timeout, read timeout) tuple (None means "wait forever"). Only the connect timeout
+           applies to wait_for_next_event(), which blocks until the next simulation event occurs
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    :param json_backend: the library used to encode/decode the JSON documents exchanged with the WRENCH daemon
+           ("msgspec", "orjson" or "json"), or None to use the fastest one installed
+    :type json_backend: Optional[str]
+    :param daemon_url: if not None, the URL of the WRENCH daemon, which overrides daemon_host and daemon_port:
+           either "http://<host>:<port>", or "unix://<socket path>" to send requests over Unix domain sockets
+           (which saves the TCP overhead when the daemon runs on the same machine)
+    :type daemon_url: Optional[str]
+    :param transport: the transport through which requests are sent to the WRENCH daemon (default: a
+           RequestsTransport built with pool_size, max_retries and timeout, which are otherwise ignored)
+    :type transport: Optional[Transport]
+
+    :raises WRENCHException: if the JSON backend is unknown or not installed, or if the daemon URL is invalid
     """
 
     def __init__(self,
                  daemon_host: Optional[str] = "localhost",
-                 daemon_port: Optional[int] = 8101
+                 daemon_port: Optional[int] = 8101,
+                 pool_size: int = 10,
+                 max_retries: Union[int, Retry] = 0,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 json_backend: Optional[str] = None,
+                 daemon_url: Optional[str] = None,
+                 transport: Optional[Transport] = None
                  ) -> None:
         """
         Constructor
         """
+        self.serializer = JSONSerializer(json_backend)
+        self.socket_path = None
+        if daemon_url is not None:
+            daemon_host, daemon_port, self.socket_path = split_daemon_url(daemon_url)
         self.daemon_host = daemon_host
         self.daemon_port = daemon_port
-        self.daemon_url = f"http://{daemon_host}:{daemon_port}/api"
+        self.daemon_url = self.__get_url("api")
         self.started = False
 
+        # Transport through which all requests are sent to the daemon (by default, over a persistent
+        # keep-alive connection pool)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        if transport is None:
+            transport = RequestsTransport(pool_size=pool_size, max_retries=max_retries, timeout=timeout)
+        self.transport = transport
+        self.transport.serializer = self.serializer
+
+        # Functions called after each request to the daemon, and the statistics dumped at termination, if any
+        self.request_hooks = []
+        self.request_stats = None
+        self.__dump_request_stats = False
+
+        # Functions called when a standard job is submitted, and when it completes or fails
+        self.job_listeners = []
+
+        # Requests buffered by batch(), as (HTTP method, route, data, callback on success) tuples
+        self.__batched_requests = None
+
+        # Standard jobs whose completion/failure has not been reported yet, events received from the daemon but not
+        # yet returned to the user, and whether task states may have changed on the daemon side since the last events
+        # were received (in which case the workflows' task graphs are only up-to-date once events have been fetched)
+        self.__running_standard_jobs = set()
+        self.__running_compound_jobs = set()
+        self.__pending_events = deque()
+        self.__task_states_outdated = False
+
+        # Answers to queries about values that only change as the simulation advances (task and action states and
+        # dates), by route, which are dropped whenever simulated time may have advanced or jobs have been changed
+        self.__state_cache = {}
+
         # Setup atexit handler
         atexit.register(self.terminate)
         self.terminated = False
@@ -69,6 +146,7 @@ class Simulation:
 
         # Simulation Item Dictionaries
         # self.tasks = {}
+        self.workflows = {}
         self.actions = {}
         self.standard_jobs = {}
         self.compound_jobs = {}
@@ -79,19 +157,269 @@ class Simulation:
         # Default for test only
         self.simid = 101
 
-    @staticmethod
-    def __send_request_to_daemon(requests_method, route, json_data):
+    def __get_url(self, path: str) -> str:
+        """
+        Get the URL of a route on the daemon
+
+        :param path: the path of the route, without leading slash (e.g., "api")
+        :type path: str
+        :return: the URL
+        :rtype: str
+        """
+        if self.socket_path is not None:
+            return unix_socket_url(self.socket_path, path)
+        return f"http://{self.daemon_host}:{self.daemon_port}/{path}"
+
+    def __send_request_to_daemon(self, method: str, route: str, json_data: Union[dict, JSONStringBody],
+                                 long_poll: bool = False,
+                                 decode: Optional[Callable[[Iterable[bytes]], object]] = None) -> dict:
+        """
+        Send a request to the daemon
+
+        :param method: HTTP method
+        :type method: str
+        :param route: the route
+        :type route: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks, which it may consume as they are
+               received (default: the serializer's loads() on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], object]]
+
+        :return: the JSON answer
+        :rtype: dict
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        if self.__batched_requests:
+            # Buffered requests must reach the daemon before any later request
+            self.__flush_batched_requests()
         try:
-            r = requests_method(route, json=json_data)
-            return r
-        except Exception as e:  # pragma no cover
-            raise WRENCHException("Connection to wrench-daemon severed: " +
-                                  str(e) + "\n"
+            return self.transport.request(method, route, json_data, long_poll=long_poll, decode=decode)
+        except WRENCHException as e:  # pragma no cover
+            raise WRENCHException(str(e) + "\n"
                                            "This could be an error on the "
                                            "wrench-daemon side (likely an uncaught maestro exception, e.g., a deadlock). Enable "
                                            "logging with the --simulation-logging and --daemon-logging "
                                            "command-line arguments")
 
+    def __call_request_hooks(self, method: str, path: str, payload_size: int, response_size: int, decode_time: float,
+                             latency: float) -> None:
+        """
+        Call the request hooks for a request sent to the daemon
+
+        :param method: the HTTP method
+        :type method: str
+        :param path: the path of the request's URL
+        :type path: str
+        :param payload_size: the size of the request's JSON payload in bytes
+        :type payload_size: int
+        :param response_size: the size of the JSON answer in bytes
+        :type response_size: int
+        :param decode_time: the time spent decoding the JSON answer in seconds
+        :type decode_time: float
+        :param latency: the wall-clock time between sending the request and receiving the answer in seconds
+        :type latency: float
+        """
+        route = RequestStats.route_template(path)
+        for hook in self.request_hooks:
+            hook(method, route, payload_size, response_size, decode_time, latency)
+
+    def __send_pipelined_requests(self, requests_to_send: List[Tuple[str, str, dict]],
+                                  stop_on_failure: bool = True, long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of requests to the daemon (over a single pipelined connection if the transport allows it)
+
+        :param requests_to_send: the (HTTP method, route, data) requests, in order
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param stop_on_failure: whether to stop sending requests once a request has failed
+        :type stop_on_failure: bool
+        :param long_poll: whether answers may take arbitrarily long
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        return self.transport.request_many(requests_to_send, stop_on_failure=stop_on_failure, long_poll=long_poll)
+
+    def __send_bulk_requests(self, requests_to_send: List[Tuple[str, str, dict]],
+                             on_success: Optional[Callable[[int, dict], None]] = None,
+                             long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of independent requests to the daemon right away, over a single pipelined connection
+        (after any buffered request)
+
+        :param requests_to_send: the (HTTP method, route, data) requests, in order
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param on_success: function to call with the index of, and the answer to, each request that the daemon has
+               successfully processed
+        :type on_success: Optional[Callable[[int, dict], None]]
+        :param long_poll: whether answers may take arbitrarily long
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if a request fails (requests after it may or may not have been processed)
+        """
+        if self.__batched_requests:
+            self.__flush_batched_requests()
+        if not requests_to_send:
+            return []
+        answers = self.__send_pipelined_requests(requests_to_send, long_poll=long_poll)
+        for i, answer in enumerate(answers):
+            if not answer["wrench_api_request_success"]:
+                raise WRENCHException(answer["failure_cause"])
+            if on_success is not None:
+                on_success(i, answer)
+        return answers
+
+    def __batch_request(self, method: str, route: str, json_data: dict,
+                        on_success: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Buffer a request if a batch() context is active
+
+        :param method: HTTP method
+        :type method: str
+        :param route: the route
+        :type route: str
+        :param json_data: the request's JSON data
+        :type json_data: dict
+        :param on_success: function to call once the daemon has successfully processed the request
+        :type on_success: Optional[Callable[[], None]]
+
+        :return: True if the request was buffered, False if it should be sent right away
+        :rtype: bool
+        """
+        if self.__batched_requests is None:
+            return False
+        self.__batched_requests.append((method, route, json_data, on_success))
+        return True
+
+    def __flush_batched_requests(self) -> None:
+        """
+        Send all buffered requests to the daemon
+
+        :raises WRENCHException: if a buffered request fails (requests buffered after it are then discarded)
+        """
+        batched_requests, self.__batched_requests = self.__batched_requests, []
+        answers = self.__send_pipelined_requests([(m, r, d) for m, r, d, _ in batched_requests])
+        for (_, _, _, on_success), answer in zip(batched_requests, answers):
+            if not answer["wrench_api_request_success"]:
+                # Requests sent after the failed one may or may not have been processed by the daemon
+                for workflow in self.workflows.values():
+                    workflow.task_graph.synchronized = False
+                raise WRENCHException(answer["failure_cause"])
+            if on_success is not None:
+                on_success()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager in which adding files to the simulation, tasks to workflows, and input/output files
+        to tasks does not cost one round-trip to the daemon per call: these requests are buffered, and
+        sent in order over a single pipelined connection when the context exits (or, earlier, before any other
+        request is sent to the daemon). The File and Task objects are returned right away, and can be used
+        within the context. Nested contexts join the outermost one.
+
+        Example::
+
+            with simulation.batch():
+                for i in range(0, 10000):
+                    task = workflow.add_task(f"task_{i}", 100.0, 1, 1, 0)
+                    task.add_input_file(simulation.add_file(f"file_{i}", 1024))
+
+        :raises WRENCHException: if a buffered request fails
+        """
+        if self.__batched_requests is not None:
+            yield
+            return
+        self.__batched_requests = []
+        try:
+            yield
+            self.__flush_batched_requests()
+        finally:
+            self.__batched_requests = None
+
+    def add_request_hook(self, hook: Callable[[str, str, int, int, float, float], None]) -> None:
+        """
+        Add a function to be called after each request sent to the daemon, with as arguments the HTTP method, the
+        route template (e.g., "workflows/{}/tasks/{}/getState"), the size of the request's JSON payload and of
+        the JSON answer in bytes, the time spent decoding the answer and the wall-clock latency of the request in
+        seconds. For requests pipelined over a single connection (see batch()), the latency is measured from the
+        time at which the request was sent along with the other requests of its pipelining window.
+
+        :param hook: the function
+        :type hook: Callable[[str, str, int, int, float, float], None]
+        """
+        self.request_hooks.append(hook)
+        self.transport.on_answer = self.__call_request_hooks
+
+    def remove_request_hook(self, hook: Callable[[str, str, int, int, float, float], None]) -> None:
+        """
+        Remove a function added with add_request_hook()
+
+        :param hook: the function
+        :type hook: Callable[[str, str, int, int, float, float], None]
+
+        :raises WRENCHException: if the function is not a request hook
+        """
+        if hook not in self.request_hooks:
+            raise WRENCHException("Not a request hook")
+        self.request_hooks.remove(hook)
+        if not self.request_hooks:
+            self.transport.on_answer = None
+
+    def add_job_listener(self, listener: Callable[[str, StandardJob, ComputeService], None]) -> None:
+        """
+        Add a function to be called whenever a standard job is submitted to a compute service, and whenever a
+        standard job completes or fails, with as arguments the type of the event ("standard_job_submission",
+        "standard_job_completion" or "standard_job_failure"), the job and the compute service. Completions and
+        failures are notified as soon as their events are received from the daemon, which may be before they are
+        returned by wait_for_next_event() or step(), once the states of the job's tasks have been updated. The
+        minimum numbers of cores and the memory of the job's tasks are cached (in their min_num_cores and memory
+        attributes) before the listeners are notified of a submission.
+
+        :param listener: the function
+        :type listener: Callable[[str, StandardJob, ComputeService], None]
+        """
+        self.job_listeners.append(listener)
+
+    def remove_job_listener(self, listener: Callable[[str, StandardJob, ComputeService], None]) -> None:
+        """
+        Remove a function added with add_job_listener()
+
+        :param listener: the function
+        :type listener: Callable[[str, StandardJob, ComputeService], None]
+
+        :raises WRENCHException: if the function is not a job listener
+        """
+        if listener not in self.job_listeners:
+            raise WRENCHException("Not a job listener")
+        self.job_listeners.remove(listener)
+
+    def enable_request_stats(self, dump_at_terminate: bool = True) -> RequestStats:
+        """
+        Record per-route statistics (number of requests, latencies, decoding time, bytes sent and received)
+        of all subsequent requests sent to the daemon
+
+        :param dump_at_terminate: whether to print the statistics as a profile table to the standard error
+               when the simulation is terminated
+        :type dump_at_terminate: bool
+
+        :return: the statistics, which are updated as requests are sent
+        :rtype: RequestStats
+        """
+        if self.request_stats is None:
+            self.request_stats = RequestStats()
+            self.add_request_hook(self.request_stats)
+        self.__dump_request_stats = dump_at_terminate
+        return self.request_stats
+
     def start(self, platform_xml: str, controller_hostname: str) -> None:
         """
         Start a new simulation (will do nothing if simulation has already started)
@@ -111,19 +439,21 @@ class Simulation:
         if not self.started:
             self.spec = {"platform_xml": platform_xml, "controller_hostname": controller_hostname}
             try:
-                r = requests.post(f"{self.daemon_url}/startSimulation", json=self.spec)
-            except Exception:  # pragma: no cover
+                response = self.transport.request("POST", f"{self.daemon_url}/startSimulation", self.spec)
+            except WRENCHException:  # pragma: no cover
                 raise WRENCHException(
-                    f"Cannot connect to WRENCH daemon ({self.daemon_host}:{self.daemon_port})."
-                    f" Perhaps it needs to be started?")
+                    f"Cannot connect to WRENCH daemon ({self.socket_path or f'{self.daemon_host}:{self.daemon_port}'})."
+                    f" Perhaps it needs to be started (e.g., with wrench.Daemon)?")
 
-            response = r.json()
             if not response["wrench_api_request_success"]:
                 self.terminated = True
                 raise WRENCHException(response["failure_cause"])
 
+            # The simulation is served on its own port or, with Unix domain sockets, on its own socket
             self.daemon_port = response["port_number"]
-            self.daemon_url = f"http://{self.daemon_host}:{self.daemon_port}/simulation"
+            if self.socket_path is not None:
+                self.socket_path = response.get("socket_path", self.socket_path)
+            self.daemon_url = self.__get_url("simulation")
             self.started = True
         else:
             pass
@@ -134,9 +464,14 @@ class Simulation:
         """
         if not self.terminated:
             try:
-                requests.post(f"{self.daemon_url}/{self.simid}/terminateSimulation", {})
-            except requests.exceptions.ConnectionError:
+                self.transport.request("POST", f"{self.daemon_url}/{self.simid}/terminateSimulation", {})
+            except WRENCHException:
                 pass  # The server process was just killed by me!
+            self.transport.close()
+            if self.__dump_request_stats:
+                sys.stderr.write(f"{self.request_stats}\n")
+            # Do not keep terminated simulations alive until exit (e.g., in long parameter sweeps)
+            atexit.unregister(self.terminate)
         self.terminated = True
 
     def wait_for_next_event(self) -> Dict[str, Union[str, StandardJob, ComputeService]]:
@@ -146,10 +481,16 @@ class Simulation:
         :return: A JSON object
         :rtype: Dict[str, Union[str, StandardJob, ComputeService]]
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/waitForNextSimulationEvent",
-                                          json_data={})
-        response = r.json()["event"]
-        return self.__json_event_to_dict(response)
+        if self.__pending_events:
+            return self.__pending_events.popleft()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/waitForNextSimulationEvent",
+                                                 json_data={}, long_poll=True)["event"]
+        self.__state_cache.clear()
+        event = self.__json_event_to_dict(response)
+        # Other jobs may have completed at the same date
+        self.__task_states_outdated = bool(self.__running_standard_jobs)
+        return event
 
     def get_events(self) -> List[Dict[str, Union[str, StandardJob, ComputeService]]]:
         """
@@ -158,11 +499,140 @@ class Simulation:
         :return: A list of events
         :rtype: List[Dict[str, Union[str, StandardJob, ComputeService]]]
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/simulationEvents",
-                                          json_data={})
-        response = r.json()["events"]
-        response = [self.__json_event_to_dict(e) for e in response]
-        return response
+        events = list(self.__pending_events) + self.__fetch_events()
+        self.__pending_events.clear()
+        return events
+
+    def events(self) -> Iterator[Dict[str, Union[str, StandardJob, ComputeService]]]:
+        """
+        Iterate over simulation events as they occur: first the events that have already occurred, and then,
+        for as long as submitted jobs have not completed or failed, each next event as soon as it occurs. Jobs
+        submitted while iterating are taken into account, which makes it possible to write a scheduling loop as::
+
+            for event in simulation.events():
+                # submit new jobs, if any, based on the event
+
+        Each next event is obtained with a long-polling request sent over the simulation's keep-alive connection,
+        so no connection is set up per event.
+
+        :return: An iterator over events
+        :rtype: Iterator[Dict[str, Union[str, StandardJob, ComputeService]]]
+        """
+        yield from self.get_events()
+        while self.__running_standard_jobs or self.__running_compound_jobs:
+            yield self.wait_for_next_event()
+
+    def step(self, workflow: Workflow,
+             submissions: Iterable[Tuple[List[Task], dict[File, StorageService], ComputeService]] = ()) \
+            -> Tuple[Dict[str, Union[str, StandardJob, ComputeService]], List[Task], bool]:
+        """
+        Perform one iteration of a scheduling loop: create standard jobs and submit them to compute services, wait
+        for the next simulation event, and get the ready tasks of the workflow and whether it is done, which makes it
+        possible to write a scheduling loop as::
+
+            ready_tasks, done = workflow.get_ready_tasks(), workflow.is_done()
+            while not done:
+                submissions = [([task], file_locations, compute_service) for task in ready_tasks]
+                event, ready_tasks, done = simulation.step(workflow, submissions)
+
+        The jobs are created with requests that are pipelined over a single connection, and then submitted with
+        requests that are pipelined, over a single connection, with the wait for the next event. Unless the workflow
+        has been changed in ways that the client cannot keep track of (see TaskGraph), its ready tasks and whether it
+        is done are then known without any further request, so that a step takes two round-trips to the daemon,
+        instead of one per job creation, per job submission, and per query.
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :param submissions: the (tasks, file locations, compute service) jobs to create and submit, if any (jobs that
+               need service-specific arguments, e.g., for a batch compute service, must be submitted separately)
+        :type submissions: Iterable[Tuple[List[Task], dict[File, StorageService], ComputeService]]
+
+        :return: the next event, the ready tasks of the workflow, and whether the workflow is done
+        :rtype: Tuple[Dict[str, Union[str, StandardJob, ComputeService]], List[Task], bool]
+
+        :raises WRENCHException: if there is any error in the responses (in which case the jobs may or may not have
+                                 been created, or submitted, and the next event, if it was received, is returned
+                                 by the next call to wait_for_next_event() or step())
+        """
+        submissions = list(submissions)
+        jobs = []
+
+        def on_created(i: int, answer: dict) -> None:
+            self.standard_jobs[answer["job_name"]] = StandardJob(self, answer["job_name"], submissions[i][0])
+            jobs.append(self.standard_jobs[answer["job_name"]])
+
+        self.__send_bulk_requests([("POST", *self.__standard_job_request(tasks, file_locations))
+                                   for tasks, file_locations, _ in submissions], on_success=on_created)
+
+        requests_to_send = [("POST", f"{self.daemon_url}/{self.simid}/standardJobs/{job.get_name()}/submit",
+                             {"compute_service_name": cs.get_name(), "service_specific_args": "{}"})
+                            for job, (_, _, cs) in zip(jobs, submissions)]
+        fetch_events = not self.__pending_events and workflow.task_graph.synchronized
+        if not self.__pending_events:
+            requests_to_send.append(("GET", f"{self.daemon_url}/{self.simid}/waitForNextSimulationEvent", {}))
+            if fetch_events:
+                # Receive the events of the other jobs that may have completed at the same date, as the task graph
+                # would otherwise have to be brought up-to-date with one more request
+                requests_to_send.append(("GET", f"{self.daemon_url}/{self.simid}/simulationEvents", {}))
+        # All answers are received even if a submission fails, so that no event is lost
+        answers = self.__send_pipelined_requests(requests_to_send, stop_on_failure=False, long_poll=True)
+        self.__state_cache.clear()
+        json_events = []
+        failure_causes = []
+        for i, answer in enumerate(answers):
+            if not answer["wrench_api_request_success"]:
+                failure_causes.append(answer["failure_cause"])
+            elif i < len(jobs):
+                self.__register_submitted_standard_job(jobs[i], submissions[i][2])
+            else:
+                json_events.extend([answer["event"]] if "event" in answer else answer["events"])
+        self.__pending_events.extend(self.__json_event_to_dict(e) for e in json_events)
+        if json_events:
+            self.__task_states_outdated = not fetch_events and bool(self.__running_standard_jobs)
+        if failure_causes:
+            raise WRENCHException(failure_causes[0])
+        event = self.__pending_events.popleft()
+        return event, self._workflow_get_ready_tasks(workflow), self._workflow_is_done(workflow)
+
+    def run_schedule(self, workflow: Workflow, schedule: StaticSchedule) \
+            -> Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]:
+        """
+        Run a workflow to completion according to a static schedule, i.e., submit each task to its compute service
+        (see StaticSchedule) as soon as it is ready, until all tasks have completed.
+
+        The run is driven with step(), so that each simulation event costs at most two round-trips to the daemon,
+        whatever the number of tasks submitted because of it, and that there is no other request (unless the
+        workflow has been changed in ways that the client cannot keep track of, see TaskGraph).
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :param schedule: the schedule, which must include all the tasks of the workflow that have not completed
+        :type schedule: StaticSchedule
+
+        :return: all the events that occurred during the run, in order, and the timings of all tasks of the workflow
+        :rtype: Tuple[List[Dict[str, Union[str, StandardJob, ComputeService]]], TaskTimings]
+
+        :raises WRENCHException: if a job fails, if the schedule cannot complete the workflow (e.g., because
+                                 a task is not in the schedule), or if there is any error in the responses
+        """
+        queues = schedule._get_queues()
+        events = []
+        ready_tasks, done = self._workflow_get_ready_tasks(workflow), self._workflow_is_done(workflow)
+        while not done:
+            submissions = StaticSchedule._take_ready_tasks(queues, ready_tasks)
+            if not submissions and not self.__running_standard_jobs and not self.__pending_events:
+                raise WRENCHException(f"The schedule cannot complete workflow {workflow.get_name()}: no job is "
+                                      f"running and none of the ready tasks "
+                                      f"{[task.get_name() for task in ready_tasks]} is next in its compute "
+                                      f"service's queue")
+            event, ready_tasks, done = self.step(workflow, submissions)
+            events.append(event)
+            if event["event_type"] == "standard_job_failure":
+                raise WRENCHException(f"Job {event['standard_job'].get_name()} failed: {event['failure_cause']}")
+        # Events of the last jobs that have completed at the same date
+        events.extend(self.__pending_events)
+        self.__pending_events.clear()
+        return events, self._workflow_get_task_timings(workflow)
 
     def create_standard_job(self, tasks: List[Task], file_locations: dict[File, StorageService]) -> StandardJob:
         """
@@ -178,25 +648,8 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-
-        # Check all tasks are in the same workflow
-        workflow = tasks[0].get_workflow()
-        for task in tasks:
-            if task.get_workflow() != workflow:
-                raise WRENCHException("Cannot create a standard job with tasks from different workflows")
-
-        task_names = [t.get_name() for t in tasks]
-
-        file_locations_specs = {}
-        for fl in file_locations:
-            file_locations_specs[fl.get_name()] = file_locations[fl].get_name()
-
-        data = {"tasks": task_names, "file_locations": file_locations_specs}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/workflows/{workflow.get_name()}/createStandardJob",
-                                          json_data=data)
-
-        response = r.json()
+        route, data = self.__standard_job_request(tasks, file_locations)
+        response = self.__send_request_to_daemon("POST", route, json_data=data)
         if response["wrench_api_request_success"]:
             self.standard_jobs[response["job_name"]] = StandardJob(self, response["job_name"], tasks)
             return self.standard_jobs[response["job_name"]]
@@ -216,11 +669,9 @@ class Simulation:
         """
 
         data = {"name": name}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/createCompoundJob",
-                                          json_data=data)
-
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/createCompoundJob",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             self.compound_jobs[response["job_name"]] = CompoundJob(self, response["job_name"])
@@ -235,14 +686,14 @@ class Simulation:
         :rtype: Workflow
         """
 
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/createWorkflow", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/createWorkflow", json_data={})
         if not response["wrench_api_request_success"]:
             self.terminated = True
             raise WRENCHException(response["failure_cause"])
 
-        return Workflow(self, response["workflow_name"])
+        self.workflows[response["workflow_name"]] = Workflow(self, response["workflow_name"])
+        return self.workflows[response["workflow_name"]]
 
     def add_file(self, name: str, size: int) -> File:
         """
@@ -259,15 +710,43 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"name": name, "size": size}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/addFile", json_data=data)
-
-        response = r.json()
+        new_file = File(self, name, size)
+        if self.__batch_request("POST", f"{self.daemon_url}/{self.simid}/addFile", data,
+                                lambda: self.files.__setitem__(name, new_file)):
+            return new_file
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addFile", json_data=data)
         if response["wrench_api_request_success"]:
-            new_file = File(self, name, size)
             self.files[name] = new_file
             return new_file
         raise WRENCHException(response["failure_cause"])
 
+    def add_files(self, files: Iterable[Tuple[str, int]]) -> List[File]:
+        """
+        Add files to the simulation, with requests that are pipelined over a single connection (instead of
+        one round-trip to the daemon per file, as with add_file())
+
+        :param files: the (file name, file size in bytes) pairs
+        :type files: Iterable[Tuple[str, int]]
+
+        :return: the file objects, in order
+        :rtype: List[File]
+
+        :raises WRENCHException: if a file cannot be added (in which case the files before it have been added, and
+                                 the files after it may or may not have been added)
+        """
+        route = f"{self.daemon_url}/{self.simid}/addFile"
+        new_files = [File(self, name, size) for name, size in files]
+        if self.__batched_requests is not None:
+            for new_file in new_files:
+                self.__batch_request("POST", route, {"name": new_file.get_name(), "size": new_file.size},
+                                     lambda f=new_file: self.files.__setitem__(f.get_name(), f))
+            return new_files
+        self.__send_bulk_requests([("POST", route, {"name": new_file.get_name(), "size": new_file.size})
+                                   for new_file in new_files],
+                                  lambda i, _: self.files.__setitem__(new_files[i].get_name(), new_files[i]))
+        return new_files
+
     def get_all_files(self) -> dict[str, File]:
         """
         Get the list of all files
@@ -285,7 +764,9 @@ class Simulation:
         :type seconds: float
         """
         data = {"increment": seconds}
-        self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/advanceTime", json_data=data)
+        self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/advanceTime", json_data=data)
+        self.__state_cache.clear()
+        self.__task_states_outdated = bool(self.__running_standard_jobs)
 
     def get_simulated_time(self) -> float:
         """
@@ -293,9 +774,8 @@ class Simulation:
         :return: the simulation date
         :rtype: float
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/getTime", json_data={})
-
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/getTime", json_data={})
         return response["time"]
 
     def create_bare_metal_compute_service(self, hostname: str,
@@ -325,9 +805,9 @@ class Simulation:
                 "property_list": json.dumps(property_list),
                 "message_payload_list": json.dumps(message_payload_list),
                 }
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/addBareMetalComputeService", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addBareMetalComputeService",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             compute_service_name = response["service_name"]
@@ -361,9 +841,9 @@ class Simulation:
                 "property_list": json.dumps(property_list),
                 "message_payload_list": json.dumps(message_payload_list),
                 }
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/addBatchComputeService", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addBatchComputeService",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             compute_service_name = response["service_name"]
@@ -397,9 +877,9 @@ class Simulation:
                 "property_list": json.dumps(property_list),
                 "message_payload_list": json.dumps(message_payload_list)}
 
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/addCloudComputeService",
-                                          json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addCloudComputeService",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             compute_service_name = response["service_name"]
@@ -421,9 +901,9 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"head_host": hostname, "mount_points": mount_points}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/addSimpleStorageService",
-                                          json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addSimpleStorageService",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             storage_service_name = response["service_name"]
@@ -444,9 +924,9 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"head_host": hostname}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/addFileRegistryService",
-                                          json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/addFileRegistryService",
+                                                 json_data=data)
 
         if response["wrench_api_request_success"]:
             file_registry_service_name = response["service_name"]
@@ -462,8 +942,8 @@ class Simulation:
         :return: list of hostnames
         :rtype: List[str]
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/hostnames", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/hostnames", json_data={})
         return response["hostnames"]
 
     def create_workflow_from_json(self, json_object: json, reference_flop_rate: str, ignore_machine_specs: bool,
@@ -499,49 +979,73 @@ class Simulation:
         :rtype: Workflow
         """
 
-        data = {"json_string": json.dumps(json_object),
-                "reference_flop_rate": reference_flop_rate,
-                "ignore_machine_specs": ignore_machine_specs,
-                "redundant_dependencies": redundant_dependencies,
-                "ignore_cycle_creating_dependencies": ignore_cycle_creating_dependencies,
-                "min_cores_per_task": min_cores_per_task,
-                "max_cores_per_task": max_cores_per_task,
-                "enforce_num_cores": enforce_num_cores,
-                "ignore_avg_cpu": ignore_avg_cpu,
-                "show_warnings": show_warnings}
-
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/createWorkflowFromJSON",
-                                          json_data=data)
-        response = r.json()
-
-        # Create the workflow
-        workflow = Workflow(self, response["workflow_name"])
-
-
-        # Create the files (caching parameter values)
-        for file_spec in response["files"]:
-            file_name = file_spec["name"]
-            file_size = file_spec["size"]
-            self.files[file_name] = File(self, file_name, file_size)
-
-        # Create the tasks (caching parameter values)
-        for task_spec in response["tasks"]:
-            task_name = task_spec["name"]
-            task_flops = task_spec["flops"]
-            task_min_num_cores = task_spec["min_num_cores"]
-            task_max_num_cores = task_spec["max_num_cores"]
-            task_memory = task_spec["memory"]
-            input_file_list = []
-            for file_name in task_spec["input_file_names"]:
-                input_file_list.append(self.files[file_name])
-            output_file_list = []
-            for file_name in task_spec["output_file_names"]:
-                output_file_list.append(self.files[file_name])
+        parameters = workflow_import.get_import_parameters(reference_flop_rate, ignore_machine_specs,
+                                                           redundant_dependencies,
+                                                           ignore_cycle_creating_dependencies, min_cores_per_task,
+                                                           max_cores_per_task, enforce_num_cores, ignore_avg_cpu,
+                                                           show_warnings)
+
+        # The (potentially huge) answer is decoded straight into file and task specifications
+        workflow_spec: WorkflowSpec = self.__send_request_to_daemon(
+            "POST", f"{self.daemon_url}/{self.simid}/createWorkflowFromJSON",
+            json_data=workflow_import.get_json_object_request(self.serializer, json_object, parameters),
+            decode=lambda chunks: self.serializer.loads_workflow_spec(b"".join(chunks)))
+        return workflow_import.create_workflow_from_spec(self, workflow_spec,
+                                                         workflow_import.get_json_object_tasks(json_object),
+                                                         redundant_dependencies, ignore_cycle_creating_dependencies)
+
+    def create_workflow_from_json_file(self, path: Union[str, pathlib.Path], reference_flop_rate: str,
+                                       ignore_machine_specs: bool, redundant_dependencies: bool,
+                                       ignore_cycle_creating_dependencies: bool, min_cores_per_task: int,
+                                       max_cores_per_task: int, enforce_num_cores: bool, ignore_avg_cpu: bool,
+                                       show_warnings: bool) -> Workflow:
+        """
+        Create a workflow from a WfCommons JSON file. Unlike with create_workflow_from_json(), the file is never
+        loaded in memory as a whole: it is streamed to the daemon, and the daemon's answer is decoded incrementally,
+        which keeps memory usage low for very large workflows.
+
+        :param path: the path of a WfCommons JSON file
+        :type path: Union[str, pathlib.Path]
+        :param reference_flop_rate: reference flop rate (e.g., "100Mf")
+        :type reference_flop_rate: str
+        :param ignore_machine_specs: whether to ignore machine specifications in the JSON
+        :type ignore_machine_specs: bool
+        :param redundant_dependencies: whether to take into account redundant task dependencies
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether to ignore cycles when creating task dependencies
+        :type ignore_cycle_creating_dependencies: bool
+        :param min_cores_per_task: the minimum number of cores for a task if not specified in the JSON
+        :type min_cores_per_task: int
+        :param max_cores_per_task: the maximum number of cores for a task if not specified in the JSON
+        :type max_cores_per_task: int
+        :param enforce_num_cores: whether to enforce the number of cores for a task even if specified in the JSON
+        :type enforce_num_cores: bool
+        :param ignore_avg_cpu: whether to ignore the average CPU time information in the JSON to compute
+               sequential task execution times
+        :type ignore_avg_cpu: bool
+        :param show_warnings: whether to show warnings when importing the JSON (displayed on the wrench-daemon console)
+        :type show_warnings: bool
 
-            workflow.tasks[task_name] = Task(self, workflow, task_name, task_flops, task_min_num_cores, task_max_num_cores, task_memory, input_file_list, output_file_list)
+        :return: A workflow
+        :rtype: Workflow
 
+        :raises WRENCHException: if the file is not valid JSON, or if the daemon cannot import it
+        :raises OSError: if the file cannot be read
+        """
+        # Only the task names, ids and parents are needed to mirror the task graph
+        json_tasks = workflow_import.get_json_file_tasks(path)
+        parameters = workflow_import.get_import_parameters(reference_flop_rate, ignore_machine_specs,
+                                                           redundant_dependencies,
+                                                           ignore_cycle_creating_dependencies, min_cores_per_task,
+                                                           max_cores_per_task, enforce_num_cores, ignore_avg_cpu,
+                                                           show_warnings)
 
-        return workflow
+        workflow_spec: WorkflowSpec = self.__send_request_to_daemon(
+            "POST", f"{self.daemon_url}/{self.simid}/createWorkflowFromJSON",
+            json_data=workflow_import.get_json_file_request(self.serializer, path, parameters),
+            decode=WorkflowSpec.from_stream)
+        return workflow_import.create_workflow_from_spec(self, workflow_spec, json_tasks, redundant_dependencies,
+                                                         ignore_cycle_creating_dependencies)
 
     ####################################################################################
     ####################################################################################
@@ -562,11 +1066,13 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"compute_service_name": cs.get_name(), "service_specific_args": service_specific_args}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/"
-                                                         f"standardJobs/{job.get_name()}/submit", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                                    f"standardJobs/{job.get_name()}/submit",
+                                                                    json_data=data)
+        self.__state_cache.clear()
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
+        self.__register_submitted_standard_job(job, cs)
 
     def _submit_compound_job(self, job: CompoundJob, cs: ComputeService, service_specific_args="{}") -> None:
         """
@@ -580,11 +1086,13 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"compute_service_name": cs.get_name(), "service_specific_args": service_specific_args}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/"
-                                                         f"compoundJobs/{job.get_name()}/submit", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/"
+                                                                    f"compoundJobs/{job.get_name()}/submit",
+                                                                    json_data=data)
+        self.__state_cache.clear()
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
+        self.__running_compound_jobs.add(job.get_name())
 
     def _create_file_copy_at_storage_service(self, file: File, storage_service: StorageService):
         """
@@ -598,13 +1106,47 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"filename": file.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/storage_services/"
-                                          f"{storage_service.get_name()}/createFileCopy", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/storage_services/"
+                                                 f"{storage_service.get_name()}/createFileCopy", json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
 
+    def _create_file_copies_at_storage_service(self, files: Iterable[File], storage_service: StorageService) -> None:
+        """
+        Create copies (ex nihilo) of files at a storage service, with requests that are pipelined over a single
+        connection
+
+        :param files: the files
+        :type files: Iterable[File]
+        :param storage_service: the storage service
+        :type storage_service: StorageService
+
+        :raises WRENCHException: if a copy cannot be created (in which case the copies before it have been created,
+                                 and the copies after it may or may not have been created)
+        """
+        route = f"{self.daemon_url}/{self.simid}/storage_services/{storage_service.get_name()}/createFileCopy"
+        self.__send_bulk_requests([("POST", route, {"filename": file.get_name()}) for file in files])
+
+    def _lookup_files_at_storage_service(self, files: Iterable[File], storage_service: StorageService) -> List[bool]:
+        """
+        Check whether copies of files are stored at a storage service, with requests that are pipelined over a
+        single connection
+
+        :param files: the files
+        :type files: Iterable[File]
+        :param storage_service: the storage service
+        :type storage_service: StorageService
+
+        :return: whether a copy of each file is stored at the storage service, in order
+        :rtype: List[bool]
+
+        :raises WRENCHException: if there is any error in the responses
+        """
+        route = f"{self.daemon_url}/{self.simid}/storage_services/{storage_service.get_name()}/lookupFile"
+        answers = self.__send_bulk_requests([("POST", route, {"filename": file.get_name()}) for file in files])
+        return [answer["result"] for answer in answers]
+
     def _lookup_file_at_storage_service(self, file: File, storage_service: StorageService) -> bool:
         """
         Checks whether a copy of a file is stored at a storage service
@@ -620,10 +1162,9 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"filename": file.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/storage_services/"
-                                          f"{storage_service.get_name()}/lookupFile", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/storage_services/"
+                                                 f"{storage_service.get_name()}/lookupFile", json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
         return response["result"]
@@ -640,14 +1181,22 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"file": file.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/addInputFile", json_data=data)
-
-        response = r.json()
+        route = f"{self.daemon_url}/{self.simid}/workflows/{task.get_workflow().get_name()}/tasks/" \
+                f"{task.get_name()}/addInputFile"
+        if task.input_files is None:
+            task.input_files = []
+        # The task, or tasks that use the file, may no longer be ready
+        self.__state_cache.clear()
+        task_graph = task.get_workflow().task_graph
+        update_task_graph = lambda: task_graph.add_input_file(task.get_name(), file.get_name())
+        if self.__batch_request("POST", route, data, lambda: task_graph.apply(update_task_graph)):
+            task.input_files.append(file)
+            return
+        response = self.__send_request_to_daemon("POST", route, json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
+        task.input_files.append(file)
+        task_graph.apply(update_task_graph)
 
     def _add_output_file(self, task: Task, file: File) -> None:
         """
@@ -661,14 +1210,22 @@ class Simulation:
         :raises WRENCHException: if there is any error in the response
         """
         data = {"file": file.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/addOutputFile", json_data=data)
-
-        response = r.json()
+        route = f"{self.daemon_url}/{self.simid}/workflows/{task.get_workflow().get_name()}/tasks/" \
+                f"{task.get_name()}/addOutputFile"
+        if task.output_files is None:
+            task.output_files = []
+        # The task, or tasks that use the file, may no longer be ready
+        self.__state_cache.clear()
+        task_graph = task.get_workflow().task_graph
+        update_task_graph = lambda: task_graph.add_output_file(task.get_name(), file.get_name())
+        if self.__batch_request("POST", route, data, lambda: task_graph.apply(update_task_graph)):
+            task.output_files.append(file)
+            return
+        response = self.__send_request_to_daemon("POST", route, json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
+        task.output_files.append(file)
+        task_graph.apply(update_task_graph)
 
     def _get_task_input_files(self, task: Task) -> List[File]:
         """
@@ -682,15 +1239,16 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                        f"{task.get_workflow().get_name()}/tasks/"
-                                                        f"{task.get_name()}/inputFiles", json_data={})
-
-        response = r.json()
+        if task.input_files is not None:
+            return task.input_files
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                   f"{task.get_workflow().get_name()}/tasks/"
+                                                                   f"{task.get_name()}/inputFiles", json_data={})
         if response["wrench_api_request_success"]:
             file_list = []
             for filename in response["files"]:
                 file_list.append(self.files[filename])
+            task.input_files = file_list
             return file_list
         raise WRENCHException(response["failure_cause"])
 
@@ -706,15 +1264,16 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                        f"{task.get_workflow().get_name()}/tasks/"
-                                                        f"{task.get_name()}/outputFiles", json_data={})
-
-        response = r.json()
+        if task.output_files is not None:
+            return task.output_files
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                   f"{task.get_workflow().get_name()}/tasks/"
+                                                                   f"{task.get_name()}/outputFiles", json_data={})
         if response["wrench_api_request_success"]:
             file_list = []
             for filename in response["files"]:
                 file_list.append(self.files[filename])
+            task.output_files = file_list
             return file_list
         raise WRENCHException(response["failure_cause"])
 
@@ -729,35 +1288,32 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}"
-                                                        f"/files/{file.get_name()}/size", json_data={})
-
-        response = r.json()
+        if file.size is not None:
+            return file.size
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}"
+                                                                   f"/files/{file.get_name()}/size", json_data={})
         if response["wrench_api_request_success"]:
-            return response["size"]
+            file.size = response["size"]
+            return file.size
         raise WRENCHException(response["failure_cause"])
 
-    def _task_get_state(self, task: Task) -> int:
+    def _task_get_state(self, task: Task) -> Task.TaskState:
         """
         Get the state of a task
         :param task: the task
         :type task: Task
 
-        :return: a state as an int (enum)
-        :rtype: int
+        :return: a state
+        :rtype: Task.TaskState
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getState",
-                                          json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["state"]
-        raise WRENCHException(response["failure_cause"])
+        task_graph = self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_state(task.get_name())
+        return Task.TaskState(self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/workflows/"
+                                                          f"{task.get_workflow().get_name()}/tasks/"
+                                                          f"{task.get_name()}/getState", "state"))
 
     def _task_get_flops(self, task: Task) -> float:
         """
@@ -770,16 +1326,16 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getFlops",
-                                          json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["flops"]
-        raise WRENCHException(response["failure_cause"])
+        if task.flops is None:
+            response = self.__send_request_to_daemon("GET",
+                                                     f"{self.daemon_url}/{self.simid}/workflows/"
+                                                     f"{task.get_workflow().get_name()}/tasks/"
+                                                     f"{task.get_name()}/getFlops",
+                                                     json_data={})
+            if not response["wrench_api_request_success"]:
+                raise WRENCHException(response["failure_cause"])
+            task.flops = response["flops"]
+        return task.flops
 
     def _task_get_min_num_cores(self, task: Task) -> int:
         """
@@ -792,16 +1348,16 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getMinNumCores",
-                                          json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["min_num_cores"]
-        raise WRENCHException(response["failure_cause"])
+        if task.min_num_cores is None:
+            response = self.__send_request_to_daemon("GET",
+                                                     f"{self.daemon_url}/{self.simid}/workflows/"
+                                                     f"{task.get_workflow().get_name()}/tasks/"
+                                                     f"{task.get_name()}/getMinNumCores",
+                                                     json_data={})
+            if not response["wrench_api_request_success"]:
+                raise WRENCHException(response["failure_cause"])
+            task.min_num_cores = response["min_num_cores"]
+        return task.min_num_cores
 
     def _task_get_max_num_cores(self, task: Task) -> int:
         """
@@ -814,16 +1370,16 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getMaxNumCores",
-                                          json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["max_num_cores"]
-        raise WRENCHException(response["failure_cause"])
+        if task.max_num_cores is None:
+            response = self.__send_request_to_daemon("GET",
+                                                     f"{self.daemon_url}/{self.simid}/workflows/"
+                                                     f"{task.get_workflow().get_name()}/tasks/"
+                                                     f"{task.get_name()}/getMaxNumCores",
+                                                     json_data={})
+            if not response["wrench_api_request_success"]:
+                raise WRENCHException(response["failure_cause"])
+            task.max_num_cores = response["max_num_cores"]
+        return task.max_num_cores
 
     def _task_get_memory(self, task: Task) -> int:
         """
@@ -836,15 +1392,15 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getMemory", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["memory"]
-        raise WRENCHException(response["failure_cause"])
+        if task.memory is None:
+            response = self.__send_request_to_daemon("GET",
+                                                     f"{self.daemon_url}/{self.simid}/workflows/"
+                                                     f"{task.get_workflow().get_name()}/tasks/"
+                                                     f"{task.get_name()}/getMemory", json_data={})
+            if not response["wrench_api_request_success"]:
+                raise WRENCHException(response["failure_cause"])
+            task.memory = response["memory"]
+        return task.memory
 
     def _task_get_number_of_children(self, task: Task) -> int:
         """
@@ -857,12 +1413,13 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getNumberOfChildren", json_data={})
-
-        response = r.json()
+        task_graph = self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_number_of_children(task.get_name())
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/workflows/"
+                                                 f"{task.get_workflow().get_name()}/tasks/"
+                                                 f"{task.get_name()}/getNumberOfChildren", json_data={})
         if response["wrench_api_request_success"]:
             return response["number_of_children"]
         raise WRENCHException(response["failure_cause"])
@@ -878,12 +1435,13 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/"
-                                          f"{task.get_name()}/getBottomLevel", json_data={})
-
-        response = r.json()
+        task_graph = self.__get_task_graph(task.get_workflow())
+        if task_graph is not None:
+            return task_graph.get_bottom_level(task.get_name())
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/workflows/"
+                                                 f"{task.get_workflow().get_name()}/tasks/"
+                                                 f"{task.get_name()}/getBottomLevel", json_data={})
         if response["wrench_api_request_success"]:
             return response["bottom_level"]
         raise WRENCHException(response["failure_cause"])
@@ -899,15 +1457,9 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/{task.get_name()}/"
-                                          f"getStartDate", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["time"]
-        raise WRENCHException(response["failure_cause"])
+        return self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/workflows/"
+                                           f"{task.get_workflow().get_name()}/tasks/{task.get_name()}/getStartDate",
+                                           "time")
 
     def _task_get_end_date(self, task: Task) -> float:
         """
@@ -920,16 +1472,85 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/workflows/"
-                                          f"{task.get_workflow().get_name()}/tasks/{task.get_name()}/"
-                                          f"getEndDate", json_data={})
+        return self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/workflows/"
+                                           f"{task.get_workflow().get_name()}/tasks/{task.get_name()}/getEndDate",
+                                           "time")
 
-        response = r.json()
+    def __add_action(self, compound_job: CompoundJob, route: str, data: dict,
+                     new_action: Callable[[dict], Action]) -> Action:
+        """
+        Add an action to a compound job
+
+        :param compound_job: the compound job
+        :type compound_job: CompoundJob
+        :param route: the route of the request, relative to the compound job's (e.g., "addSleepAction")
+        :type route: str
+        :param data: the request's JSON data
+        :type data: dict
+        :param new_action: function that creates the action object from the daemon's answer
+        :type new_action: Callable[[dict], Action]
+
+        :return: the action
+        :rtype: Action
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        response = self.__send_request_to_daemon("POST", f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                         f"{compound_job.get_name()}/{route}", json_data=data)
         if response["wrench_api_request_success"]:
-            return response["time"]
+            action = new_action(response)
+            compound_job.actions.append(action)
+            return action
         raise WRENCHException(response["failure_cause"])
 
+    def __compute_action_request(self, compound_job: CompoundJob, name: str, flops: float, ram: int,
+                                 max_num_cores: int, min_num_cores: int,
+                                 parallel_model: tuple) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "flops": flops, "ram": ram,
+                "min_num_cores": min_num_cores, "max_num_cores": max_num_cores, "parallel_model": parallel_model}
+        return "addComputeAction", data, lambda response: ComputeAction(self, compound_job, response["name"], flops,
+                                                                        ram, min_num_cores, max_num_cores,
+                                                                        parallel_model)
+
+    def __file_copy_action_request(self, compound_job: CompoundJob, name: str, file: File,
+                                   src_storage_service: StorageService,
+                                   dest_storage_service: StorageService) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "file_name": file.get_name(), "src_storage_service_name": src_storage_service.get_name(),
+                "dest_storage_service_name": dest_storage_service.get_name()}
+        return "addFileCopyAction", data, lambda response: FileCopyAction(self, compound_job, response["name"], file,
+                                                                          src_storage_service, dest_storage_service,
+                                                                          response["uses_scratch"] == "1")
+
+    def __file_delete_action_request(self, compound_job: CompoundJob, name: str, file: File,
+                                     storage_service: StorageService) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
+        return "addFileDeleteAction", data, lambda response: FileDeleteAction(self, compound_job, response["name"],
+                                                                              file, storage_service,
+                                                                              response["uses_scratch"] == "1")
+
+    def __file_write_action_request(self, compound_job: CompoundJob, name: str, file: File,
+                                    storage_service: StorageService) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
+        return "addFileWriteAction", data, lambda response: FileWriteAction(self, compound_job, response["name"],
+                                                                            file, storage_service,
+                                                                            response["uses_scratch"] == "1")
+
+    def __file_read_action_request(self, compound_job: CompoundJob, name: str, file: File,
+                                   storage_service: StorageService,
+                                   num_bytes_to_read: int) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name(),
+                "num_bytes_to_read": num_bytes_to_read}
+        return "addFileReadAction", data, lambda response: FileReadAction(self, compound_job, response["name"], file,
+                                                                          storage_service,
+                                                                          response["num_bytes_to_read"],
+                                                                          response["uses_scratch"] == "1")
+
+    def __sleep_action_request(self, compound_job: CompoundJob, name: str,
+                               sleep_time: float) -> Tuple[str, dict, Callable[[dict], Action]]:
+        data = {"name": name, "sleep_time": sleep_time}
+        return "addSleepAction", data, lambda response: SleepAction(self, compound_job,
+                                                                    response["sleep_action_name"], sleep_time)
+
     def _add_compute_action(self, compound_job: CompoundJob, name: str, flops: float, ram: int,
                             max_num_cores: int, min_num_cores: int, parallel_model: tuple) -> Action:
         """
@@ -955,20 +1576,9 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "flops": flops, "ram": ram,
-                "min_num_cores": min_num_cores, "max_num_cores": max_num_cores, "parallel_model": parallel_model}
-
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addComputeAction", json_data=data)
-
-        response = r.json()
-
-        if response["wrench_api_request_success"]:
-            compute_action = ComputeAction(self, compound_job, response["name"], flops, ram,
-                                           min_num_cores, max_num_cores, parallel_model)
-            compound_job.actions.append(compute_action)
-            return compute_action
-        raise WRENCHException(response["failure_cause"])
+        return self.__add_action(compound_job, *self.__compute_action_request(compound_job, name, flops, ram,
+                                                                             max_num_cores, min_num_cores,
+                                                                             parallel_model))
 
     def _add_file_copy_action(self, compound_job: CompoundJob, name: str, file: File,
                               src_storage_service: StorageService, dest_storage_service: StorageService) -> Action:
@@ -993,24 +1603,9 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "file_name": file.get_name(), "src_storage_service_name": src_storage_service.get_name(),
-                "dest_storage_service_name": dest_storage_service.get_name()}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addFileCopyAction", json_data=data)
-
-        response = r.json()
-
-        if response["wrench_api_request_success"]:
-            if response["uses_scratch"] == "1":
-                uses_scratch = True
-            else:
-                uses_scratch = False
-
-            file_copy_action = FileCopyAction(self, compound_job, response["name"], file, src_storage_service,
-                                              dest_storage_service, uses_scratch)
-            compound_job.actions.append(file_copy_action)
-            return file_copy_action
-        raise WRENCHException(response["failure_cause"])
+        return self.__add_action(compound_job, *self.__file_copy_action_request(compound_job, name, file,
+                                                                               src_storage_service,
+                                                                               dest_storage_service))
 
     def _add_file_delete_action(self, compound_job: CompoundJob, name: str, file: File,
                                 storage_service: StorageService) -> Action:
@@ -1033,24 +1628,8 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addFileDeleteAction",
-                                          json_data=data)
-
-        response = r.json()
-
-        if response["wrench_api_request_success"]:
-            if response["uses_scratch"] == "1":
-                uses_scratch = True
-            else:
-                uses_scratch = False
-
-            file_delete_action = FileDeleteAction(self, compound_job, response["name"], file, storage_service,
-                                                  uses_scratch)
-            compound_job.actions.append(file_delete_action)
-            return file_delete_action
-        raise WRENCHException(response["failure_cause"])
+        return self.__add_action(compound_job, *self.__file_delete_action_request(compound_job, name, file,
+                                                                                 storage_service))
 
     def _add_file_write_action(self, compound_job: CompoundJob, name: str, file: File,
                                storage_service: StorageService) -> Action:
@@ -1073,24 +1652,8 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name()}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addFileWriteAction",
-                                          json_data=data)
-
-        response = r.json()
-
-        if response["wrench_api_request_success"]:
-            if response["uses_scratch"] == "1":
-                uses_scratch = True
-            else:
-                uses_scratch = False
-
-            file_write_action = FileWriteAction(self, compound_job, response["name"], file, storage_service,
-                                                uses_scratch)
-            compound_job.actions.append(file_write_action)
-            return file_write_action
-        raise WRENCHException(response["failure_cause"])
+        return self.__add_action(compound_job, *self.__file_write_action_request(compound_job, name, file,
+                                                                                storage_service))
 
     def _add_file_read_action(self, compound_job: CompoundJob, name: str, file: File, storage_service: StorageService,
                               num_bytes_to_read: int) -> Action:
@@ -1111,25 +1674,8 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "file_name": file.get_name(), "storage_service_name": storage_service.get_name(),
-                "num_bytes_to_read": num_bytes_to_read}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addFileReadAction",
-                                          json_data=data)
-
-        response = r.json()
-
-        if response["wrench_api_request_success"]:
-            if response["uses_scratch"] == "1":
-                uses_scratch = True
-            else:
-                uses_scratch = False
-
-            file_read_action = FileReadAction(self, compound_job, response["name"], file, storage_service,
-                                              response["num_bytes_to_read"], uses_scratch)
-            compound_job.actions.append(file_read_action)
-            return file_read_action
-        raise WRENCHException(response["failure_cause"])
+        return self.__add_action(compound_job, *self.__file_read_action_request(compound_job, name, file,
+                                                                               storage_service, num_bytes_to_read))
 
     def _add_sleep_action(self, compound_job: CompoundJob, name: str, sleep_time: float) -> Action:
         """
@@ -1147,38 +1693,84 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        data = {"name": name, "sleep_time": sleep_time}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                                         f"{compound_job.get_name()}/addSleepAction", json_data=data)
+        return self.__add_action(compound_job, *self.__sleep_action_request(compound_job, name, sleep_time))
 
-        response = r.json()
+    def _build_compound_job(self, name: str, actions: List[Tuple[str, tuple]], dependencies: List[Tuple[str, str]],
+                            parent_jobs: List[CompoundJob], compute_service: Optional[ComputeService] = None,
+                            service_specific_args: str = "{}") -> CompoundJob:
+        """
+        Create a compound job with all its actions, action dependencies and parent jobs (and, optionally, submit it),
+        with requests that are pipelined over a single connection
 
-        if response["wrench_api_request_success"]:
-            sleep_action = SleepAction(self, compound_job, response["sleep_action_name"], sleep_time)
-            compound_job.actions.append(sleep_action)
-            return sleep_action
-        raise WRENCHException(response["failure_cause"])
+        :param name: the name of the compound job
+        :type name: str
+        :param actions: the (kind, arguments) pairs of the actions, where the kind is the name of the
+               CompoundJob method that adds the action (e.g., "add_sleep_action"), in order
+        :type actions: List[Tuple[str, tuple]]
+        :param dependencies: the (parent action name, child action name) dependencies
+        :type dependencies: List[Tuple[str, str]]
+        :param parent_jobs: the parent compound jobs
+        :type parent_jobs: List[CompoundJob]
+        :param compute_service: the compute service to which the job is submitted, if any
+        :type compute_service: Optional[ComputeService]
+        :param service_specific_args: the service-specific arguments of the submission
+        :type service_specific_args: str
+
+        :return: the compound job
+        :rtype: CompoundJob
 
-    def _action_get_state(self, action: Action) -> int:
+        :raises WRENCHException: if there is any error in the responses (in which case the job may have been
+                                 partially built)
+        """
+        action_requests = {"add_compute_action": self.__compute_action_request,
+                           "add_file_copy_action": self.__file_copy_action_request,
+                           "add_file_delete_action": self.__file_delete_action_request,
+                           "add_file_write_action": self.__file_write_action_request,
+                           "add_file_read_action": self.__file_read_action_request,
+                           "add_sleep_action": self.__sleep_action_request}
+        compound_job = CompoundJob(self, name)
+        job_route = f"{self.daemon_url}/{self.simid}/compoundJobs/{name}"
+        specs = [action_requests[kind](compound_job, *args) for kind, args in actions]
+        requests_to_send = [("POST", f"{self.daemon_url}/{self.simid}/createCompoundJob", {"name": name})]
+        requests_to_send += [("POST", f"{job_route}/{route}", data) for route, data, _ in specs]
+        requests_to_send += [("POST", f"{job_route}/addActionDependency",
+                              {"parent_action_name": parent, "child_action_name": child})
+                             for parent, child in dependencies]
+        requests_to_send += [("POST", f"{job_route}/addParentJob", {"parent_compound_job": parent_job.get_name()})
+                             for parent_job in parent_jobs]
+        if compute_service is not None:
+            requests_to_send.append(("POST", f"{job_route}/submit",
+                                     {"compute_service_name": compute_service.get_name(),
+                                      "service_specific_args": service_specific_args}))
+
+        def on_success(i: int, answer: dict) -> None:
+            if i == 0:
+                self.compound_jobs[name] = compound_job
+            elif i <= len(specs):
+                compound_job.actions.append(specs[i - 1][2](answer))
+            elif i == len(requests_to_send) - 1 and compute_service is not None:
+                self.__running_compound_jobs.add(name)
+
+        try:
+            self.__send_bulk_requests(requests_to_send, on_success)
+        finally:
+            self.__state_cache.clear()
+        return compound_job
+
+    def _action_get_state(self, action: Action) -> Action.ActionState:
         """
         Get the action's state
         :param action: the action
         :type action: Action
 
-        :return: a state as an int (enum)
-        :rtype: int
+        :return: a state
+        :rtype: Action.ActionState
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{action.get_job().get_name()}/actions/{action.get_name()}/"
-                                          f"getState", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["state"]
-        raise WRENCHException(response["failure_cause"])
+        return Action.ActionState(self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                              f"{action.get_job().get_name()}/actions/"
+                                                              f"{action.get_name()}/getState", "state"))
 
     def _action_get_start_date(self, action: Action) -> float:
         """
@@ -1191,15 +1783,9 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{action.get_job().get_name()}/actions/{action.get_name()}/"
-                                          f"getStartDate", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["time"]
-        raise WRENCHException(response["failure_cause"])
+        return self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                           f"{action.get_job().get_name()}/actions/{action.get_name()}/getStartDate",
+                                           "time")
 
     def _action_get_end_date(self, action: Action) -> float:
         """
@@ -1212,15 +1798,9 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{action.get_job().get_name()}/actions/{action.get_name()}/"
-                                          f"getEndDate", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            return response["time"]
-        raise WRENCHException(response["failure_cause"])
+        return self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                           f"{action.get_job().get_name()}/actions/{action.get_name()}/getEndDate",
+                                           "time")
 
     def _action_get_failure_cause(self, action: Action) -> str | None:
         """
@@ -1233,18 +1813,13 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{action.get_job().get_name()}/actions/{action.get_name()}/"
-                                          f"getFailureCause", json_data={})
-
-        response = r.json()
-        if response["wrench_api_request_success"]:
-            if response["action_failure_cause"] == "":
-                return None
-            else:
-                return response["action_failure_cause"]
-        raise WRENCHException(response["failure_cause"])
+        failure_cause = self.__get_simulation_state(f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                    f"{action.get_job().get_name()}/actions/{action.get_name()}/"
+                                                    f"getFailureCause", "action_failure_cause")
+        if failure_cause == "":
+            return None
+        else:
+            return failure_cause
 
     def _add_action_dependency(self, compound_job: CompoundJob, parent_action: Action, child_action: Action):
         """
@@ -1262,11 +1837,11 @@ class Simulation:
         """
         data = {"parent_action_name": parent_action.get_name(),
                 "child_action_name": child_action.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{compound_job.get_name()}/addActionDependency",
-                                          json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                 f"{compound_job.get_name()}/addActionDependency",
+                                                 json_data=data)
+        self.__state_cache.clear()
 
         if response["wrench_api_request_success"]:
             return
@@ -1287,11 +1862,11 @@ class Simulation:
         """
 
         data = {"parent_compound_job": parent_compound_job.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/compoundJobs/"
-                                          f"{compound_job.get_name()}/addParentJob",
-                                          json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/compoundJobs/"
+                                                 f"{compound_job.get_name()}/addParentJob",
+                                                 json_data=data)
+        self.__state_cache.clear()
 
         if response["wrench_api_request_success"]:
             return
@@ -1327,10 +1902,9 @@ class Simulation:
                 "property_list": json.dumps(property_list),
                 "message_payload_list": json.dumps(message_payload_list)}
 
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{service.get_name()}/"
-                                          f"createVM", json_data=data)
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{service.get_name()}/"
+                                                 f"createVM", json_data=data)
 
         if response["wrench_api_request_success"]:
             return VirtualMachine(self, service, response["vm_name"])
@@ -1346,10 +1920,9 @@ class Simulation:
         """
         # data = {"service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
 
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"startVM", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"startVM", json_data={})
 
         if response["wrench_api_request_success"]:
             mbcs_name = response["service_name"]
@@ -1366,10 +1939,9 @@ class Simulation:
 
         # data = {"service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
 
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"shutdownVM", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"shutdownVM", json_data={})
 
         if response["wrench_api_request_success"]:
             return
@@ -1384,10 +1956,9 @@ class Simulation:
 
         # data = {"service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
 
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"destroyVM", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"destroyVM", json_data={})
 
         if response["wrench_api_request_success"]:
             return
@@ -1402,10 +1973,9 @@ class Simulation:
         :rtype: bool
         """
         # data = {"compute_service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"isVMRunning", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"isVMRunning", json_data={})
 
         if response["wrench_api_request_success"]:
             return response["result"]
@@ -1420,10 +1990,9 @@ class Simulation:
         :rtype: bool
         """
         # data = {"compute_service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"isVMDown", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"isVMDown", json_data={})
 
         if response["wrench_api_request_success"]:
             return response["result"]
@@ -1436,10 +2005,9 @@ class Simulation:
         :type vm: VirtualMachine
         """
         # data = {"compute_service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"suspendVM", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"suspendVM", json_data={})
 
         if response["wrench_api_request_success"]:
             return
@@ -1454,10 +2022,9 @@ class Simulation:
         :rtype: bool
         """
         # data = {"compute_service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"isVMSuspended", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"isVMSuspended", json_data={})
 
         if response["wrench_api_request_success"]:
             return response["result"]
@@ -1470,10 +2037,9 @@ class Simulation:
         :type vm: VirtualMachine
         """
         # data = {"compute_service_name": vm.get_cloud_compute_service().get_name(), "vm_name": vm.get_name()}
-        r = self.__send_request_to_daemon(requests.post,
-                                          f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
-                                          f"resumeVM", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/cloud_compute_services/{vm.get_cloud_compute_service().get_name()}/vms/{vm.get_name()}/"
+                                                 f"resumeVM", json_data={})
 
         if response["wrench_api_request_success"]:
             return
@@ -1487,10 +2053,9 @@ class Simulation:
         :return: True or False
         :rtype: bool
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
-                                          f"supportsCompoundJobs", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
+                                                 f"supportsCompoundJobs", json_data={})
         return response["result"]
 
     def _supports_pilot_jobs(self, cs: ComputeService) -> bool:
@@ -1501,10 +2066,9 @@ class Simulation:
         :return: True or False
         :rtype: bool
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
-                                          f"supportsPilotJobs", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
+                                                 f"supportsPilotJobs", json_data={})
         return response["result"]
 
     def _supports_standard_jobs(self, cs: ComputeService) -> bool:
@@ -1515,10 +2079,9 @@ class Simulation:
         :return: True or False
         :rtype: bool
         """
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
-                                          f"supportsStandardJobs", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
+                                                 f"supportsStandardJobs", json_data={})
         return response["result"]
 
     def _get_core_flop_rates(self, cs: ComputeService) -> Dict[str, float]:
@@ -1530,10 +2093,9 @@ class Simulation:
         :rtype: Dict[str, float]
         """
 
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
-                                          f"coreFlopRates", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
+                                                 f"coreFlopRates", json_data={})
         to_return = {}
         for i in range(0, len(response["hostnames"])):
             to_return[response["hostnames"][i]] = response["flop_rates"][i]
@@ -1548,10 +2110,9 @@ class Simulation:
         :rtype: Dict[str, int]
         """
 
-        r = self.__send_request_to_daemon(requests.get,
-                                          f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
-                                          f"coreCounts", json_data={})
-        response = r.json()
+        response = self.__send_request_to_daemon("GET",
+                                                 f"{self.daemon_url}/{self.simid}/compute_services/{cs.get_name()}/"
+                                                 f"coreCounts", json_data={})
         to_return = {}
         for i in range(0, len(response["hostnames"])):
             to_return[response["hostnames"][i]] = response["core_counts"][i]
@@ -1584,13 +2145,14 @@ class Simulation:
                 "min_num_cores": min_num_cores,
                 "max_num_cores": max_num_cores,
                 "memory": memory}
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                         f"{workflow.get_name()}/createTask", json_data=data)
-
-        response = r.json()
+        new_task = Task(self, workflow, name, flops, min_num_cores, max_num_cores, memory)
+        route = f"{self.daemon_url}/{self.simid}/workflows/{workflow.get_name()}/createTask"
+        if self.__batch_request("POST", route, data, lambda: self.__register_task(new_task)):
+            return new_task
+        response = self.__send_request_to_daemon("POST", route, json_data=data)
         if response["wrench_api_request_success"]:
-            workflow.tasks[name] = Task(self, workflow, name, flops, min_num_cores, max_num_cores, memory)
-            return workflow.tasks[name]
+            self.__register_task(new_task)
+            return new_task
         raise WRENCHException(response["failure_cause"])
 
     def _workflow_get_input_files(self, workflow: Workflow) -> List[File]:
@@ -1603,10 +2165,8 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                        f"{workflow.get_name()}/inputFiles", json_data={})
-
-        response = r.json()
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                   f"{workflow.get_name()}/inputFiles", json_data={})
         if response["wrench_api_request_success"]:
             file_list = []
             for filename in response["files"]:
@@ -1614,6 +2174,76 @@ class Simulation:
             return file_list
         raise WRENCHException(response["failure_cause"])
 
+    def _workflow_get_task_states(self, workflow: Workflow) -> Dict[str, Task.TaskState]:
+        """
+        Get the states of all tasks in the workflow, from its task graph if possible, and otherwise with all
+        requests pipelined over a single connection
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: A dictionary of task states where task names are keys
+        :rtype: Dict[str, Task.TaskState]
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        task_graph = self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return {task_name: task_graph.get_state(task_name) for task_name in workflow.tasks}
+        answers = self.__send_workflow_task_requests(workflow, ["getState"])
+        return {task_name: Task.TaskState(answer["state"]) for task_name, answer in zip(workflow.tasks, answers)}
+
+    def _workflow_get_task_timings(self, workflow: Workflow) -> TaskTimings:
+        """
+        Get the states, start dates, and end dates of all tasks in the workflow, with all requests pipelined
+        over a single connection
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: A TaskTimings object
+        :rtype: TaskTimings
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        task_graph = self.__get_task_graph(workflow)
+        if task_graph is not None:
+            states = [task_graph.get_state(task_name) for task_name in workflow.tasks]
+            answers = self.__send_workflow_task_requests(workflow, ["getStartDate", "getEndDate"])
+        else:
+            answers = self.__send_workflow_task_requests(workflow, ["getStartDate", "getEndDate", "getState"])
+            states = [Task.TaskState(answer["state"]) for answer in answers[2::3]]
+        stride = 2 if task_graph is not None else 3
+        return TaskTimings(list(workflow.tasks), states,
+                           [answer["time"] for answer in answers[0::stride]],
+                           [answer["time"] for answer in answers[1::stride]])
+
+    def _workflow_get_task_table(self, workflow: Workflow) -> TaskTable:
+        """
+        Get a columnar view of the tasks in the workflow, which is cached (and kept up-to-date by the task graph)
+        if the task graph is in sync with the daemon, and built from pipelined requests otherwise
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: A TaskTable object
+        :rtype: TaskTable
+
+        :raises WRENCHException: if NumPy is not installed, or if there is any error in the response
+        """
+        self.__fetch_task_specs(workflow)
+        task_graph = self.__get_task_graph(workflow)
+        if task_graph is None:
+            answers = self.__send_workflow_task_requests(workflow, ["getState", "getBottomLevel"])
+            return TaskTable(list(workflow.tasks.values()),
+                             [Task.TaskState(answer["state"]) for answer in answers[0::2]],
+                             [answer["bottom_level"] for answer in answers[1::2]])
+        task_table = workflow.task_table
+        if task_table is None or task_table.version != task_graph.version:
+            if task_table is not None:
+                task_graph.state_listeners.remove(task_table.set_state)
+            task_table = TaskTable(list(workflow.tasks.values()),
+                                   [task_graph.get_state(task_name) for task_name in workflow.tasks],
+                                   [task_graph.get_bottom_level(task_name) for task_name in workflow.tasks])
+            task_table.version = task_graph.version
+            task_graph.state_listeners.append(task_table.set_state)
+            workflow.task_table = task_table
+        return task_table
+
     def _add_entry_to_file_registry_service(self, file_registry_service: FileRegistryService, file: File,
                                             storage_service: StorageService):
         """
@@ -1629,10 +2259,10 @@ class Simulation:
         """
         data = {"file_name": file.get_name(),
                 "storage_service_name": storage_service.get_name(), }
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
-                                                         f"{file_registry_service.get_name()}/addEntry", json_data=data)
-
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
+                                                                    f"{file_registry_service.get_name()}/addEntry",
+                                                                    json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
         return
@@ -1647,11 +2277,10 @@ class Simulation:
         """
         data = {"file_name": file.get_name()}
 
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
-                                                         f"{file_registry_service.get_name()}/lookupEntry",
-                                          json_data=data)
-
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
+                                                                    f"{file_registry_service.get_name()}/lookupEntry",
+                                                 json_data=data)
         if response["wrench_api_request_success"]:
             ss_list = []
             for storage_service_name in response["storage_services"]:
@@ -1674,11 +2303,10 @@ class Simulation:
         """
         data = {"file_name": file.get_name(),
                 "storage_service_name": storage_service.get_name(), }
-        r = self.__send_request_to_daemon(requests.post, f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
-                                                         f"{file_registry_service.get_name()}/removeEntry",
-                                          json_data=data)
-
-        response = r.json()
+        response = self.__send_request_to_daemon("POST",
+                                                 f"{self.daemon_url}/{self.simid}/fileRegistryServices/"
+                                                                    f"{file_registry_service.get_name()}/removeEntry",
+                                                 json_data=data)
         if not response["wrench_api_request_success"]:
             raise WRENCHException(response["failure_cause"])
         return
@@ -1693,10 +2321,11 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                        f"{workflow.get_name()}/readyTasks", json_data={})
-
-        response = r.json()
+        task_graph = self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return [workflow.tasks[task_name] for task_name in task_graph.get_ready_tasks()]
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                   f"{workflow.get_name()}/readyTasks", json_data={})
         if response["wrench_api_request_success"]:
             task_list = []
             for task_name in response["tasks"]:
@@ -1714,10 +2343,11 @@ class Simulation:
 
         :raises WRENCHException: if there is any error in the response
         """
-        r = self.__send_request_to_daemon(requests.get, f"{self.daemon_url}/{self.simid}/workflows/"
-                                                        f"{workflow.get_name()}/isDone", json_data={})
-
-        response = r.json()
+        task_graph = self.__get_task_graph(workflow)
+        if task_graph is not None:
+            return task_graph.is_done()
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                                   f"{workflow.get_name()}/isDone", json_data={})
         if response["wrench_api_request_success"]:
             return response["result"]
         raise WRENCHException(response["failure_cause"])
@@ -1726,6 +2356,191 @@ class Simulation:
     # Private methods
     ###############################
 
+    def __register_task(self, task: Task) -> None:
+        """
+        Register a task that the daemon has successfully created in its workflow
+
+        :param task: the task
+        :type task: Task
+        """
+        workflow = task.get_workflow()
+        workflow.tasks[task.get_name()] = task
+        workflow.task_graph.apply(lambda: workflow.task_graph.add_task(task.get_name()))
+
+    def __standard_job_request(self, tasks: List[Task], file_locations: dict[File, StorageService]) -> Tuple[str, dict]:
+        """
+        Build the request that creates a standard job
+
+        :param tasks: list of tasks
+        :type tasks: List[Task]
+        :param file_locations: list of file locations
+        :type file_locations: dict[File, StorageService]
+        :return: the route and the data of the (POST) request
+        :rtype: Tuple[str, dict]
+
+        :raises WRENCHException: if the tasks are not all in the same workflow
+        """
+        # Check all tasks are in the same workflow
+        workflow = tasks[0].get_workflow()
+        for task in tasks:
+            if task.get_workflow() != workflow:
+                raise WRENCHException("Cannot create a standard job with tasks from different workflows")
+
+        task_names = [t.get_name() for t in tasks]
+
+        file_locations_specs = {}
+        for fl in file_locations:
+            file_locations_specs[fl.get_name()] = file_locations[fl].get_name()
+
+        data = {"tasks": task_names, "file_locations": file_locations_specs}
+        return f"{self.daemon_url}/{self.simid}/workflows/{workflow.get_name()}/createStandardJob", data
+
+    def __register_submitted_standard_job(self, job: StandardJob, cs: ComputeService) -> None:
+        """
+        Register a standard job that the daemon has successfully submitted to a compute service
+
+        :param job: the job
+        :type job: StandardJob
+        :param cs: the compute service
+        :type cs: ComputeService
+        """
+        self.__running_standard_jobs.add(job.get_name())
+        task_graph = job.get_tasks()[0].get_workflow().task_graph
+        for task in job.get_tasks():
+            task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState.PENDING))
+        if self.job_listeners:
+            # Listeners read the (cached) specifications of the job's tasks
+            for task in job.get_tasks():
+                self._task_get_min_num_cores(task)
+                self._task_get_memory(task)
+        for listener in self.job_listeners:
+            listener("standard_job_submission", job, cs)
+
+    def __send_workflow_task_requests(self, workflow: Workflow, task_routes: List[str]) -> List[dict]:
+        """
+        Send a series of GET requests about each task of a workflow, pipelined over a single connection
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :param task_routes: the task routes (e.g., "getState") to query for each task
+        :type task_routes: List[str]
+
+        :return: the answers, task by task and, for each task, in the order of the routes
+        :rtype: List[dict]
+
+        :raises WRENCHException: if there is any error in an answer
+        """
+        if self.__batched_requests:
+            self.__flush_batched_requests()
+        answers = self.__send_pipelined_requests([("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                          f"{workflow.get_name()}/tasks/{task_name}/{route}", {})
+                                                  for task_name in workflow.tasks for route in task_routes])
+        for answer in answers:
+            if not answer["wrench_api_request_success"]:
+                raise WRENCHException(answer["failure_cause"])
+        return answers
+
+    def __fetch_task_specs(self, workflow: Workflow) -> None:
+        """
+        Get the flops, numbers of cores and memory requirements of the tasks of a workflow, with all requests
+        pipelined over a single connection, unless they are all known already
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+
+        :raises WRENCHException: if there is any error in an answer
+        """
+        if all(None not in (task.flops, task.min_num_cores, task.max_num_cores, task.memory)
+               for task in workflow.tasks.values()):
+            return
+        answers = self.__send_workflow_task_requests(workflow, ["getFlops", "getMinNumCores", "getMaxNumCores",
+                                                                "getMemory"])
+        for task, task_answers in zip(workflow.tasks.values(), zip(*[iter(answers)] * 4)):
+            task.flops = task_answers[0]["flops"]
+            task.min_num_cores = task_answers[1]["min_num_cores"]
+            task.max_num_cores = task_answers[2]["max_num_cores"]
+            task.memory = task_answers[3]["memory"]
+
+    def __get_task_graph(self, workflow: Workflow) -> Optional[TaskGraph]:
+        """
+        Get the task graph of a workflow, brought up-to-date, if it can be used instead of querying the daemon
+
+        :param workflow: the workflow
+        :type workflow: Workflow
+        :return: the task graph, or None if the daemon must be queried
+        :rtype: Optional[TaskGraph]
+        """
+        if self.__batched_requests:
+            self.__flush_batched_requests()
+        if not workflow.task_graph.synchronized:
+            return None
+        if self.__task_states_outdated:
+            # Receive the events (to be returned later to the user) of the jobs that have completed in the meantime
+            self.__pending_events.extend(self.__fetch_events())
+        return workflow.task_graph
+
+    def __get_simulation_state(self, route: str, key: str):
+        """
+        Query the daemon about a value that only changes as the simulation advances (e.g., an action's state), unless
+        it has already been queried since simulated time last advanced or jobs were last changed
+
+        :param route: the (GET) route of the query
+        :type route: str
+        :param key: the key of the value in the answer
+        :type key: str
+        :return: the value
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        if route not in self.__state_cache:
+            response = self.__send_request_to_daemon("GET", route, json_data={})
+            if not response["wrench_api_request_success"]:
+                raise WRENCHException(response["failure_cause"])
+            self.__state_cache[route] = response[key]
+        return self.__state_cache[route]
+
+    def __fetch_events(self) -> List[Dict[str, Union[str, StandardJob, ComputeService]]]:
+        """
+        Get all simulation events that have not been received yet from the daemon
+
+        :return: A list of events
+        :rtype: List[Dict[str, Union[str, StandardJob, ComputeService]]]
+        """
+        response = self.__send_request_to_daemon("GET", f"{self.daemon_url}/{self.simid}/simulationEvents",
+                                                 json_data={})["events"]
+        self.__state_cache.clear()
+        response = [self.__json_event_to_dict(e) for e in response]
+        self.__task_states_outdated = False
+        return response
+
+    def __update_task_states(self, job: StandardJob, success: bool) -> None:
+        """
+        Update the task graph of a standard job's workflow once the job has completed or failed
+
+        :param job: the standard job
+        :type job: StandardJob
+        :param success: whether the job has completed successfully
+        :type success: bool
+        """
+        self.__running_standard_jobs.discard(job.get_name())
+        workflow = job.get_tasks()[0].get_workflow()
+        task_graph = workflow.task_graph
+        if success:
+            for task in job.get_tasks():
+                task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState.COMPLETED))
+            return
+        if not task_graph.synchronized:
+            return
+        # Some tasks of a failed job may have completed, and the others are no longer pending
+        answers = self.__send_pipelined_requests([("GET", f"{self.daemon_url}/{self.simid}/workflows/"
+                                                          f"{workflow.get_name()}/tasks/{task.get_name()}/getState", {})
+                                                  for task in job.get_tasks()], stop_on_failure=False)
+        for task, answer in zip(job.get_tasks(), answers):
+            if not answer["wrench_api_request_success"]:
+                task_graph.synchronized = False
+                return
+            task_graph.apply(lambda: task_graph.set_state(task.get_name(), Task.TaskState(answer["state"])))
+
     def __json_event_to_dict(self, json_event: Dict[str, str]) -> Dict[str, Union[str, StandardJob, ComputeService]]:
         """
         :param json_event:
@@ -1745,6 +2560,9 @@ class Simulation:
             event_dict["end_date"] = json_event["end_date"]
             event_dict["event_date"] = json_event["event_date"]
             event_dict["standard_job"] = self.standard_jobs[json_event["job_name"]]
+            self.__update_task_states(event_dict["standard_job"], True)
+            for listener in self.job_listeners:
+                listener(event_dict["event_type"], event_dict["standard_job"], event_dict["compute_service"])
             return event_dict
         elif json_event["event_type"] == "standard_job_failure":
             event_dict["event_type"] = json_event["event_type"]
@@ -1754,6 +2572,9 @@ class Simulation:
             event_dict["event_date"] = json_event["event_date"]
             event_dict["standard_job"] = self.standard_jobs[json_event["job_name"]]
             event_dict["failure_cause"] = json_event["failure_cause"]
+            self.__update_task_states(event_dict["standard_job"], False)
+            for listener in self.job_listeners:
+                listener(event_dict["event_type"], event_dict["standard_job"], event_dict["compute_service"])
             return event_dict
         elif json_event["event_type"] == "compound_job_completion":
             event_dict["event_type"] = json_event["event_type"]
@@ -1762,6 +2583,7 @@ class Simulation:
             event_dict["end_date"] = json_event["end_date"]
             event_dict["event_date"] = json_event["event_date"]
             event_dict["compound_job"] = self.compound_jobs[json_event["job_name"]]
+            self.__running_compound_jobs.discard(json_event["job_name"])
             return event_dict
         elif json_event["event_type"] == "compound_job_failure":
             event_dict["event_type"] = json_event["event_type"]
@@ -1771,6 +2593,7 @@ class Simulation:
             event_dict["event_date"] = json_event["event_date"]
             event_dict["compound_job"] = self.compound_jobs[json_event["job_name"]]
             event_dict["failure_cause"] = json_event["failure_cause"]
+            self.__running_compound_jobs.discard(json_event["job_name"])
             return event_dict
 
         raise WRENCHException("Unknown event type " + json_event["event_type"])
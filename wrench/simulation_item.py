@@ -11,9 +11,13 @@
 # noinspection GrazieInspection
 class SimulationItem:
     """
-    WRENCH Simulation Item class
+    WRENCH Simulation Item class. Simulation items, and all their subclasses, declare their attributes
+    in __slots__, so that handles to the (possibly millions of) tasks, files and actions of a simulation
+    have no per-instance __dict__.
     """
 
+    __slots__ = ("_simulation", "_name")
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
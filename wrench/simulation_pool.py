@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import itertools
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from wrench.daemon import Daemon
+from wrench.exception import WRENCHException
+from wrench.simulation import Simulation
+
+
+def _run_controller(daemon_host: str, daemon_port: int, simulation_args: Dict[str, Any],
+                    controller: Callable[..., Any], args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+    """
+    Run a controller function on a new simulation (in a worker process of a simulation pool)
+
+    :param daemon_host: name of the host on which the WRENCH daemon is running
+    :type daemon_host: str
+    :param daemon_port: port number on which the WRENCH daemon is listening
+    :type daemon_port: int
+    :param simulation_args: the other arguments of the Simulation constructor
+    :type simulation_args: Dict[str, Any]
+    :param controller: the controller function
+    :type controller: Callable[..., Any]
+    :param args: the controller's positional arguments, after the simulation
+    :type args: Sequence[Any]
+    :param kwargs: the controller's keyword arguments
+    :type kwargs: Dict[str, Any]
+    :return: the controller's return value
+    :rtype: Any
+    """
+    simulation = Simulation(daemon_host, daemon_port, **simulation_args)
+    try:
+        return controller(simulation, *args, **kwargs)
+    finally:
+        simulation.terminate()
+
+
+class SimulationPool:
+    """
+    Pool of local WRENCH daemons and of worker processes, for running many independent simulations (e.g., for a
+    parameter sweep over platforms, reference flop rates or scheduling heuristics) on all the cores of the
+    machine. Each run calls a user-provided controller function, in a worker process, with a new Simulation
+    object connected to one of the daemons (in round-robin order) as first argument. The controller starts
+    the simulation, drives it and returns a (picklable) result. The simulation is terminated once the
+    controller returns, and the daemons are reused from one run to the next (and restarted if they die).
+
+    Example::
+
+        def controller(simulation, platform_xml, flop_rate):
+            simulation.start(platform_xml, "ControllerHost")
+            ...
+            return simulation.get_simulated_time()
+
+        with wrench.SimulationPool() as pool:
+            makespans = pool.map(controller, [(platform_xml, rate) for rate in ["50Gf", "100Gf", "200Gf"]])
+
+    :param num_daemons: number of daemons to launch (default: the number of cores)
+    :type num_daemons: Optional[int]
+    :param num_workers: number of worker processes (default: the number of cores)
+    :type num_workers: Optional[int]
+    :param daemon_host: name of the host on which the daemons are running
+    :type daemon_host: str
+    :param daemon_command: the command that launches a daemon, to which "--port <port number>" is appended
+    :type daemon_command: Sequence[str]
+    :param daemon_ports: port numbers of already running daemons to use, in which case no daemon is launched
+    :type daemon_ports: Optional[Sequence[int]]
+    :param startup_timeout: time in seconds to wait for each launched daemon to accept connections
+    :type startup_timeout: float
+    :param simulation_args: the other arguments of the Simulation constructor (e.g., timeout=60)
+    """
+
+    def __init__(self,
+                 num_daemons: Optional[int] = None,
+                 num_workers: Optional[int] = None,
+                 daemon_host: str = "localhost",
+                 daemon_command: Sequence[str] = ("wrench-daemon",),
+                 daemon_ports: Optional[Sequence[int]] = None,
+                 startup_timeout: float = 30.0,
+                 **simulation_args) -> None:
+        """
+        Constructor
+        """
+        self.num_daemons = num_daemons if num_daemons is not None else os.cpu_count()
+        self.num_workers = num_workers if num_workers is not None else os.cpu_count()
+        self.daemon_host = daemon_host
+        self.daemon_command = list(daemon_command)
+        self.daemon_ports = list(daemon_ports) if daemon_ports is not None else []
+        self.startup_timeout = startup_timeout
+        self.simulation_args = simulation_args
+        self.daemons = []
+        self.executor = None
+        self.__launch_daemons = daemon_ports is None
+        self.__next_daemon = itertools.cycle(range(0))
+
+    def __enter__(self) -> "SimulationPool":
+        """
+        Start the pool when entering a with block
+
+        :return: the pool
+        :rtype: SimulationPool
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Stop the pool when leaving a with block
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Launch the daemons, if needed, and the worker processes (will do nothing if the pool has already started)
+
+        :raises WRENCHException: if a daemon cannot be launched or does not accept connections in time
+        """
+        if self.executor is not None:
+            return
+        try:
+            if self.__launch_daemons:
+                for _ in range(self.num_daemons):
+                    daemon = Daemon(self.daemon_command, self.daemon_host, startup_timeout=self.startup_timeout)
+                    self.daemons.append(daemon)
+                    daemon.start()
+                    self.daemon_ports.append(daemon.daemon_port)
+            if not self.daemon_ports:
+                raise WRENCHException("A simulation pool needs at least one daemon")
+            self.executor = ProcessPoolExecutor(max_workers=self.num_workers)
+        except BaseException:
+            self.stop()
+            raise
+        self.__next_daemon = itertools.cycle(range(len(self.daemon_ports)))
+
+    def stop(self) -> None:
+        """
+        Wait for the submitted runs to complete, and stop the worker processes and the launched daemons
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        for daemon in self.daemons:
+            daemon.stop()
+        if self.__launch_daemons:
+            self.daemon_ports = []
+        self.daemons = []
+
+    def simulation(self) -> Simulation:
+        """
+        Get a new simulation, in the calling process, connected to the next daemon of the pool
+
+        :return: a simulation, which still needs to be started
+        :rtype: Simulation
+
+        :raises WRENCHException: if the pool has not been started
+        """
+        return Simulation(self.daemon_host, self.__get_daemon_port(), **self.simulation_args)
+
+    def submit(self, controller: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Run a controller function on a new simulation in a worker process
+
+        :param controller: the controller function, which must be picklable (e.g., defined at the top level of
+               a module), and is called with the simulation followed by the other arguments
+        :type controller: Callable[..., Any]
+        :return: a future holding the controller's return value, or the exception it raised
+        :rtype: concurrent.futures.Future
+
+        :raises WRENCHException: if the pool has not been started
+        """
+        daemon_port = self.__get_daemon_port()
+        return self.executor.submit(_run_controller, self.daemon_host, daemon_port, self.simulation_args,
+                                    controller, args, kwargs)
+
+    def map(self, controller: Callable[..., Any], args_list: Iterable[Sequence[Any]]) -> List[Any]:
+        """
+        Run a controller function on new simulations in the worker processes, once per tuple of arguments
+
+        :param controller: the controller function, which must be picklable (e.g., defined at the top level of
+               a module), and is called with a simulation followed by the arguments of one tuple
+        :type controller: Callable[..., Any]
+        :param args_list: the tuples of arguments
+        :type args_list: Iterable[Sequence[Any]]
+        :return: the controller's return values, in order
+        :rtype: List[Any]
+
+        :raises Exception: the first exception raised by a controller, if any
+        """
+        futures = [self.submit(controller, *args) for args in args_list]
+        return [future.result() for future in futures]
+
+    def __get_daemon_port(self) -> int:
+        """
+        Get the port number of the next daemon, in round-robin order, which is restarted first if it has been
+        launched by the pool but is no longer running
+
+        :return: a port number
+        :rtype: int
+
+        :raises WRENCHException: if the pool has not been started, or if the daemon cannot be restarted
+        """
+        if self.executor is None:
+            raise WRENCHException("The simulation pool has not been started")
+        i = next(self.__next_daemon)
+        if self.daemons:
+            self.daemons[i].ensure_running()
+        return self.daemon_ports[i]
+
+    def __repr__(self) -> str:
+        """
+        String representation of the SimulationPool object
+
+        :return: String representation of the SimulationPool object
+        :rtype: str
+        """
+        return f"SimulationPool(daemon_ports={self.daemon_ports}, num_workers={self.num_workers})"
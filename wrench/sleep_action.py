@@ -15,6 +15,8 @@ class SleepAction(Action):
     WRENCH Sleep Action class
     """
 
+    __slots__ = ("sleep_time",)
+
     def __init__(self, simulation, compound_job: CompoundJob, name: str, sleep_time: float) -> None:
         """
         Constructor
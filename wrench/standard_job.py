@@ -19,6 +19,8 @@ class StandardJob(SimulationItem):
     WRENCH Standard Job class
     """
 
+    __slots__ = ("tasks",)
+
     def __init__(self, simulation, name: str, tasks: List[Task]) -> None:
         """
         Constructor
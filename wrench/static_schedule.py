@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+from wrench.compute_service import ComputeService
+from wrench.exception import WRENCHException
+from wrench.file import File
+from wrench.storage_service import StorageService
+from wrench.task import Task
+
+
+class StaticSchedule:
+    """
+    Complete schedule of a workflow, as computed up front by an offline scheduler (e.g., HEFT), to be run to
+    completion with Simulation.run_schedule(). Each task is mapped to a compute service, with the locations of its
+    files, and the tasks mapped to the same compute service are submitted to it in the order in which they were
+    added to the schedule, each one in its own standard job, as soon as it is ready.
+
+    Example::
+
+        schedule = wrench.StaticSchedule()
+        for task, compute_service in heft(workflow):
+            schedule.add_task(task, compute_service, {f: storage_service for f in task.get_input_files()})
+        events, timings = simulation.run_schedule(workflow, schedule)
+
+    :param entries: the (task, compute service, file locations) entries of the schedule, if any, in order
+    :type entries: Iterable[Tuple[Task, ComputeService, dict[File, StorageService]]]
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Task, ComputeService, dict[File, StorageService]]] = ()) -> None:
+        """
+        Constructor
+        """
+        self.entries: List[Tuple[Task, ComputeService, dict[File, StorageService]]] = []
+        self.__task_keys = set()
+        for task, compute_service, file_locations in entries:
+            self.add_task(task, compute_service, file_locations)
+
+    def add_task(self, task: Task, compute_service: ComputeService,
+                 file_locations: dict[File, StorageService]) -> None:
+        """
+        Add a task to the schedule, after the tasks that have already been mapped to the same compute service
+
+        :param task: the task
+        :type task: Task
+        :param compute_service: the compute service that is to run the task
+        :type compute_service: ComputeService
+        :param file_locations: the locations of the task's files
+        :type file_locations: dict[File, StorageService]
+
+        :raises WRENCHException: if the task is already in the schedule
+        """
+        key = (task.get_workflow().get_name(), task.get_name())
+        if key in self.__task_keys:
+            raise WRENCHException(f"Task {task.get_name()} is already in the schedule")
+        self.__task_keys.add(key)
+        self.entries.append((task, compute_service, file_locations))
+
+    def _get_queues(self) -> Dict[ComputeService, Deque[Tuple[Task, dict[File, StorageService]]]]:
+        """
+        Get the (task, file locations) queue of each compute service, for a run of the schedule
+
+        :return: a dictionary of queues, in which compute services are keys
+        :rtype: Dict[ComputeService, Deque[Tuple[Task, dict[File, StorageService]]]]
+        """
+        queues = {}
+        for task, compute_service, file_locations in self.entries:
+            queues.setdefault(compute_service, deque()).append((task, file_locations))
+        return queues
+
+    @staticmethod
+    def _take_ready_tasks(queues: Dict[ComputeService, Deque[Tuple[Task, dict[File, StorageService]]]],
+                          ready_tasks: List[Task]) -> List[Tuple[List[Task], dict[File, StorageService],
+                                                                 ComputeService]]:
+        """
+        Remove, from the head of each queue, the tasks that are ready
+
+        :param queues: the queues (see _get_queues())
+        :type queues: Dict[ComputeService, Deque[Tuple[Task, dict[File, StorageService]]]]
+        :param ready_tasks: the ready tasks
+        :type ready_tasks: List[Task]
+        :return: the (tasks, file locations, compute service) jobs to create and submit (see Simulation.step())
+        :rtype: List[Tuple[List[Task], dict[File, StorageService], ComputeService]]
+        """
+        ready_task_names = {task.get_name() for task in ready_tasks}
+        submissions = []
+        for compute_service, queue in queues.items():
+            while queue and queue[0][0].get_name() in ready_task_names:
+                task, file_locations = queue.popleft()
+                submissions.append(([task], file_locations, compute_service))
+        return submissions
+
+    def __len__(self) -> int:
+        """
+        Number of tasks in the schedule
+
+        :return: a number of tasks
+        :rtype: int
+        """
+        return len(self.entries)
+
+    def __str__(self) -> str:
+        """
+        :return: String representation of the schedule
+        :rtype: str
+        """
+        return f"Static schedule of {len(self.entries)} tasks"
+
+    def __repr__(self) -> str:
+        """
+        :return: String representation of the StaticSchedule object
+        :rtype: str
+        """
+        return f"StaticSchedule(num_tasks={len(self.entries)})"
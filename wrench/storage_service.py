@@ -7,6 +7,8 @@
 # the Free Software Foundation, either version 3 of the License, or
 # (at your option) any later version.
 
+from typing import Iterable, List
+
 from wrench.file import File
 from wrench.simulation_item import SimulationItem
 
@@ -17,6 +19,8 @@ class StorageService(SimulationItem):
     WRENCH Storage Service class
     """
 
+    __slots__ = ()
+
     def __init__(self, simulation, name: str) -> None:
         """
         Constructor
@@ -36,6 +40,16 @@ class StorageService(SimulationItem):
         """
         return self._simulation._create_file_copy_at_storage_service(file, self)
 
+    def create_file_copies(self, files: Iterable[File]) -> None:
+        """
+        Create copies of files (ex nihilo) at the storage service, in much fewer round-trips to the daemon than
+        with one create_file_copy() call per file
+
+        :param files: the files
+        :type files: Iterable[File]
+        """
+        return self._simulation._create_file_copies_at_storage_service(files, self)
+
     def lookup_file(self, file: File) -> bool:
         """
         Check whether a copy of a file is stored on the storage service
@@ -46,6 +60,18 @@ class StorageService(SimulationItem):
         """
         return self._simulation._lookup_file_at_storage_service(file, self)
 
+    def lookup_files(self, files: Iterable[File]) -> List[bool]:
+        """
+        Check whether copies of files are stored on the storage service, in much fewer round-trips to the daemon
+        than with one lookup_file() call per file
+
+        :param files: the files
+        :type files: Iterable[File]
+        :return: true or false for each file, in order
+        :rtype: List[bool]
+        """
+        return self._simulation._lookup_files_at_storage_service(files, self)
+
     def __str__(self) -> str:
         """
         :return: String representation of the storage service
@@ -28,6 +28,8 @@ class Task(SimulationItem):
     WRENCH Task class
     """
 
+    __slots__ = ("workflow", "flops", "min_num_cores", "max_num_cores", "memory", "input_files", "output_files")
+
     def __init__(self, simulation: Simulation, workflow: Workflow, name: str,
                  flops: flops = None,
                  min_num_cores:  number = None,
@@ -64,7 +66,7 @@ class Task(SimulationItem):
         """
         Get the state of the action
         """
-        return self.TaskState(self._simulation._task_get_state(self))
+        return self._simulation._task_get_state(self)
 
     def get_workflow(self) -> Workflow:
         """
@@ -79,10 +81,7 @@ class Task(SimulationItem):
         :param file: File name
         :type file: File
         """
-        self._simulation._add_input_file(self, file)
-        if self.input_files is None:
-            self.input_files = []
-        self.input_files.append(file)
+        return self._simulation._add_input_file(self, file)
 
     def add_output_file(self, file: File) -> None:
         """
@@ -90,10 +89,7 @@ class Task(SimulationItem):
         :param file: File name
         :type file: File
         """
-        self._simulation._add_output_file(self, file)
-        if self.output_files is None:
-            self.output_files = []
-        self.output_files.append(file)
+        return self._simulation._add_output_file(self, file)
 
     def get_input_files(self) -> List[File]:
         """
@@ -101,9 +97,7 @@ class Task(SimulationItem):
         :return: List of input file names
         :rtype: List[File]
         """
-        if self.input_files is None:
-            self.input_files = self._simulation._get_task_input_files(self)
-        return self.input_files
+        return self._simulation._get_task_input_files(self)
 
     def get_output_files(self) -> List[File]:
         """
@@ -111,9 +105,7 @@ class Task(SimulationItem):
         :return: List of output file names
         :rtype: List[File]
         """
-        if self.output_files is None:
-            self.output_files = self._simulation._get_task_output_files(self)
-        return self.output_files
+        return self._simulation._get_task_output_files(self)
 
     def get_flops(self) -> float:
         """
@@ -121,9 +113,7 @@ class Task(SimulationItem):
         :return: A number of flops
         :rtype: float
         """
-        if not self.flops:
-            self.flops = self._simulation._task_get_flops(self)
-        return self.flops
+        return self._simulation._task_get_flops(self)
 
     def get_min_num_cores(self) -> int:
         """
@@ -131,9 +121,7 @@ class Task(SimulationItem):
         :return: A number of cores
         :rtype: integer
         """
-        if not self.min_num_cores:
-            self.min_num_cores = self._simulation._task_get_min_num_cores(self)
-        return self.min_num_cores
+        return self._simulation._task_get_min_num_cores(self)
 
     def get_max_num_cores(self) -> int:
         """
@@ -141,9 +129,7 @@ class Task(SimulationItem):
         :return: A number of cores
         :rtype: integer
         """
-        if not self.max_num_cores:
-            self.max_num_cores = self._simulation._task_get_max_num_cores(self)
-        return self.max_num_cores
+        return self._simulation._task_get_max_num_cores(self)
 
     def get_memory(self) -> int:
         """
@@ -151,9 +137,7 @@ class Task(SimulationItem):
         :return: A memory size in bytes
         :rtype: int
         """
-        if not self.memory:
-            self.memory = self._simulation._task_get_memory(self)
-        return self.memory
+        return self._simulation._task_get_memory(self)
 
     def get_number_of_children(self) -> int:
         """
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import json
+from typing import Callable, Dict, List, Set
+
+from wrench.exception import WRENCHException
+from wrench.task import Task
+from wrench.workflow_spec import WorkflowTaskSpec
+
+
+class TaskGraph:
+    """
+    Client-side mirror of a workflow's DAG of tasks, keyed by task name. It is built from the same task/file
+    edits that are sent to the wrench-daemon, and applies the same dependency rules (a task depends on the task
+    that produces one of its input files, and a dependency is not added if it is redundant, i.e., if there is
+    already a path from the parent to the child). Task states are updated as jobs are submitted and as job
+    completion events are received, so that ready tasks, children counts, and bottom-levels can be answered
+    without a round-trip to the daemon. The graph is flagged as not synchronized if it may no longer reflect the
+    daemon's view of the workflow, in which case it should not be used.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor
+        """
+        self.task_indices: Dict[str, int] = {}
+        self.parents: Dict[str, Set[str]] = {}
+        self.children: Dict[str, Set[str]] = {}
+        self.producers: Dict[str, str] = {}
+        self.consumers: Dict[str, List[str]] = {}
+        self.states: Dict[str, Task.TaskState] = {}
+        self.num_incomplete_parents: Dict[str, int] = {}
+        self.ready_tasks: Set[str] = set()
+        self.num_completed_tasks = 0
+        self.bottom_levels: Dict[str, int] = {}
+        self.synchronized = True
+        # Incremented whenever tasks or dependencies are added, and functions called whenever a task's state changes
+        self.version = 0
+        self.state_listeners: List[Callable[[str, Task.TaskState], None]] = []
+
+    def apply(self, update: Callable[[], None]) -> None:
+        """
+        Apply an update to the graph, which is flagged as not synchronized if the update fails
+
+        :param update: the update (e.g., a call to one of the graph's methods)
+        :type update: Callable[[], None]
+        """
+        if not self.synchronized:
+            return
+        try:
+            update()
+        except WRENCHException:
+            self.synchronized = False
+
+    def __lookup(self, task_name: str) -> str:
+        """
+        Check that a task is known
+
+        :param task_name: the task's name
+        :type task_name: str
+        :return: the task's name
+        :rtype: str
+
+        :raises WRENCHException: if the task is unknown
+        """
+        if task_name not in self.task_indices:
+            raise WRENCHException(f"Unknown task {task_name}")
+        return task_name
+
+    def add_task(self, task_name: str) -> None:
+        """
+        Add a (READY) task to the graph
+
+        :param task_name: the task's name
+        :type task_name: str
+        """
+        self.task_indices[task_name] = len(self.task_indices)
+        self.parents[task_name] = set()
+        self.children[task_name] = set()
+        self.states[task_name] = Task.TaskState.READY
+        self.num_incomplete_parents[task_name] = 0
+        self.ready_tasks.add(task_name)
+        self.bottom_levels.clear()
+        self.version += 1
+
+    def add_input_file(self, task_name: str, file_name: str) -> None:
+        """
+        Add an input file to a task, which creates a dependency to the task that produces the file (if any)
+
+        :param task_name: the task's name
+        :type task_name: str
+        :param file_name: the file's name
+        :type file_name: str
+        """
+        self.consumers.setdefault(file_name, []).append(self.__lookup(task_name))
+        if file_name in self.producers:
+            self.add_dependency(self.producers[file_name], task_name)
+
+    def add_output_file(self, task_name: str, file_name: str) -> None:
+        """
+        Add an output file to a task, which creates dependencies to the tasks that consume the file
+
+        :param task_name: the task's name
+        :type task_name: str
+        :param file_name: the file's name
+        :type file_name: str
+        """
+        self.producers[file_name] = self.__lookup(task_name)
+        for consumer in sorted(self.consumers.get(file_name, []), key=self.task_indices.__getitem__):
+            self.add_dependency(task_name, consumer)
+
+    def add_tasks_from_json(self, json_object: json, task_specs: List[WorkflowTaskSpec], redundant_dependencies: bool,
+                            ignore_cycle_creating_dependencies: bool) -> None:
+        """
+        Add the tasks of a workflow created by the daemon from a WfCommons JSON object, adding dependencies in the
+        same order as the daemon does (file-based dependencies first, then explicit parent-child dependencies)
+
+        :param json_object: the WfCommons JSON object
+        :type json_object: json
+        :param task_specs: the task specifications returned by the daemon
+        :type task_specs: List[WorkflowTaskSpec]
+        :param redundant_dependencies: whether redundant task dependencies are taken into account
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether cycle-creating dependencies are ignored
+        :type ignore_cycle_creating_dependencies: bool
+
+        :raises WRENCHException: if the JSON object refers to a task that the daemon did not create
+        """
+        workflow_spec = json_object["workflow"]
+        self.add_tasks_from_json_tasks(workflow_spec.get("specification", workflow_spec)["tasks"], task_specs,
+                                       redundant_dependencies, ignore_cycle_creating_dependencies)
+
+    def add_tasks_from_json_tasks(self, json_tasks: List[Dict], task_specs: List[WorkflowTaskSpec],
+                                  redundant_dependencies: bool, ignore_cycle_creating_dependencies: bool) -> None:
+        """
+        Same as add_tasks_from_json(), given the task objects of the WfCommons JSON object (of which only the
+        "name", "id" and "parents" members are used)
+
+        :param json_tasks: the WfCommons task objects
+        :type json_tasks: List[Dict]
+        :param task_specs: the task specifications returned by the daemon
+        :type task_specs: List[WorkflowTaskSpec]
+        :param redundant_dependencies: whether redundant task dependencies are taken into account
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether cycle-creating dependencies are ignored
+        :type ignore_cycle_creating_dependencies: bool
+
+        :raises WRENCHException: if a task object refers to a task that the daemon did not create
+        """
+        for task_spec in task_specs:
+            self.add_task(task_spec.name)
+        for task_spec in task_specs:
+            for file_name in task_spec.input_file_names:
+                self.add_input_file(task_spec.name, file_name)
+            for file_name in task_spec.output_file_names:
+                self.add_output_file(task_spec.name, file_name)
+        # Parents are referred to by id or, in some WfCommons instances, by name
+        ids_by_name = {json_task["name"]: json_task.get("id", json_task["name"]) for json_task in json_tasks}
+        for json_task in json_tasks:
+            for parent in json_task.get("parents", []):
+                if parent not in self.task_indices:
+                    parent = ids_by_name.get(parent, parent)
+                self.add_dependency(parent, json_task.get("id", json_task.get("name")),
+                                    redundant_dependencies, ignore_cycle_creating_dependencies)
+
+    def path_exists(self, source: str, destination: str) -> bool:
+        """
+        Determine whether there is a path from a task to another
+
+        :param source: the name of the source task
+        :type source: str
+        :param destination: the name of the destination task
+        :type destination: str
+        :return: True if there is a path, False otherwise
+        :rtype: bool
+        """
+        # Walk up from the destination, whose ancestors are typically fewer during workflow construction
+        visited = {destination}
+        to_visit = [destination]
+        while to_visit:
+            for parent in self.parents[to_visit.pop()]:
+                if parent == source:
+                    return True
+                if parent not in visited:
+                    visited.add(parent)
+                    to_visit.append(parent)
+        return False
+
+    def add_dependency(self, parent: str, child: str, redundant_dependencies: bool = False,
+                       ignore_cycle_creating_dependencies: bool = False) -> None:
+        """
+        Add a dependency between two tasks
+
+        :param parent: the name of the parent task
+        :type parent: str
+        :param child: the name of the child task
+        :type child: str
+        :param redundant_dependencies: whether to add the dependency even if it is redundant
+        :type redundant_dependencies: bool
+        :param ignore_cycle_creating_dependencies: whether to silently ignore the dependency if it would create a cycle
+        :type ignore_cycle_creating_dependencies: bool
+
+        :raises WRENCHException: if a task is unknown, or if the dependency would create a cycle
+        """
+        self.__lookup(parent)
+        self.__lookup(child)
+        if parent == child or child in self.children[parent]:
+            return
+        if self.path_exists(child, parent):
+            if ignore_cycle_creating_dependencies:
+                return
+            raise WRENCHException(f"Adding a dependency from {parent} to {child} would create a cycle")
+        if not redundant_dependencies and self.path_exists(parent, child):
+            return
+        self.children[parent].add(child)
+        self.parents[child].add(parent)
+        self.bottom_levels.clear()
+        self.version += 1
+        if self.states[parent] != Task.TaskState.COMPLETED:
+            self.num_incomplete_parents[child] += 1
+            if self.states[child] == Task.TaskState.READY:
+                self.__update_state(child, Task.TaskState.NOT_READY)
+                self.ready_tasks.discard(child)
+
+    def set_state(self, task_name: str, state: Task.TaskState) -> None:
+        """
+        Set the state of a task, and update the states of its children accordingly
+
+        :param task_name: the task's name
+        :type task_name: str
+        :param state: the task's new state
+        :type state: Task.TaskState
+        """
+        previous_state = self.states[self.__lookup(task_name)]
+        if state == previous_state:
+            return
+        self.__update_state(task_name, state)
+        if state == Task.TaskState.READY:
+            self.ready_tasks.add(task_name)
+        else:
+            self.ready_tasks.discard(task_name)
+
+        if state == Task.TaskState.COMPLETED:
+            self.num_completed_tasks += 1
+            for child in self.children[task_name]:
+                self.num_incomplete_parents[child] -= 1
+                if self.num_incomplete_parents[child] == 0 and self.states[child] == Task.TaskState.NOT_READY:
+                    self.__update_state(child, Task.TaskState.READY)
+                    self.ready_tasks.add(child)
+        elif previous_state == Task.TaskState.COMPLETED:
+            self.num_completed_tasks -= 1
+            for child in self.children[task_name]:
+                self.num_incomplete_parents[child] += 1
+                if self.states[child] == Task.TaskState.READY:
+                    self.__update_state(child, Task.TaskState.NOT_READY)
+                    self.ready_tasks.discard(child)
+
+    def __update_state(self, task_name: str, state: Task.TaskState) -> None:
+        """
+        Record the state of a task, and notify the state listeners
+
+        :param task_name: the task's name
+        :type task_name: str
+        :param state: the task's new state
+        :type state: Task.TaskState
+        """
+        self.states[task_name] = state
+        for listener in self.state_listeners:
+            listener(task_name, state)
+
+    def get_state(self, task_name: str) -> Task.TaskState:
+        """
+        Get the state of a task
+
+        :param task_name: the task's name
+        :type task_name: str
+        :return: the task's state
+        :rtype: Task.TaskState
+        """
+        return self.states[self.__lookup(task_name)]
+
+    def get_ready_tasks(self) -> List[str]:
+        """
+        Get the names of the ready tasks, in the order in which tasks were added to the graph
+
+        :return: a list of task names
+        :rtype: List[str]
+        """
+        return sorted(self.ready_tasks, key=self.task_indices.__getitem__)
+
+    def is_done(self) -> bool:
+        """
+        Determine whether all tasks are completed
+
+        :return: True if all tasks are completed, False otherwise
+        :rtype: bool
+        """
+        return self.num_completed_tasks == len(self.task_indices)
+
+    def get_number_of_children(self, task_name: str) -> int:
+        """
+        Get the number of children of a task
+
+        :param task_name: the task's name
+        :type task_name: str
+        :return: a number of children
+        :rtype: int
+        """
+        return len(self.children[self.__lookup(task_name)])
+
+    def get_bottom_level(self, task_name: str) -> int:
+        """
+        Get the bottom-level of a task, i.e., the number of dependencies on the longest path from the task
+        to an exit task (bottom-levels are computed for all tasks at once, and cached until the graph changes)
+
+        :param task_name: the task's name
+        :type task_name: str
+        :return: a bottom-level
+        :rtype: int
+        """
+        self.__lookup(task_name)
+        if not self.bottom_levels:
+            # Process tasks in reverse topological order (Kahn's algorithm on the reversed graph)
+            num_unprocessed_children = {t: len(c) for t, c in self.children.items()}
+            to_process = [t for t, n in num_unprocessed_children.items() if n == 0]
+            while to_process:
+                task = to_process.pop()
+                self.bottom_levels[task] = 1 + max((self.bottom_levels[c] for c in self.children[task]), default=-1)
+                for parent in self.parents[task]:
+                    num_unprocessed_children[parent] -= 1
+                    if num_unprocessed_children[parent] == 0:
+                        to_process.append(parent)
+        return self.bottom_levels[task_name]
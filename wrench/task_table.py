@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from typing import List, Optional
+
+from wrench.exception import WRENCHException
+from wrench.task import Task
+
+
+class TaskTable:
+    """
+    Columnar view of the tasks of a workflow, as NumPy arrays whose i-th entries pertain to the task with id i
+    (tasks are numbered in the order in which they were added to the workflow), so that scheduling queries
+    (e.g., "the ready task with the most flops", "the ready tasks that fit on 4 cores") run vectorized.
+    Requires NumPy, which is an optional dependency. A task table is typically obtained with
+    Workflow.get_task_table(), which keeps the states up-to-date as long as the workflow's task graph is
+    in sync with the daemon.
+
+    Example::
+
+        table = workflow.get_task_table()
+        task = table.get_task_with_max("flops", table.ready_mask() & table.fits_mask(num_idle_cores))
+
+    :param tasks: the tasks, whose flops, numbers of cores and memory requirements must have been obtained already
+    :type tasks: List[Task]
+    :param states: the task states
+    :type states: List[Task.TaskState]
+    :param bottom_levels: the task bottom-levels
+    :type bottom_levels: List[int]
+
+    :raises WRENCHException: if NumPy is not installed
+    """
+
+    COLUMNS = ("flops", "min_num_cores", "max_num_cores", "memory", "states", "bottom_levels")
+
+    def __init__(self, tasks: List[Task], states: List[Task.TaskState], bottom_levels: List[int]) -> None:
+        """
+        Constructor
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise WRENCHException("NumPy is required to build a task table (pip install numpy)")
+        self.__numpy = numpy
+        self.tasks = tasks
+        self.names = [task.get_name() for task in tasks]
+        self.indices = {name: i for i, name in enumerate(self.names)}
+        self.flops = numpy.array([task.flops for task in tasks], dtype=numpy.float64)
+        self.min_num_cores = numpy.array([task.min_num_cores for task in tasks], dtype=numpy.int64)
+        self.max_num_cores = numpy.array([task.max_num_cores for task in tasks], dtype=numpy.int64)
+        self.memory = numpy.array([task.memory for task in tasks], dtype=numpy.float64)
+        self.states = numpy.array([state.value for state in states], dtype=numpy.int8)
+        self.bottom_levels = numpy.array(bottom_levels, dtype=numpy.int64)
+        self.version = None
+
+    def __len__(self) -> int:
+        """
+        Number of tasks
+
+        :return: a number of tasks
+        :rtype: int
+        """
+        return len(self.tasks)
+
+    def set_state(self, task_name: str, state: Task.TaskState) -> None:
+        """
+        Update the state of a task (the signature is that of TaskGraph state listeners)
+
+        :param task_name: the task's name
+        :type task_name: str
+        :param state: the task's new state
+        :type state: Task.TaskState
+        """
+        self.states[self.indices[task_name]] = state.value
+
+    def state_mask(self, state: Task.TaskState):
+        """
+        Get the tasks in a given state
+
+        :param state: the state
+        :type state: Task.TaskState
+        :return: a boolean array, which is True for the tasks in the state
+        :rtype: numpy.ndarray
+        """
+        return self.states == state.value
+
+    def ready_mask(self):
+        """
+        Get the ready tasks
+
+        :return: a boolean array, which is True for the ready tasks
+        :rtype: numpy.ndarray
+        """
+        return self.state_mask(Task.TaskState.READY)
+
+    def fits_mask(self, num_cores: int, memory: Optional[float] = None):
+        """
+        Get the tasks that can run with a given number of cores (i.e., whose minimum number of cores is
+        not larger) and, optionally, a given amount of memory
+
+        :param num_cores: a number of cores
+        :type num_cores: int
+        :param memory: an amount of memory in bytes (None means "unlimited")
+        :type memory: Optional[float]
+        :return: a boolean array, which is True for the tasks that fit
+        :rtype: numpy.ndarray
+        """
+        mask = self.min_num_cores <= num_cores
+        if memory is not None:
+            mask &= self.memory <= memory
+        return mask
+
+    def get_tasks(self, selection=None) -> List[Task]:
+        """
+        Get the tasks selected by a boolean mask or an array of task ids
+
+        :param selection: a boolean array, an array of task ids, or None for all tasks
+        :type selection: Optional[numpy.ndarray]
+        :return: a list of tasks, by increasing id
+        :rtype: List[Task]
+        """
+        if selection is None:
+            return list(self.tasks)
+        selection = self.__numpy.asarray(selection)
+        ids = self.__numpy.flatnonzero(selection) if selection.dtype == bool else selection
+        return [self.tasks[i] for i in ids]
+
+    def __get_extreme_task(self, column: str, mask, use_max: bool) -> Optional[Task]:
+        """
+        Get the task with the largest or smallest value in a column, among the tasks selected by a mask
+
+        :param column: the column name
+        :type column: str
+        :param mask: a boolean array, or None for all tasks
+        :type mask: Optional[numpy.ndarray]
+        :param use_max: whether to look for the largest value
+        :type use_max: bool
+        :return: the task (the one with the smallest id in case of ties), or None if no task is selected
+        :rtype: Optional[Task]
+
+        :raises WRENCHException: if the column is unknown
+        """
+        if column not in self.COLUMNS:
+            raise WRENCHException(f"Unknown task table column {column} (should be one of {', '.join(self.COLUMNS)})")
+        values = getattr(self, column)
+        if mask is not None:
+            candidates = self.__numpy.flatnonzero(mask)
+            if len(candidates) == 0:
+                return None
+            values = values[candidates]
+        elif len(values) == 0:
+            return None
+        i = int(values.argmax() if use_max else values.argmin())
+        return self.tasks[int(candidates[i]) if mask is not None else i]
+
+    def get_task_with_max(self, column: str, mask=None) -> Optional[Task]:
+        """
+        Get the task with the largest value in a column (e.g., "flops"), among the tasks selected by a mask
+
+        :param column: the column name (one of TaskTable.COLUMNS)
+        :type column: str
+        :param mask: a boolean array, or None for all tasks
+        :type mask: Optional[numpy.ndarray]
+        :return: the task (the one with the smallest id in case of ties), or None if no task is selected
+        :rtype: Optional[Task]
+
+        :raises WRENCHException: if the column is unknown
+        """
+        return self.__get_extreme_task(column, mask, True)
+
+    def get_task_with_min(self, column: str, mask=None) -> Optional[Task]:
+        """
+        Get the task with the smallest value in a column (e.g., "memory"), among the tasks selected by a mask
+
+        :param column: the column name (one of TaskTable.COLUMNS)
+        :type column: str
+        :param mask: a boolean array, or None for all tasks
+        :type mask: Optional[numpy.ndarray]
+        :return: the task (the one with the smallest id in case of ties), or None if no task is selected
+        :rtype: Optional[Task]
+
+        :raises WRENCHException: if the column is unknown
+        """
+        return self.__get_extreme_task(column, mask, False)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the TaskTable object
+
+        :return: String representation of the TaskTable object
+        :rtype: str
+        """
+        return f"TaskTable(num_tasks={len(self.tasks)})"
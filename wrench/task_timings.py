@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from typing import List
+
+from wrench.exception import WRENCHException
+from wrench.task import Task
+
+
+class TaskTimings:
+    """
+    Columnar view of the states and execution dates of a workflow's tasks, as parallel lists (the i-th entry of
+    each list pertains to the same task). Dates are -1.0 for tasks that have not started/completed.
+
+    :param names: the task names
+    :type names: List[str]
+    :param states: the task states
+    :type states: List[Task.TaskState]
+    :param start_dates: the task start dates
+    :type start_dates: List[float]
+    :param end_dates: the task end dates
+    :type end_dates: List[float]
+    """
+
+    def __init__(self, names: List[str], states: List[Task.TaskState], start_dates: List[float],
+                 end_dates: List[float]) -> None:
+        """
+        Constructor
+        """
+        self.names = names
+        self.states = states
+        self.start_dates = start_dates
+        self.end_dates = end_dates
+
+    def __len__(self) -> int:
+        """
+        Number of tasks
+
+        :return: a number of tasks
+        :rtype: int
+        """
+        return len(self.names)
+
+    def to_numpy(self):
+        """
+        Convert to a NumPy structured array with fields "name" (str), "state" (int, the TaskState value),
+        "start_date" (float) and "end_date" (float). Requires NumPy, which is an optional dependency.
+
+        :return: a structured array with one record per task
+        :rtype: numpy.ndarray
+
+        :raises WRENCHException: if NumPy is not installed
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise WRENCHException("NumPy is required to convert task timings to an array "
+                                  "(pip install numpy)")
+        dtype = [("name", f"U{max((len(name) for name in self.names), default=1)}"),
+                 ("state", "i1"),
+                 ("start_date", "f8"),
+                 ("end_date", "f8")]
+        array = numpy.empty(len(self.names), dtype=dtype)
+        array["name"] = self.names
+        array["state"] = [state.value for state in self.states]
+        array["start_date"] = self.start_dates
+        array["end_date"] = self.end_dates
+        return array
+
+    def __str__(self) -> str:
+        """
+        String representation of the task timings when using print
+
+        :return: String representation of the task timings
+        :rtype: str
+        """
+        return f"TaskTimings for {len(self)} tasks"
+
+    def __repr__(self) -> str:
+        """
+        String representation of the TaskTimings object
+
+        :return: String representation of the TaskTimings object
+        :rtype: str
+        """
+        return f"TaskTimings(num_tasks={len(self)})"
@@ -0,0 +1,600 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from __future__ import annotations
+
+import abc
+import socket
+import time
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from wrench.exception import WRENCHException
+from wrench.json_serializer import JSONSerializer
+from wrench.json_stream import JSONStringBody
+from wrench.request_pipeline import RequestPipeline
+from wrench.unix_socket_adapter import SCHEME as UNIX_SOCKET_SCHEME, UnixSocketAdapter, unix_socket_path
+
+if TYPE_CHECKING:  # pragma: no cover
+    from wrench.mock_daemon import MockDaemon
+
+
+class Transport(abc.ABC):
+    """
+    Base class of the transports through which a Simulation sends its requests to the WRENCH daemon. A transport
+    sends a request, given as an HTTP method, the URL of a route and the request's JSON data, and returns the
+    daemon's decoded answer, so that the way in which requests reach the daemon can be changed (e.g., to compare
+    implementations in benchmarks) without changing the Simulation API. A transport is meant to be used by a
+    single simulation, which sets its serializer and its on_answer function.
+
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+           (None means "wait forever")
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    """
+
+    def __init__(self, timeout: Optional[Union[float, Tuple[float, float]]] = None) -> None:
+        """
+        Constructor
+        """
+        self.timeout = timeout
+        self.serializer = JSONSerializer()
+        # Function called for each answer with the request's HTTP method, path, payload size, and the answer's size,
+        # decoding time and latency
+        self.on_answer: Optional[Callable[[str, str, int, int, float, float], None]] = None
+
+    @abc.abstractmethod
+    def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Send a request to the daemon and wait for its answer
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks, which it may consume as they are
+               received (default: the serializer's loads() on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+
+    def request_many(self, requests_to_send: List[Tuple[str, str, dict]], stop_on_failure: bool = True,
+                     long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of requests to the daemon (one after the other, unless the transport can do better)
+
+        :param requests_to_send: the (HTTP method, URL, data) requests, in order
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param stop_on_failure: whether to stop sending requests once a request has failed
+        :type stop_on_failure: bool
+        :param long_poll: whether answers may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        answers = []
+        for method, url, json_data in requests_to_send:
+            answer = self.request(method, url, json_data, long_poll=long_poll)
+            answers.append(answer)
+            if stop_on_failure and not answer.get("wrench_api_request_success", True):
+                break
+        return answers
+
+    def close(self) -> None:
+        """
+        Close all connections to the daemon
+        """
+        pass
+
+    def _encode(self, json_data: Union[dict, JSONStringBody]) -> Union[bytes, JSONStringBody]:
+        """
+        Encode the JSON data of a request
+
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :return: the request's body
+        :rtype: Union[bytes, JSONStringBody]
+        """
+        return json_data if isinstance(json_data, JSONStringBody) else self.serializer.dumps(json_data)
+
+    def _get_timeouts(self, long_poll: bool = False) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get the connect and read timeouts of a request
+
+        :param long_poll: whether the answer may take arbitrarily long
+        :type long_poll: bool
+        :return: the connect timeout and the read timeout
+        :rtype: Tuple[Optional[float], Optional[float]]
+        """
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+        else:
+            connect_timeout = read_timeout = self.timeout
+        return connect_timeout, None if long_poll else read_timeout
+
+    def _decode_answer(self, method: str, path: str, payload_size: int, content: Union[bytes, Iterable[bytes]],
+                       sent_date: float, decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Decode the answer to a request, and call the on_answer function
+
+        :param method: the request's HTTP method
+        :type method: str
+        :param path: the request's path
+        :type path: str
+        :param payload_size: the size of the request's body in bytes
+        :type payload_size: int
+        :param content: the answer, whole or as an iterable over its chunks as they are received
+        :type content: Union[bytes, Iterable[bytes]]
+        :param sent_date: the performance counter value when the request was sent
+        :type sent_date: float
+        :param decode: the function that decodes the answer from its chunks (default: the serializer's loads())
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+        """
+        received_date = time.perf_counter()
+        if isinstance(content, bytes):
+            response_size = len(content)
+            answer = self.serializer.loads(content) if decode is None else decode((content,))
+        else:
+            chunk_sizes = []
+
+            def chunks() -> Iterable[bytes]:
+                for chunk in content:
+                    chunk_sizes.append(len(chunk))
+                    yield chunk
+
+            answer = self.serializer.loads(b"".join(chunks())) if decode is None else decode(chunks())
+            response_size = sum(chunk_sizes)
+        if self.on_answer is not None:
+            self.on_answer(method, path, payload_size, response_size, time.perf_counter() - received_date,
+                           received_date - sent_date)
+        return answer
+
+    def _send_pipelined(self, requests_to_send: List[Tuple[str, str, dict]], stop_on_failure: bool,
+                        long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of requests to the daemon over a single pipelined connection (see RequestPipeline)
+
+        :param requests_to_send: the (HTTP method, URL, data) requests, in order, which are all sent to the address
+               of the first one
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param stop_on_failure: whether to stop sending requests once a request has failed
+        :type stop_on_failure: bool
+        :param long_poll: whether answers may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        if not requests_to_send:
+            return []
+        timeout = self._get_timeouts(long_poll)
+        parts = urlsplit(requests_to_send[0][1])
+        if parts.scheme == UNIX_SOCKET_SCHEME:
+            pipeline = RequestPipeline(None, None, socket_path=unix_socket_path(requests_to_send[0][1]),
+                                       timeout=timeout, on_answer=self.on_answer, serializer=self.serializer)
+        else:
+            pipeline = RequestPipeline(parts.hostname, parts.port or 80, timeout=timeout,
+                                       on_answer=self.on_answer, serializer=self.serializer)
+        for method, url, json_data in requests_to_send:
+            pipeline.add_request(method, url, json_data)
+        return pipeline.send(stop_on_failure=stop_on_failure)
+
+
+class RequestsTransport(Transport):
+    """
+    Transport built on a requests session, which keeps a pool of keep-alive connections per daemon address,
+    can retry failed connection attempts, and streams large answers. Requests to "http+unix" URLs (i.e., when
+    the Simulation's daemon_url is "unix://<socket path>") are sent over Unix domain sockets. Sequences of
+    requests (see Simulation.batch()) are pipelined over a single connection. This is the default transport.
+
+    :param pool_size: maximum number of keep-alive connections kept open to each daemon address
+    :type pool_size: int
+    :param max_retries: number of times a request is retried if the connection to the WRENCH daemon
+           cannot be established, or a urllib3 Retry object for full control over the retry policy
+    :type max_retries: Union[int, Retry]
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+           (None means "wait forever")
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    """
+
+    def __init__(self,
+                 pool_size: int = 10,
+                 max_retries: Union[int, Retry] = 0,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None
+                 ) -> None:
+        """
+        Constructor
+        """
+        super().__init__(timeout)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.session = self.__create_session()
+
+    def __create_session(self) -> requests.Session:
+        """
+        Create the HTTP session through which all requests to the daemon are sent, so that
+        connections are pooled and kept alive across requests
+
+        :return: a session
+        :rtype: requests.Session
+        """
+        if isinstance(self.max_retries, Retry):
+            retries = self.max_retries
+        else:
+            # Only retry failed connection attempts: a request that has reached the daemon
+            # may have modified the simulation state, and thus cannot be safely re-sent
+            retries = Retry(total=self.max_retries, connect=self.max_retries, read=0, redirect=0, status=0,
+                            backoff_factor=0.1)
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retries))
+        session.mount(f"{UNIX_SOCKET_SCHEME}://", UnixSocketAdapter(pool_maxsize=self.pool_size, max_retries=retries))
+        session.headers["Content-Type"] = "application/json"
+        return session
+
+    def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Send a request to the daemon and wait for its answer
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks, which it may consume as they are
+               received (default: the serializer's loads() on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        timeout = self.timeout
+        if long_poll and timeout is not None:
+            # Keep the connect timeout, but wait for the answer for as long as needed
+            timeout = self._get_timeouts(long_poll)
+        body = self._encode(json_data)
+        try:
+            sent_date = time.perf_counter()
+            r = self.session.request(method, url, data=body, timeout=timeout, stream=decode is not None)
+            # A streamed answer is read as it is decoded, and the connection may be severed meanwhile
+            return self._decode_answer(method, r.request.path_url, len(body),
+                                       r.content if decode is None else r.iter_content(1 << 16), sent_date, decode)
+        except requests.exceptions.RequestException as e:
+            raise WRENCHException("Connection to wrench-daemon severed: " + str(e))
+
+    def request_many(self, requests_to_send: List[Tuple[str, str, dict]], stop_on_failure: bool = True,
+                     long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of requests to the daemon over a single pipelined connection
+
+        :param requests_to_send: the (HTTP method, URL, data) requests, in order
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param stop_on_failure: whether to stop sending requests once a request has failed
+        :type stop_on_failure: bool
+        :param long_poll: whether answers may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        return self._send_pipelined(requests_to_send, stop_on_failure, long_poll)
+
+    def close(self) -> None:
+        """
+        Close all connections to the daemon
+        """
+        self.session.close()
+
+
+class _HTTPConnection(HTTPConnection):
+    """
+    HTTP connection that sends small requests right away
+    """
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    """
+    HTTP connection over a Unix domain socket
+    """
+
+    def __init__(self, socket_path: str, connect_timeout: Optional[float]) -> None:
+        super().__init__("localhost", timeout=connect_timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class HTTPClientTransport(Transport):
+    """
+    Transport built directly on http.client, with a single keep-alive connection per daemon address (i.e., to
+    the daemon and to the simulation's server), which avoids most of the per-request cost of the requests
+    library. Requests to "http+unix" URLs (i.e., when the Simulation's daemon_url is "unix://<socket path>") are
+    sent over Unix domain sockets. Sequences of requests (see Simulation.batch()) are pipelined over a single
+    connection. Failed connection attempts are not retried.
+
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+           (None means "wait forever")
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    """
+
+    def __init__(self, timeout: Optional[Union[float, Tuple[float, float]]] = None) -> None:
+        """
+        Constructor
+        """
+        super().__init__(timeout)
+        self.connections: Dict[Tuple[str, str], HTTPConnection] = {}
+
+    def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Send a request to the daemon and wait for its answer
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks, which it may consume as they are
+               received (default: the serializer's loads() on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        body = self._encode(json_data)
+        headers = {"Content-Type": "application/json", "Content-Length": str(len(body))}
+        connect_timeout, read_timeout = self._get_timeouts(long_poll)
+        key = (parts.scheme, parts.netloc)
+        while True:
+            connection = self.connections.get(key)
+            reused = connection is not None
+            sent = False
+            try:
+                if connection is None:
+                    if parts.scheme == UNIX_SOCKET_SCHEME:
+                        connection = _UnixHTTPConnection(unix_socket_path(url), connect_timeout)
+                    else:
+                        connection = _HTTPConnection(parts.hostname, parts.port or 80, timeout=connect_timeout)
+                    self.connections[key] = connection
+                    connection.connect()
+                connection.sock.settimeout(read_timeout)
+                sent_date = time.perf_counter()
+                connection.request(method, path, body=body, headers=headers)
+                sent = True
+                response = connection.getresponse()
+                if decode is None:
+                    content = response.read()
+                else:
+                    content = iter(lambda: response.read(1 << 16), b"")
+                answer = self._decode_answer(method, path, len(body), content, sent_date, decode)
+            except (OSError, HTTPException) as e:
+                self.connections.pop(key, None)
+                if connection is not None:
+                    connection.close()
+                if reused and isinstance(body, bytes) and (not sent or isinstance(e, RemoteDisconnected)):
+                    # The daemon closed the idle connection before processing the request: retry on a new one
+                    continue
+                # Otherwise, the request may have been processed by the daemon, and thus cannot be safely re-sent
+                raise WRENCHException("Connection to wrench-daemon severed: " + str(e))
+            if response.will_close:
+                self.connections.pop(key, None)
+                connection.close()
+            return answer
+
+    def request_many(self, requests_to_send: List[Tuple[str, str, dict]], stop_on_failure: bool = True,
+                     long_poll: bool = False) -> List[dict]:
+        """
+        Send a sequence of requests to the daemon over a single pipelined connection
+
+        :param requests_to_send: the (HTTP method, URL, data) requests, in order
+        :type requests_to_send: List[Tuple[str, str, dict]]
+        :param stop_on_failure: whether to stop sending requests once a request has failed
+        :type stop_on_failure: bool
+        :param long_poll: whether answers may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+
+        :return: the JSON answers to the requests that were sent, in order
+        :rtype: List[dict]
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+        return self._send_pipelined(requests_to_send, stop_on_failure, long_poll)
+
+    def close(self) -> None:
+        """
+        Close all connections to the daemon
+        """
+        connections, self.connections = self.connections, {}
+        for connection in connections.values():
+            connection.close()
+
+
+class InProcessTransport(Transport):
+    """
+    Transport that has requests answered, in the calling process, by a mock daemon (see MockDaemon) that need not
+    listen on any port: no request goes through the network stack or HTTP, but requests and answers are still
+    encoded and decoded as JSON. It is meant for measuring the client-side cost of requests alone (e.g., in
+    benchmarks), and for testing client code without any daemon, and not for obtaining meaningful simulation
+    results.
+
+    :param daemon: the mock daemon (default: a new one)
+    :type daemon: Optional[MockDaemon]
+    """
+
+    def __init__(self, daemon: Optional[MockDaemon] = None) -> None:
+        """
+        Constructor
+        """
+        super().__init__()
+        from wrench.mock_daemon import MockDaemon  # Only needed by in-process transports
+        self.daemon = daemon if daemon is not None else MockDaemon()
+
+    def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Have a request answered by the mock daemon
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: ignored, since the mock daemon answers right away
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks (default: the serializer's loads())
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+        """
+        parts = urlsplit(url)
+        body = self._encode(json_data)
+        if isinstance(body, JSONStringBody):
+            body = body.read()
+        sent_date = time.perf_counter()
+        content = self.daemon.answer(parts.port, parts.path, body)
+        return self._decode_answer(method, parts.path, len(body), content, sent_date, decode)
+
+
+class AsyncTransport(abc.ABC):
+    """
+    Base class of the transports through which an AsyncSimulation sends its requests to the WRENCH daemon (see
+    Transport). A transport is meant to be used by a single simulation, which sets its serializer.
+
+    :param timeout: timeout in seconds, either as a single value or as a (connect timeout, read timeout) tuple
+           (None means "wait forever")
+    :type timeout: Optional[Union[float, Tuple[float, float]]]
+    """
+
+    def __init__(self, timeout: Optional[Union[float, Tuple[float, float]]] = None) -> None:
+        """
+        Constructor
+        """
+        self.timeout = timeout
+        self.serializer = JSONSerializer()
+
+    @abc.abstractmethod
+    async def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                      decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Send a request to the daemon and wait for its answer
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: whether the answer may take arbitrarily long (in which case only the connect timeout applies)
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks (default: the serializer's loads()
+               on the whole answer)
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+
+        :raises WRENCHException: if the daemon cannot be reached
+        """
+
+    async def close(self) -> None:
+        """
+        Close all connections to the daemon
+        """
+        pass
+
+
+class AsyncInProcessTransport(AsyncTransport):
+    """
+    Asynchronous counterpart of InProcessTransport, whose requests are answered right away, without ever
+    yielding to the event loop
+
+    :param daemon: the mock daemon (default: a new one)
+    :type daemon: Optional[MockDaemon]
+    """
+
+    def __init__(self, daemon: Optional[MockDaemon] = None) -> None:
+        """
+        Constructor
+        """
+        super().__init__()
+        from wrench.mock_daemon import MockDaemon  # Only needed by in-process transports
+        self.daemon = daemon if daemon is not None else MockDaemon()
+
+    async def request(self, method: str, url: str, json_data: Union[dict, JSONStringBody], long_poll: bool = False,
+                      decode: Optional[Callable[[Iterable[bytes]], Any]] = None) -> Any:
+        """
+        Have a request answered by the mock daemon
+
+        :param method: HTTP method (e.g., "GET", "POST")
+        :type method: str
+        :param url: URL of the route
+        :type url: str
+        :param json_data: the request's JSON data, or an already encoded (file-like) body
+        :type json_data: Union[dict, JSONStringBody]
+        :param long_poll: ignored, since the mock daemon answers right away
+        :type long_poll: bool
+        :param decode: the function that decodes the answer from its chunks (default: the serializer's loads())
+        :type decode: Optional[Callable[[Iterable[bytes]], Any]]
+
+        :return: the decoded answer
+        :rtype: Any
+        """
+        parts = urlsplit(url)
+        body = json_data.read() if isinstance(json_data, JSONStringBody) else self.serializer.dumps(json_data)
+        content = self.daemon.answer(parts.port, parts.path, body)
+        return self.serializer.loads(content) if decode is None else decode((content,))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import socket
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+from wrench.exception import WRENCHException
+
+SCHEME = "http+unix"
+
+
+def split_daemon_url(daemon_url: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """
+    Split the URL of a WRENCH daemon, i.e., "http://<host>:<port>" or "unix://<socket path>"
+
+    :param daemon_url: the URL
+    :type daemon_url: str
+    :return: the host name and port number (or None, None), and the socket path (or None)
+    :rtype: Tuple[Optional[str], Optional[int], Optional[str]]
+
+    :raises WRENCHException: if the URL is invalid
+    """
+    parts = urlsplit(daemon_url)
+    if parts.scheme == "unix" and parts.path:
+        return None, None, parts.netloc + parts.path
+    if parts.scheme == "http" and parts.hostname:
+        return parts.hostname, parts.port or 80, None
+    raise WRENCHException(f"Invalid WRENCH daemon URL {daemon_url} (should be http://<host>:<port> "
+                          f"or unix://<socket path>)")
+
+
+def unix_socket_url(socket_path: str, path: str) -> str:
+    """
+    Build the URL of a route served over a Unix domain socket, e.g., "http+unix://%2Ftmp%2Fwrench.sock/api"
+
+    :param socket_path: the socket path
+    :type socket_path: str
+    :param path: the path of the route, without leading slash
+    :type path: str
+    :return: the URL
+    :rtype: str
+    """
+    return f"{SCHEME}://{quote(socket_path, safe='')}/{path}"
+
+
+def unix_socket_path(url: str) -> str:
+    """
+    Get the socket path of a URL built with unix_socket_url()
+
+    :param url: the URL
+    :type url: str
+    :return: the socket path
+    :rtype: str
+    """
+    return unquote(urlsplit(url).netloc)
+
+
+class _UnixSocketConnection(HTTPConnection):
+    """
+    HTTP connection over a Unix domain socket
+    """
+
+    def __init__(self, *args, socket_path: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The timeout is a sentinel object (and not a number) when no timeout was set
+        sock.settimeout(self.timeout if isinstance(self.timeout, (int, float)) else None)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, f"Failed to connect to {self.socket_path}: {e}")
+        return sock
+
+
+class _UnixSocketConnectionPool(HTTPConnectionPool):
+    """
+    Pool of keep-alive HTTP connections over a Unix domain socket
+    """
+
+    ConnectionCls = _UnixSocketConnection
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    Transport adapter with which a requests session sends the requests whose URLs have the "http+unix" scheme (see
+    unix_socket_url()) over Unix domain sockets, with one pool of keep-alive connections per socket
+
+    :param pool_maxsize: maximum number of connections kept open per socket
+    :type pool_maxsize: int
+    :param max_retries: number of times, or urllib3 Retry policy by which, failed connection attempts are retried
+    """
+
+    def __init__(self, pool_maxsize: int = 10, max_retries=0) -> None:
+        """
+        Constructor
+        """
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=max_retries)
+        self.pools: Dict[str, _UnixSocketConnectionPool] = {}
+
+    def get_connection(self, url: str, proxies: Optional[dict] = None) -> _UnixSocketConnectionPool:
+        """
+        Get the connection pool of the socket of a URL
+
+        :param url: the URL
+        :type url: str
+        :param proxies: ignored
+        :type proxies: Optional[dict]
+        :return: the connection pool
+        :rtype: HTTPConnectionPool
+        """
+        socket_path = unix_socket_path(url)
+        pool = self.pools.get(socket_path)
+        if pool is None:
+            pool = _UnixSocketConnectionPool("localhost", maxsize=self._pool_maxsize, block=self._pool_block,
+                                             socket_path=socket_path)
+            self.pools[socket_path] = pool
+        return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies: Optional[dict] = None,
+                                        cert=None) -> _UnixSocketConnectionPool:
+        """
+        Get the connection pool of the socket of a request's URL (this method replaces get_connection() as of
+        requests 2.32)
+
+        :param request: the request
+        :type request: requests.PreparedRequest
+        :return: the connection pool
+        :rtype: HTTPConnectionPool
+        """
+        return self.get_connection(request.url, proxies)
+
+    def close(self) -> None:
+        """
+        Close all connections
+        """
+        super().close()
+        for pool in self.pools.values():
+            pool.close()
+        self.pools.clear()
@@ -24,6 +24,8 @@ class VirtualMachine(SimulationItem):
     WRENCH Virtual Machine class
     """
 
+    __slots__ = ("cloud_compute_service",)
+
     def __init__(self, simulation, cloud_compute_service: CloudComputeService, name: str) -> None:
         """
         Constructor
@@ -15,7 +15,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from wrench.simulation import Simulation
     from wrench.task import Task
     from wrench.file import File
+    from wrench.task_timings import TaskTimings
+    from wrench.task_table import TaskTable
 from wrench.simulation_item import SimulationItem
+from wrench.task_graph import TaskGraph
 
 from typing import List
 
@@ -26,6 +29,8 @@ class Workflow(SimulationItem):
     WRENCH Workflow class
     """
 
+    __slots__ = ("tasks", "task_graph", "task_table")
+
     def __init__(self, simulation: Simulation, name: str) -> None:
         """
         Constructor
@@ -36,6 +41,8 @@ class Workflow(SimulationItem):
         :type name: str
         """
         self.tasks = {}
+        self.task_graph = TaskGraph()
+        self.task_table = None
         super().__init__(simulation, name)
 
     def add_task(self, name: str, flops: float, min_num_cores: int, max_num_cores: int, memory: int) -> Task:
@@ -87,6 +94,43 @@ class Workflow(SimulationItem):
         """
         return self._simulation._workflow_get_ready_tasks(self)
 
+    def get_task_states(self) -> dict[str, Task.TaskState]:
+        """
+        Get the states of all tasks in the workflow (at once, rather than one request per task)
+
+        :return: A dictionary of task states where task names are keys
+        :rtype: dict[str, Task.TaskState]
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        return self._simulation._workflow_get_task_states(self)
+
+    def get_task_timings(self) -> TaskTimings:
+        """
+        Get the states, start dates, and end dates of all tasks in the workflow (at once, rather than
+        several requests per task)
+
+        :return: A columnar TaskTimings object (which can be converted to a NumPy structured array)
+        :rtype: TaskTimings
+
+        :raises WRENCHException: if there is any error in the response
+        """
+        return self._simulation._workflow_get_task_timings(self)
+
+    def get_task_table(self) -> TaskTable:
+        """
+        Get a columnar (NumPy) view of the tasks in the workflow, for vectorized scheduling queries. As long as the
+        workflow's task graph is in sync with the daemon, the table is cached and its states are kept up-to-date, so
+        that calling this method before each scheduling decision is cheap (otherwise, a new table is built from the
+        daemon's answers at each call). Requires NumPy, which is an optional dependency.
+
+        :return: A TaskTable object
+        :rtype: TaskTable
+
+        :raises WRENCHException: if NumPy is not installed, or if there is any error in the response
+        """
+        return self._simulation._workflow_get_task_table(self)
+
     def is_done(self) -> bool:
         """
         Determine whether the workflow is done
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+import json
+import pathlib
+from typing import Dict, List, Union
+
+from wrench.exception import WRENCHException
+from wrench.file import File
+from wrench.json_serializer import JSONSerializer
+from wrench.json_stream import JSONStreamParser, JSONStringBody
+from wrench.task import Task
+from wrench.workflow import Workflow
+from wrench.workflow_spec import WorkflowSpec
+
+# The client-side part of importing a WfCommons workflow, shared by Simulation and AsyncSimulation
+
+
+def get_import_parameters(reference_flop_rate: str, ignore_machine_specs: bool, redundant_dependencies: bool,
+                          ignore_cycle_creating_dependencies: bool, min_cores_per_task: int,
+                          max_cores_per_task: int, enforce_num_cores: bool, ignore_avg_cpu: bool,
+                          show_warnings: bool) -> dict:
+    """
+    Build the parameters of a createWorkflowFromJSON request (other than the JSON string itself)
+
+    :param reference_flop_rate: reference flop rate (e.g., "100Mf")
+    :type reference_flop_rate: str
+    :param ignore_machine_specs: whether to ignore machine specifications in the JSON
+    :type ignore_machine_specs: bool
+    :param redundant_dependencies: whether to take into account redundant task dependencies
+    :type redundant_dependencies: bool
+    :param ignore_cycle_creating_dependencies: whether to ignore cycles when creating task dependencies
+    :type ignore_cycle_creating_dependencies: bool
+    :param min_cores_per_task: the minimum number of cores for a task if not specified in the JSON
+    :type min_cores_per_task: int
+    :param max_cores_per_task: the maximum number of cores for a task if not specified in the JSON
+    :type max_cores_per_task: int
+    :param enforce_num_cores: whether to enforce the number of cores for a task even if specified in the JSON
+    :type enforce_num_cores: bool
+    :param ignore_avg_cpu: whether to ignore the average CPU time information in the JSON
+    :type ignore_avg_cpu: bool
+    :param show_warnings: whether to show warnings when importing the JSON
+    :type show_warnings: bool
+
+    :return: the request's JSON data, without its "json_string" member
+    :rtype: dict
+    """
+    return {"reference_flop_rate": reference_flop_rate,
+            "ignore_machine_specs": ignore_machine_specs,
+            "redundant_dependencies": redundant_dependencies,
+            "ignore_cycle_creating_dependencies": ignore_cycle_creating_dependencies,
+            "min_cores_per_task": min_cores_per_task,
+            "max_cores_per_task": max_cores_per_task,
+            "enforce_num_cores": enforce_num_cores,
+            "ignore_avg_cpu": ignore_avg_cpu,
+            "show_warnings": show_warnings}
+
+
+def get_json_object_request(serializer: JSONSerializer, json_object: json, parameters: dict) -> dict:
+    """
+    Build a createWorkflowFromJSON request from a WfCommons JSON object
+
+    :param serializer: the simulation's serializer
+    :type serializer: JSONSerializer
+    :param json_object: the WfCommons JSON object
+    :type json_object: json
+    :param parameters: the request parameters (see get_import_parameters())
+    :type parameters: dict
+
+    :return: the request's JSON data
+    :rtype: dict
+    """
+    return {"json_string": serializer.dumps(json_object).decode(), **parameters}
+
+
+def get_json_object_tasks(json_object: json) -> List[Dict]:
+    """
+    Get the task objects of a WfCommons JSON object
+
+    :param json_object: the WfCommons JSON object
+    :type json_object: json
+
+    :return: the WfCommons task objects
+    :rtype: List[Dict]
+    """
+    workflow_spec_json = json_object["workflow"]
+    return workflow_spec_json.get("specification", workflow_spec_json)["tasks"]
+
+
+def get_json_file_request(serializer: JSONSerializer, path: Union[str, pathlib.Path],
+                          parameters: dict) -> JSONStringBody:
+    """
+    Build a createWorkflowFromJSON request from a WfCommons JSON file, as a body that streams the file
+
+    :param serializer: the simulation's serializer
+    :type serializer: JSONSerializer
+    :param path: the path of the WfCommons JSON file
+    :type path: Union[str, pathlib.Path]
+    :param parameters: the request parameters (see get_import_parameters())
+    :type parameters: dict
+
+    :return: the request's body
+    :rtype: JSONStringBody
+
+    :raises OSError: if the file cannot be read
+    """
+    return JSONStringBody(str(path), "json_string", serializer.dumps(parameters))
+
+
+def get_json_file_tasks(path: Union[str, pathlib.Path]) -> List[Dict]:
+    """
+    Get the task objects of a WfCommons JSON file, which is parsed incrementally, keeping only the members
+    needed to mirror the task graph ("name", "id" and "parents")
+
+    :param path: the path of the WfCommons JSON file
+    :type path: Union[str, pathlib.Path]
+
+    :return: the (partial) WfCommons task objects
+    :rtype: List[Dict]
+
+    :raises WRENCHException: if the file is not valid JSON
+    :raises OSError: if the file cannot be read
+    """
+    json_tasks = []
+    with open(path, "rb") as f:
+        for _, json_task in JSONStreamParser(iter(lambda: f.read(1 << 20), b"")).items(
+                {("workflow", "specification", "tasks"), ("workflow", "tasks")}):
+            json_tasks.append({key: json_task[key] for key in ("name", "id", "parents") if key in json_task})
+    return json_tasks
+
+
+def create_workflow_from_spec(simulation, workflow_spec: WorkflowSpec, json_tasks: List[Dict],
+                              redundant_dependencies: bool, ignore_cycle_creating_dependencies: bool) -> Workflow:
+    """
+    Create the client-side objects of a workflow imported by the daemon
+
+    :param simulation: the simulation (a Simulation or an AsyncSimulation)
+    :param workflow_spec: the daemon's answer to the createWorkflowFromJSON request
+    :type workflow_spec: WorkflowSpec
+    :param json_tasks: the WfCommons task objects
+    :type json_tasks: List[Dict]
+    :param redundant_dependencies: whether redundant task dependencies are taken into account
+    :type redundant_dependencies: bool
+    :param ignore_cycle_creating_dependencies: whether cycle-creating dependencies are ignored
+    :type ignore_cycle_creating_dependencies: bool
+
+    :return: A workflow
+    :rtype: Workflow
+
+    :raises WRENCHException: if the daemon could not import the workflow
+    """
+    if not workflow_spec.wrench_api_request_success:
+        raise WRENCHException(workflow_spec.failure_cause)
+
+    # Create the workflow
+    workflow = Workflow(simulation, workflow_spec.workflow_name)
+    simulation.workflows[workflow.get_name()] = workflow
+
+    # Create the files (caching parameter values)
+    files = simulation.files
+    for file_spec in workflow_spec.files:
+        files[file_spec.name] = File(simulation, file_spec.name, file_spec.size)
+
+    # Create the tasks (caching parameter values)
+    for task_spec in workflow_spec.tasks:
+        workflow.tasks[task_spec.name] = Task(simulation, workflow, task_spec.name, task_spec.flops,
+                                              task_spec.min_num_cores, task_spec.max_num_cores, task_spec.memory,
+                                              [files[file_name] for file_name in task_spec.input_file_names],
+                                              [files[file_name] for file_name in task_spec.output_file_names])
+
+    # Mirror the task graph, with dependencies added in the same order as by the daemon
+    task_graph = workflow.task_graph
+    task_graph.apply(lambda: task_graph.add_tasks_from_json_tasks(json_tasks, workflow_spec.tasks,
+                                                                  redundant_dependencies,
+                                                                  ignore_cycle_creating_dependencies))
+
+    return workflow
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 The WRENCH Team.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+from dataclasses import dataclass, field
+from typing import Iterable, List
+
+from wrench.json_stream import JSONStreamParser
+
+
+@dataclass
+class WorkflowFileSpec:
+    """
+    Specification of a file created by the daemon when importing a workflow
+
+    :param name: the file name
+    :type name: str
+    :param size: the file size in bytes
+    :type size: float
+    """
+    name: str
+    size: float
+
+
+@dataclass
+class WorkflowTaskSpec:
+    """
+    Specification of a task created by the daemon when importing a workflow
+
+    :param name: the task name
+    :type name: str
+    :param flops: the number of flops
+    :type flops: float
+    :param min_num_cores: the minimum number of cores
+    :type min_num_cores: int
+    :param max_num_cores: the maximum number of cores
+    :type max_num_cores: int
+    :param memory: the memory requirement in bytes
+    :type memory: float
+    :param input_file_names: the names of the task's input files
+    :type input_file_names: List[str]
+    :param output_file_names: the names of the task's output files
+    :type output_file_names: List[str]
+    """
+    name: str
+    flops: float
+    min_num_cores: int
+    max_num_cores: int
+    memory: float
+    input_file_names: List[str] = field(default_factory=list)
+    output_file_names: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WorkflowSpec:
+    """
+    The daemon's answer to a createWorkflowFromJSON request, i.e., the workflow's name, files and tasks
+
+    :param wrench_api_request_success: whether the request succeeded
+    :type wrench_api_request_success: bool
+    :param failure_cause: the failure cause, if the request failed
+    :type failure_cause: str
+    :param workflow_name: the workflow name
+    :type workflow_name: str
+    :param files: the workflow's files
+    :type files: List[WorkflowFileSpec]
+    :param tasks: the workflow's tasks
+    :type tasks: List[WorkflowTaskSpec]
+    """
+    wrench_api_request_success: bool = True
+    failure_cause: str = ""
+    workflow_name: str = ""
+    files: List[WorkflowFileSpec] = field(default_factory=list)
+    tasks: List[WorkflowTaskSpec] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(answer: dict) -> "WorkflowSpec":
+        """
+        Build a workflow specification from a decoded createWorkflowFromJSON answer
+
+        :param answer: the decoded JSON answer
+        :type answer: dict
+        :return: the workflow specification
+        :rtype: WorkflowSpec
+        """
+        return WorkflowSpec(answer.get("wrench_api_request_success", True),
+                            answer.get("failure_cause", ""),
+                            answer.get("workflow_name", ""),
+                            [WorkflowFileSpec(f["name"], f["size"]) for f in answer.get("files", [])],
+                            [WorkflowTaskSpec(t["name"], t["flops"], t["min_num_cores"], t["max_num_cores"],
+                                              t["memory"], t["input_file_names"], t["output_file_names"])
+                             for t in answer.get("tasks", [])])
+
+    @staticmethod
+    def from_stream(chunks: Iterable[bytes]) -> "WorkflowSpec":
+        """
+        Build a workflow specification from a createWorkflowFromJSON answer read as a sequence of chunks, decoding
+        the files and tasks one at a time
+
+        :param chunks: the chunks of the JSON answer
+        :type chunks: Iterable[bytes]
+        :return: the workflow specification
+        :rtype: WorkflowSpec
+
+        :raises WRENCHException: if the answer is not valid JSON
+        """
+        workflow_spec = WorkflowSpec()
+        for (key,), value in JSONStreamParser(chunks).items({("files",), ("tasks",), ("workflow_name",),
+                                                             ("wrench_api_request_success",), ("failure_cause",)}):
+            if key == "files":
+                workflow_spec.files.append(WorkflowFileSpec(value["name"], value["size"]))
+            elif key == "tasks":
+                workflow_spec.tasks.append(WorkflowTaskSpec(value["name"], value["flops"], value["min_num_cores"],
+                                                            value["max_num_cores"], value["memory"],
+                                                            value["input_file_names"], value["output_file_names"]))
+            else:
+                setattr(workflow_spec, key, value)
+        return workflow_spec